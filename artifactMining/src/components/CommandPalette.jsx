@@ -58,8 +58,8 @@ export default function CommandPalette() {
     setQuery("");
     setActive(0);
     setTimeout(() => inputRef.current?.focus(), 30);
-    apiFetch("/projects").then(d => {
-      setProjects(Array.isArray(d) ? d.slice(0, 40) : []);
+    apiFetch("/projects?view=card&fields=id,name,display_name,custom_description&limit=40").then(d => {
+      setProjects(Array.isArray(d) ? d : []);
     }).catch(() => {});
   }, [open]);
 
@@ -2022,7 +2022,7 @@ function EditForm({ p, editForm, setEditForm, saveEdit, setEditId }) {
 
 function ProjectCard({ p, rank, editId, editForm, setEditForm, startEdit, saveEdit, setEditId, rankInput, setRankInput, saveRank, nav, isPublic, toggleHidden }) {
   const accent = typeColor(p.type || p.project_type);
-  const thumb = thumbUrl(p.thumbnail_path);
+  const thumb = thumbUrl(p.thumbnail_path, p.thumbnail_urls);
   return (
     <div className={`port-top-card card${p.is_featured ? " port-featured-card" : ""}`} style={{ borderLeft: `3px solid ${accent}` }}>
       <div className="port-rank">#{rank}</div>
@@ -2096,7 +2096,7 @@ function ProjectCard({ p, rank, editId, editForm, setEditForm, startEdit, saveEd
 function ProjectRow({ p, editId, editForm, setEditForm, startEdit, saveEdit, setEditId, rankInput, setRankInput, saveRank, nav, isPublic, toggleHidden }) {
   const accent = typeColor(p.type || p.project_type);
   const score = p.importance_score ?? 0;
-  const thumb = thumbUrl(p.thumbnail_path);
+  const thumb = thumbUrl(p.thumbnail_path, p.thumbnail_urls);
   return (
     <div className="port-list-row card" style={{ borderLeft: `3px solid ${accent}` }}>
       {/* Importance bar on left */}
@@ -23,8 +23,10 @@ export function typeColor(type) {
   return TYPE_COLORS.default;
 }
 
-export function thumbUrl(path) {
+export function thumbUrl(path, urls) {
   if (!path) return null;
+  // Prefer the resized derivative served by /media when the API provides one
+  if (urls && urls.thumb) return `${API_BASE}${urls.thumb}`;
   if (path.startsWith("http")) return path;
   const filename = path.split(/[/\\]/).pop();
   return `${API_BASE}/uploads/${filename}`;
@@ -213,7 +215,7 @@ export function EditForm({ p, editForm, setEditForm, saveEdit, setEditId }) {
 
 export function ProjectCard({ p, rank, editId, editForm, setEditForm, startEdit, saveEdit, setEditId, rankInput, setRankInput, saveRank, nav, isPublic, toggleHidden }) {
   const accent = typeColor(p.type || p.project_type);
-  const thumb = thumbUrl(p.thumbnail_path);
+  const thumb = thumbUrl(p.thumbnail_path, p.thumbnail_urls);
   return (
     <div className={`port-top-card card${p.is_featured ? " port-featured-card" : ""}`} style={{ borderLeft: `3px solid ${accent}` }}>
       <div className="port-rank">#{rank}</div>
@@ -289,7 +291,7 @@ export function ProjectCard({ p, rank, editId, editForm, setEditForm, startEdit,
 export function ProjectRow({ p, editId, editForm, setEditForm, startEdit, saveEdit, setEditId, rankInput, setRankInput, saveRank, nav, isPublic, toggleHidden }) {
   const accent = typeColor(p.type || p.project_type);
   const score = p.importance_score ?? 0;
-  const thumb = thumbUrl(p.thumbnail_path);
+  const thumb = thumbUrl(p.thumbnail_path, p.thumbnail_urls);
   return (
     <div className="port-list-row card" style={{ borderLeft: `3px solid ${accent}` }}>
       <div className="port-score-bar" style={{ background: accent, height: `${Math.round(score * 100)}%` }} />
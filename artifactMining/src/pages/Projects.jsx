@@ -73,8 +73,9 @@ export default function Projects() {
     return (b / Math.pow(k, i)).toFixed(1) + " " + sz[i];
   }
 
-  function thumbUrl(path) {
+  function thumbUrl(path, urls) {
     if (!path) return null;
+    if (urls && urls.thumb) return `http://127.0.0.1:8000${urls.thumb}`;
     if (path.startsWith("http")) return path;
     const filename = path.split(/[/\\]/).pop();
     return `http://127.0.0.1:8000/uploads/${filename}`;
@@ -203,8 +204,8 @@ export default function Projects() {
               {sorted.map(p => (
                 <div key={p.id} className="proj-card card" onClick={() => nav(`/projects/${p.id}`)}>
                   <div className="proj-card-banner">
-                    {thumbUrl(p.thumbnail_path)
-                      ? <img src={thumbUrl(p.thumbnail_path)} alt="" className="proj-card-thumb" />
+                    {thumbUrl(p.thumbnail_path, p.thumbnail_urls)
+                      ? <img src={thumbUrl(p.thumbnail_path, p.thumbnail_urls)} alt="" className="proj-card-thumb" />
                       : <span className="proj-card-placeholder-icon">{TYPE_ICONS[p.project_type] || <FileText size={40} strokeWidth={1.5} />}</span>
                     }
                   </div>
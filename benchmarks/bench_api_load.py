@@ -0,0 +1,369 @@
+"""
+API load test: many concurrent clients against src.mainAPI.app.
+
+Boots the app under uvicorn in a background thread, working in a throwaway
+directory (fresh data/projects.db, uploads and AI cache) with Gemini
+replaced by benchmarks/gemini_stub.py. Setup signs up --users users, grants
+consent, uploads a few code / text / media projects per user and builds a
+resume for each. Then --clients clients, each logged in as one of the users,
+send a weighted mix of requests for --duration seconds:
+
+    list (card view and full)   project detail   search
+    portfolio showcase/summary  analytics        upload (small ZIP)
+    resume PDF export           AI bullets and project analysis (stub)
+
+Reports per route: requests, errors, p50/p95/p99 latency, requests/s and
+SQL statements per request (from the /metrics registry, so N+1 queries
+show up as a high count), plus the server event loop's scheduling lag.
+Lag well above a millisecond means something blocked the loop.
+
+Run from the repository root:
+    python benchmarks/bench_api_load.py [--clients 32] [--duration 30] [--users 8]
+                                        [--ai-latency 0.2] [--ai-rpm 15] [--json out.json]
+
+--ai-rpm is AIService's client-side rate limit (15/min, as in production);
+raise it to load the AI routes harder.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import socket
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+import httpx
+
+from benchmarks import gemini_stub, scan_corpus
+
+SEARCH_TERMS = ('report', 'pipeline', 'python', 'dashboard', 'widget', 'analysis')
+
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+# ============================================
+# UPLOAD PAYLOADS
+# ============================================
+
+class UploadPayloads:
+    """
+    Small upload bodies (code ZIP, PDF, image ZIP), each one unique.
+
+    Uploads are de-duplicated by content hash across all users, so every
+    payload gets one extra generated file to make it a new project.
+    """
+
+    def __init__(self, workdir, seed):
+        self.root = os.path.join(workdir, 'payloads')
+        self.seed = seed
+        self.count = 0
+        scan_corpus.generate_code_repo(os.path.join(self.root, 'code'), files=24, seed=seed)
+        scan_corpus.generate_media_set(os.path.join(self.root, 'media'), images=4, size=(320, 240), seed=seed)
+
+    def _zip(self, folder, extra_name, extra_bytes):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            base = os.path.join(self.root, folder)
+            for dirpath, _, files in os.walk(base):
+                for name in sorted(files):
+                    path = os.path.join(dirpath, name)
+                    archive.write(path, os.path.relpath(path, base))
+            archive.writestr(extra_name, extra_bytes)
+        return buffer.getvalue()
+
+    def make(self, kind):
+        """(filename, bytes, content type) for the next upload of `kind`."""
+        self.count += 1
+        n = self.count
+        if kind == 'code':
+            source = f'"""Upload {n}."""\n\n\ndef variant_{n}():\n    return {n}\n'.encode()
+            return 'project.zip', self._zip('code', f'src/variant_{n}.py', source), 'application/zip'
+        if kind == 'media':
+            from PIL import Image
+            image = io.BytesIO()
+            Image.new('RGB', (32, 32), (n % 256, n // 256 % 256, 128)).save(image, format='PNG')
+            return 'photos.zip', self._zip('media', f'variant_{n}.png', image.getvalue()), 'application/zip'
+        path = os.path.join(self.root, f'report_{n}.pdf')
+        scan_corpus._write_pdf(Path(path), f'Report {n}', list(scan_corpus.PROSE[n % 6:n % 6 + 6]))
+        with open(path, 'rb') as f:
+            return 'report.pdf', f.read(), 'application/pdf'
+
+
+# ============================================
+# SERVER
+# ============================================
+
+class ServerThread(threading.Thread):
+    """uvicorn serving the app on a free local port, plus an event-loop lag probe."""
+
+    def __init__(self, app, probe_interval=0.01):
+        super().__init__(daemon=True, name='api-server')
+        import uvicorn
+
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.sock.bind(('127.0.0.1', 0))
+        self.port = self.sock.getsockname()[1]
+        self.server = uvicorn.Server(uvicorn.Config(app, log_level='warning', access_log=False))
+        self.probe_interval = probe_interval
+        self.lag = []
+        self.started = threading.Event()
+
+    async def _probe(self):
+        while not self.server.should_exit:
+            start = time.perf_counter()
+            await asyncio.sleep(self.probe_interval)
+            self.lag.append(time.perf_counter() - start - self.probe_interval)
+
+    async def _main(self):
+        probe = asyncio.ensure_future(self._probe())
+        serve = asyncio.ensure_future(self.server.serve(sockets=[self.sock]))
+        while not self.server.started:
+            await asyncio.sleep(0.01)
+        self.started.set()
+        await serve
+        probe.cancel()
+
+    def run(self):
+        asyncio.run(self._main())
+
+    def stop(self):
+        self.server.should_exit = True
+        self.join(timeout=10)
+
+
+# ============================================
+# SETUP
+# ============================================
+
+def setup_users(base_url, users, projects_per_user, payloads):
+    """Sign up users, upload their projects and build a resume each."""
+    accounts = []
+    with httpx.Client(base_url=base_url, timeout=300) as client:
+        client.post('/consent/basic-consent-grant').raise_for_status()
+        client.post('/consent/ai-consent-grant').raise_for_status()
+        for i in range(users):
+            response = client.post('/auth/signup', json={
+                'first_name': 'Load', 'last_name': f'User{i}',
+                'email': f'load{i}@example.com', 'password': 'load-test-password',
+            })
+            response.raise_for_status()
+            headers = {'Authorization': f"Bearer {response.json()['token']}"}
+            kinds = ('code', 'text', 'media')
+            for j in range(projects_per_user):
+                client.post('/projects/upload', headers=headers,
+                            files={'file': payloads.make(kinds[j % len(kinds)])}).raise_for_status()
+            projects = client.get('/projects', params={'view': 'card'}, headers=headers).json()
+            resume_id = client.post('/resume/create', headers=headers, json={'name': 'Load'}).json()['resume']['id']
+            client.post('/resume/generate', headers=headers, params={'resume_id': resume_id}, json={})
+            accounts.append({
+                'headers': headers,
+                'resume_id': resume_id,
+                'projects': [p['id'] for p in projects],
+                'code_projects': [p['id'] for p in projects if p.get('project_type') == 'code'],
+            })
+    return accounts
+
+
+# ============================================
+# TRAFFIC MIX
+# ============================================
+
+def build_mix(payloads, include_ai):
+    """[(weight, label, route template, request factory)]; factory(account, rng) -> request kwargs."""
+    mix = [
+        (20, 'list cards', 'GET /projects',
+         lambda a, r: dict(method='GET', url='/projects', params={'view': 'card'})),
+        (6, 'list full', 'GET /projects',
+         lambda a, r: dict(method='GET', url='/projects')),
+        (12, 'project detail', 'GET /projects/{project_id}',
+         lambda a, r: dict(method='GET', url=f"/projects/{r.choice(a['projects'])}")),
+        (8, 'search', 'GET /projects/search',
+         lambda a, r: dict(method='GET', url='/projects/search', params={'q': r.choice(SEARCH_TERMS)})),
+        (10, 'portfolio showcase', 'GET /portfolio/showcase',
+         lambda a, r: dict(method='GET', url='/portfolio/showcase')),
+        (6, 'portfolio summary', 'GET /portfolio/summary',
+         lambda a, r: dict(method='GET', url='/portfolio/summary')),
+        (6, 'analytics skills', 'GET /analytics/skills',
+         lambda a, r: dict(method='GET', url='/analytics/skills')),
+        (4, 'analytics co-occurrence', 'GET /analytics/co-occurrence',
+         lambda a, r: dict(method='GET', url='/analytics/co-occurrence')),
+        (4, 'resume pdf', 'GET /resume/download/pdf',
+         lambda a, r: dict(method='GET', url='/resume/download/pdf', params={'resume_id': a['resume_id']})),
+        (3, 'upload', 'POST /projects/upload',
+         lambda a, r: dict(method='POST', url='/projects/upload', files={'file': payloads.make('code')})),
+    ]
+    if include_ai:
+        mix += [
+            (2, 'ai bullets', 'POST /resume/projects/{project_id}/ai-generate',
+             lambda a, r: dict(method='POST', url=f"/resume/projects/{r.choice(a['projects'])}/ai-generate",
+                               params={'resume_id': a['resume_id']}, json={})),
+            (1, 'ai analyze', 'POST /projects/{project_id}/analyze',
+             lambda a, r: dict(method='POST', url=f"/projects/{r.choice(a['code_projects'] or a['projects'])}/analyze",
+                               json={})),
+        ]
+    return mix
+
+
+async def client_loop(client, account, mix, rng, deadline, samples):
+    weights = [entry[0] for entry in mix]
+    while time.perf_counter() < deadline:
+        _, label, _, factory = rng.choices(mix, weights=weights)[0]
+        request = factory(account, rng)
+        start = time.perf_counter()
+        try:
+            response = await client.request(headers=account['headers'], **request)
+            status = response.status_code
+        except httpx.HTTPError:
+            status = 0
+        samples.append((label, status, time.perf_counter() - start))
+
+
+async def run_load(base_url, accounts, mix, clients, duration, seed):
+    samples = []
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, timeout=120, limits=limits) as client:
+        deadline = time.perf_counter() + duration
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            client_loop(client, accounts[i % len(accounts)], mix, random.Random(seed * 1000 + i), deadline, samples)
+            for i in range(clients)
+        ))
+        elapsed = time.perf_counter() - start
+    return samples, elapsed
+
+
+# ============================================
+# REPORT
+# ============================================
+
+def summarize(samples, elapsed, mix, lag):
+    from src.Services import metrics
+
+    templates = {label: template for _, label, template, _ in mix}
+    report = {'elapsed_s': round(elapsed, 2), 'requests': len(samples),
+              'throughput_rps': round(len(samples) / elapsed, 1), 'routes': {}}
+    for label in dict.fromkeys(label for _, label, _, _ in mix):
+        latencies = sorted(latency for l, _, latency in samples if l == label)
+        if not latencies:
+            continue
+        template = templates[label]
+        route = template.split(' ', 1)[1]
+        queries = metrics.HTTP_REQUEST_DB_QUERIES
+        count = queries.count(route=route)
+        report['routes'][label] = {
+            'route': template,
+            'requests': len(latencies),
+            'errors': sum(1 for l, status, _ in samples if l == label and not 200 <= status < 300),
+            'p50_ms': round(_percentile(latencies, 50) * 1000, 1),
+            'p95_ms': round(_percentile(latencies, 95) * 1000, 1),
+            'p99_ms': round(_percentile(latencies, 99) * 1000, 1),
+            'rps': round(len(latencies) / elapsed, 2),
+            # per route template, so labels sharing a template share this figure
+            'sql_per_request': round(queries.sum(route=route) / count, 1) if count else None,
+        }
+    lag = sorted(lag)
+    report['event_loop_lag_ms'] = {
+        'p50': round(_percentile(lag, 50) * 1000, 2),
+        'p99': round(_percentile(lag, 99) * 1000, 2),
+        'max': round(lag[-1] * 1000, 2) if lag else 0.0,
+    }
+    return report
+
+
+def print_report(report, clients, ai_calls):
+    print(f"\n{report['requests']} requests in {report['elapsed_s']}s from {clients} clients "
+          f"= {report['throughput_rps']} req/s ({ai_calls} stub AI calls)\n")
+    print(f"{'route':<26}{'reqs':>7}{'errors':>8}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>8}{'SQL/req':>9}")
+    for label, row in report['routes'].items():
+        sql = f"{row['sql_per_request']:.1f}" if row['sql_per_request'] is not None else '-'
+        print(f"{label:<26}{row['requests']:>7}{row['errors']:>8}{row['p50_ms']:>9.1f}{row['p95_ms']:>9.1f}"
+              f"{row['p99_ms']:>9.1f}{row['rps']:>8.1f}{sql:>9}")
+    lag = report['event_loop_lag_ms']
+    print(f"\nevent loop lag: p50 {lag['p50']} ms, p99 {lag['p99']} ms, max {lag['max']} ms")
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--duration', type=float, default=30.0, help='seconds of load')
+    parser.add_argument('--users', type=int, default=8)
+    parser.add_argument('--projects-per-user', type=int, default=3)
+    parser.add_argument('--ai-latency', type=float, default=0.2, help='stub Gemini seconds per call')
+    parser.add_argument('--ai-rpm', type=int, default=15, help="AIService's requests-per-minute limit")
+    parser.add_argument('--no-ai', action='store_true', help='leave the AI routes out of the mix')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--json', help='also write the report to this file')
+    parser.add_argument('--verbose', action='store_true', help="show the app's stdout output")
+    args = parser.parse_args()
+
+    json_path = os.path.abspath(args.json) if args.json else None
+    workdir = tempfile.mkdtemp(prefix='bench_api_load_')
+    os.chdir(workdir)
+    # Cheap password hashes so setup isn't dominated by bcrypt; quiet app logs
+    os.environ.setdefault('BCRYPT_ROUNDS', '4')
+    os.environ.setdefault('LOG_LEVEL', 'WARNING')
+
+    server = None
+    try:
+        gemini_stub.install(latency=args.ai_latency, seed=args.seed)
+        from src.AI.ai_service import initialize_ai_service
+        from src.mainAPI import app
+        from src.Services import metrics
+        initialize_ai_service(requests_per_minute=args.ai_rpm)
+
+        server = ServerThread(app)
+        server.start()
+        server.started.wait(30)
+        base_url = f"http://127.0.0.1:{server.port}"
+
+        # Some analyzers still print progress to stdout; keep it out of the report
+        app_output = sys.stdout if args.verbose else open(os.devnull, 'w')
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(app_output):
+            payloads = UploadPayloads(workdir, args.seed)
+            accounts = setup_users(base_url, args.users, args.projects_per_user, payloads)
+        print(f"setup: {args.users} users, {sum(len(a['projects']) for a in accounts)} projects "
+              f"in {time.perf_counter() - start:.1f}s; {args.clients} clients for {args.duration:g}s...")
+
+        mix = build_mix(payloads, include_ai=not args.no_ai)
+        metrics.REGISTRY.reset()
+        server.lag.clear()
+        ai_calls = gemini_stub.GenerativeModel.calls
+        with contextlib.redirect_stdout(app_output):
+            samples, elapsed = asyncio.run(run_load(base_url, accounts, mix, args.clients, args.duration, args.seed))
+        report = summarize(samples, elapsed, mix, list(server.lag))
+        print_report(report, args.clients, gemini_stub.GenerativeModel.calls - ai_calls)
+        if json_path:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2)
+    finally:
+        if server is not None:
+            server.stop()
+        os.chdir(REPO_ROOT)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
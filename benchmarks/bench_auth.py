@@ -0,0 +1,115 @@
+"""
+Per-request authentication overhead: token verification plus the user
+lookup an authenticated endpoint like /auth/me does.
+
+Times, on a temporary database with --users users and a stream of
+--requests requests spread over those users' tokens:
+  - token verification: jwt.decode on every request (legacy) against the
+    verified-token cache in auth_service.decode_user_id
+  - user lookup: get_user (User row joined with education and work
+    history) against the cached get_user_summary projection
+  - both together, which is what require_auth + the lookup cost per request
+
+Run from the repository root:
+    python benchmarks/bench_auth.py [--users 50] [--requests 5000] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jose import jwt
+
+from src.Databases.database import DatabaseManager
+from src.Services import auth_service
+
+
+def _best_of(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def legacy_decode(token):
+    payload = jwt.decode(token, auth_service.SECRET_KEY, algorithms=[auth_service.ALGORITHM])
+    return int(payload["sub"])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement (best is kept)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = DatabaseManager(os.path.join(tmp, 'bench.db'))
+        user_ids = []
+        for i in range(args.users):
+            user = db.create_user({'first_name': f'User{i}', 'last_name': 'Bench',
+                                   'email': f'user{i}@example.com', 'password_hash': 'x'})
+            for j in range(3):
+                db.add_education({'user_id': user.id, 'institution': f'School {j}',
+                                  'degree_type': 'BSc', 'topic': 'CS',
+                                  'start_date': datetime(2020, 9, 1)})
+            user_ids.append(user.id)
+        tokens = [auth_service.create_access_token(uid) for uid in user_ids]
+        rng = random.Random(0)
+        stream = [rng.choice(tokens) for _ in range(args.requests)]
+        ids = [user_ids[tokens.index(token)] for token in stream]
+
+        def legacy_verify():
+            for token in stream:
+                legacy_decode(token)
+
+        def new_verify():
+            auth_service.clear_token_cache()
+            for token in stream:
+                auth_service.decode_user_id(token)
+
+        def legacy_lookup():
+            for user_id in ids:
+                db.get_user(user_id)
+
+        def new_lookup():
+            db.clear_user_summaries()
+            for user_id in ids:
+                db.get_user_summary(user_id)
+
+        def legacy_request():
+            for token in stream:
+                db.get_user(legacy_decode(token))
+
+        def new_request():
+            auth_service.clear_token_cache()
+            db.clear_user_summaries()
+            for token in stream:
+                db.get_user_summary(auth_service.decode_user_id(token))
+
+        rows = [
+            ("token verification", legacy_verify, new_verify),
+            ("user lookup", legacy_lookup, new_lookup),
+            ("auth + lookup per request", legacy_request, new_request),
+        ]
+        print(f"{args.requests} requests over {args.users} users (caches start cold each run)\n")
+        print(f"{'':<28}{'legacy':>12}{'new':>12}{'speed-up':>10}")
+        for label, legacy_fn, new_fn in rows:
+            legacy_time = _best_of(legacy_fn, args.repeat)
+            new_time = _best_of(new_fn, args.repeat)
+            per_legacy = legacy_time / args.requests * 1e6
+            per_new = new_time / args.requests * 1e6
+            print(f"{label:<28}{per_legacy:>9.1f} us{per_new:>9.1f} us{legacy_time / new_time:>9.1f}x")
+        db.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Folder grading benchmark for codeEfficiency / folderEfficiency.
+
+Grades every code file under a large Python tree (default: this
+interpreter's standard library) three ways:
+  - per-scorer: the pre-context flow, where grade_efficiency, timeScore and
+    spaceScore each identify the file (re-reading it) and each interpreted
+    scorer parses the AST again
+  - shared serial: grade_folder(workers=1), one read/parse/traversal per file
+  - shared parallel: grade_folder(workers=N) on a process pool
+
+Run from the repository root:
+    python benchmarks/bench_code_efficiency.py [FOLDER] [--workers N]
+"""
+
+import argparse
+import os
+import sys
+import sysconfig
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Analysis import codeEfficiency as ce
+from src.Analysis.codeIdentifier import identify_language_and_framework
+from src.Analysis.folderEfficiency import aggregate_results, grade_folder, is_code_file
+
+
+def _per_scorer_grade(file_path):
+    """The old grade_efficiency flow: no shared context between steps."""
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            code = f.read()
+    except Exception as e:
+        return {"time_score": None, "notes": [str(e)]}
+    result = identify_language_and_framework(file_path)
+    if isinstance(result, dict) or not result[0]:
+        return {"time_score": None}
+    time_result = ce.timeScore(code, file_path)
+    space_result = ce.spaceScore(code, file_path)
+    return {"time_score": time_result["time_score"], "space_score": space_result["space_score"],
+            "total_loops": time_result.get("total_loops"),
+            "max_loop_depth": time_result.get("max_loop_depth")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('folder', nargs='?', default=sysconfig.get_paths()['stdlib'])
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    files = [os.path.join(root, name) for root, _, names in os.walk(args.folder)
+             for name in names if is_code_file(name)]
+    size_mb = sum(os.path.getsize(f) for f in files) / (1024 * 1024)
+    print(f"{args.folder}: {len(files)} code files, {size_mb:.1f} MB, {args.workers} worker(s)\n")
+
+    runs = [
+        ("per-scorer (old flow)", lambda: aggregate_results([_per_scorer_grade(f) for f in files])),
+        ("shared context, serial", lambda: grade_folder(args.folder, workers=1)),
+        (f"shared context, {args.workers} workers", lambda: grade_folder(args.folder, workers=args.workers)),
+    ]
+    baseline = None
+    for label, run in runs:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"{label:<32}{elapsed:>8.2f} s{len(files) / elapsed:>10.0f} files/s"
+              f"{size_mb / elapsed:>8.2f} MB/s{baseline / elapsed:>7.2f}x", flush=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+"""
+Password hashing: bcrypt cost per work factor, and how a login burst
+affects the latency of unrelated endpoints.
+
+  - work factor: time of one bcrypt hash at each --rounds-range value, to
+    pick BCRYPT_ROUNDS for a deployment (OWASP suggests >= 10; aim for a
+    few hundred ms per hash on the production CPU)
+  - login burst: --logins concurrent logins plus a steady stream of
+    requests to a cheap sync endpoint (standing in for the upload and
+    portfolio routes). legacy verifies in a sync handler, holding a request
+    thread for the whole hash; new awaits the dedicated password hash pool.
+    Reports the cheap endpoint's latency during the burst.
+
+Run from the repository root:
+    BCRYPT_ROUNDS=10 python benchmarks/bench_password_hash.py [--logins 40] [--threads 8]
+
+The burst uses BCRYPT_ROUNDS (default 12) for the stored hash, as the API does.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import anyio.to_thread
+import httpx
+from fastapi import FastAPI
+from passlib.context import CryptContext
+
+from src.Services import auth_service
+
+
+def work_factor_table(rounds_range):
+    print(f"{'rounds':>8}{'ms / hash':>12}")
+    for rounds in rounds_range:
+        context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+        start = time.perf_counter()
+        context.hash("benchmark-password")
+        print(f"{rounds:>8}{(time.perf_counter() - start) * 1000:>12.1f}")
+
+
+def build_app(stored_hash):
+    app = FastAPI()
+
+    @app.get("/ping")
+    def ping():
+        return {"ok": True}
+
+    @app.post("/legacy-login")
+    def legacy_login():
+        return {"valid": auth_service.verify_password("benchmark-password", stored_hash)}
+
+    @app.post("/login")
+    async def login():
+        valid, _ = await auth_service.verify_password_async("benchmark-password", stored_hash)
+        return {"valid": valid}
+
+    return app
+
+
+async def burst(app, login_path, logins, threads, pings=40, ping_interval=0.02):
+    anyio.to_thread.current_default_thread_limiter().total_tokens = threads
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def timed_ping():
+            start = time.perf_counter()
+            await client.get("/ping")
+            return time.perf_counter() - start
+
+        async def ping_stream():
+            tasks = []
+            for _ in range(pings):
+                tasks.append(asyncio.ensure_future(timed_ping()))
+                await asyncio.sleep(ping_interval)
+            return await asyncio.gather(*tasks)
+
+        start = time.perf_counter()
+        login_tasks = [asyncio.ensure_future(client.post(login_path)) for _ in range(logins)]
+        await asyncio.sleep(0.01)  # let the burst land first
+        latencies = await ping_stream()
+        responses = await asyncio.gather(*login_tasks)
+        total = time.perf_counter() - start
+    statuses = sorted({r.status_code for r in responses})
+    return latencies, total, statuses
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--logins', type=int, default=40)
+    parser.add_argument('--threads', type=int, default=8, help='request threadpool size')
+    parser.add_argument('--rounds-range', default='10-13')
+    args = parser.parse_args()
+
+    low, high = (int(x) for x in args.rounds_range.split('-'))
+    work_factor_table(range(low, high + 1))
+
+    stored_hash = auth_service.hash_password("benchmark-password")
+    app = build_app(stored_hash)
+    pool = auth_service.password_hash_pool
+    print(f"\n{args.logins} concurrent logins at {auth_service.BCRYPT_ROUNDS} rounds, {args.threads} request threads, "
+          f"{pool.workers} hash workers (queue limit {pool.max_queue})\n")
+    print(f"{'':<8}{'ping p50':>10}{'ping p95':>10}{'ping max':>10}{'burst':>9}  login status")
+    for label, path in (("legacy", "/legacy-login"), ("new", "/login")):
+        latencies, total, statuses = asyncio.run(burst(app, path, args.logins, args.threads))
+        latencies = sorted(l * 1000 for l in latencies)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        print(f"{label:<8}{statistics.median(latencies):>8.1f}ms{p95:>8.1f}ms{latencies[-1]:>8.1f}ms"
+              f"{total:>8.2f}s  {statuses}")
+    print(f"\npool stats: {pool.stats()}")
+    pool.shutdown()
+
+
+if __name__ == '__main__':
+    main()
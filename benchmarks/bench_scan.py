@@ -0,0 +1,295 @@
+"""
+End-to-end scanner throughput on synthetic corpora, with a regression gate.
+
+Generates deterministic corpora (benchmarks/scan_corpus.py) and times:
+  - code         scan_coding_project on a multi-language source tree
+  - text         scan_text_document on a .txt/.docx/.pdf folder
+  - media        scan_media_project on JPEG (with EXIF) and PNG images
+  - zip          processZipFile on one archive holding all three as roots
+  - incremental  IncrementalZipHandler adding a mixed ZIP to a scanned project
+
+Each case runs in its own process, working in a throwaway directory so it
+gets a fresh data/projects.db, and reports files/s, MB/s, peak RSS (whole
+process, imports included; not available on Windows) and the number of SQL
+statements it ran. Best of --repeat runs is kept.
+
+Results are appended to a JSON history file. The run fails (exit status 1)
+when a case is more than --threshold worse than the median of the previous
+--baseline-runs passing runs on the same machine, scale and seed: lower
+files/s, higher peak RSS or more SQL statements.
+
+Run from the repository root:
+    python benchmarks/bench_scan.py [--scale small|medium|large] [--cases code,zip]
+                                    [--repeat 3] [--threshold 0.2] [--no-record]
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks import scan_corpus
+
+DEFAULT_HISTORY = os.path.join(REPO_ROOT, 'benchmarks', 'results', 'scan_history.json')
+CASES = ('code', 'text', 'media', 'zip', 'incremental')
+
+# Corpus sizes: code files, text documents, images (the incremental ZIP adds a quarter of each)
+SCALES = {
+    'small': (200, 30, 30),
+    'medium': (1000, 120, 120),
+    'large': (4000, 400, 400),
+}
+
+# metric -> True if higher is better
+GATED_METRICS = {'files_per_sec': True, 'peak_rss_mb': False, 'db_queries': False}
+
+
+# ============================================
+# CORPUS
+# ============================================
+
+def build_corpus(corpus_dir, scale, seed):
+    """Generate every input the cases need; returns {name: {'files', 'bytes'}}."""
+    code_files, documents, images = SCALES[scale]
+    sizes = {
+        'code': scan_corpus.generate_code_repo(os.path.join(corpus_dir, 'code'), code_files, seed=seed),
+        'text': scan_corpus.generate_text_corpus(os.path.join(corpus_dir, 'text'), documents, seed=seed),
+        'media': scan_corpus.generate_media_set(os.path.join(corpus_dir, 'media'), images, seed=seed),
+    }
+
+    bundle = os.path.join(corpus_dir, 'bundle.zip')
+    with tempfile.TemporaryDirectory() as staging:
+        for name in ('code', 'text', 'media'):
+            shutil.copytree(os.path.join(corpus_dir, name), os.path.join(staging, name))
+        scan_corpus.zip_tree(staging, bundle)
+    sizes['zip'] = {key: sum(sizes[n][key] for n in ('code', 'text', 'media')) for key in ('files', 'bytes')}
+
+    additions = os.path.join(corpus_dir, 'additions')
+    parts = [
+        scan_corpus.generate_code_repo(os.path.join(additions, 'code'), max(1, code_files // 4), seed=seed + 1),
+        scan_corpus.generate_text_corpus(os.path.join(additions, 'docs'), max(1, documents // 4), seed=seed + 1),
+        scan_corpus.generate_media_set(os.path.join(additions, 'images'), max(1, images // 4), seed=seed + 1),
+    ]
+    scan_corpus.zip_tree(additions, os.path.join(corpus_dir, 'additions.zip'))
+    sizes['incremental'] = {key: sum(p[key] for p in parts) for key in ('files', 'bytes')}
+    return sizes
+
+
+# ============================================
+# CASE RUNNER (child process)
+# ============================================
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss)
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def run_case(case, corpus_dir):
+    """Run one case in this process (cwd must be a scratch directory)."""
+    import gc
+
+    from src.Analysis.codingProjectScanner import scan_coding_project
+    from src.Analysis.incrementalZipHandler import IncrementalZipHandler
+    from src.Analysis.mediaProjectScanner import scan_media_project
+    from src.Analysis.multiProjectZip import processZipFile
+    from src.Analysis.textDocumentScanner import scan_text_document
+    from src.Services import metrics
+
+    def scan_zip():
+        results = processZipFile(os.path.join(corpus_dir, 'bundle.zip'))
+        return all(r.get('database_id') for r in results) and len(results) == 3
+
+    if case == 'incremental':
+        project_id = scan_coding_project(os.path.join(corpus_dir, 'code'))
+
+        def add_zip():
+            result = IncrementalZipHandler().add_zip_to_existing_project(
+                project_id, os.path.join(corpus_dir, 'additions.zip'))
+            return result.get('success') and result.get('files_added', 0) > 0
+        work = add_zip
+    else:
+        work = {
+            'code': lambda: scan_coding_project(os.path.join(corpus_dir, 'code')) is not None,
+            'text': lambda: scan_text_document(os.path.join(corpus_dir, 'text')) is not None,
+            'media': lambda: scan_media_project(os.path.join(corpus_dir, 'media')) is not None,
+            'zip': scan_zip,
+        }[case]
+
+    gc.collect()
+    queries = metrics.DB_QUERIES.total()
+    start = time.perf_counter()
+    ok = work()
+    seconds = time.perf_counter() - start
+    return {
+        'ok': bool(ok),
+        'seconds': seconds,
+        'db_queries': int(metrics.DB_QUERIES.total() - queries),
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def run_case_isolated(case, corpus_dir):
+    """Run a case in a fresh interpreter and scratch directory."""
+    with tempfile.TemporaryDirectory(prefix=f'bench_scan_{case}_') as workdir:
+        result_path = os.path.join(workdir, 'result.json')
+        subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--run-case', case,
+             '--corpus-dir', corpus_dir, '--result', result_path],
+            cwd=workdir, check=True, stdout=subprocess.DEVNULL,
+        )
+        with open(result_path, encoding='utf-8') as f:
+            return json.load(f)
+
+
+# ============================================
+# HISTORY / REGRESSION GATE
+# ============================================
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding='utf-8') as f:
+        return json.load(f).get('runs', [])
+
+
+def save_history(path, runs):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'runs': runs}, f, indent=2)
+
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+
+def find_regressions(results, history, machine, scale, seed, baseline_runs, threshold):
+    """[(case, metric, baseline, current)] for metrics worse than threshold."""
+    comparable = [run for run in history
+                  if run.get('machine') == machine and run.get('scale') == scale
+                  and run.get('seed') == seed and not run.get('regressions')][-baseline_runs:]
+    regressions = []
+    for case, current in results.items():
+        for metric, higher_is_better in GATED_METRICS.items():
+            previous = [run['results'][case][metric] for run in comparable
+                        if run['results'].get(case, {}).get(metric) is not None]
+            if not previous or current.get(metric) is None:
+                continue
+            baseline = statistics.median(previous)
+            if higher_is_better:
+                worse = current[metric] < baseline * (1 - threshold)
+            else:
+                worse = current[metric] > baseline * (1 + threshold)
+            if worse:
+                regressions.append((case, metric, baseline, current[metric]))
+    return regressions
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--cases', default=','.join(CASES), help='comma-separated subset of ' + ', '.join(CASES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--corpus-dir', help='generate into (or, with --run-case, read from) this directory')
+    parser.add_argument('--history', default=DEFAULT_HISTORY)
+    parser.add_argument('--baseline-runs', type=int, default=5)
+    parser.add_argument('--threshold', type=float, default=0.2, help='allowed relative regression (0.2 = 20%%)')
+    parser.add_argument('--no-record', action='store_true', help="don't append this run to the history")
+    parser.add_argument('--run-case', help=argparse.SUPPRESS)
+    parser.add_argument('--result', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        with open(args.result, 'w', encoding='utf-8') as f:
+            json.dump(run_case(args.run_case, args.corpus_dir), f)
+        return 0
+
+    cases = [c.strip() for c in args.cases.split(',') if c.strip()]
+    unknown = set(cases) - set(CASES)
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+
+    corpus_dir = args.corpus_dir or tempfile.mkdtemp(prefix='bench_scan_corpus_')
+    try:
+        start = time.perf_counter()
+        sizes = build_corpus(os.path.abspath(corpus_dir), args.scale, args.seed)
+        print(f"corpus ({args.scale}, seed {args.seed}) generated in {time.perf_counter() - start:.1f}s\n")
+
+        print(f"{'case':<13}{'files':>7}{'MB':>8}{'seconds':>10}{'files/s':>10}{'MB/s':>8}{'peak RSS':>11}{'queries':>9}")
+        results = {}
+        for case in cases:
+            runs = [run_case_isolated(case, os.path.abspath(corpus_dir)) for _ in range(args.repeat)]
+            if not all(run['ok'] for run in runs):
+                print(f"{case:<13} FAILED (scan returned no project)")
+                return 1
+            best = min(runs, key=lambda run: run['seconds'])
+            files, megabytes = sizes[case]['files'], sizes[case]['bytes'] / (1024 * 1024)
+            results[case] = {
+                'files': files,
+                'megabytes': round(megabytes, 3),
+                'seconds': round(best['seconds'], 4),
+                'files_per_sec': round(files / best['seconds'], 2),
+                'mb_per_sec': round(megabytes / best['seconds'], 3),
+                'peak_rss_mb': round(best['peak_rss_mb'], 1) if best['peak_rss_mb'] is not None else None,
+                'db_queries': best['db_queries'],
+            }
+            r = results[case]
+            rss = f"{r['peak_rss_mb']:.0f} MB" if r['peak_rss_mb'] is not None else 'n/a'
+            print(f"{case:<13}{files:>7}{megabytes:>8.1f}{r['seconds']:>10.2f}{r['files_per_sec']:>10.1f}"
+                  f"{r['mb_per_sec']:>8.2f}{rss:>11}{r['db_queries']:>9}")
+    finally:
+        if not args.corpus_dir:
+            shutil.rmtree(corpus_dir, ignore_errors=True)
+
+    machine = f"{platform.node()}/{platform.machine()}/py{platform.python_version()}"
+    history = load_history(args.history)
+    regressions = find_regressions(results, history, machine, args.scale, args.seed,
+                                   args.baseline_runs, args.threshold)
+
+    if not args.no_record:
+        history.append({
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'machine': machine,
+            'scale': args.scale,
+            'seed': args.seed,
+            'results': results,
+            'regressions': [f"{case}.{metric}" for case, metric, _, _ in regressions],
+        })
+        save_history(args.history, history)
+
+    if regressions:
+        print(f"\nREGRESSION (more than {args.threshold:.0%} worse than the median of recent runs):")
+        for case, metric, baseline, current in regressions:
+            print(f"  {case} {metric}: {baseline:g} -> {current:g}")
+        return 1
+    print("\nno regressions against recorded history")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""
+Document skill analysis on long PDFs: the compiled SkillMatcher against
+the previous per-keyword regex loop.
+
+Builds a PDF of --pages pages of prose (ReportLab) and times:
+  - analyze_document_for_skills on a cold file: legacy is a full PyPDF2
+    extraction, then one re.findall per dictionary keyword over the whole
+    lowercased text; new tokenizes each page once
+  - the text scanner flow, which reads the document for its keywords and
+    then analyzes its skills: legacy extracted the PDF twice, new reuses
+    the cached page text
+  - matching only: both counting strategies on already-extracted text
+
+Run from the repository root:
+    python benchmarks/bench_skill_matcher.py [--pages 200] [--repeat 3]
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Analysis import skillsExtractDocs
+from tests.test_skillMatcher import legacy_count_skills
+
+FILLER = ("the report describes how the team approached the project and what it "
+          "learned along the way while working with several stakeholders").split()
+
+
+def _best_of(fn, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def build_pdf(path, pages, seed=0):
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+
+    rng = random.Random(seed)
+    vocab = [kw for keywords in skillsExtractDocs.SKILL_KEYWORDS.values() for kw in keywords]
+    pdf = canvas.Canvas(path, pagesize=letter)
+    for _ in range(pages):
+        y = 750
+        for _ in range(50):
+            words = [rng.choice(vocab) if rng.random() < 0.15 else rng.choice(FILLER) for _ in range(14)]
+            pdf.drawString(40, y, " ".join(words).capitalize() + ".")
+            y -= 14
+        pdf.showPage()
+    pdf.save()
+
+
+def legacy_extract_text(path):
+    from PyPDF2 import PdfReader
+    text = ""
+    for page in PdfReader(path).pages:
+        page_text = page.extract_text()
+        if page_text:
+            text += page_text + "\n"
+    return text
+
+
+def legacy_analyze_document(path):
+    counts = legacy_count_skills(legacy_extract_text(path), skillsExtractDocs.SKILL_KEYWORDS)
+    return sorted(counts.items(), key=lambda x: x[1], reverse=True)
+
+
+def legacy_scanner_flow(path):
+    legacy_extract_text(path)
+    return legacy_analyze_document(path)
+
+
+def new_cold_analyze(path):
+    skillsExtractDocs._read_pdf_pages.cache_clear()
+    return skillsExtractDocs.analyze_document_for_skills(path)
+
+
+def new_scanner_flow(path):
+    skillsExtractDocs._read_pdf_pages.cache_clear()
+    skillsExtractDocs.extract_text(path)
+    return skillsExtractDocs.analyze_document_for_skills(path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=3, help='runs per measurement (best is kept)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'long.pdf')
+        build_pdf(path, args.pages)
+        text = skillsExtractDocs.extract_text(path)
+        print(f"{args.pages} pages, {os.path.getsize(path) / 1024:.0f} KB PDF, "
+              f"{len(text) / 1024:.0f} KB of text\n")
+
+        matcher = skillsExtractDocs._MATCHER
+        rows = [
+            ("analyze_document (cold)", legacy_analyze_document, new_cold_analyze),
+            ("scanner: text + skills", legacy_scanner_flow, new_scanner_flow),
+            ("keyword matching only", lambda _: legacy_count_skills(text, skillsExtractDocs.SKILL_KEYWORDS),
+             lambda _: matcher.count_skills(text)),
+        ]
+        print(f"{'':<26}{'legacy':>10}{'new':>10}{'speed-up':>10}")
+        for label, legacy_fn, new_fn in rows:
+            legacy_time, legacy_result = _best_of(lambda: legacy_fn(path), args.repeat)
+            new_time, new_result = _best_of(lambda: new_fn(path), args.repeat)
+            if label != "keyword matching only":
+                assert legacy_result == new_result, "skill counts differ"
+            print(f"{label:<26}{legacy_time:>9.3f}s{new_time:>9.3f}s{legacy_time / new_time:>9.1f}x")
+
+
+if __name__ == '__main__':
+    main()
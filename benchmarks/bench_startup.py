@@ -0,0 +1,84 @@
+"""
+Startup benchmark: API worker cold start and test collection.
+
+Measures, each in fresh interpreters:
+  - cold import of src.mainAPI (what every uvicorn worker pays on boot),
+    median of --runs imports
+  - `pytest --collect-only` over tests/ (what every test run pays first)
+  - which heavy optional packages the API import still pulls in; these
+    should only load when an endpoint that needs them is first called
+
+Run from the repository root:
+    python benchmarks/bench_startup.py [--runs 7] [--skip-collect]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Loaded lazily by the analyzers/exporters that need them
+HEAVY_PACKAGES = ('google.generativeai', 'IPython', 'numpy', 'pandas', 'reportlab',
+                  'docx', 'PyPDF2', 'PIL', 'nltk', 'rake_nltk')
+
+_PROBE = (
+    "import sys, time\n"
+    "t = time.perf_counter()\n"
+    "import {module}\n"
+    "elapsed = time.perf_counter() - t\n"
+    "heavy = [p for p in {heavy!r} if p in sys.modules]\n"
+    "print('RESULT', elapsed, ','.join(heavy))\n"
+)
+
+
+def _run(args):
+    return subprocess.run(args, cwd=ROOT, capture_output=True, text=True,
+                          env={**os.environ, 'PYTHONPATH': ROOT})
+
+
+def cold_import(module='src.mainAPI'):
+    """(seconds, heavy packages loaded) for one import in a new interpreter."""
+    proc = _run([sys.executable, '-c', _PROBE.format(module=module, heavy=HEAVY_PACKAGES)])
+    for line in proc.stdout.splitlines():
+        if line.startswith('RESULT'):
+            _, elapsed, heavy = (line.split(' ', 2) + [''])[:3]
+            return float(elapsed), [p for p in heavy.split(',') if p]
+    raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+
+def collect_tests():
+    """(seconds, pytest summary line) for `pytest --collect-only -q`."""
+    start = time.perf_counter()
+    proc = _run([sys.executable, '-m', 'pytest', '--collect-only', '-q', '-p', 'no:cacheprovider', 'tests'])
+    elapsed = time.perf_counter() - start
+    lines = [l for l in proc.stdout.splitlines() if l.strip()]
+    return elapsed, (lines[-1] if lines else proc.stderr.strip()[-200:])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--module', default='src.mainAPI')
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--skip-collect', action='store_true')
+    args = parser.parse_args()
+
+    cold_import(args.module)  # warm the bytecode cache
+    samples, heavy = [], []
+    for _ in range(args.runs):
+        elapsed, heavy = cold_import(args.module)
+        samples.append(elapsed)
+    print(f"cold import {args.module}: median {statistics.median(samples) * 1000:.0f} ms, "
+          f"min {min(samples) * 1000:.0f} ms over {args.runs} runs")
+    print(f"  heavy packages loaded at import: {', '.join(heavy) if heavy else 'none'}")
+
+    if not args.skip_collect:
+        elapsed, summary = collect_tests()
+        print(f"pytest --collect-only: {elapsed:.2f} s ({summary})")
+
+
+if __name__ == '__main__':
+    main()
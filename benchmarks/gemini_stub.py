@@ -0,0 +1,154 @@
+"""
+Local stand-in for google.generativeai, for load tests and benchmarks.
+
+install() registers stub `google.generativeai` and `google.generativeai.types`
+modules, so AIService and the routes that import the SDK directly get a
+GenerativeModel whose generate_content sleeps for a configurable latency
+(standing in for the network round trip) and returns a canned response:
+
+  - a JSON object when the prompt asks for JSON (project analysis, document
+    analysis)
+  - bullet lines otherwise (resume bullets, summaries)
+
+Responses are shaped like the SDK's (candidates[0].content.parts[*].text,
+finish_reason 1 = STOP, .text), which is all ai_service reads.
+
+    from benchmarks import gemini_stub
+    gemini_stub.install(latency=0.2)   # before the first AIService is built
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+import time
+import types
+
+JSON_RESPONSE = {
+    "ai_description": "A well structured project that demonstrates data processing, API design and testing.",
+    "summary": "Service that ingests records, validates them and exposes a REST API with reporting.",
+    "extracted_skills": ["Python", "REST APIs", "SQL", "Testing", "Data Analysis"],
+    "document_type": "report",
+    "topics": ["data pipelines", "reporting", "APIs"],
+    "writing_strengths": ["clear structure", "concise explanations"],
+    "complexity": "intermediate",
+    "contribution_score": 7,
+}
+
+TEXT_RESPONSE = "\n".join((
+    "• Built a REST API in Python serving 20+ endpoints for reporting and search",
+    "• Reduced report generation time by 40% by batching database queries",
+    "• Wrote unit and integration tests covering the ingestion pipeline",
+    "• Documented the data model and deployment steps for new contributors",
+))
+
+
+class GenerationConfig:
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class HarmCategory:
+    HARM_CATEGORY_HATE_SPEECH = 8
+    HARM_CATEGORY_HARASSMENT = 7
+    HARM_CATEGORY_SEXUALLY_EXPLICIT = 9
+    HARM_CATEGORY_DANGEROUS_CONTENT = 10
+
+
+class HarmBlockThreshold:
+    BLOCK_NONE = 4
+
+
+class _Part:
+    def __init__(self, text):
+        self.text = text
+
+
+class _Content:
+    def __init__(self, text):
+        self.parts = [_Part(text)]
+
+
+class _Candidate:
+    def __init__(self, text):
+        self.content = _Content(text)
+        self.finish_reason = 1  # STOP
+
+
+class _Response:
+    def __init__(self, text):
+        self.candidates = [_Candidate(text)]
+        self.text = text
+
+
+class GenerativeModel:
+    """Sleeps for latency (+/- jitter) per call, then returns a canned response."""
+
+    latency = 0.2
+    jitter = 0.05
+    _rng = random.Random(0)
+    _lock = threading.Lock()
+    calls = 0
+
+    def __init__(self, model_name=None, safety_settings=None, **kwargs):
+        self.model_name = model_name
+        self._safety_settings = safety_settings
+
+    def generate_content(self, contents, generation_config=None, **kwargs):
+        cls = type(self)
+        with cls._lock:
+            cls.calls += 1
+            delay = max(0.0, cls.latency + cls._rng.uniform(-cls.jitter, cls.jitter))
+        time.sleep(delay)
+        prompt = contents if isinstance(contents, str) else " ".join(
+            part for part in contents if isinstance(part, str))
+        if "json" in prompt.lower():
+            return _Response(json.dumps(JSON_RESPONSE))
+        return _Response(TEXT_RESPONSE)
+
+
+def configure(api_key=None, **kwargs):
+    pass
+
+
+def install(latency: float = 0.2, jitter: float = 0.05, seed: int = 0) -> types.ModuleType:
+    """Register the stub as google.generativeai; returns the stub module."""
+    GenerativeModel.latency = latency
+    GenerativeModel.jitter = min(jitter, latency)
+    GenerativeModel._rng = random.Random(seed)
+    GenerativeModel.calls = 0
+
+    genai_types = types.ModuleType("google.generativeai.types")
+    genai_types.GenerationConfig = GenerationConfig
+    genai_types.HarmCategory = HarmCategory
+    genai_types.HarmBlockThreshold = HarmBlockThreshold
+
+    genai = types.ModuleType("google.generativeai")
+    genai.__path__ = []
+    genai.configure = configure
+    genai.GenerativeModel = GenerativeModel
+    genai.GenerationConfig = GenerationConfig
+    genai.types = genai_types
+
+    google = sys.modules.get("google")
+    if google is None:
+        try:
+            import google
+        except ImportError:
+            google = types.ModuleType("google")
+            google.__path__ = []
+            sys.modules["google"] = google
+    google.generativeai = genai
+    sys.modules["google.generativeai"] = genai
+    sys.modules["google.generativeai.types"] = genai_types
+
+    # AIService refuses to start without a key; the stub never sends it anywhere
+    os.environ.setdefault("GEMINI_API_KEY", "stub-key")
+
+    # An AIService built before install() would still hold the real SDK
+    ai_service = sys.modules.get("src.AI.ai_service")
+    if ai_service is not None:
+        ai_service.genai = genai
+        ai_service._ai_service = None
+    return genai
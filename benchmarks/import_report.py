@@ -0,0 +1,104 @@
+"""
+Import-time report: where a module's import cost goes.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter and
+summarises the per-module timings:
+  - total wall time of the import
+  - the slowest modules by cumulative and by self time
+  - self time per top-level package (fastapi, sqlalchemy, google, ...)
+  - for each third-party package, the first project module that pulled it in
+
+Run from the repository root:
+    python benchmarks/import_report.py [MODULE] [--top 20]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List, NamedTuple
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PROJECT_PACKAGE = 'src'
+
+
+class ImportRecord(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def measure_imports(module: str) -> List[ImportRecord]:
+    """Import `module` in a fresh interpreter; one record per imported module."""
+    proc = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT, capture_output=True, text=True,
+        env={**os.environ, 'PYTHONPATH': ROOT},
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Records from `-X importtime` stderr output, in the order printed."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line.split(':', 1)[1].split('|')
+        # One space after the bar, then two per nesting level
+        depth = (len(name) - len(name.lstrip(' ')) - 1) // 2
+        records.append(ImportRecord(name.strip(), int(self_us), int(cumulative_us), depth))
+    return records
+
+
+def attribute_packages(records: List[ImportRecord]) -> Dict[str, str]:
+    """Third-party top-level package -> project module whose import loaded it first."""
+    # -X importtime prints children before their parent, so walk it in reverse
+    stack: List[ImportRecord] = []
+    pulled_by: Dict[str, str] = {}
+    for record in reversed(records):
+        while stack and stack[-1].depth >= record.depth:
+            stack.pop()
+        package = record.name.split('.')[0]
+        if package != PROJECT_PACKAGE and package not in pulled_by:
+            owners = [r.name for r in stack if r.name.split('.')[0] == PROJECT_PACKAGE]
+            if owners:
+                pulled_by[package] = owners[-1]
+        stack.append(record)
+    return pulled_by
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('module', nargs='?', default='src.mainAPI')
+    parser.add_argument('--top', type=int, default=20)
+    args = parser.parse_args()
+
+    records = measure_imports(args.module)
+    total = max(r.cumulative_us for r in records)
+    print(f"import {args.module}: {total / 1000:.0f} ms, {len(records)} modules\n")
+
+    print(f"Slowest by cumulative time (top {args.top}):")
+    for r in sorted(records, key=lambda r: -r.cumulative_us)[:args.top]:
+        print(f"  {r.cumulative_us / 1000:8.1f} ms  {r.name}")
+
+    print(f"\nSlowest by self time (top {args.top}):")
+    for r in sorted(records, key=lambda r: -r.self_us)[:args.top]:
+        print(f"  {r.self_us / 1000:8.1f} ms  {r.name}")
+
+    by_package = defaultdict(int)
+    for r in records:
+        by_package[r.name.split('.')[0]] += r.self_us
+    pulled_by = attribute_packages(records)
+    print("\nSelf time by top-level package:")
+    for package, us in sorted(by_package.items(), key=lambda kv: -kv[1])[:args.top]:
+        owner = f"  (via {pulled_by[package]})" if package in pulled_by else ''
+        print(f"  {us / 1000:8.1f} ms  {package}{owner}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,376 @@
+"""
+Deterministic synthetic corpora for the scanner benchmarks.
+
+Every generator takes a seed and produces the same file names, contents and
+modification times for the same arguments, so runs on different days (and
+machines with the same library versions) scan identical inputs:
+
+  - generate_code_repo:  Python / JavaScript / TypeScript / Java / Go / C++
+                         sources with imports, docstrings and comments, plus
+                         requirements.txt and package.json
+  - generate_text_corpus: .txt, .docx (python-docx) and .pdf (reportlab)
+                         documents built from a fixed vocabulary
+  - generate_media_set:  JPEG images with EXIF camera / software / date tags
+                         and PNG exports (Pillow)
+  - zip_tree:            a directory as a ZIP archive with fixed timestamps
+
+DOCX files embed the save time inside the archive, so their bytes differ
+between runs; their text does not.
+"""
+
+import os
+import random
+import zipfile
+from pathlib import Path
+from typing import Dict
+
+# Fixed epoch (2024-01-01 UTC) for generated mtimes
+BASE_MTIME = 1704067200
+
+WORDS = (
+    "account analysis application archive audit balance batch budget cache "
+    "catalog client cluster config customer dashboard dataset delivery device "
+    "document engine event export feature filter gateway graph history import "
+    "index inventory invoice job ledger metric model module network order "
+    "payment pipeline policy portal profile query queue record region report "
+    "request resource result schedule schema search session shipment snapshot "
+    "stream summary task template tenant token transaction upload user vendor "
+    "widget worker workflow"
+).split()
+
+PROSE = (
+    "The team led a research project on customer retention and presented the findings to stakeholders.",
+    "We applied statistical analysis and data visualization to quarterly survey results.",
+    "Project management included weekly planning, risk tracking and budget reviews.",
+    "The report discusses qualitative interviews, thematic coding and literature review methods.",
+    "Technical writing guidelines were followed for the user manual and API reference.",
+    "Marketing strategy combined social media campaigns with search engine optimization.",
+    "Critical thinking and problem solving were required to reconcile conflicting requirements.",
+    "The essay examines public policy, economics and the history of urban planning.",
+    "Collaboration with designers and engineers shaped the final product roadmap.",
+    "Financial modeling in spreadsheets projected revenue under three growth scenarios.",
+    "Leadership of a five person team covered mentoring, code review and sprint retrospectives.",
+    "Experimental design, hypothesis testing and regression were used to validate the results.",
+)
+
+CAMERAS = (("Canon", "EOS R6"), ("NIKON CORPORATION", "NIKON Z 6_2"), ("SONY", "ILCE-7M4"), ("FUJIFILM", "X-T5"))
+SOFTWARE = ("Adobe Photoshop 25.0 (Windows)", "Adobe Lightroom Classic 13.0", "GIMP 2.10.36", "Capture One 23")
+
+
+def _rng(seed: int, name: str) -> random.Random:
+    return random.Random(f"{seed}:{name}")
+
+
+def _identifier(rng: random.Random, parts: int = 2) -> str:
+    return "_".join(rng.choice(WORDS) for _ in range(parts))
+
+
+def _camel(rng: random.Random, parts: int = 2) -> str:
+    return "".join(rng.choice(WORDS).capitalize() for _ in range(parts))
+
+
+def _touch(path: Path, index: int) -> None:
+    os.utime(path, (BASE_MTIME + index * 60, BASE_MTIME + index * 60))
+
+
+# ============================================
+# CODE
+# ============================================
+
+def _python_source(rng: random.Random, functions: int) -> str:
+    lines = [
+        '"""' + " ".join(rng.choice(WORDS) for _ in range(8)).capitalize() + '."""',
+        "import json",
+        "import os",
+        rng.choice(("from flask import Flask, request", "from django.db import models",
+                    "import numpy as np", "import pandas as pd", "from fastapi import APIRouter")),
+        "",
+    ]
+    for _ in range(functions):
+        name = _identifier(rng)
+        arg = rng.choice(WORDS)
+        lines += [
+            "",
+            f"def {name}({arg}, limit=10):",
+            f'    """Return the {rng.choice(WORDS)} entries for {arg}."""',
+            f"    # TODO: cache {rng.choice(WORDS)} lookups per {rng.choice(WORDS)}",
+            "    results = []",
+            f"    for item in {arg}:",
+            f"        if item.get('{rng.choice(WORDS)}') and len(results) < limit:",
+            "            results.append(item)",
+            f"    return json.dumps(results) if os.getenv('{rng.choice(WORDS).upper()}') else results",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def _javascript_source(rng: random.Random, functions: int, typed: bool) -> str:
+    lines = [
+        rng.choice(("import React, { useState } from 'react';", "const express = require('express');",
+                    "import axios from 'axios';", "import { Component } from '@angular/core';")),
+        "",
+    ]
+    for _ in range(functions):
+        name = _camel(rng)
+        arg = rng.choice(WORDS)
+        signature = f"{arg}: any[], limit: number = 10" if typed else f"{arg}, limit = 10"
+        lines += [
+            "/**",
+            f" * Collect {rng.choice(WORDS)} records for the {rng.choice(WORDS)} view.",
+            " */",
+            f"export function {name[0].lower() + name[1:]}({signature}) {{",
+            f"  // filter out inactive {rng.choice(WORDS)} rows",
+            f"  return {arg}.filter((row) => row.{rng.choice(WORDS)}).slice(0, limit);",
+            "}",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def _java_source(rng: random.Random, functions: int, class_name: str) -> str:
+    lines = [
+        "package com.example." + rng.choice(WORDS) + ";",
+        "",
+        "import java.util.ArrayList;",
+        "import java.util.List;",
+        rng.choice(("import org.springframework.stereotype.Service;", "import javax.persistence.Entity;")),
+        "",
+        f"/** Handles {rng.choice(WORDS)} {rng.choice(WORDS)} operations. */",
+        f"public class {class_name} {{",
+    ]
+    for _ in range(functions):
+        name = _camel(rng)
+        lines += [
+            f"    // Loads {rng.choice(WORDS)} rows in batches",
+            f"    public List<String> load{name}(List<String> input, int limit) {{",
+            "        List<String> result = new ArrayList<>();",
+            "        for (String value : input) {",
+            "            if (result.size() < limit && !value.isEmpty()) {",
+            "                result.add(value.trim());",
+            "            }",
+            "        }",
+            "        return result;",
+            "    }",
+            "",
+        ]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _go_source(rng: random.Random, functions: int) -> str:
+    lines = ["package main", "", 'import (', '\t"fmt"', '\t"net/http"', ')', ""]
+    for _ in range(functions):
+        name = _camel(rng)
+        lines += [
+            f"// {name} writes the {rng.choice(WORDS)} summary.",
+            f"func {name}(w http.ResponseWriter, r *http.Request) {{",
+            f'\tfmt.Fprintf(w, "%s", r.URL.Query().Get("{rng.choice(WORDS)}"))',
+            "}",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def _cpp_source(rng: random.Random, functions: int) -> str:
+    lines = ["#include <vector>", "#include <string>", "#include <algorithm>", ""]
+    for _ in range(functions):
+        name = _identifier(rng)
+        lines += [
+            f"// Sort and deduplicate {rng.choice(WORDS)} keys",
+            f"std::vector<std::string> {name}(std::vector<std::string> keys) {{",
+            "    std::sort(keys.begin(), keys.end());",
+            "    keys.erase(std::unique(keys.begin(), keys.end()), keys.end());",
+            "    return keys;",
+            "}",
+            "",
+        ]
+    return "\n".join(lines)
+
+
+def generate_code_repo(root, files: int = 200, functions_per_file: int = 8, seed: int = 0) -> Dict[str, int]:
+    """
+    Write a multi-language source tree of `files` code files under `root`.
+
+    Returns {'files': n, 'bytes': total} for everything written.
+    """
+    root = Path(root)
+    rng = _rng(seed, "code")
+    kinds = ("py", "py", "py", "js", "ts", "java", "go", "cpp")
+    written, total = 0, 0
+    for i in range(files):
+        kind = kinds[i % len(kinds)]
+        package = root / "src" / f"pkg_{i // 50:03d}"
+        package.mkdir(parents=True, exist_ok=True)
+        if kind == "py":
+            path, text = package / f"{_identifier(rng)}_{i}.py", _python_source(rng, functions_per_file)
+        elif kind in ("js", "ts"):
+            path, text = package / f"{_camel(rng)}{i}.{kind}", _javascript_source(rng, functions_per_file, kind == "ts")
+        elif kind == "java":
+            class_name = f"{_camel(rng)}{i}"
+            path, text = package / f"{class_name}.java", _java_source(rng, functions_per_file, class_name)
+        elif kind == "go":
+            path, text = package / f"{_identifier(rng)}_{i}.go", _go_source(rng, functions_per_file)
+        else:
+            path, text = package / f"{_identifier(rng)}_{i}.cpp", _cpp_source(rng, functions_per_file)
+        path.write_text(text, encoding="utf-8")
+        _touch(path, i)
+        written += 1
+        total += len(text.encode("utf-8"))
+
+    manifests = {
+        "requirements.txt": "flask==3.0.0\nnumpy\npandas\nrequests\n",
+        "package.json": '{\n  "name": "bench-app",\n  "dependencies": {"react": "^18.2.0", "express": "^4.18.2"}\n}\n',
+        "README.md": "# Benchmark repository\n\nGenerated source tree for scanner benchmarks.\n",
+    }
+    for i, (name, text) in enumerate(manifests.items()):
+        path = root / name
+        path.write_text(text, encoding="utf-8")
+        _touch(path, files + i)
+        written += 1
+        total += len(text.encode("utf-8"))
+    return {"files": written, "bytes": total}
+
+
+# ============================================
+# TEXT
+# ============================================
+
+def _paragraphs(rng: random.Random, count: int):
+    return [" ".join(rng.choice(PROSE) for _ in range(rng.randint(3, 6))) for _ in range(count)]
+
+
+def _write_docx(path: Path, title: str, paragraphs) -> None:
+    from docx import Document
+
+    document = Document()
+    document.add_heading(title, level=1)
+    for paragraph in paragraphs:
+        document.add_paragraph(paragraph)
+    document.save(str(path))
+
+
+def _write_pdf(path: Path, title: str, paragraphs) -> None:
+    from reportlab.lib.pagesizes import letter
+    from reportlab.pdfgen import canvas
+    import textwrap
+
+    # invariant=1 leaves out the creation date and random document ID
+    pdf = canvas.Canvas(str(path), pagesize=letter, invariant=1)
+    pdf.setTitle(title)
+    y = 740
+    pdf.setFont("Helvetica-Bold", 14)
+    pdf.drawString(72, y, title)
+    pdf.setFont("Helvetica", 10)
+    y -= 28
+    for paragraph in paragraphs:
+        for line in textwrap.wrap(paragraph, 95) + [""]:
+            if y < 72:
+                pdf.showPage()
+                pdf.setFont("Helvetica", 10)
+                y = 740
+            pdf.drawString(72, y, line)
+            y -= 14
+    pdf.save()
+
+
+def generate_text_corpus(root, documents: int = 40, paragraphs_per_document: int = 12, seed: int = 0) -> Dict[str, int]:
+    """
+    Write `documents` documents under `root`, cycling .txt, .docx and .pdf.
+
+    Returns {'files': n, 'bytes': total}.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    rng = _rng(seed, "text")
+    total = 0
+    for i in range(documents):
+        title = f"{_camel(rng)} {rng.choice(('Report', 'Proposal', 'Essay', 'Case Study', 'Notes'))}"
+        paragraphs = _paragraphs(rng, paragraphs_per_document)
+        stem = f"{_identifier(rng)}_{i:04d}"
+        kind = ("txt", "docx", "pdf")[i % 3]
+        path = root / f"{stem}.{kind}"
+        if kind == "txt":
+            path.write_text(title + "\n\n" + "\n\n".join(paragraphs) + "\n", encoding="utf-8")
+        elif kind == "docx":
+            _write_docx(path, title, paragraphs)
+        else:
+            _write_pdf(path, title, paragraphs)
+        _touch(path, i)
+        total += path.stat().st_size
+    return {"files": documents, "bytes": total}
+
+
+# ============================================
+# MEDIA
+# ============================================
+
+def _draw_image(rng: random.Random, size):
+    from PIL import Image, ImageDraw
+
+    width, height = size
+    image = Image.new("RGB", size, tuple(rng.randrange(256) for _ in range(3)))
+    draw = ImageDraw.Draw(image)
+    for _ in range(24):
+        x0, y0 = rng.randrange(width), rng.randrange(height)
+        x1, y1 = x0 + rng.randrange(20, width // 2), y0 + rng.randrange(20, height // 2)
+        colour = tuple(rng.randrange(256) for _ in range(3))
+        if rng.random() < 0.5:
+            draw.rectangle((x0, y0, x1, y1), fill=colour)
+        else:
+            draw.ellipse((x0, y0, x1, y1), fill=colour)
+    return image
+
+
+def _exif(rng: random.Random, index: int):
+    from PIL import Image
+
+    make, model = rng.choice(CAMERAS)
+    taken = f"2024:{1 + index % 12:02d}:{1 + index % 28:02d} {8 + index % 10:02d}:{index % 60:02d}:00"
+    exif = Image.Exif()
+    exif[0x010F] = make                    # Make
+    exif[0x0110] = model                   # Model
+    exif[0x0131] = rng.choice(SOFTWARE)    # Software
+    exif[0x0132] = taken                   # DateTime
+    exif[0x013B] = "Benchmark Photographer"  # Artist
+    return exif
+
+
+def generate_media_set(root, images: int = 40, size=(640, 480), seed: int = 0) -> Dict[str, int]:
+    """
+    Write `images` images under `root`: JPEGs with EXIF, every fourth a PNG.
+
+    Returns {'files': n, 'bytes': total}.
+    """
+    root = Path(root)
+    root.mkdir(parents=True, exist_ok=True)
+    rng = _rng(seed, "media")
+    total = 0
+    for i in range(images):
+        image = _draw_image(rng, size)
+        subject = _identifier(rng, 1)
+        if i % 4 == 3:
+            path = root / "exports" / f"{subject}_{i:04d}.png"
+            path.parent.mkdir(exist_ok=True)
+            image.save(path, format="PNG")
+        else:
+            path = root / "raw" / f"IMG_{i:04d}_{subject}.jpg"
+            path.parent.mkdir(exist_ok=True)
+            image.save(path, format="JPEG", quality=85, exif=_exif(rng, i))
+        _touch(path, i)
+        total += path.stat().st_size
+    return {"files": images, "bytes": total}
+
+
+# ============================================
+# ARCHIVES
+# ============================================
+
+def zip_tree(root, zip_path, prefix: str = "") -> str:
+    """Zip everything under `root` (entries under `prefix`/) with fixed timestamps."""
+    root = Path(root)
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for path in sorted(p for p in root.rglob("*") if p.is_file()):
+            name = str(Path(prefix) / path.relative_to(root)) if prefix else str(path.relative_to(root))
+            info = zipfile.ZipInfo(name.replace(os.sep, "/"), date_time=(2024, 1, 1, 0, 0, 0))
+            info.compress_type = zipfile.ZIP_DEFLATED
+            archive.writestr(info, path.read_bytes())
+    return str(zip_path)
@@ -15,6 +15,7 @@ Integration Strategy:
 4. Provide both AI and non-AI modes
 """
 
+import logging
 import sys
 import os
 import re
@@ -29,10 +30,11 @@ try:
     from src.AI.ai_service import get_ai_service
     from src.Databases.database import db_manager
 except ImportError as e:
-    print(f"⚠️ Import error: {e}")
-    print("Make sure you're running from the project root")
+    logging.getLogger(__name__).error("Import error: %s (run from the project root)", e)
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 def ai_enhance_project_summary(
     project_dict: Dict[str, Any],
     ai_service=None,
@@ -90,7 +92,7 @@ def ai_enhance_project_summary(
             project_dict['technical_insights'] = tech_analysis.strip()
     
     except Exception as e:
-        print(f"⚠️ AI enhancement failed for {project_dict.get('project_name')}: {e}")
+        logger.warning("AI enhancement failed for %s: %s", project_dict.get('project_name'), e)
         project_dict['ai_description'] = f"A {', '.join(project_dict.get('skills', ['software'])[:2])} project."
     
     return project_dict
@@ -131,7 +133,7 @@ def summarize_projects_with_ai(
     if not use_ai:
         return result
     
-    print(f"\n🤖 Enhancing projects with AI descriptions...")
+    logger.debug("Enhancing projects with AI descriptions")
     ai_service = get_ai_service()
     
     # Determine which projects to enhance
@@ -155,7 +157,7 @@ def summarize_projects_with_ai(
             
         enhanced_count += 1
     
-    print(f"✅ Enhanced {enhanced_count} projects (💾 {cache_hits} from cache)")
+    logger.debug("Enhanced %d projects (%d from cache)", enhanced_count, cache_hits)
     
     # Step 3: Generate AI-powered summary
     if use_ai:
@@ -180,11 +182,8 @@ def _cache_ai_description(project_id: Optional[int], description: str):
         return
     try:
         db_manager.update_project(project_id, {"ai_description": desc})
-        # Optional: readback verify (remove later)
-        p = db_manager.get_project(project_id)
-        print("✅ Saved ai_description readback:", bool(getattr(p, "ai_description", None)), flush=True)
     except Exception as e:
-        print(f"⚠️ Cache write warning: {e}")
+        logger.warning("Could not save ai_description for project %s: %s", project_id, e)
 
 def _generate_portfolio_summary(result: Dict[str, Any], ai_service) -> str:
     """
@@ -224,7 +223,7 @@ def _generate_portfolio_summary(result: Dict[str, Any], ai_service) -> str:
         )
         return summary.strip()
     except Exception as e:
-        print(f"⚠️ AI summary generation failed: {e}")
+        logger.warning("AI summary generation failed: %s", e)
         return result['summary']  # Fall back to original summary
 
 def enhance_resume_bullets(bullets: List[str], project_name: str, skills: List[str]) -> List[str]:
@@ -273,7 +272,7 @@ Improved bullets:"""
         return bullets  # fall back to originals if parsing fails
 
     except Exception as e:
-        print(f"⚠️ Resume bullet enhancement failed: {e}")
+        logger.warning("Resume bullet enhancement failed: %s", e)
         return bullets  # fall back to originals on error
 
 
@@ -301,9 +300,7 @@ def generate_resume_bullets(project: Dict[str, Any], num_bullets: int = 3) -> Li
     
     try:
         response = ai_service.generate_text(prompt, temperature=0.6)
-        
-        # DEBUG: Print what we got
-        print(f"\n[DEBUG] AI Response:\n{repr(response)}\n")
+        logger.debug("Resume bullets AI response: %r", response)
         
         # ULTRA-ROBUST PARSING - Handles ANY format
         import re
@@ -328,12 +325,11 @@ def generate_resume_bullets(project: Dict[str, Any], num_bullets: int = 3) -> Li
             # If we got something substantial, keep it
             if cleaned and len(cleaned) >= 15:
                 bullets.append(cleaned)
-                print(f"[DEBUG] Added bullet: {cleaned[:50]}...")
                 
                 if len(bullets) >= num_bullets:
                     break
         
-        print(f"[DEBUG] Total bullets found: {len(bullets)}\n")
+        logger.debug("Resume bullets found: %d", len(bullets))
         
         # Return what we found
         if len(bullets) >= num_bullets:
@@ -343,7 +339,7 @@ def generate_resume_bullets(project: Dict[str, Any], num_bullets: int = 3) -> Li
             return bullets
         else:
             # Parsing completely failed - return fallback
-            print("[DEBUG] Parsing failed, using fallback")
+            logger.warning("Could not parse resume bullets from the AI response, using fallback")
             return [
                 f"Developed {project.get('project_name')} using {', '.join(project.get('skills', ['various technologies'])[:3])}",
                 f"Implemented features using {', '.join(project.get('skills', ['technologies'])[1:3])}",
@@ -351,7 +347,7 @@ def generate_resume_bullets(project: Dict[str, Any], num_bullets: int = 3) -> Li
             ][:num_bullets]
     
     except Exception as e:
-        print(f"⚠️ Resume bullet generation failed: {e}")
+        logger.warning("Resume bullet generation failed: %s", e)
         name = project.get('project_name', 'this project')
         skills = project.get('skills', ['various technologies'])
         fallbacks = [
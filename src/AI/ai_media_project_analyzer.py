@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 import json
@@ -11,9 +12,11 @@ try:
     from src.AI.ai_service import get_ai_service, AIService
     from src.Databases.database import db_manager
 except ImportError as e:
-    print(f"⚠️ Import error: {e}")
+    logging.getLogger(__name__).error("Import error: %s", e)
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 
 class AIMediaProjectAnalyzer:
     
@@ -115,7 +118,7 @@ class AIMediaProjectAnalyzer:
                 json.dump(data, f, indent=2)
 
         except Exception as e:
-            print(f"⚠️ Cache write error: {e}")
+            logger.warning("Cache write error: %s", e)
 
     # ---------- SKILLS EXTRACTION --------------------------
 
@@ -187,7 +190,7 @@ class AIMediaProjectAnalyzer:
 
     def analyze_project_complete(self, project_dict: Dict[str, Any]) -> Dict[str, Any]:
         name = project_dict.get("project_name", "Unnamed Media Project")
-        print(f"🎨 Analyzing media project: {name}")
+        logger.debug("Analyzing media project: %s", name)
 
         skills = self.extract_skills(project_dict)
         project_dict["extracted_skills"] = skills
@@ -222,10 +225,10 @@ class AIMediaProjectAnalyzer:
                             "contribution_score": analyzed["contribution_score"]
                         }
                     )
-                    print(f"💾 Updated DB for media project: {p.name}")
+                    logger.debug("Updated DB for media project: %s", p.name)
                     break
         except Exception as e:
-            print(f"⚠️ Database update failed: {e}")
+            logger.warning("Database update failed: %s", e)
 
         return analyzed
 
@@ -11,6 +11,7 @@ Based on TA announcement:
 - Uncover evidence of advanced computer science concepts
 """
 
+import logging
 import os
 import sys
 import json
@@ -28,11 +29,15 @@ try:
     from src.Databases.database import db_manager
     from src.Analysis.codeIdentifier import identify_language_and_framework
     from src.Extraction.keywordExtractorCode import extract_code_keywords_with_scores
+    from src.AI.project_context import SECTION_BUDGETS, get_project_context
+    from src.AI.tokens import truncate_to_tokens
 except ImportError as e:
-    print(f"⚠️ Import error: {e}")
-    print("Make sure you're running from the project root and Week 1 AI service is set up")
+    logging.getLogger(__name__).error(
+        "Import error: %s (run from the project root with the AI service set up)", e)
     sys.exit(1)
 
+logger = logging.getLogger(__name__)
+
 
 class AIProjectAnalyzer:
     """
@@ -141,7 +146,7 @@ class AIProjectAnalyzer:
                 cache_file.unlink()  # Delete stale cache
                 return None
         except Exception as e:
-            print(f"⚠️ Cache read error: {e}")
+            logger.warning("Cache read error: %s", e)
             return None
 
     def _cache_analysis(self, project_id: int, analysis_type: str, analysis: str):
@@ -158,139 +163,17 @@ class AIProjectAnalyzer:
                     'timestamp': datetime.now().isoformat()
                 }, f, indent=2)
         except Exception as e:
-            print(f"⚠️ Cache write error: {e}")
+            logger.warning("Cache write error: %s", e)
 
     def _gather_project_context(self, project) -> Dict[str, str]:
-        """Gather comprehensive context about a project for AI analysis."""
-        
-        # Safely handle languages with multiple fallbacks
-        try:
-            langs = project.languages
-            if langs and isinstance(langs, (list, tuple)) and len(langs) > 0:
-                languages_str = ', '.join(str(l) for l in langs)
-            else:
-                languages_str = 'Not detected'
-        except Exception as e:
-            print(f"⚠️  Error getting languages: {e}")
-            languages_str = 'Not detected'
-        
-        # Safely handle frameworks with multiple fallbacks
-        try:
-            fworks = project.frameworks
-            if fworks and isinstance(fworks, (list, tuple)) and len(fworks) > 0:
-                frameworks_str = ', '.join(str(f) for f in fworks)
-            else:
-                frameworks_str = 'None'
-        except Exception as e:
-            print(f"⚠️  Error getting frameworks: {e}")
-            frameworks_str = 'None'
-        
-        context = {
-            'project_name': project.name or 'Unnamed Project',
-            'languages': languages_str,
-            'frameworks': frameworks_str,
-            'file_count': project.file_count or 0,
-            'lines_of_code': project.lines_of_code or 0,
-            'date_created': project.date_created.strftime('%Y-%m-%d') if project.date_created else 'Unknown',
-            'date_modified': project.date_modified.strftime('%Y-%m-%d') if project.date_modified else 'Unknown',
-            'project_id': project.id
-        }
-
-        # Get keywords for context - with error handling
-        try:
-            keywords = db_manager.get_keywords_for_project(project.id)
-            if keywords:
-                context['keywords'] = ', '.join([str(kw.keyword) for kw in keywords[:20]])
-            else:
-                context['keywords'] = 'None extracted'
-        except Exception as e:
-            print(f"⚠️  Error getting keywords: {e}")
-            context['keywords'] = 'None extracted'
-
-        # Get key files (attempt to identify important files)
-        try:
-            context['key_files'] = self._identify_key_files(project)
-        except Exception as e:
-            print(f"⚠️  Error identifying key files: {e}")
-            context['key_files'] = 'Not available'
-
-        # Get code structure hints
-        try:
-            context['code_structure'] = self._analyze_structure(project)
-        except Exception as e:
-            print(f"⚠️  Error analyzing structure: {e}")
-            context['code_structure'] = 'Unknown structure'
-
-        # Check for version control
-        try:
-            if project.file_path:
-                git_path = Path(project.file_path) / '.git'
-                context['has_commits'] = 'Yes' if git_path.exists() else 'No'
-            else:
-                context['has_commits'] = 'Unknown'
-        except Exception as e:
-            print(f"⚠️  Error checking git: {e}")
-            context['has_commits'] = 'Unknown'
-
+        """
+        Prompt context for a project. Comes from the shared project digest,
+        so the overview, technical depth and skills prompts reuse one
+        keyword query and tree walk per content version.
+        """
+        context = get_project_context(project)
+        context['project_id'] = project.id
         return context
-    
-    def _identify_key_files(self, project) -> str:
-        """Identify important files in the project structure."""
-        if not project.file_path or not Path(project.file_path).exists():
-            return "Not available"
-
-        key_patterns = {
-            'entry': ['main.py', 'app.py', 'index.js', 'main.js', 'server.js', 'index.html'],
-            'config': ['package.json', 'requirements.txt', 'Cargo.toml', 'pom.xml', 'build.gradle'],
-            'test': ['test_', '_test.', 'spec.', '.test.', '.spec.'],
-            'readme': ['README', 'readme']
-        }
-
-        found = []
-        try:
-            project_path = Path(project.file_path)
-            for file in project_path.rglob('*'):
-                if file.is_file():
-                    name = file.name.lower()
-                    for category, patterns in key_patterns.items():
-                        if any(pattern in name for pattern in patterns):
-                            found.append(f"{file.name} ({category})")
-                            break
-                if len(found) >= 5:
-                    break
-        except Exception:
-            return "Not available"
-
-        return ', '.join(found[:5]) if found else "Standard project structure"
-
-    def _analyze_structure(self, project) -> str:
-        """Analyze project structure for patterns."""
-        if not project.file_path or not Path(project.file_path).exists():
-            return "Unknown structure"
-
-        try:
-            project_path = Path(project.file_path)
-            dirs = [d.name for d in project_path.iterdir() if d.is_dir() and not d.name.startswith('.')]
-
-            patterns = []
-            if any(d in ['src', 'lib'] for d in dirs):
-                patterns.append("organized source structure")
-            if any(d in ['test', 'tests', '__tests__'] for d in dirs):
-                patterns.append("dedicated test directory")
-            if any(d in ['docs', 'documentation'] for d in dirs):
-                patterns.append("documentation")
-            if any(d in ['api', 'routes', 'controllers'] for d in dirs):
-                patterns.append("API/web architecture")
-            if any(d in ['models', 'schemas'] for d in dirs):
-                patterns.append("data modeling")
-            if any(d in ['components', 'views'] for d in dirs):
-                patterns.append("component-based UI")
-
-            if patterns:
-                return ', '.join(patterns)
-            return f"{len(dirs)} directories, flat structure"
-        except Exception:
-            return "Unknown structure"
 
     def analyze_project_overview(self, project_id: int) -> Optional[str]:
         """
@@ -313,7 +196,7 @@ class AIProjectAnalyzer:
         # Generate prompt - use the context dict
         prompt = self.ANALYSIS_PROMPTS['overview'].format(**context)
 
-        print(f"🤖 Generating overview for: {project.name}...")
+        logger.debug("Generating overview for: %s", project.name)
 
         result = ai_service.generate_text(prompt)
         self.cache[cache_key] = result
@@ -349,7 +232,7 @@ class AIProjectAnalyzer:
         prompt = self.ANALYSIS_PROMPTS['technical_depth'].format(**context)
 
         # Get AI analysis
-        print(f"🔬 Performing deep technical analysis for: {project.name}...")
+        logger.debug("Performing technical analysis for: %s", project.name)
         analysis_text = self.ai_service.generate_text(
             prompt,
             temperature=0.3,  # Lower temperature for factual analysis
@@ -359,7 +242,7 @@ class AIProjectAnalyzer:
         self.analyses_count += 1
 
         if analysis_text is None:
-            print("⚠️  Technical analysis failed - AI response was blocked or errored")
+            logger.warning("Technical analysis failed for project %s: AI response was blocked or errored", project_id)
             return {
                 'raw_analysis': 'Analysis failed - AI response was blocked',
                 'project_id': project_id,
@@ -401,14 +284,15 @@ class AIProjectAnalyzer:
 
         # Get technical depth for better skill extraction
         tech_analysis = self.analyze_technical_depth(project_id)
-        context['technical_patterns'] = tech_analysis.get('raw_analysis', 'None analyzed') if tech_analysis else 'None'
+        context['technical_patterns'] = truncate_to_tokens(
+            tech_analysis.get('raw_analysis', 'None analyzed'), SECTION_BUDGETS['technical_patterns']
+        ) if tech_analysis else 'None'
 
         # Generate prompt
         prompt = self.ANALYSIS_PROMPTS['skills_extraction'].format(**context)
 
         # Get AI analysis
-        # Get AI analysis
-        print(f"💡 Extracting demonstrable skills for: {project.name}...")
+        logger.debug("Extracting demonstrable skills for: %s", project.name)
         skills_text = self.ai_service.generate_text(
             prompt,
             temperature=0.2,
@@ -419,7 +303,7 @@ class AIProjectAnalyzer:
 
         # Check if AI generation failed
         if skills_text is None:
-            print("⚠️  Skills extraction failed - AI response was blocked or errored")
+            logger.warning("Skills extraction failed for project %s: AI response was blocked or errored", project_id)
             return []
 
         # Parse skills into structured format
@@ -509,18 +393,11 @@ class AIProjectAnalyzer:
         Perform complete AI analysis on a project.
         Returns all analysis types in one comprehensive result.
         """
-        import traceback  # Add this import at the top
-        
-        print(f"\n{'='*70}")
-        print(f"🤖 AI Analysis: Complete Project Analysis")
-        print(f"{'='*70}\n")
-
         project = db_manager.get_project(project_id)
         if not project:
             return {'error': 'Project not found'}
 
-        print(f"📁 Project: {project.name}")
-        print(f"🔬 Running comprehensive AI analysis...\n")
+        logger.debug("Running complete AI analysis for project %s (%s)", project_id, project.name)
 
         results = {
             'project_id': project_id,
@@ -537,31 +414,19 @@ class AIProjectAnalyzer:
 
         # Run all analyses with detailed error tracking
         try:
-            print("🔍 DEBUG: Starting overview analysis...")
             results['overview'] = self.analyze_project_overview(project_id)
-            print("✓ Overview complete")
-            
-            print("🔍 DEBUG: Starting technical depth analysis...")
             results['technical_depth'] = self.analyze_technical_depth(project_id)
-            print("✓ Technical depth complete")
-            
-            print("🔍 DEBUG: Starting skills extraction...")
             results['skills'] = self.extract_demonstrated_skills(project_id)
-            print("✓ Skills extraction complete")
-            
         except Exception as e:
             results['error'] = str(e)
-            print(f"❌ Analysis error: {e}")
-            print(f"🔍 DEBUG: Full traceback:")
-            traceback.print_exc()
+            logger.warning("AI analysis failed for project %s: %s", project_id, e, exc_info=True)
 
         # Update cache stats
         results['cache_stats']['analyses_run'] = self.analyses_count
         results['cache_stats']['cache_hits'] = self.cache_hits
 
-        print(f"\n✅ Analysis complete!")
-        print(f"📊 API calls made: {self.analyses_count}")
-        print(f"💾 Cache hits: {self.cache_hits}")
+        logger.debug("AI analysis of project %s done: %d API calls, %d cache hits",
+                     project_id, self.analyses_count, self.cache_hits)
 
         return results
     def batch_analyze_projects(self, project_ids: List[int], 
@@ -580,9 +445,7 @@ class AIProjectAnalyzer:
         if analysis_types is None:
             analysis_types = ['overview', 'technical_depth', 'skills']
 
-        print(f"\n{'='*70}")
-        print(f"🚀 Batch Analysis: {len(project_ids)} projects")
-        print(f"{'='*70}\n")
+        logger.debug("Batch analysis of %d projects", len(project_ids))
 
         results = []
         total_start_analyses = self.analyses_count
@@ -591,10 +454,10 @@ class AIProjectAnalyzer:
         for i, project_id in enumerate(project_ids, 1):
             project = db_manager.get_project(project_id)
             if not project:
-                print(f"⚠️ Project {project_id} not found, skipping...")
+                logger.warning("Project %s not found, skipping", project_id)
                 continue
 
-            print(f"\n[{i}/{len(project_ids)}] Processing: {project.name}")
+            logger.debug("[%d/%d] Processing: %s", i, len(project_ids), project.name)
 
             project_result = {
                 'project_id': project_id,
@@ -613,21 +476,16 @@ class AIProjectAnalyzer:
                 if 'skills' in analysis_types:
                     project_result['skills'] = self.extract_demonstrated_skills(project_id)
 
-                print(f"   ✅ Complete")
             except Exception as e:
                 project_result['error'] = str(e)
-                print(f"   ❌ Error: {e}")
+                logger.warning("Batch analysis failed for project %s: %s", project_id, e)
 
             results.append(project_result)
 
-        # Print batch summary
-        print(f"\n{'='*70}")
-        print(f"📊 Batch Analysis Summary")
-        print(f"{'='*70}")
-        print(f"Projects processed: {len(results)}")
-        print(f"Total API calls: {self.analyses_count - total_start_analyses}")
-        print(f"Cache hits: {self.cache_hits - total_start_cache}")
-        print(f"Cache hit rate: {(self.cache_hits - total_start_cache) / max(1, (self.analyses_count - total_start_analyses)) * 100:.1f}%")
+        api_calls = self.analyses_count - total_start_analyses
+        cache_hits = self.cache_hits - total_start_cache
+        logger.debug("Batch analysis done: %d projects, %d API calls, %d cache hits (%.1f%%)",
+                     len(results), api_calls, cache_hits, cache_hits / max(1, api_calls) * 100)
 
         return results
 
@@ -646,11 +504,11 @@ class AIProjectAnalyzer:
             })
 
             if success:
-                print(f"✅ Updated database for project {project_id}")
+                logger.debug("Updated database for project %s", project_id)
 
             return success
         except Exception as e:
-            print(f"❌ Database update error: {e}")
+            logger.warning("Database update error for project %s: %s", project_id, e)
             return False
 
 
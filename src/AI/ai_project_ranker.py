@@ -2,9 +2,11 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from typing import List, Dict, Any, Optional
-import math
-from copy import deepcopy
+import numpy as np
 from src.AI.ai_service import get_ai_service
+from src.Helpers.rankingMatrix import (
+    cosine_to, diverse_top_k, embedding_matrix, min_max, skill_incidence,
+)
 
 
 class AIProjectRanker:
@@ -30,28 +32,6 @@ class AIProjectRanker:
         # AI service (if embedding logic is used)
         self.ai_service = get_ai_service()
 
-    # ----------------------------------------
-    # Helpers
-    # ----------------------------------------
-
-    def _min_max(self, vals):
-        if not vals:
-            return [0] * len(vals)
-        lo, hi = min(vals), max(vals)
-        if lo == hi:
-            return [1] * len(vals)
-        return [(v - lo) / (hi - lo) for v in vals]
-
-    def _cosine(self, a, b):
-        if not a or not b:
-            return 0
-        dot = sum(x * y for x, y in zip(a, b))
-        mag1 = math.sqrt(sum(x * x for x in a))
-        mag2 = math.sqrt(sum(x * x for x in b))
-        if mag1 == 0 or mag2 == 0:
-            return 0
-        return dot / (mag1 * mag2)
-
     # ----------------------------------------
     # Main Ranking Function
     # ----------------------------------------
@@ -66,7 +46,8 @@ class AIProjectRanker:
         if not projects:
             return {"selected": [], "all_scored": []}
 
-        items = deepcopy(projects)
+        # Shallow copies: only top-level keys are added or replaced below
+        items = [dict(p) for p in projects]
 
         # Ensure baseline fields
         for p in items:
@@ -79,79 +60,72 @@ class AIProjectRanker:
             p.setdefault("contributors", [])
             p.setdefault("embedding", None)
 
-        # Infer missing metrics
-        for p in items:
+        def column(key):
+            return np.array([p.get(key) or 0 for p in items], dtype=np.float64)
 
-            # A) Time spent from LOC
-            if p.get("time_spent", 0) == 0:
-                loc = p.get("lines_of_code", 0)
-                p["time_spent"] = max(1, loc / 500)
-
-            # B) Success score from file_count + LOC
-            if p.get("success_score", 0) == 0:
-                files = p.get("file_count", 1)
-                loc = p.get("lines_of_code", 1)
-                p["success_score"] = min(100, (files * 5) + (loc / 200)) / 100
-
-            # C) Contribution score from contributors
-            if p.get("contribution_score", 0) == 0:
-                contributors = p.get("contributors", [])
-                if isinstance(contributors, list) and len(contributors) > 0:
-                    p["contribution_score"] = 1 / len(contributors)
-                else:
-                    p["contribution_score"] = 1.0
-
-        # Normalize metrics
-        t_norm = self._min_max([p["time_spent"] for p in items])
-        s_norm = self._min_max([p["success_score"] for p in items])
-        c_norm = self._min_max([p["contribution_score"] for p in items])
-
-        # Compute scores
-        for i, p in enumerate(items):
-
-            # Base weighted score
-            base = (
-                self.weights["time"] * t_norm[i] +
-                self.weights["success"] * s_norm[i] +
-                self.weights["contribution"] * c_norm[i]
-            )
+        time_spent = column("time_spent")
+        success = column("success_score")
+        contribution = column("contribution_score")
+        loc = column("lines_of_code")
+        files = column("file_count")
+        n_contributors = np.array(
+            [len(c) if isinstance(c, list) else 0 for c in (p["contributors"] for p in items)],
+            dtype=np.float64,
+        )
 
-            # Skill matching
-            skill_score = 0
-            if target_skills:
-                overlap = len(set(p["skills"]) & set(target_skills))
-                if overlap > 0:
-                    skill_score = 2.0
+        # Infer missing metrics
+        # A) Time spent from LOC
+        time_spent = np.where(time_spent == 0, np.maximum(1, loc / 500), time_spent)
+        # B) Success score from file_count + LOC
+        success = np.where(success == 0, np.minimum(100, files * 5 + loc / 200) / 100, success)
+        # C) Contribution score from contributors
+        contribution = np.where(
+            contribution == 0,
+            np.where(n_contributors > 0, 1 / np.maximum(n_contributors, 1), 1.0),
+            contribution,
+        )
+
+        # Base weighted score over normalized metrics
+        base = (
+            self.weights["time"] * min_max(time_spent) +
+            self.weights["success"] * min_max(success) +
+            self.weights["contribution"] * min_max(contribution)
+        )
+
+        # Skill matching
+        vocab, incidence = skill_incidence([list(dict.fromkeys(p["skills"])) for p in items])
+        skill_score = np.zeros(len(items))
+        if target_skills:
+            wanted = np.array([skill in set(target_skills) for skill in vocab], dtype=bool)
+            skill_score = np.where((incidence & wanted).any(axis=1), 2.0, 0.0)
+
+        # Semantic similarity
+        semantic = np.zeros(len(items))
+        if target_embedding:
+            matrix, has_embedding = embedding_matrix([p["embedding"] for p in items],
+                                                     dim=len(target_embedding))
+            semantic = np.where(
+                has_embedding, self.semantic_alpha * cosine_to(matrix, target_embedding), 0.0
+            )
 
-            # Semantic similarity
-            semantic = 0
-            if p.get("embedding") and target_embedding:
-                semantic = self.semantic_alpha * self._cosine(
-                    p["embedding"], target_embedding
-                )
+        # Final combined score
+        scores = np.clip(base + skill_score + semantic, 0, 1.5)
 
-            # Final combined score
-            p["_rank_score"] = max(0, min(1.5, base + skill_score + semantic))
+        for p, t, s, c, score in zip(items, time_spent.tolist(), success.tolist(),
+                                     contribution.tolist(), scores.tolist()):
+            p["time_spent"], p["success_score"], p["contribution_score"] = t, s, c
+            p["_rank_score"] = score
 
         # Diversity-aware Top-k
-        selected, seen_skills = [], set()
-        remaining = sorted(items, key=lambda x: x["_rank_score"], reverse=True)
-
-        for _ in range(min(top_k, len(remaining))):
-            best_idx, best_val = None, -999
-
-            for i, p in enumerate(remaining):
-                new_skills = set(p["skills"]) - seen_skills
-                diversity_bonus = self.diversity_alpha if new_skills else 0
-                score = p["_rank_score"] + diversity_bonus
-
-                if score > best_val:
-                    best_val = score
-                    best_idx = i
-
-            chosen = remaining.pop(best_idx)
-            selected.append(chosen)
-            seen_skills.update(chosen["skills"])
+        picked = diverse_top_k(
+            scores,
+            incidence,
+            top_k,
+            bonus=lambda new_skills: np.where(new_skills > 0, self.diversity_alpha, 0.0),
+            max_bonus=abs(self.diversity_alpha),
+        )
+        selected = [items[i] for i in picked]
+        seen_skills = set().union(*(p["skills"] for p in selected))
 
         # Final output
         return {
@@ -10,6 +10,7 @@ Features:
 - Token estimation for cost management
 """
 
+import logging
 import os
 import time
 import json
@@ -20,9 +21,9 @@ from pathlib import Path
 from collections import deque
 from dataclasses import dataclass, asdict
 from dotenv import load_dotenv
-from pathlib import Path
-import google.generativeai as genai
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
+
+from src.Services import metrics
+from src.AI.tokens import estimate_tokens
 
 # Find .env — check src/ first, then project root as fallback
 env_path = Path(__file__).parent.parent / '.env'
@@ -30,18 +31,29 @@ if not env_path.exists():
     env_path = Path(__file__).parent.parent.parent / '.env'
 load_dotenv(dotenv_path=env_path)
 
-# DEBUG: Check if key loaded
-api_key_check = os.getenv('GEMINI_API_KEY')
-if api_key_check:
-    print(f"✅ API key loaded: {api_key_check[:10]}...")
+logger = logging.getLogger(__name__)
+
+if os.getenv('GEMINI_API_KEY'):
+    logger.debug("GEMINI_API_KEY loaded")
 else:
-    print("❌ API key NOT loaded from .env")
+    logger.info("GEMINI_API_KEY not set; AI features are unavailable")
 
-try:
-    import google.generativeai as genai
-except ImportError:
-    print("⚠️  google-generativeai not installed. Run: pip install google-generativeai")
-    genai = None
+# google.generativeai (and the IPython stack it pulls in) takes close to a
+# second to import, so it is loaded on first AIService construction instead
+# of whenever a router imports this module.
+genai = None
+
+
+def _load_genai():
+    """Import google.generativeai once; None if the package is missing."""
+    global genai
+    if genai is None:
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            logger.warning("google-generativeai not installed. Run: pip install google-generativeai")
+            return None
+    return genai
 
 
 @dataclass
@@ -68,6 +80,13 @@ class APIUsageStats:
         return cls(**data)
 
 
+def _record_ai_call(outcome: str, call_start: Optional[float]) -> None:
+    """Count one generate_text outcome; time it if the model was called."""
+    metrics.AI_REQUESTS.inc(outcome=outcome)
+    if call_start is not None:
+        metrics.AI_REQUEST_SECONDS.observe(time.perf_counter() - call_start, outcome=outcome)
+
+
 class RateLimiter:
     """Token bucket rate limiter for API requests"""
     
@@ -93,7 +112,7 @@ class RateLimiter:
         if len(self.request_times) >= self.requests_per_minute:
             sleep_time = 60 - (now - self.request_times[0])
             if sleep_time > 0:
-                print(f"⏳ Rate limit reached. Waiting {sleep_time:.1f}s...")
+                logger.info("Rate limit reached. Waiting %.1fs...", sleep_time)
                 time.sleep(sleep_time)
         
         # Record this request
@@ -126,7 +145,7 @@ class ResponseCache:
             with open(self.cache_file, 'w') as f:
                 json.dump(self.cache, f, indent=2)
         except Exception as e:
-            print(f"⚠️  Failed to save cache: {e}")
+            logger.warning("Failed to save cache: %s", e)
     
     def get_cache_key(self, prompt: str, temperature: float, max_tokens: int) -> str:
         """Generate unique cache key for a request"""
@@ -184,7 +203,7 @@ class AIService:
             requests_per_minute: Rate limit
             enable_cache: Whether to cache responses
         """
-        if genai is None:
+        if _load_genai() is None:
             raise RuntimeError("google-generativeai package not installed")
         
         # Get API key
@@ -209,6 +228,7 @@ class AIService:
         self.usage_stats = self._load_stats()   
 
         # Create model instance with relaxed safety settings for technical content
+        from google.generativeai.types import HarmCategory, HarmBlockThreshold
         self.model = genai.GenerativeModel(
             model_name=self.model_name,
             safety_settings={
@@ -219,8 +239,8 @@ class AIService:
             }
         )
         
-        print(f"✓ AI Service initialized with {self.model_name}")
-        print(f"✓ Model safety settings: {self.model._safety_settings}")  # Debug line        
+        logger.info("AI Service initialized with %s", self.model_name)
+        logger.debug("Model safety settings: %s", self.model._safety_settings)
         
     
     def _load_stats(self) -> APIUsageStats:
@@ -240,16 +260,11 @@ class AIService:
             with open(self.stats_file, 'w') as f:
                 json.dump(self.usage_stats.to_dict(), f, indent=2)
         except Exception as e:
-            print(f"⚠️  Failed to save stats: {e}")
+            logger.warning("Failed to save stats: %s", e)
     
     def _estimate_tokens(self, text: str) -> int:
-        """
-        Rough token estimation (more accurate would require tokenizer)
-        Rule of thumb: ~4 characters per token for English
-        """
-        if not text:
-            return 0
-        return len(text) // 4
+        """Token estimate for usage stats (see src/AI/tokens.py)"""
+        return estimate_tokens(text)
     
     def _calculate_cost(self, input_tokens: int, output_tokens: int) -> float:
         """Calculate cost in USD for a request"""
@@ -276,13 +291,15 @@ class AIService:
         Returns:
             Generated text or None if failed
         """
+        call_start = None  # set once the request goes to the model, for /metrics
         try:
             # Check cache first
             if use_cache and self.cache:
                 cached = self.cache.get(prompt, temperature, max_tokens)
                 if cached:
+                    metrics.AI_REQUESTS.inc(outcome="cached")
                     self.usage_stats.cached_responses += 1
-                    print("✓ Using cached response")
+                    logger.debug("Using cached response")
                     return cached
             
             # Rate limiting
@@ -301,6 +318,7 @@ class AIService:
             )
 
             # Retry up to 3 times on quota/rate-limit errors (429)
+            call_start = time.perf_counter()
             for _attempt in range(3):
                 try:
                     response = self.model.generate_content(
@@ -313,14 +331,15 @@ class AIService:
                         import re as _re
                         delay_match = _re.search(r'retry.*?(\d+(?:\.\d+)?)s', str(_e), _re.IGNORECASE)
                         delay = float(delay_match.group(1)) + 1 if delay_match else 5
-                        print(f"  ⚠️ Rate limited, retrying in {delay:.0f}s...")
+                        logger.info("Rate limited, retrying in %.0fs...", delay)
                         time.sleep(delay)
                     else:
                         raise
 
             # Check for safety blocks
             if not response.candidates or len(response.candidates) == 0:
-                print("✗ AI response blocked")
+                logger.warning("AI response blocked")
+                _record_ai_call("blocked", call_start)
                 self.usage_stats.failed_requests += 1
                 self._save_stats()
                 return None
@@ -330,15 +349,17 @@ class AIService:
             # Check finish reason
             # 1 = STOP (normal), 2 = MAX_TOKENS (truncated but valid), 3 = SAFETY, 4 = RECITATION
             if candidate.finish_reason == 3:  # SAFETY block
-                print(f"✗ AI blocked by safety filter")
+                logger.warning("AI blocked by safety filter")
+                _record_ai_call("blocked", call_start)
                 self.usage_stats.failed_requests += 1
                 self._save_stats()
                 return None
             elif candidate.finish_reason == 2:  # MAX_TOKENS - warning but continue
-                print(f"⚠️  Response truncated (hit max tokens limit)")
+                logger.warning("Response truncated (hit max tokens limit)")
                 # Continue processing - we still got partial response
             elif candidate.finish_reason not in [1, 2]:  # Not STOP or MAX_TOKENS
-                print(f"✗ AI stopped unexpectedly: finish_reason={candidate.finish_reason}")
+                logger.warning("AI stopped unexpectedly: finish_reason=%s", candidate.finish_reason)
+                _record_ai_call("failed", call_start)
                 self.usage_stats.failed_requests += 1
                 self._save_stats()
                 return None
@@ -358,14 +379,17 @@ class AIService:
                 if not result_text:
                     if candidate.finish_reason == 2:
                         # Truncated with no recoverable parts
-                        print("✗ Truncated response with no content parts — skipping")
+                        logger.warning("Truncated response with no content parts — skipping")
+                        _record_ai_call("failed", call_start)
                         return None
                     result_text = response.text
                 if not result_text or not isinstance(result_text, str):
-                    print("✗ Empty or invalid response text")
+                    logger.warning("Empty or invalid response text")
+                    _record_ai_call("failed", call_start)
                     return None
             except Exception as e:
-                print(f"✗ Could not get text: {e}")
+                logger.warning("Could not get text: %s", e)
+                _record_ai_call("failed", call_start)
                 return None
 
             
@@ -378,6 +402,7 @@ class AIService:
             self.usage_stats.total_cost_usd += cost
             
             # Update stats
+            _record_ai_call("success", call_start)
             self.usage_stats.successful_requests += 1
             self._save_stats()
             
@@ -385,14 +410,15 @@ class AIService:
             if use_cache and self.cache:
                 self.cache.set(prompt, temperature, max_tokens, result_text)
             
-            print(f"✓ Response received (~{output_tokens} tokens")
+            logger.debug("Response received (~%s tokens)", output_tokens)
             
             return result_text
             
         except Exception as e:
+            _record_ai_call("failed", call_start)
             self.usage_stats.failed_requests += 1
             self._save_stats()
-            print(f"✗ AI generation failed: {e}")
+            logger.error("AI generation failed: %s", e)
             return None
     
     def generate_with_retry(
@@ -419,10 +445,10 @@ class AIService:
             
             if attempt < max_retries - 1:
                 wait_time = (attempt + 1) * 2  # Exponential backoff
-                print(f"⏳ Retry {attempt + 1}/{max_retries} in {wait_time}s...")
+                logger.info("Retry %s/%s in %ss...", attempt + 1, max_retries, wait_time)
                 time.sleep(wait_time)
         
-        print(f"✗ All {max_retries} attempts failed")
+        logger.error("All %s attempts failed", max_retries)
         return None
     
     def get_usage_report(self) -> Dict[str, Any]:
@@ -473,13 +499,13 @@ class AIService:
         """Reset usage statistics"""
         self.usage_stats = APIUsageStats(last_reset=datetime.now())
         self._save_stats()
-        print("✓ Usage statistics reset")
+        logger.info("Usage statistics reset")
     
     def clear_cache(self):
         """Clear response cache"""
         if self.cache:
             self.cache.clear()
-            print("✓ Response cache cleared")
+            logger.info("Response cache cleared")
 
 
 # Global AI service instance (lazy initialization)
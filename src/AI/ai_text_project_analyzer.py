@@ -1,3 +1,4 @@
+import logging
 import os
 import sys
 import json
@@ -10,6 +11,8 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 try:
     from src.AI.ai_service import get_ai_service, AIService
     from src.Databases.database import db_manager
+    from src.AI.project_context import SECTION_BUDGETS, get_project_context
+    from src.AI.tokens import truncate_to_tokens
 except ImportError:
     try:
         from AI.ai_service import get_ai_service, AIService
@@ -17,6 +20,8 @@ except ImportError:
     except ImportError as e:
         raise ImportError(f"Cannot import AI/DB modules: {e}")
 
+logger = logging.getLogger(__name__)
+
 
 def _extract_text_from_file(file_path: str, max_chars: int = 4000) -> str:
     """Extract readable text from .txt, .md, .pdf, or .docx files."""
@@ -41,7 +46,7 @@ def _extract_text_from_file(file_path: str, max_chars: int = 4000) -> str:
                             break
                 return "\n".join(pages)[:max_chars]
             except Exception as e:
-                print(f"  PDF read error: {e}")
+                logger.warning("PDF read error for %s: %s", file_path, e)
                 return ""
 
         if ext in {".docx", ".doc"}:
@@ -51,7 +56,7 @@ def _extract_text_from_file(file_path: str, max_chars: int = 4000) -> str:
                 text = "\n".join(para.text for para in doc.paragraphs)
                 return text[:max_chars]
             except Exception as e:
-                print(f"  DOCX read error: {e}")
+                logger.warning("DOCX read error for %s: %s", file_path, e)
                 return ""
     except Exception:
         pass
@@ -108,37 +113,43 @@ For extracted_skills, include writing skills, subject matter expertise, document
             with open(path, "w") as f:
                 json.dump(data, f, indent=2)
         except Exception as e:
-            print(f"⚠️ Cache write error: {e}")
+            logger.warning("Cache write error: %s", e)
 
     def analyze_project_complete(self, project_dict: Dict[str, Any]) -> Dict[str, Any]:
         project_name = project_dict.get("project_name") or project_dict.get("name") or "Untitled"
-        print(f"🔎 Running complete analysis for: {project_name}")
+        logger.debug("Running complete analysis for: %s", project_name)
 
         cached = self._load_cache(project_name)
         if cached:
-            print(f"  ✓ Loaded from cache")
+            logger.debug("Loaded analysis of %s from cache", project_name)
             project_dict.update(cached)
             return project_dict
 
-        # Extract real text content from the file
+        # Stored projects share the cached, token-budgeted digest; ad hoc
+        # dicts (CLI) are read directly
         file_path = project_dict.get("file_path", "")
-        content = _extract_text_from_file(file_path) if file_path else ""
+        digest = get_project_context(project_dict["id"]) if project_dict.get("id") else None
+        if digest:
+            content = digest["content"]
+            file_type = digest["file_type"]
+        else:
+            content = _extract_text_from_file(file_path) if file_path else ""
+            file_type = Path(file_path).suffix.lstrip(".").upper() if file_path else "document"
         if not content:
             content = project_dict.get("ai_description", "") or "(no content available)"
 
         word_count = project_dict.get("word_count") or (len(content.split()) if content else 0)
-        file_type = Path(file_path).suffix.lstrip(".").upper() if file_path else "document"
 
         prompt = self.ANALYSIS_PROMPT.format(
             project_name=project_name,
             file_type=file_type or "document",
             word_count=word_count or "unknown",
-            content=content[:3500],
+            content=truncate_to_tokens(content, SECTION_BUDGETS["content"]),
         )
 
         raw = self.ai_service.generate_text(prompt, temperature=0.4, max_tokens=700)
         if not raw:
-            print("  ✗ No response from AI")
+            logger.warning("No AI response for text project %s", project_name)
             project_dict["extracted_skills"] = []
             project_dict["ai_description"] = ""
             project_dict["contribution_score"] = 0.0
@@ -189,5 +200,5 @@ For extracted_skills, include writing skills, subject matter expertise, document
                     })
                     break
         except Exception as e:
-            print(f"⚠️ Database update failed: {e}")
+            logger.warning("Database update failed: %s", e)
         return analyzed
@@ -0,0 +1,336 @@
+"""
+Project Context for AI Prompts
+==============================
+Builds one compact, token-budgeted digest of a project that the AI prompts
+(code analysis, text analysis, evidence extraction) all draw from, instead of
+each prompt re-querying keywords, walking the project tree and re-reading
+documents with its own character cut-off.
+
+The digest is built once per content version, a hash of the fields a scan or
+incremental update changes, and stored in the project_ai_contexts table with
+a small in-process LRU in front. A rescan changes the version, so the next
+prompt rebuilds it.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.AI.tokens import estimate_tokens, truncate_to_tokens
+from src.Databases.database import Project, db_manager
+
+logger = logging.getLogger(__name__)
+
+# Bump when the digest layout changes so stored digests are rebuilt
+CONTEXT_FORMAT = 1
+
+# Token budget per digest section, and for the technical analysis that the
+# skills prompt quotes back
+SECTION_BUDGETS = {
+    'keywords': 80,
+    'key_files': 60,
+    'code_structure': 40,
+    'content': 900,
+    'technical_patterns': 400,
+}
+
+MAX_KEYWORDS = 20
+MAX_KEY_FILES = 5
+MAX_DOCUMENTS = 8
+MIN_DOCUMENT_TOKENS = 100
+MEMORY_CACHE_SIZE = 128
+
+KEY_FILE_PATTERNS = {
+    'entry': ['main.py', 'app.py', 'index.js', 'main.js', 'server.js', 'index.html'],
+    'config': ['package.json', 'requirements.txt', 'cargo.toml', 'pom.xml', 'build.gradle'],
+    'test': ['test_', '_test.', 'spec.', '.test.', '.spec.'],
+    'readme': ['readme'],
+}
+
+STRUCTURE_PATTERNS = (
+    (('src', 'lib'), "organized source structure"),
+    (('test', 'tests', '__tests__'), "dedicated test directory"),
+    (('docs', 'documentation'), "documentation"),
+    (('api', 'routes', 'controllers'), "API/web architecture"),
+    (('models', 'schemas'), "data modeling"),
+    (('components', 'views'), "component-based UI"),
+)
+
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', 'venv', '.venv', 'dist', 'build'}
+PLAIN_TEXT_EXTENSIONS = {'.txt', '.md', '.rst', '.tex', '.csv'}
+DOCUMENT_EXTENSIONS = PLAIN_TEXT_EXTENSIONS | {'.docx', '.pdf'}
+
+
+# ============================================
+# DEDUPLICATION
+# ============================================
+
+def _normalize(text: str) -> str:
+    return ' '.join(text.lower().split())
+
+
+def dedupe_keywords(keywords: Iterable[str], exclude: Iterable[str] = ()) -> List[str]:
+    """
+    Keywords in order, without case variants, entries already named in
+    exclude (languages, frameworks) or single words that a kept phrase
+    already contains ("data" next to "data analysis").
+    """
+    excluded = {_normalize(e) for e in exclude}
+    candidates = []
+    for keyword in keywords:
+        norm = _normalize(str(keyword))
+        if norm and norm not in excluded and norm not in candidates:
+            candidates.append(norm)
+    phrase_words = {word for norm in candidates if ' ' in norm for word in norm.split()}
+    return [norm for norm in candidates if ' ' in norm or norm not in phrase_words]
+
+
+def dedupe_lines(text: str, seen: Optional[set] = None) -> str:
+    """Drop repeated lines (page headers, footers, boilerplate) and blank runs."""
+    seen = set() if seen is None else seen
+    kept = []
+    for line in text.splitlines():
+        norm = _normalize(line)
+        if not norm:
+            if kept and kept[-1]:
+                kept.append('')
+            continue
+        if norm in seen:
+            continue
+        seen.add(norm)
+        kept.append(line.strip())
+    return '\n'.join(kept).strip()
+
+
+# ============================================
+# DIGEST
+# ============================================
+
+def _join(values, empty: str) -> str:
+    if values and isinstance(values, (list, tuple)):
+        return ', '.join(str(v) for v in values)
+    return empty
+
+
+def _date(value) -> str:
+    return value.strftime('%Y-%m-%d') if hasattr(value, 'strftime') else 'Unknown'
+
+
+def _stamp(value):
+    # SQLite hands back naive datetimes; a freshly created row may hold aware ones
+    return value.replace(tzinfo=None).isoformat() if hasattr(value, 'isoformat') else repr(value)
+
+
+def _project_keywords(project, db) -> list:
+    """Keywords, highest score first (get_project() has them loaded already)."""
+    try:
+        keywords = list(project.keywords)
+    except Exception:
+        try:
+            return list(db.get_keywords_for_project(project.id))
+        except Exception as e:
+            logger.warning("Error getting keywords for project %s: %s", project.id, e)
+            return []
+    return sorted(keywords, key=lambda kw: -(kw.score or 0))
+
+
+def content_version(project, keywords) -> str:
+    """Hash of everything the digest is built from; changes on rescan or incremental update."""
+    parts = (
+        CONTEXT_FORMAT, project.name, project.file_path, project.project_type,
+        project.content_hash, _stamp(project.date_scanned), _stamp(project.date_created),
+        _stamp(project.date_modified), project.file_count, project.total_size_bytes,
+        project.lines_of_code, project.word_count, repr(project.languages), repr(project.frameworks),
+        len(keywords), max((kw.id or 0 for kw in keywords), default=0),
+    )
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+
+def _walk(root: str):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if d not in SKIP_DIRS and not d.startswith('.'))
+        for name in sorted(filenames):
+            yield os.path.join(dirpath, name)
+
+
+def _key_files(path: Optional[str]) -> str:
+    if not path or not os.path.isdir(path):
+        return "Not available"
+    found = []
+    for file_path in _walk(path):
+        name = os.path.basename(file_path).lower()
+        for category, patterns in KEY_FILE_PATTERNS.items():
+            if any(pattern in name for pattern in patterns):
+                found.append(f"{os.path.basename(file_path)} ({category})")
+                break
+        if len(found) >= MAX_KEY_FILES:
+            break
+    return ', '.join(found) if found else "Standard project structure"
+
+
+def _code_structure(path: Optional[str]) -> str:
+    if not path or not os.path.isdir(path):
+        return "Unknown structure"
+    dirs = {entry.name for entry in os.scandir(path) if entry.is_dir() and not entry.name.startswith('.')}
+    patterns = [label for names, label in STRUCTURE_PATTERNS if dirs.intersection(names)]
+    return ', '.join(patterns) if patterns else f"{len(dirs)} directories, flat structure"
+
+
+def _document_text(path: str, max_tokens: int) -> str:
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        if ext in PLAIN_TEXT_EXTENSIONS:
+            # About 4 characters a token for prose; no need to read past the budget
+            with open(path, encoding='utf-8', errors='ignore') as f:
+                return f.read(max_tokens * 8)
+        from src.Analysis.skillsExtractDocs import extract_text
+        return extract_text(path) or ""
+    except Exception as e:
+        logger.warning("Could not read %s for AI context: %s", path, e)
+        return ""
+
+
+def _documents(path: Optional[str]) -> List[str]:
+    if not path:
+        return []
+    if os.path.isfile(path):
+        return [path] if os.path.splitext(path)[1].lower() in DOCUMENT_EXTENSIONS else []
+    if not os.path.isdir(path):
+        return []
+    docs = [p for p in _walk(path) if os.path.splitext(p)[1].lower() in DOCUMENT_EXTENSIONS]
+    return docs[:MAX_DOCUMENTS]
+
+
+def _content(docs: List[str], budget: int) -> str:
+    """Document excerpts sharing the budget, each line appearing once across all of them."""
+    if not docs:
+        return ""
+    share = max(budget // len(docs), MIN_DOCUMENT_TOKENS)
+    seen, parts, used = set(), [], 0
+    for path in docs:
+        remaining = budget - used
+        if remaining < MIN_DOCUMENT_TOKENS // 2:
+            break
+        text = dedupe_lines(_document_text(path, share), seen)
+        if not text:
+            continue
+        if len(docs) > 1:
+            text = f"[{os.path.basename(path)}]\n{text}"
+        text = truncate_to_tokens(text, min(share, remaining))
+        parts.append(text)
+        used += estimate_tokens(text)
+    return '\n\n'.join(parts)
+
+
+def build_project_context(project, keywords=None) -> Dict[str, Any]:
+    """Build the digest for a project (no caching); every value is prompt-ready text."""
+    if keywords is None:
+        keywords = _project_keywords(project, db_manager)
+
+    try:
+        languages, frameworks = project.languages, project.frameworks
+    except Exception as e:
+        logger.warning("Error getting languages/frameworks: %s", e)
+        languages, frameworks = [], []
+    languages = languages if isinstance(languages, (list, tuple)) else []
+    frameworks = frameworks if isinstance(frameworks, (list, tuple)) else []
+
+    kept = dedupe_keywords((kw.keyword for kw in keywords), exclude=list(languages) + list(frameworks))
+    path = project.file_path if isinstance(project.file_path, str) else None
+    is_text = str(project.project_type or '').lower() == 'text'
+
+    digest = {
+        'project_name': project.name or 'Unnamed Project',
+        'languages': _join(languages, 'Not detected'),
+        'frameworks': _join(frameworks, 'None'),
+        'file_count': project.file_count or 0,
+        'lines_of_code': project.lines_of_code or 0,
+        'word_count': project.word_count or 'unknown',
+        'date_created': _date(project.date_created),
+        'date_modified': _date(project.date_modified),
+        'keywords': truncate_to_tokens(', '.join(kept[:MAX_KEYWORDS]), SECTION_BUDGETS['keywords'])
+                    or 'None extracted',
+        'has_commits': ('Yes' if os.path.isdir(os.path.join(path, '.git')) else 'No') if path else 'Unknown',
+        'key_files': 'Not available',
+        'code_structure': 'Unknown structure',
+        'file_type': 'document',
+        'content': '',
+    }
+
+    try:
+        if is_text:
+            docs = _documents(path)
+            digest['content'] = _content(docs, SECTION_BUDGETS['content'])
+            if docs:
+                common = Counter(os.path.splitext(d)[1] for d in docs).most_common(1)[0][0]
+                digest['file_type'] = common.lstrip('.').upper()
+        else:
+            digest['key_files'] = truncate_to_tokens(_key_files(path), SECTION_BUDGETS['key_files'])
+            digest['code_structure'] = truncate_to_tokens(_code_structure(path), SECTION_BUDGETS['code_structure'])
+    except OSError as e:
+        logger.warning("Error reading project files for AI context: %s", e)
+
+    digest['token_count'] = sum(estimate_tokens(str(v)) for v in digest.values())
+    return digest
+
+
+# ============================================
+# CACHE
+# ============================================
+
+# (project_id, version) -> digest
+_memory: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_memory_lock = threading.Lock()
+
+
+def _remember(key: tuple, digest: Dict[str, Any]) -> None:
+    with _memory_lock:
+        _memory[key] = digest
+        _memory.move_to_end(key)
+        while len(_memory) > MEMORY_CACHE_SIZE:
+            _memory.popitem(last=False)
+
+
+def clear_memory_cache() -> None:
+    with _memory_lock:
+        _memory.clear()
+
+
+def get_project_context(project, db=None) -> Optional[Dict[str, Any]]:
+    """
+    Digest for a project (a Project row or its id), built at most once per
+    content version. Only Project rows are stored in the database.
+    """
+    db = db or db_manager
+    if isinstance(project, int):
+        project = db.get_project(project)
+        if project is None:
+            return None
+
+    keywords = _project_keywords(project, db)
+    version = content_version(project, keywords)
+    key = (project.id, version)
+
+    with _memory_lock:
+        digest = _memory.get(key)
+        if digest is not None:
+            _memory.move_to_end(key)
+            return dict(digest)
+
+    persist = isinstance(project, Project)
+    stored = db.get_project_ai_context(project.id) if persist else None
+    if stored is not None and stored.version == version:
+        digest = stored.digest
+    else:
+        digest = build_project_context(project, keywords)
+        if persist:
+            try:
+                db.save_project_ai_context(project.id, version, digest, digest['token_count'])
+            except Exception as e:
+                logger.warning("Could not store AI context for project %s: %s", project.id, e)
+
+    _remember(key, digest)
+    return dict(digest)
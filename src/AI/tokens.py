@@ -0,0 +1,41 @@
+"""
+Token estimates for prompt budgeting and usage stats, without a tokenizer.
+"""
+
+import re
+
+
+_TOKEN_PIECES = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+
+
+def _piece_tokens(piece: str) -> int:
+    # Common words are a single BPE token; longer ones split every ~4 letters
+    return 1 if len(piece) <= 7 else (len(piece) + 3) // 4
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate BPE token count without a tokenizer: a token per short word,
+    per group of up to three digits and per symbol or non-Latin character.
+    len/4 undercounts code and punctuation-heavy text badly.
+    """
+    if not text:
+        return 0
+    return sum(_piece_tokens(m.group()) for m in _TOKEN_PIECES.finditer(text))
+
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to about max_tokens, at a sentence or word boundary."""
+    if not text or estimate_tokens(text) <= max_tokens:
+        return text or ""
+    used, end = 0, 0
+    for m in _TOKEN_PIECES.finditer(text):
+        used += _piece_tokens(m.group())
+        if used > max_tokens - 1:  # leave room for the ellipsis
+            break
+        end = m.end()
+    cut = text[:end]
+    sentence = max(cut.rfind('. '), cut.rfind('\n'))
+    if sentence >= len(cut) * 0.7:
+        cut = cut[:sentence + 1]
+    return cut.rstrip() + " …"
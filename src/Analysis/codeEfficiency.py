@@ -2,13 +2,135 @@
 
 import ast
 import re
+from functools import cached_property
 from typing import Dict, Optional
 from .codeIdentifier import identify_language_and_framework
 
+INTERPRETED_LANGUAGES = ["Python", "Ruby", "PHP", "R", "JavaScript", "TypeScript"]
+COMPILED_LANGUAGES = ["C", "C++", "Java", "Go", "Rust", "Kotlin", "Swift", "C#"]
+STATIC_LANGUAGES = ["HTML", "CSS", "SQL"]
+
+LOOP_PATTERNS = [r"\bfor\b", r"\bwhile\b", r"\bdo\b", r"\bforeach\b"]
+# The four keywords never overlap, so one alternation finds the same loops
+_LOOP_RE = re.compile("|".join(LOOP_PATTERNS))
+
+# ===============================
+# Per-file analysis context
+# ===============================
+class _PythonMetricsVisitor(ast.NodeVisitor):
+    """
+    Loop count, loop nesting depth and recursive calls in one traversal.
+    A call counts once for every enclosing function of the same name.
+    """
+    def __init__(self):
+        self.max_depth = 0
+        self.current_depth = 0
+        self.total_loops = 0
+        self.recursive_calls = 0
+        self._open_functions: Dict[str, int] = {}
+
+    def visit_For(self, node): self._enter_loop(node)
+    def visit_While(self, node): self._enter_loop(node)
+
+    def _enter_loop(self, node):
+        self.total_loops += 1
+        self.current_depth += 1
+        self.max_depth = max(self.max_depth, self.current_depth)
+        self.generic_visit(node)
+        self.current_depth -= 1
+
+    def visit_FunctionDef(self, node):
+        self._open_functions[node.name] = self._open_functions.get(node.name, 0) + 1
+        self.generic_visit(node)
+        self._open_functions[node.name] -= 1
+
+    def visit_Call(self, node):
+        name = getattr(node.func, "id", None)
+        if name is not None:
+            self.recursive_calls += self._open_functions.get(name, 0)
+        self.generic_visit(node)
+
+
+class CodeAnalysisContext:
+    """
+    Everything the scorers derive from one file, computed at most once:
+    the language, line count, AST and loop/recursion metrics. The time and
+    space scorers share one context instead of each re-identifying the
+    language and re-parsing the code.
+    """
+    def __init__(self, code: str, file_path: str, language: Optional[str] = None):
+        self.code = code
+        self.file_path = file_path
+        self._language = language
+        self._language_known = language is not None
+
+    @classmethod
+    def from_file(cls, file_path: str) -> "CodeAnalysisContext":
+        """Read the file once (UTF-8)."""
+        with open(file_path, "r", encoding="utf-8") as f:
+            return cls(f.read(), file_path)
+
+    @property
+    def language(self) -> Optional[str]:
+        if not self._language_known:
+            result = identify_language_and_framework(self.file_path, content=self.code)
+            self._language = result[0] if isinstance(result, tuple) else None
+            self._language_known = True
+        return self._language
+
+    @language.setter
+    def language(self, value: Optional[str]) -> None:
+        self._language = value
+        self._language_known = True
+
+    @cached_property
+    def line_count(self) -> int:
+        return len(self.code.splitlines())
+
+    @cached_property
+    def _parsed(self):
+        """(tree, None) or (None, exception)"""
+        try:
+            return ast.parse(self.code), None
+        except Exception as e:
+            return None, e
+
+    @cached_property
+    def python_metrics(self) -> Dict[str, int]:
+        """max_loop_depth, total_loops, recursive_calls; raises if parsing failed."""
+        tree, error = self._parsed
+        if error is not None:
+            raise error
+        visitor = _PythonMetricsVisitor()
+        visitor.visit(tree)
+        return {
+            "max_loop_depth": visitor.max_depth,
+            "total_loops": visitor.total_loops,
+            "recursive_calls": visitor.recursive_calls,
+        }
+
+    @cached_property
+    def keyword_loop_metrics(self) -> Dict[str, int]:
+        """Keyword-based loop count and brace nesting depth (compiled languages)."""
+        total_loops = len(_LOOP_RE.findall(self.code))
+        depth = 0
+        max_depth = 0
+        for line in self.code.splitlines():
+            if _LOOP_RE.search(line):
+                depth += 1
+                max_depth = max(max_depth, depth)
+            depth = max(0, depth - line.count("}"))
+        return {"max_loop_depth": max_depth, "total_loops": total_loops}
+
+
+def _context(code: str, file_path: str, context: Optional[CodeAnalysisContext]) -> CodeAnalysisContext:
+    return context if context is not None else CodeAnalysisContext(code, file_path)
+
 # ===============================
 # Main grading function
 # ===============================
-def grade_efficiency(code: str, file_path: str) -> Dict[str, Optional[float]]:
+def grade_efficiency(code: str, file_path: str,
+                     context: Optional[CodeAnalysisContext] = None) -> Dict[str, Optional[float]]:
     """
     Grades a piece of code for time and space complexity.
     Returns a dictionary with:
@@ -18,8 +140,9 @@ def grade_efficiency(code: str, file_path: str) -> Dict[str, Optional[float]]:
         - max_loop_depth: maximum nesting depth of loops
         - total_loops: total number of loops
         - notes: textual notes about detected issues
+    The file is identified and parsed once; both scorers share the context.
     """
-    result = identify_language_and_framework(file_path)
+    result = identify_language_and_framework(file_path, content=code)
     if isinstance(result, dict):
         notes = [result.get("error", "Unknown error")]
         return {"time_score": None, "space_score": None, "efficiency_score": None,
@@ -30,8 +153,10 @@ def grade_efficiency(code: str, file_path: str) -> Dict[str, Optional[float]]:
         return {"time_score": None, "space_score": None, "efficiency_score": None,
                 "max_loop_depth": None, "total_loops": None, "notes": ["Unknown language"]}
 
-    time_result = timeScore(code, file_path)
-    space_result = spaceScore(code, file_path)
+    context = _context(code, file_path, context)
+    context.language = language
+    time_result = timeScore(code, file_path, context)
+    space_result = spaceScore(code, file_path, context)
 
     time_score = time_result.get("time_score", 0)
     space_score = space_result.get("space_score", 0)
@@ -53,28 +178,30 @@ def grade_efficiency(code: str, file_path: str) -> Dict[str, Optional[float]]:
 # ===============================
 # Time Score Dispatcher
 # ===============================
-def timeScore(code: str, file_path: str) -> dict:
-    language, _ = identify_language_and_framework(file_path)
-    if language in ["Python", "Ruby", "PHP", "R", "JavaScript", "TypeScript"]:
-        return timeScore_interpreted(code, file_path)
-    elif language in ["C", "C++", "Java", "Go", "Rust", "Kotlin", "Swift", "C#"]:
-        return timeScore_compiled(code, file_path)
-    elif language in ["HTML", "CSS", "SQL"]:
-        return timeScore_static(code, file_path)
+def timeScore(code: str, file_path: str, context: Optional[CodeAnalysisContext] = None) -> dict:
+    context = _context(code, file_path, context)
+    language = context.language
+    if language in INTERPRETED_LANGUAGES:
+        return timeScore_interpreted(code, file_path, context)
+    elif language in COMPILED_LANGUAGES:
+        return timeScore_compiled(code, file_path, context)
+    elif language in STATIC_LANGUAGES:
+        return timeScore_static(code, file_path, context)
     else:
         return {"time_score": 0, "notes": ["Unknown language"], "max_loop_depth": 0, "total_loops": 0}
 
 # ===============================
 # Space Score Dispatcher
 # ===============================
-def spaceScore(code: str, file_path: str) -> dict:
-    language, _ = identify_language_and_framework(file_path)
-    if language in ["Python", "Ruby", "PHP", "R", "JavaScript", "TypeScript"]:
-        return spaceScore_interpreted(code, file_path)
-    elif language in ["C", "C++", "Java", "Go", "Rust", "Kotlin", "Swift", "C#"]:
-        return spaceScore_compiled(code, file_path)
-    elif language in ["HTML", "CSS", "SQL"]:
-        return spaceScore_static(code, file_path)
+def spaceScore(code: str, file_path: str, context: Optional[CodeAnalysisContext] = None) -> dict:
+    context = _context(code, file_path, context)
+    language = context.language
+    if language in INTERPRETED_LANGUAGES:
+        return spaceScore_interpreted(code, file_path, context)
+    elif language in COMPILED_LANGUAGES:
+        return spaceScore_compiled(code, file_path, context)
+    elif language in STATIC_LANGUAGES:
+        return spaceScore_static(code, file_path, context)
     else:
         return {"space_score": 0, "notes": ["Unknown language"], "max_loop_depth": 0, "total_loops": 0}
 
@@ -93,10 +220,11 @@ def decaying_penalty(base: float, count: int, line_count: int = 100, decay: floa
 # ===============================
 # Interpreted Language Scores
 # ===============================
-def timeScore_interpreted(code: str, file_path: str) -> dict:
+def timeScore_interpreted(code: str, file_path: str, context: Optional[CodeAnalysisContext] = None) -> dict:
+    context = _context(code, file_path, context)
     notes = []
     score = 100
-    file_lines = len(code.splitlines())
+    file_lines = context.line_count
     max_depth = 0
     total_loops = 0
 
@@ -106,50 +234,19 @@ def timeScore_interpreted(code: str, file_path: str) -> dict:
     base_recursion_penalty = max(10, min(35, 0.25 * file_lines))
 
     try:
-        tree = ast.parse(code)
-
-        # Loop detection
-        class LoopVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.max_depth = 0
-                self.current_depth = 0
-                self.total_loops = 0
-            def visit_For(self, node): self._enter_loop(node)
-            def visit_While(self, node): self._enter_loop(node)
-            def _enter_loop(self, node):
-                self.total_loops += 1
-                self.current_depth += 1
-                self.max_depth = max(self.max_depth, self.current_depth)
-                self.generic_visit(node)
-                self.current_depth -= 1
-
-        lv = LoopVisitor()
-        lv.visit(tree)
-        total_loops = lv.total_loops
-        max_depth = lv.max_depth
-
-        # Recursion detection
-        class RecVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.count = 0
-            def visit_FunctionDef(self, node):
-                func_name = node.name
-                for n in ast.walk(node):
-                    if isinstance(n, ast.Call) and getattr(n.func, "id", None) == func_name:
-                        self.count += 1
-                self.generic_visit(node)
-
-        rv = RecVisitor()
-        rv.visit(tree)
+        metrics = context.python_metrics
+        total_loops = metrics["total_loops"]
+        max_depth = metrics["max_loop_depth"]
+        recursive_calls = metrics["recursive_calls"]
 
         # Apply decaying penalties
         score -= decaying_penalty(base_loop_penalty, total_loops, file_lines)
         if max_depth > 1:
             score -= decaying_penalty(base_nested_penalty, max_depth - 1, file_lines)
-        score -= decaying_penalty(base_recursion_penalty, rv.count, file_lines)
+        score -= decaying_penalty(base_recursion_penalty, recursive_calls, file_lines)
 
-        if rv.count > 0:
-            notes.append(f"{rv.count} recursive function(s) detected")
+        if recursive_calls > 0:
+            notes.append(f"{recursive_calls} recursive function(s) detected")
 
     except Exception as e:
         score -= 30
@@ -159,10 +256,11 @@ def timeScore_interpreted(code: str, file_path: str) -> dict:
     score = max(0, min(100, score))
     return {"time_score": score, "notes": notes, "max_loop_depth": max_depth, "total_loops": total_loops}
 
-def spaceScore_interpreted(code: str, file_path: str) -> dict:
+def spaceScore_interpreted(code: str, file_path: str, context: Optional[CodeAnalysisContext] = None) -> dict:
+    context = _context(code, file_path, context)
     notes = []
     score = 100
-    file_lines = len(code.splitlines())
+    file_lines = context.line_count
     max_depth = 0
     total_loops = 0
 
@@ -172,50 +270,19 @@ def spaceScore_interpreted(code: str, file_path: str) -> dict:
     base_recursion_penalty = max(5, min(25, 0.2 * file_lines))
 
     try:
-        tree = ast.parse(code)
-
-        # Loop detection
-        class LoopVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.max_depth = 0
-                self.current_depth = 0
-                self.total_loops = 0
-            def visit_For(self, node): self._enter_loop(node)
-            def visit_While(self, node): self._enter_loop(node)
-            def _enter_loop(self, node):
-                self.total_loops += 1
-                self.current_depth += 1
-                self.max_depth = max(self.max_depth, self.current_depth)
-                self.generic_visit(node)
-                self.current_depth -= 1
-
-        lv = LoopVisitor()
-        lv.visit(tree)
-        total_loops = lv.total_loops
-        max_depth = lv.max_depth
-
-        # Recursion detection
-        class RecVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.count = 0
-            def visit_FunctionDef(self, node):
-                func_name = node.name
-                for n in ast.walk(node):
-                    if isinstance(n, ast.Call) and getattr(n.func, "id", None) == func_name:
-                        self.count += 1
-                self.generic_visit(node)
-
-        rv = RecVisitor()
-        rv.visit(tree)
+        metrics = context.python_metrics
+        total_loops = metrics["total_loops"]
+        max_depth = metrics["max_loop_depth"]
+        recursive_calls = metrics["recursive_calls"]
 
         # Apply decaying penalties
         score -= decaying_penalty(base_loop_penalty, total_loops, file_lines)
         if max_depth > 1:
             score -= decaying_penalty(base_nested_penalty, max_depth - 1, file_lines)
-        score -= decaying_penalty(base_recursion_penalty, rv.count, file_lines)
+        score -= decaying_penalty(base_recursion_penalty, recursive_calls, file_lines)
 
-        if rv.count > 0:
-            notes.append(f"{rv.count} recursive function(s) detected")
+        if recursive_calls > 0:
+            notes.append(f"{recursive_calls} recursive function(s) detected")
 
     except Exception as e:
         score -= 30
@@ -228,24 +295,16 @@ def spaceScore_interpreted(code: str, file_path: str) -> dict:
 # ===============================
 # Compiled Language Scores
 # ===============================
-def timeScore_compiled(code: str, file_path: str) -> dict:
+def timeScore_compiled(code: str, file_path: str, context: Optional[CodeAnalysisContext] = None) -> dict:
+    context = _context(code, file_path, context)
     notes = []
     score = 100
-    max_depth = 0
-    total_loops = 0
-
-    loop_patterns = [r"\bfor\b", r"\bwhile\b", r"\bdo\b", r"\bforeach\b"]
-    for pat in loop_patterns:
-        total_loops += len(re.findall(pat, code))
 
-    depth = 0
-    for line in code.splitlines():
-        if any(re.search(pat, line) for pat in loop_patterns):
-            depth += 1
-            max_depth = max(max_depth, depth)
-        depth = max(0, depth - line.count("}"))
+    metrics = context.keyword_loop_metrics
+    total_loops = metrics["total_loops"]
+    max_depth = metrics["max_loop_depth"]
 
-    file_lines = len(code.splitlines())
+    file_lines = context.line_count
     base_loop_penalty = max(5, min(25, 0.15 * file_lines))
     base_nested_penalty = max(5, min(30, 0.2 * file_lines))
     score -= decaying_penalty(base_loop_penalty, total_loops)
@@ -256,24 +315,16 @@ def timeScore_compiled(code: str, file_path: str) -> dict:
     score = max(0, min(100, score))
     return {"time_score": score, "notes": notes, "max_loop_depth": max_depth, "total_loops": total_loops}
 
-def spaceScore_compiled(code: str, file_path: str) -> dict:
+def spaceScore_compiled(code: str, file_path: str, context: Optional[CodeAnalysisContext] = None) -> dict:
+    context = _context(code, file_path, context)
     notes = []
     score = 100
-    max_depth = 0
-    total_loops = 0
-
-    loop_patterns = [r"\bfor\b", r"\bwhile\b", r"\bdo\b", r"\bforeach\b"]
-    for pat in loop_patterns:
-        total_loops += len(re.findall(pat, code))
 
-    depth = 0
-    for line in code.splitlines():
-        if any(re.search(pat, line) for pat in loop_patterns):
-            depth += 1
-            max_depth = max(max_depth, depth)
-        depth = max(0, depth - line.count("}"))
+    metrics = context.keyword_loop_metrics
+    total_loops = metrics["total_loops"]
+    max_depth = metrics["max_loop_depth"]
 
-    file_lines = len(code.splitlines())
+    file_lines = context.line_count
     base_loop_penalty = max(5, min(25, 0.15 * file_lines))
     base_nested_penalty = max(3, min(20, 0.1 * file_lines))
     score -= decaying_penalty(base_loop_penalty, total_loops)
@@ -286,10 +337,11 @@ def spaceScore_compiled(code: str, file_path: str) -> dict:
 # ===============================
 # Static Language Scores
 # ===============================
-def timeScore_static(code: str, file_path: str) -> dict:
+def timeScore_static(code: str, file_path: str, context: Optional[CodeAnalysisContext] = None) -> dict:
+    context = _context(code, file_path, context)
     notes = []
     score = 100
-    lines = len(code.splitlines())
+    lines = context.line_count
     if lines > 500:
         score -= 40
     elif lines > 200:
@@ -298,7 +350,7 @@ def timeScore_static(code: str, file_path: str) -> dict:
     score = max(0, min(100, score))
     return {"time_score": score, "notes": notes, "max_loop_depth": 0, "total_loops": 0}
 
-def spaceScore_static(code: str, file_path: str) -> dict:
+def spaceScore_static(code: str, file_path: str, context: Optional[CodeAnalysisContext] = None) -> dict:
     notes = []
     score = 100
     size = len(code.encode("utf-8"))
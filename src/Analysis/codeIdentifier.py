@@ -1,5 +1,6 @@
 import os
 import re
+from typing import Optional
 
 # We are able to add more, just basic for now
 LANGUAGE_BY_EXTENSION = {
@@ -43,15 +44,16 @@ FRAMEWORKS = {
     ],
 }
 
-def identify_language_and_framework(file_path: str):
+def identify_language_and_framework(file_path: str, content: Optional[str] = None):
     """
     Identifies the programming language and framework used in the provided code file.
     Args:
         file_path (str): Path to the code file
+        content (str, optional): The file's text, if the caller already read it
     Returns:
         tuple: (language, list of frameworks detected) or dict with error
     """
-    if not os.path.exists(file_path):
+    if content is None and not os.path.exists(file_path):
         return {"error": "File not found"}
 
     _, ext = os.path.splitext(file_path)
@@ -61,11 +63,12 @@ def identify_language_and_framework(file_path: str):
     
     language = LANGUAGE_BY_EXTENSION[ext]
 
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-    except Exception as e:
-        return {"error": str(e)}
+    if content is None:
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except Exception as e:
+            return {"error": str(e)}
     
     detected_frameworks = []
 
@@ -3,6 +3,7 @@ Coding Project Scanner
 Scans code projects, analyzes them using existing functions, and stores in database
 """
 
+import logging
 import os
 import sys
 from datetime import datetime, timezone
@@ -16,12 +17,16 @@ from src.UserPrompts.config_integration import config_manager
 from src.Analysis.file_hasher import compute_file_hash
 from src.Databases.database import db_manager
 from src.Analysis.codeIdentifier import identify_language_and_framework, LANGUAGE_BY_EXTENSION
-from src.Extraction.keywordExtractorCode import extract_code_keywords_with_scores
+from src.Extraction.keywordExtractorCode import extract_code_keywords_many, read_code_file
 from src.Analysis.skillsExtractCodingImproved import analyze_coding_skills_refined, SUBSKILL_KEYWORDS, CORE_FOLDERS, PERIPHERAL_FOLDERS, ADVANCED_KEYWORDS, SKILL_KEYWORDS
 from src.Helpers.fileFormatCheck import check_file_format, InvalidFileFormatError
 from src.Helpers.fileDataCheck import sniff_supertype
 from src.Helpers.classifier import supertype_from_extension
 from src.Helpers.gitContributorExtraction import is_git_repository, populate_contributors_for_project
+from src.Helpers.ignoreRules import IgnoreMatcher, normalize_extensions
+from src.Services import metrics
+
+logger = logging.getLogger(__name__)
 
 class CodingProjectScanner:
     """Scans and analyzes coding projects"""
@@ -51,8 +56,8 @@ class CodingProjectScanner:
         else:
             raise ValueError(f"Project path must be a file or directory: {project_path}")
 
-        # Load excluded file types from config
-        self.excluded_file_types = self._load_excluded_file_types()
+        # Load user exclusions from config once per scan
+        self.excluded_file_types, self.excluded_folders = self._load_user_exclusions()
 
         # Data storage
         self.code_files = []  # List of code file paths
@@ -61,30 +66,25 @@ class CodingProjectScanner:
         self.all_skills = {}
         self.all_keywords = []
 
-        # Directories to skip during scanning
-        self.skip_dirs = {
-            'node_modules', '__pycache__', '.git', '.venv', 'venv',
-            'env', 'dist', 'build', '.next', '.cache', 'vendor',
-            '.pytest_cache', 'coverage', '.mypy_cache', '__MACOSX'
-        }
-    def _load_excluded_file_types(self) -> set[str]:
-        """Load normalized excluded file extensions from user config."""
+        # Built-in skips + user exclusions + the project's .gitignore
+        self.ignore = IgnoreMatcher(
+            str(self.project_path.parent if self.single_file else self.project_path),
+            excluded_folders=self.excluded_folders,
+            excluded_file_types=self.excluded_file_types,
+        )
+
+    def _load_user_exclusions(self) -> tuple[set[str], list[str]]:
+        """Load normalized excluded file extensions and excluded folders from user config."""
         try:
             config = config_manager.get_or_create_config()
             raw_extensions = getattr(config, 'excluded_file_types', []) or []
+            folders = getattr(config, 'excluded_folders', []) or []
         except Exception:
-            return set()
-
-        normalized_extensions = set()
-        for extension in raw_extensions:
-            normalized_extension = str(extension).strip().lower()
-            if not normalized_extension:
-                continue
-            if not normalized_extension.startswith('.'):
-                normalized_extension = f'.{normalized_extension}'
-            normalized_extensions.add(normalized_extension)
+            return set(), []
 
-        return normalized_extensions
+        if not isinstance(folders, list):
+            folders = []
+        return normalize_extensions(raw_extensions), folders
 
     def scan_and_store(self, user_id: Optional[int] = None) -> int:
         """
@@ -96,10 +96,7 @@ class CodingProjectScanner:
         """
         from datetime import datetime, timezone
         
-        print(f"\n{'='*60}")
-        print(f"Scanning Coding Project: {self.project_name}")
-        print(f"Path: {self.project_path}")
-        print(f"{'='*60}\n")
+        logger.info("Scanning coding project: %s (%s)", self.project_name, self.project_path)
         
         # Check if already in database
         existing = db_manager.get_project_by_path(str(self.project_path))
@@ -122,24 +119,28 @@ class CodingProjectScanner:
                 existing = None
         
         # Step 1: Find all code files
-        print("Step 1: Finding code files...")
-        self._find_code_files()
-        print(f"  ✓ Found {len(self.code_files)} code files")
+        logger.info("Step 1: Finding code files...")
+        with metrics.phase("coding", "find_files"):
+            self._find_code_files()
+        logger.info("  ✓ Found %d code files", len(self.code_files))
 
         if len(self.code_files) == 0:
-            print("\n⚠️  No code files found. This may not be a coding project.")
+            logger.warning("No code files found in %s. This may not be a coding project.", self.project_path)
             return None
         
         # Step 2: Detect languages and frameworks
-        print("\nStep 2: Detecting languages and frameworks...")
-        self._detect_languages_and_frameworks()
-        print(f"  ✓ Languages: {', '.join(self.languages) if self.languages else 'None detected'}")
-        print(f"  ✓ Frameworks: {', '.join(self.frameworks) if self.frameworks else 'None detected'}")
+        logger.info("Step 2: Detecting languages and frameworks...")
+        with metrics.phase("coding", "detect_languages"):
+            self._detect_languages_and_frameworks()
+        logger.info("  ✓ Languages: %s", ', '.join(self.languages) if self.languages else 'None detected')
+        logger.info("  ✓ Frameworks: %s", ', '.join(self.frameworks) if self.frameworks else 'None detected')
 
         # Step 2b: Extract keywords and analyze skills
-        print("\nStep 2b: Analyzing skills...")
-        self._extract_keywords()
-        self._analyze_skills()
+        logger.info("Step 2b: Analyzing skills...")
+        with metrics.phase("coding", "extract_keywords"):
+            self._extract_keywords()
+        with metrics.phase("coding", "analyze_skills"):
+            self._analyze_skills()
 
         if is_incremental:
             project_id = existing.id
@@ -169,18 +170,19 @@ class CodingProjectScanner:
                 new_files_count += 1
 
             # 🔹 Recalculate metrics from ALL code files
-            print("\nStep X: Recalculating project metrics (incremental)...")
-            metrics = self._calculate_metrics()
+            logger.info("Recalculating project metrics (incremental)...")
+            with metrics.phase("coding", "calculate_metrics"):
+                project_metrics = self._calculate_metrics()
 
             # Ensure logical date order before storing
-            earliest = min(metrics['date_created'], metrics['date_modified'])
-            latest = max(metrics['date_created'], metrics['date_modified'])
+            earliest = min(project_metrics['date_created'], project_metrics['date_modified'])
+            latest = max(project_metrics['date_created'], project_metrics['date_modified'])
             
             # 🔹 Update EVERYTHING that depends on files
             db_manager.update_project(project_id, {
-                'lines_of_code': metrics['lines_of_code'],
-                'file_count': metrics['file_count'],
-                'total_size_bytes': metrics['total_size_bytes'],
+                'lines_of_code': project_metrics['lines_of_code'],
+                'file_count': project_metrics['file_count'],
+                'total_size_bytes': project_metrics['total_size_bytes'],
                 'date_created': earliest,
                 'date_modified': latest,
                 'languages': list(set(existing.languages + list(self.languages))),
@@ -188,12 +190,11 @@ class CodingProjectScanner:
                 'updated_at': datetime.now(timezone.utc)
             })
 
-            print(f"  ✓ Added {new_files_count} new files")
-            print(f"  ✓ Lines of code: {metrics['lines_of_code']:,}")
-            print(f"  ✓ Date range: {earliest.date()} → {latest.date()}")
-            print(f"  ✓ Total files: {metrics['file_count']}")
-
-            print("\n✓ Incremental update complete!")
+            logger.info("  ✓ Added %d new files", new_files_count)
+            logger.info("  ✓ Lines of code: %d", project_metrics['lines_of_code'])
+            logger.info("  ✓ Date range: %s → %s", earliest.date(), latest.date())
+            logger.info("  ✓ Total files: %d", project_metrics['file_count'])
+            logger.info("✓ Incremental update complete")
             
         else:
             # Create new project - FIX: Convert sets to lists
@@ -212,46 +213,48 @@ class CodingProjectScanner:
             project = db_manager.create_project(project_data)
             project_id = project.id
             
-            print(f"\n✓ Project stored with ID: {project_id}")
+            logger.info("✓ Project stored with ID: %d", project_id)
             
             # Step 3: Store file information
-            print("\nStep 3: Storing file information...")
-            for file_path in self.code_files:
-                file_hash = compute_file_hash(str(file_path))
-                file_data = {
-                    'project_id': project_id,
-                    'file_path': str(file_path),
-                    'file_name': file_path.name,
-                    'file_type': file_path.suffix,
-                    'file_size': file_path.stat().st_size,
-                    'file_created': datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc),
-                    'file_modified': datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc),
-                    'file_hash': file_hash
-                }
-                db_manager.add_file_to_project(file_data)
+            logger.info("Step 3: Storing file information...")
+            with metrics.phase("coding", "store_files"):
+                for file_path in self.code_files:
+                    file_hash = compute_file_hash(str(file_path))
+                    file_data = {
+                        'project_id': project_id,
+                        'file_path': str(file_path),
+                        'file_name': file_path.name,
+                        'file_type': file_path.suffix,
+                        'file_size': file_path.stat().st_size,
+                        'file_created': datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc),
+                        'file_modified': datetime.fromtimestamp(file_path.stat().st_mtime, tz=timezone.utc),
+                        'file_hash': file_hash
+                    }
+                    db_manager.add_file_to_project(file_data)
             
-            print(f"  ✓ Stored {len(self.code_files)} files")
+            logger.info("  ✓ Stored %d files", len(self.code_files))
             # Step X: Calculate + store metrics
-            print("\nStep X: Calculating project metrics...")
-            metrics = self._calculate_metrics()
+            logger.info("Calculating project metrics...")
+            with metrics.phase("coding", "calculate_metrics"):
+                project_metrics = self._calculate_metrics()
 
             # Ensure logical date order before storing
-            earliest = min(metrics['date_created'], metrics['date_modified'])
-            latest = max(metrics['date_created'], metrics['date_modified'])
+            earliest = min(project_metrics['date_created'], project_metrics['date_modified'])
+            latest = max(project_metrics['date_created'], project_metrics['date_modified'])
             
             db_manager.update_project(project_id, {
-                'lines_of_code': metrics['lines_of_code'],
-                'total_size_bytes': metrics['total_size_bytes'],
+                'lines_of_code': project_metrics['lines_of_code'],
+                'total_size_bytes': project_metrics['total_size_bytes'],
                 'date_created': earliest,
                 'date_modified': latest,
-                'file_count': metrics['file_count'],
+                'file_count': project_metrics['file_count'],
             })
-            print(f"  ✓ Lines of code: {metrics['lines_of_code']:,}")
-            print(f"  ✓ Date range: {earliest.date()} → {latest.date()}")
+            logger.info("  ✓ Lines of code: %d", project_metrics['lines_of_code'])
+            logger.info("  ✓ Date range: %s → %s", earliest.date(), latest.date())
             
             # Step 4: Store keywords
             if self.all_keywords:
-                print(f"\nStep 4: Storing keywords...")
+                logger.info("Step 4: Storing keywords...")
                 for keyword, score in self.all_keywords[:30]:
                     db_manager.add_keyword({
                         'project_id': project_id,
@@ -259,22 +262,24 @@ class CodingProjectScanner:
                         'score': float(score),
                         'category': 'code'
                     })
-                print(f"  ✓ Stored {min(len(self.all_keywords), 30)} keywords")
+                logger.info("  ✓ Stored %d keywords", min(len(self.all_keywords), 30))
         
         # Step 5: Extract Git contributors (if Git repository)
         if is_git_repository(str(self.project_path)):
-            project = db_manager.get_project(project_id)
-            try:
-                populate_contributors_for_project(project)
-            except Exception:
-                pass  # Silently skip Git errors
+            with metrics.phase("coding", "contributors"):
+                project = db_manager.get_project(project_id)
+                try:
+                    populate_contributors_for_project(project)
+                except Exception:
+                    pass  # Silently skip Git errors
 
         # Step 6: Compute importance score now that all data is stored
         try:
             from src.Analysis.importanceScores import calculate_importance_score
-            project = db_manager.get_project(project_id)
-            score = calculate_importance_score(project)
-            db_manager.update_project(project_id, {"importance_score": score})
+            with metrics.phase("coding", "importance_score"):
+                project = db_manager.get_project(project_id)
+                score = calculate_importance_score(project)
+                db_manager.update_project(project_id, {"importance_score": score})
         except Exception:
             pass
 
@@ -292,29 +297,29 @@ class CodingProjectScanner:
 
             # 0) Respect excluded file types from user config
             if file_ext in self.excluded_file_types:
-                print(f"Skipping excluded file type: {file_path} (ext={file_ext})")
+                logger.debug("Skipping excluded file type: %s (ext=%s)", file_path, file_ext)
                 return
 
             # 1) Global format check
             try:
                 check_file_format(str(file_path))
             except InvalidFileFormatError as e:
-                print(f"Skipping unsupported file: {file_path} — {e}")
+                logger.debug("Skipping unsupported file: %s — %s", file_path, e)
                 return
 
             # 2) Only allow files with known code extensions
             if file_ext not in LANGUAGE_BY_EXTENSION:
-                print(f"Skipping file with unsupported code extension: {file_path} (ext={file_ext})")
+                logger.debug("Skipping file with unsupported code extension: %s (ext=%s)", file_path, file_ext)
                 return
 
             # 3) Verify content is actually code
             try:
                 sniff_type = sniff_supertype(str(file_path))
                 if sniff_type != "code":
-                    print(f"Skipping file due to content mismatch: {file_path} (sniffed as {sniff_type})")
+                    logger.debug("Skipping file due to content mismatch: %s (sniffed as %s)", file_path, sniff_type)
                     return
             except Exception as e:
-                print(f"Skipping file due to sniffing error: {file_path} — {e}")
+                logger.debug("Skipping file due to sniffing error: %s — %s", file_path, e)
                 return
 
             self.code_files.append(file_path)
@@ -324,12 +329,9 @@ class CodingProjectScanner:
             process_file(self.project_path)
             return
 
-        # Directory mode
-        for root, dirs, files in os.walk(self.project_path):
-            dirs[:] = [d for d in dirs if d not in self.skip_dirs and not d.startswith('.')]
-
-            for filename in files:
-                process_file(Path(root) / filename)
+        # Directory mode: ignored folders are pruned without being opened
+        for entry in self.ignore.walk():
+            process_file(Path(entry.path))
 
 
     
@@ -355,19 +357,21 @@ class CodingProjectScanner:
     def _extract_keywords(self):
         """Extract keywords from code files using existing keyword extractor"""
         keyword_scores = defaultdict(float)
-        
+
+        texts, languages = [], []
         for file_path in self.code_files:
             try:
-                # Use existing function
-                keywords = extract_code_keywords_with_scores(str(file_path))
-                
-                # Aggregate scores (take top 10 per file)
-                for score, keyword in keywords[:10]:
-                    keyword_scores[keyword.lower()] += score
-                    
-            except Exception as e:
+                texts.append(read_code_file(str(file_path)))
+                languages.append(LANGUAGE_BY_EXTENSION.get(file_path.suffix.lower()))
+            except Exception:
                 # Skip files that can't be processed
                 continue
+
+        # One batch through the shared RAKE engine (identical files run once)
+        for keywords in extract_code_keywords_many(texts, languages):
+            # Aggregate scores (take top 10 per file)
+            for score, keyword in keywords[:10]:
+                keyword_scores[keyword.lower()] += score
         
         # Sort by score and keep top 50 overall
         self.all_keywords = sorted(
@@ -384,6 +388,7 @@ class CodingProjectScanner:
 
             result = analyze_coding_skills_refined(
                 folder_path=str(analysis_root),
+                ignore=self.ignore,
                 file_extensions={
                     ".py", ".js", ".jsx", ".ts", ".tsx",
                     ".java", ".cpp", ".cc", ".cxx", ".c",
@@ -394,7 +399,7 @@ class CodingProjectScanner:
                 }
             )
         except Exception as e:
-            print(f"  ⚠️ Skill analysis failed: {e}")
+            logger.warning("Skill analysis failed: %s", e)
             self.all_skills = {}
             self.skill_combinations = {}
             self.unified_skills = set()
@@ -434,12 +439,13 @@ class CodingProjectScanner:
 
 
     def _print_skills(self):
-        print(f"  ✓ Skills detected ({len(self.all_skills)} total):")
+        logger.info("  ✓ Skills detected (%d total)", len(self.all_skills))
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         for skill, data in sorted(self.all_skills.items(), key=lambda x: x[1]["score"], reverse=True):
-            print(f"       {skill} (score: {data['score']:.3f})")
+            logger.debug("       %s (score: %.3f)", skill, data['score'])
             if data["subskills"]:
-                subskills_sorted = sorted(data["subskills"].keys())
-                print(f"          🔧 {', '.join(subskills_sorted)}")
+                logger.debug("          🔧 %s", ', '.join(sorted(data["subskills"].keys())))
 
 
 
@@ -505,7 +511,7 @@ class CodingProjectScanner:
         
         # Store keywords (top 30)
         if self.all_keywords:
-            print(f"  → Storing {min(len(self.all_keywords), 30)} keywords...")
+            logger.info("  → Storing %d keywords...", min(len(self.all_keywords), 30))
             for keyword, score in self.all_keywords[:30]:
                 db_manager.add_keyword({
                     'project_id': project.id,
@@ -538,12 +544,13 @@ def scan_coding_project(project_path: str, user_id: Optional[int] = None) -> Opt
         scanner = CodingProjectScanner(project_path)
         return scanner.scan_and_store(user_id=user_id)
     except Exception as e:
-        print(f"\n✗ Error scanning project: {e}")
+        logger.error("✗ Error scanning project %s: %s", project_path, e)
         return None
 
 
 if __name__ == "__main__":
     """Command-line interface"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     if len(sys.argv) < 2:
         print("Usage: python codingProjectScanner.py <project_path>")
         sys.exit(1)
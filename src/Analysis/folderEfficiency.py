@@ -1,24 +1,46 @@
 # src/Analysis/folder_efficiency.py
 
 import os
-from typing import Dict, Any, List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, List, Optional
 from tqdm import tqdm
-from .codeEfficiency import grade_efficiency
+from .codeEfficiency import CodeAnalysisContext, grade_efficiency
 from src.Settings.config import EXT_SUPERTYPES  # import the mapping
 
 # Only include extensions classified as "code"
 CODE_EXTENSIONS = [ext for ext, typ in EXT_SUPERTYPES.items() if typ == "code"]
 
+# Below this many files a process pool costs more to start than it saves
+PARALLEL_MIN_FILES = 32
+
 def is_code_file(filename: str) -> bool:
     return any(filename.endswith(ext) for ext in CODE_EXTENSIONS)
 
-def grade_folder(folder_path: str) -> Dict[str, Any]:
+def grade_file(file_path: str) -> Dict[str, Any]:
+    """Read, parse and grade one file (a failure becomes a result with notes)."""
+    try:
+        context = CodeAnalysisContext.from_file(file_path)
+        return grade_efficiency(context.code, file_path, context)
+    except Exception as e:
+        return {
+            "file_path": file_path,
+            "time_score": None,
+            "space_score": None,
+            "efficiency_score": None,
+            "max_loop_depth": None,
+            "total_loops": None,
+            "notes": [f"Failed to read or parse file: {e}"]
+        }
+
+def grade_folder(folder_path: str, workers: Optional[int] = None) -> Dict[str, Any]:
     """
     Recursively grades all code files in a folder and aggregates results.
     Shows a progress bar.
-    """
-    file_results = []
 
+    Files are graded in a process pool (AST work holds the GIL) when there
+    are at least PARALLEL_MIN_FILES of them; workers=1 forces serial grading
+    and None uses every CPU.
+    """
     # Collect all code files first for tqdm
     code_files = []
     for root, _, files in os.walk(folder_path):
@@ -26,24 +48,20 @@ def grade_folder(folder_path: str) -> Dict[str, Any]:
             if is_code_file(file):
                 code_files.append(os.path.join(root, file))
 
-    # Process files with progress bar
-    for file_path in tqdm(code_files, desc="Grading files", unit="file"):
+    workers = workers or os.cpu_count() or 1
+    progress = dict(total=len(code_files), desc="Grading files", unit="file")
+
+    if workers > 1 and len(code_files) >= PARALLEL_MIN_FILES:
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                code = f.read()
-            result = grade_efficiency(code, file_path)
-            file_results.append(result)
+            chunksize = max(1, len(code_files) // (workers * 8))
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                file_results = list(tqdm(pool.map(grade_file, code_files, chunksize=chunksize), **progress))
+            return aggregate_results(file_results)
         except Exception as e:
-            file_results.append({
-                "file_path": file_path,
-                "time_score": None,
-                "space_score": None,
-                "efficiency_score": None,
-                "max_loop_depth": None,
-                "total_loops": None,
-                "notes": [f"Failed to read or parse file: {e}"]
-            })
+            print(f"[WARN] Parallel grading failed, grading serially: {e}")
 
+    # Process files with progress bar
+    file_results = [grade_file(file_path) for file_path in tqdm(code_files, **progress)]
     return aggregate_results(file_results)
 
 def aggregate_results(results: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -88,9 +106,10 @@ if __name__ == "__main__":
     import argparse
     parser = argparse.ArgumentParser(description="Grade code efficiency for all files in a folder")
     parser.add_argument("folder", help="Path to the folder to grade")
+    parser.add_argument("--workers", type=int, default=None, help="Processes to use (default: all CPUs)")
     args = parser.parse_args()
 
-    summary = grade_folder(args.folder)
+    summary = grade_folder(args.folder, workers=args.workers)
     print("=== Folder Efficiency Summary ===")
     for k, v in summary.items():
         print(f"{k}: {v}")
@@ -2,11 +2,25 @@
 # Importance scoring for MEDIA and TEXT projects only.
 # Coding projects are handled by a separate module.
 
-from src.Databases.database import db_manager, Project
+from src.Databases.database import db_manager, Project, File, Keyword
 from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
 import math
+import numpy as np
+from sqlalchemy import func, select
 from sqlalchemy.orm import joinedload
 
+
+def _project_kind(project_type) -> str:
+    """Route a project_type string to 'media', 'coding' or 'text'."""
+    project_type = (project_type or 'text').lower()
+    if 'media' in project_type or 'visual' in project_type:
+        return 'media'
+    elif 'cod' in project_type or 'software' in project_type or 'code' in project_type:
+        return 'coding'
+    return 'text'
+
+
 # ------------------------
 #  MEDIA & TEXT SCORING FORMULA
 # ------------------------
@@ -21,28 +35,30 @@ def calculate_importance_score(project):
     Note: Does not use lines_of_code as these are media/text projects.
     """
     
-    # If project is detached from session, re-fetch with eager loading
+    # If project is detached from session, re-fetch with its relationships loaded
+    # (skills/languages/tags are JSON columns and always come with the row)
     if project.id:
         try:
             session = db_manager.get_session()
-            project = session.query(Project).filter(Project.id == project.id).options(
-                joinedload(Project.keywords),
-                joinedload(Project.skills),
-                joinedload(Project.languages),
-                joinedload(Project.tags),
-                joinedload(Project.files)
-            ).first()
-            session.close()
+            try:
+                fresh = session.query(Project).filter(Project.id == project.id).options(
+                    joinedload(Project.keywords),
+                    joinedload(Project.files)
+                ).first()
+            finally:
+                session.close()
+            if fresh is not None:
+                project = fresh
         except Exception:
             # If re-fetch fails, continue with what we have
             pass
     
     # Determine project type and route to appropriate scorer
-    project_type = getattr(project, 'project_type', 'text').lower()
+    kind = _project_kind(getattr(project, 'project_type', 'text'))
 
-    if 'media' in project_type or 'visual' in project_type:
+    if kind == 'media':
         return _score_media_project(project)
-    elif 'cod' in project_type or 'software' in project_type or 'code' in project_type:
+    elif kind == 'coding':
         return _score_coding_project(project)
     else:  # text or default
         return _score_text_project(project)
@@ -237,49 +253,195 @@ def _score_media_project(project):
 
 
 # ------------------------
-# APPLY SCORES TO THE DB
+#  BATCH SCORING (same formulas, whole arrays at a time)
 # ------------------------
-def assign_importance_scores():
+
+# math.log1p element-wise: NumPy's own log1p may be a SIMD approximation that
+# differs from libm in the last bit, and scores must match the scalar path
+_libm_log1p = np.frompyfunc(math.log1p, 1, 1)
+
+_JSON_COUNT_COLUMNS = ('_skills', '_languages', '_tags')
+
+
+def _json_len(raw) -> int:
+    value = Project._safe_json_loads(raw, [])
+    return len(value) if value else 0
+
+
+def _days_since(dates: List[Optional[datetime]], now: datetime) -> Tuple[np.ndarray, np.ndarray]:
+    """Whole days since each date (floored like timedelta.days) and a has-date mask."""
+    naive_now = now.astimezone(timezone.utc).replace(tzinfo=None)
+    stamps = np.array(
+        [
+            (d.astimezone(timezone.utc).replace(tzinfo=None) if d.tzinfo else d) if d else naive_now
+            for d in dates
+        ],
+        dtype='datetime64[us]',
+    )
+    days = (np.datetime64(naive_now, 'us') - stamps) // np.timedelta64(1, 'D')
+    has_date = np.array([d is not None for d in dates], dtype=bool)
+    return days.astype(np.float64), has_date
+
+
+def _recency(days: np.ndarray, has_date: np.ndarray, window: int) -> np.ndarray:
+    return np.where(has_date, np.clip((window - days) / window, 0, 1) * 100, 0.0)
+
+
+def score_rows(rows, now: Optional[datetime] = None) -> List[float]:
     """
-    Loads media and text projects with related data eagerly loaded,
-    computes quality-based score for each, and saves the score back to the database.
-    
-    Filters for project_type in ['media', 'text', 'visual_media'].
+    Vectorized calculate_importance_score for rows carrying the scored
+    columns (see load_score_rows). Each type's formula is evaluated for
+    every row and the right one is picked per row.
+    """
+    if not rows:
+        return []
+    now = now or datetime.now(timezone.utc)
+
+    def column(name):
+        return np.array([getattr(r, name) or 0 for r in rows], dtype=np.float64)
+
+    word_count = column('word_count')
+    size_mb = column('total_size_bytes') / (1024 * 1024)
+    file_count = column('file_count')
+    loc = column('lines_of_code')
+    keyword_count = column('keyword_count')
+    actual_files = column('actual_file_count')
+    skill_count, lang_count, tag_count = (
+        np.array([_json_len(getattr(r, c)) for r in rows], dtype=np.float64)
+        for c in _JSON_COUNT_COLUMNS
+    )
+    days, has_date = _days_since([r.date_modified for r in rows], now)
+    kinds = np.array([_project_kind(r.project_type) for r in rows])
+
+    # TEXT
+    word_volume = np.minimum(word_count / 12000, 1) * 100
+    small = size_mb <= 1.0
+    size_volume = np.empty_like(size_mb)
+    size_volume[small] = np.minimum(
+        _libm_log1p(size_mb[small]).astype(np.float64) / math.log1p(1.0), 1) * 70
+    size_volume[~small] = 70 + np.minimum(
+        _libm_log1p(size_mb[~small] - 1.0).astype(np.float64) / math.log1p(19.0), 1) * 30
+    content_volume = np.maximum(word_volume, size_volume)
+    content_volume = np.where((size_mb >= 0.2) | (word_count >= 500),
+                              np.maximum(content_volume, 40), content_volume)
+    text_score = (
+        content_volume * 0.45 +
+        np.minimum(keyword_count / 35, 1) * 100 * 0.20 +
+        np.minimum(skill_count / 9, 1) * 100 * 0.15 +
+        np.minimum(file_count / 12, 1) * 100 * 0.10 +
+        _recency(days, has_date, 730) * 0.10
+    )
+
+    # CODING
+    coding_score = (
+        np.minimum(loc / 5000, 1) * 100 * 0.40 +
+        np.minimum(file_count / 25, 1) * 100 * 0.20 +
+        np.minimum((lang_count + tag_count) / 6, 1) * 100 * 0.20 +
+        np.minimum(skill_count / 8, 1) * 100 * 0.10 +
+        _recency(days, has_date, 730) * 0.10
+    )
+
+    # MEDIA
+    media_files = np.where(file_count != 0, file_count, actual_files)
+    complexity = (np.minimum(media_files / 30, 1) * 100 * 0.7 +
+                  np.minimum(size_mb / 500, 1) * 100 * 0.3)
+    media_score = (
+        complexity * 0.55 +
+        np.minimum((lang_count + tag_count) / 8, 1) * 100 * 0.20 +
+        np.minimum(keyword_count / 25, 1) * 100 * 0.10 +
+        np.minimum(skill_count / 6, 1) * 100 * 0.10 +
+        _recency(days, has_date, 1095) * 0.05
+    )
+
+    total = np.select([kinds == 'media', kinds == 'coding'], [media_score, coding_score], text_score)
+    # Python's round() is correctly rounded; np.round is not always
+    return [round(score, 2) for score in total.tolist()]
+
+
+def load_score_rows(user_id: Optional[int] = None, guest: bool = False,
+                    project_types: Optional[List[str]] = None, include_hidden: bool = True):
     """
+    Fetch every column the scorers read, plus keyword and file counts, for
+    a set of projects in one query (newest first).
+
+    Args:
+        user_id: Only this user's projects
+        guest: Only projects without an owner (ignored when user_id is set)
+        project_types: Only these project_type values
+        include_hidden: Include hidden projects
+    """
+    keyword_counts = (
+        select(Keyword.project_id, func.count(Keyword.id).label('n'))
+        .group_by(Keyword.project_id).subquery()
+    )
+    file_counts = (
+        select(File.project_id, func.count(File.id).label('n'))
+        .group_by(File.project_id).subquery()
+    )
+    stmt = (
+        select(
+            Project.id, Project.name, Project.custom_description, Project.description,
+            Project.ai_description, Project.project_type,
+            Project.word_count, Project.total_size_bytes, Project.file_count,
+            Project.lines_of_code, Project.date_modified,
+            Project._skills, Project._languages, Project._tags,
+            func.coalesce(keyword_counts.c.n, 0).label('keyword_count'),
+            func.coalesce(file_counts.c.n, 0).label('actual_file_count'),
+        )
+        .outerjoin(keyword_counts, keyword_counts.c.project_id == Project.id)
+        .outerjoin(file_counts, file_counts.c.project_id == Project.id)
+        .order_by(Project.date_modified.desc())
+    )
+    if user_id is not None:
+        stmt = stmt.where(Project.user_id == user_id)
+    elif guest:
+        stmt = stmt.where(Project.user_id.is_(None))
+    if project_types is not None:
+        stmt = stmt.where(Project.project_type.in_(project_types))
+    if not include_hidden:
+        stmt = stmt.where(Project.is_hidden == False)
+
     session = db_manager.get_session()
     try:
-        projects = session.query(Project).filter(
-            Project.project_type.in_(['media', 'text', 'visual_media', 'coding', 'software', 'code'])
-        ).options(
-            joinedload(Project.contributors),
-            joinedload(Project.files),
-            joinedload(Project.keywords),
-            joinedload(Project.skills),
-            joinedload(Project.languages),
-            joinedload(Project.tags)
-        ).all()
-
-        if not projects:
-            print("No media or text projects found.")
-            return []
-
-        results = []
-
-        for p in projects:
-            score = calculate_importance_score(p)
-
-            # Save score back into DB as success_score
-            p.success_score = score
-            session.add(p)
-
-            results.append((p, score))
-
-        session.commit()
-        return results
+        return session.execute(stmt).all()
     finally:
         session.close()
 
 
+def compute_importance_scores(user_id: Optional[int] = None, guest: bool = False,
+                              project_types: Optional[List[str]] = None,
+                              include_hidden: bool = True, save: bool = True):
+    """
+    Score a set of projects in one pass: one query to load, array maths to
+    score, one executemany UPDATE to save importance_score.
+
+    Returns:
+        list[(row, score)] in load order; rows have id, name, descriptions and the scored columns
+    """
+    rows = load_score_rows(user_id=user_id, guest=guest, project_types=project_types,
+                           include_hidden=include_hidden)
+    scores = score_rows(rows)
+    if save:
+        db_manager.bulk_update_importance_scores({row.id: score for row, score in zip(rows, scores)})
+    return list(zip(rows, scores))
+
+
+# ------------------------
+# APPLY SCORES TO THE DB
+# ------------------------
+def assign_importance_scores():
+    """
+    Computes the quality-based score for every media, text and coding
+    project and saves it back to the database as importance_score.
+    """
+    results = compute_importance_scores(
+        project_types=['media', 'text', 'visual_media', 'coding', 'software', 'code']
+    )
+    if not results:
+        print("No media or text projects found.")
+    return results
+
+
 if __name__ == "__main__":
     scored = assign_importance_scores()
     for p, s in scored:
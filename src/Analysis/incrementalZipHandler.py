@@ -16,27 +16,17 @@ from src.Analysis.codingProjectScanner import CodingProjectScanner
 from src.Analysis.mediaProjectScanner import MediaProjectScanner
 from src.Analysis.textDocumentScanner import TextDocumentScanner
 from src.Settings.config import EXT_SUPERTYPES
+from src.Helpers.classifier import sample_project_types
 
 
 def detect_project_type(folder_path):
-    type_counts = {'code': 0, 'media': 0, 'text': 0}
-    skip_dirs = {'node_modules', '__pycache__', '.git', '.venv', 'venv', 'env',
-                 'dist', 'build', '.next', '.cache', 'vendor', '__MACOSX'}
-
-    for root, dirs, files in os.walk(folder_path):
-        dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith('.')]
-        for filename in files:
-            if filename.startswith('.'):
-                continue
-            ext = os.path.splitext(filename)[1].lower()
-            file_type = EXT_SUPERTYPES.get(ext)
-            if file_type in type_counts:
-                type_counts[file_type] += 1
+    sample = sample_project_types(folder_path)
+    type_counts = {kind: sample[kind] for kind in ('code', 'media', 'text')}
 
     total_files = sum(type_counts.values())
     if total_files == 0:
         return {'type': 'unknown', 'code_count': 0, 'media_count': 0, 'text_count': 0,
-                'details': 'No recognizable files found'}
+                'confidence': sample['confidence'], 'details': 'No recognizable files found'}
 
     code_pct = type_counts['code'] / total_files
     media_pct = type_counts['media'] / total_files
@@ -56,7 +46,7 @@ def detect_project_type(folder_path):
 
     return {'type': project_type, 'code_count': type_counts['code'],
             'media_count': type_counts['media'], 'text_count': type_counts['text'],
-            'details': details}
+            'confidence': sample['confidence'], 'details': details}
 
 
 class IncrementalZipHandler:
@@ -1,10 +1,8 @@
 import os
 import sys
-import pandas as pd
 import re
 import math
 from math import sqrt
-import numpy as np
 from collections import defaultdict
 from pathlib import Path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -86,7 +84,8 @@ def keyword_clustering(file_path):
         max_key = max(rounded, key=rounded.get)
         rounded[max_key] = round(rounded[max_key] + diff, 2)
 
-    # Convert to DataFrame
+    # Convert to DataFrame (pandas is only needed here, so import it lazily)
+    import pandas as pd
     df = pd.DataFrame(
     [{"Cluster": k, "Keywords": v} for k, v in rounded.items()]
     )
@@ -4,6 +4,7 @@ Scans VISUAL media projects (images, videos, 3D, design files) and stores in dat
 Note: This scanner is for visual/creative projects only, not text-based projects
 """
 
+import logging
 import os
 import sys
 from datetime import datetime, timezone
@@ -44,14 +45,17 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../.
 # Import from src after path setup
 from src.UserPrompts.config_integration import config_manager
 from src.Analysis.file_hasher import compute_file_hash
+from src.Helpers.ignoreRules import IgnoreMatcher
 
 from src.Databases.database import db_manager
 from src.Analysis.visualMediaAnalyzer import analyze_visual_project
-from src.Extraction.keywordExtractorText import extract_keywords_with_scores
+from src.Extraction.keywordExtractorText import extract_keywords_many
 from src.Helpers.fileFormatCheck import check_file_format, InvalidFileFormatError
 from src.Helpers.fileDataCheck import sniff_supertype
 from src.Helpers.classifier import supertype_from_extension
 
+logger = logging.getLogger(__name__)
+
 
 class MediaProjectScanner:
     """Scans and analyzes VISUAL media projects (photography, design, video, 3D)"""
@@ -98,15 +102,26 @@ class MediaProjectScanner:
         self.skills_detected = set()
         self.all_keywords = []
         
-        # Directories to skip during scanning
+        # Media-specific folders to skip on top of the built-in ones
         self.skip_dirs = {
-            'node_modules', '__pycache__', '.git', '.venv', 'venv',
-            'env', 'dist', 'build', '.next', '.cache', 'vendor',
-            '.pytest_cache', 'coverage', '.mypy_cache', '__MACOSX',
             'Backup', 'Cache', 'Thumbnails', '.DS_Store', 'Thumbs.db',
             '.backup', 'backup', 'backups', '.archive', 'archive', 
             'archives', '.trash', 'trash', 'temp', 'tmp', '.tmp'
         }
+
+        # Built-in skips + user exclusions + the project's .gitignore
+        try:
+            config = config_manager.get_or_create_config()
+            excluded_folders = getattr(config, 'excluded_folders', None)
+            excluded_file_types = getattr(config, 'excluded_file_types', None)
+        except Exception:
+            excluded_folders = excluded_file_types = None
+        self.ignore = IgnoreMatcher(
+            str(self.project_path.parent if self.single_file else self.project_path),
+            excluded_folders=excluded_folders,
+            excluded_file_types=excluded_file_types,
+            extra_skip_dirs=self.skip_dirs,
+        )
     
     def scan_and_store(self, user_id: Optional[int] = None) -> int:
         """
@@ -118,10 +133,8 @@ class MediaProjectScanner:
         """
         from datetime import datetime, timezone
         
-        print(f"\n{'='*60}")
-        print(f"Scanning Media Project: {self.project_name}")
-        print(f"Path: {self.project_path}")
-        print(f"{'='*60}\n")
+        logger.info("Scanning Media Project: %s", self.project_name)
+        logger.info("Path: %s", self.project_path)
         
         # Check if already in database
         existing = db_manager.get_project_by_path(str(self.project_path))
@@ -143,24 +156,24 @@ class MediaProjectScanner:
                 existing = None
         
         # Step 1: Find media files
-        print("Step 1: Finding media files...")
+        logger.info("Step 1: Finding media files...")
         self._find_files()
-        print(f"  ✓ Found {len(self.media_files)} media files")
+        logger.info("  ✓ Found %s media files", len(self.media_files))
 
         if len(self.media_files) == 0:
-            print("\n⚠️  No media files found.")
+            logger.warning("⚠️  No media files found.")
             return None
         
         #Calculate and display total size 
         total_size = sum(f.stat().st_size for f in self.media_files)
         total_size_mb = total_size / (1024 * 1024)
-        print(f"  ✓ Total size: {total_size_mb:.2f} MB ({total_size:,} bytes)")
+        logger.info("  ✓ Total size: %.2f MB (%d bytes)", total_size_mb, total_size)
 
         
         # Step 2: Detect software/tools
-        print("\nStep 2: Detecting software used...")
+        logger.info("Step 2: Detecting software used...")
         self._analyze_media()
-        print(f"  ✓ Software detected: {', '.join(self.software_used) if self.software_used else 'None'}")
+        logger.info("  ✓ Software detected: %s", ', '.join(self.software_used) if self.software_used else 'None')
 
         # Step 3: Extract keywords from text files (if enabled)
         if config_manager.get_or_create_config().enable_keyword_extraction:
@@ -202,9 +215,9 @@ class MediaProjectScanner:
             }
             db_manager.update_project(project_id, updates)
             
-            print(f"\n✓ Incremental update complete!")
-            print(f"  Added {new_files_count} new files")
-            print(f"  Total files: {updates['file_count']}")
+            logger.info("✓ Incremental update complete!")
+            logger.info("  Added %s new files", new_files_count)
+            logger.info("  Total files: %s", updates['file_count'])
             
 # Calculate project dates from files — prefer EXIF, fall back to st_mtime
             file_dates = []
@@ -241,10 +254,10 @@ class MediaProjectScanner:
             importance_score = calculate_importance_score(project)
             db_manager.update_project(project_id, {'importance_score': importance_score})
             
-            print(f"\n✓ Project stored with ID: {project_id}")
+            logger.info("✓ Project stored with ID: %s", project_id)
             
             # Store files
-            print("\nStep 3: Storing file information...")
+            logger.info("Step 3: Storing file information...")
             for file_path in self.media_files:
                 file_hash = compute_file_hash(str(file_path))
                 file_data = {
@@ -259,11 +272,11 @@ class MediaProjectScanner:
                 }
                 db_manager.add_file_to_project(file_data)
             
-            print(f"  ✓ Stored {len(self.media_files)} files")
+            logger.info("  ✓ Stored %s files", len(self.media_files))
 
             # Store keywords (top 20)
             if self.all_keywords:
-                print(f"  → Storing {min(len(self.all_keywords), 20)} keywords...")
+                logger.info("  → Storing %s keywords...", min(len(self.all_keywords), 20))
                 for keyword, score in self.all_keywords[:20]:
                     db_manager.add_keyword({
                         'project_id': project_id,
@@ -286,14 +299,14 @@ class MediaProjectScanner:
                 check_file_format(path_str)
             except InvalidFileFormatError as e:
                 # Unsupported extension → skip with message
-                print(f"Skipping unsupported file: {path_str} — {e}")
+                logger.debug("Skipping unsupported file: %s — %s", path_str, e)
                 return
             
             # 2) Then: map extension → supertype ("text" / "code" / "media" / etc)
             ext_supertype = supertype_from_extension(path_str)
             if ext_supertype != "media":
                 # Not configured as a media file
-                print(f"Skipping file with unsupported media extension: {path_str}")
+                logger.debug("Skipping file with unsupported media extension: %s", path_str)
                 return
             
             # 3) Finally: sniff content to confirm it's actually media
@@ -309,7 +322,7 @@ class MediaProjectScanner:
                                         '.c4d', '.3ds', '.stl', '.mp4', '.mov', '.avi', '.mkv', '.webm', '.flv',
                                         '.wmv', '.m4v', '.mpg', '.mpeg', '.aep', '.prproj', '.veg', '.drp',
                                         '.mp3', '.wav', '.flac', '.aac', '.ogg', '.m4a'}:
-                        print(f"Skipping file due to content mismatch: {path_str} (sniffed as {sniffed_supertype})")
+                        logger.debug("Skipping file due to content mismatch: %s (sniffed as %s)", path_str, sniffed_supertype)
                         return
             except Exception:
                 # Allow based on extension if sniffing fails
@@ -363,23 +376,15 @@ class MediaProjectScanner:
                 _maybe_add_text_file(file_path)
             return
         
-        # --- Directory mode ---
-        for root, dirs, files in os.walk(self.project_path):
-            # Remove skip directories from dirs list
-            dirs[:] = [d for d in dirs if d not in self.skip_dirs and not d.startswith('.')]
-            
-            for filename in files:
-                # Skip hidden files
-                if filename.startswith('.'):
-                    continue
-                
-                file_path = Path(root) / filename
-                
-                # Try to add as media file
-                _maybe_add_media_file(file_path)
-                
-                # Try to add as text file (for keyword extraction)
-                _maybe_add_text_file(file_path)
+        # --- Directory mode: ignored folders are pruned without being opened ---
+        for entry in self.ignore.walk():
+            file_path = Path(entry.path)
+
+            # Try to add as media file
+            _maybe_add_media_file(file_path)
+
+            # Try to add as text file (for keyword extraction)
+            _maybe_add_text_file(file_path)
     
     def _analyze_media(self):
         """Analyze media files using existing visualMediaAnalyzer function"""
@@ -394,7 +399,7 @@ class MediaProjectScanner:
                 self.skills_detected.update(analysis['skills_detected'])
                 
         except Exception as e:
-            print(f"  ⚠️  Error during media analysis: {e}")
+            logger.warning("  ⚠️  Error during media analysis: %s", e)
             # Continue anyway with what we have
 
         # Fallback: infer tools/skills from extensions if analyzer returns nothing
@@ -423,23 +428,22 @@ class MediaProjectScanner:
     def _extract_keywords(self):
         """Extract keywords from text files in the project"""
         keyword_scores = defaultdict(float)
-        
+
+        texts = []
         for file_path in self.text_files:
             try:
                 # Read text file
                 with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    text = f.read()
-                
-                # Use existing keyword extractor
-                keywords = extract_keywords_with_scores(text)
-                
-                # Aggregate scores (take top 10 per file)
-                for score, keyword in keywords[:10]:
-                    keyword_scores[keyword.lower()] += score
-                    
-            except Exception as e:
+                    texts.append(f.read())
+            except Exception:
                 # Skip files that can't be processed
                 continue
+
+        # One batch through the shared RAKE engine
+        for keywords in extract_keywords_many(texts):
+            # Aggregate scores (take top 10 per file)
+            for score, keyword in keywords[:10]:
+                keyword_scores[keyword.lower()] += score
         
         # Sort by score and keep top 30 overall
         self.all_keywords = sorted(
@@ -506,7 +510,7 @@ class MediaProjectScanner:
         
         # Store keywords (top 20)
         if self.all_keywords:
-            print(f"  → Storing {min(len(self.all_keywords), 20)} keywords...")
+            logger.info("  → Storing %s keywords...", min(len(self.all_keywords), 20))
             for keyword, score in self.all_keywords[:20]:
                 db_manager.add_keyword({
                     'project_id': project.id,
@@ -532,12 +536,13 @@ def scan_media_project(project_path: str, user_id: Optional[int] = None) -> Opti
         scanner = MediaProjectScanner(project_path)
         return scanner.scan_and_store(user_id=user_id)
     except Exception as e:
-        print(f"\n✗ Error scanning project: {e}")
+        logger.error("✗ Error scanning project: %s", e)
         return None
 
 
 if __name__ == "__main__":
     """Command-line interface"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     if len(sys.argv) < 2:
         print("Usage: python mediaProjectScanner.py <project_path>")
         sys.exit(1)
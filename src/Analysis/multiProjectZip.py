@@ -1,3 +1,4 @@
+import logging
 import sys
 import os
 import shutil
@@ -7,13 +8,21 @@ import tempfile
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import PurePosixPath
 from src.Settings.config import EXT_SUPERTYPES
+from src.Helpers.ignoreRules import BUILTIN_SKIP_DIRS, IgnoreMatcher
+from src.Helpers.classifier import sample_project_types
 from src.Databases.database import db_manager
 from src.Analysis.codingProjectScanner import scan_coding_project
 from src.Analysis.mediaProjectScanner import scan_media_project
 from src.Analysis.textDocumentScanner import scan_text_document
 
+logger = logging.getLogger(__name__)
+
+# Upper bound on project roots scanned at the same time
+MAX_SCAN_WORKERS = min(4, os.cpu_count() or 1)
+
 
 def _zip_top_level_name(member_name):
     """Normalise a zip member path and return its top-level component."""
@@ -44,11 +53,8 @@ def splitZipFile(zip_path):
 
 
 def _count_files_recursive(folder):
-    """Count all files under *folder* recursively."""
-    total = 0
-    for _, _, files in os.walk(folder):
-        total += len(files)
-    return total
+    """Count the non-ignored files under *folder*, as identifyProjectType does."""
+    return sum(1 for _ in IgnoreMatcher(folder).walk())
 
 
 def _find_project_roots(extract_dir):
@@ -69,7 +75,7 @@ def _find_project_roots(extract_dir):
     Returns:
         list[tuple[str, str]]: (name, absolute_path) pairs for each root.
     """
-    skip = {'__MACOSX', '__pycache__', '.git', 'node_modules'}
+    skip = BUILTIN_SKIP_DIRS
 
     top_items = [
         item for item in os.listdir(extract_dir)
@@ -112,13 +118,93 @@ def _find_project_roots(extract_dir):
     return [("project", extract_dir)]
 
 
-def processZipFile(zipFilePath, user_id=None):
+def _scan_project_root(name, path, user_id=None):
+    """
+    Classify one project root and run the matching scanner.
+
+    The classification walk already counts every non-ignored file, so the
+    root is only walked a second time (with the same ignore rules) if
+    classification stopped early.
+    """
+    project_info = identifyProjectType(path)
+    project_type = project_info['type']
+
+    if project_type == 'code':
+        project_id = scan_coding_project(path, user_id=user_id)
+    elif project_type == 'media':
+        project_id = scan_media_project(path, user_id=user_id)
+    elif project_type == 'text':
+        project_id = scan_text_document(path, user_id=user_id)
+    else:
+        project_id = scan_text_document(path, user_id=user_id)
+
+    return {
+        "name": name,
+        "type": project_type,
+        # Only a root that was sampled early needs a full count
+        "file_count": project_info['file_count'] if project_info['complete'] else _count_files_recursive(path),
+        "path": path,
+        "details": project_info['details'],
+        "database_id": project_id,
+    }
+
+
+def iterProjectRoots(extract_dir, user_id=None, max_workers=None, roots=None, scan_root=None):
+    """
+    Scan every project root under an extracted ZIP concurrently and yield
+    each result as soon as its root finishes (completion order, not
+    discovery order).
+
+    Scanners share the global db_manager, so roots run in a thread pool
+    rather than separate processes. A root that fails yields an entry with
+    an 'error' key instead of stopping the others.
+
+    Args:
+        extract_dir: Folder the ZIP was extracted into
+        user_id: Owner of the created projects
+        max_workers: Pool size (defaults to MAX_SCAN_WORKERS)
+        roots: Pre-computed (name, path) pairs from _find_project_roots
+        scan_root: Callable(name, path, user_id) -> dict scanning one root
+                   (defaults to _scan_project_root)
+
+    Yields:
+        dict: Same shape as a processZipFile entry.
+    """
+    if roots is None:
+        roots = _find_project_roots(extract_dir)
+    if not roots:
+        return
+
+    workers = max(1, min(max_workers or MAX_SCAN_WORKERS, len(roots)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zip-root") as pool:
+        futures = {
+            pool.submit(scan_root or _scan_project_root, name, path, user_id): (name, path)
+            for name, path in roots
+        }
+        for future in as_completed(futures):
+            name, path = futures[future]
+            try:
+                yield future.result()
+            except Exception as e:
+                logger.warning("Failed to scan project root '%s'", name, exc_info=True)
+                yield {
+                    "name": name,
+                    "type": "unknown",
+                    "file_count": 0,
+                    "path": path,
+                    "details": "Scan failed",
+                    "database_id": None,
+                    "error": str(e),
+                }
+
+
+def processZipFile(zipFilePath, user_id=None, max_workers=None):
     """
     Extract a ZIP file and scan each detected project root with the appropriate
-    scanner, storing results in the database.
+    scanner, storing results in the database. Roots are scanned concurrently.
 
     Returns:
-        list[dict]: One entry per discovered project.
+        list[dict]: One entry per discovered project, in discovery order.
     """
     temp_dir = tempfile.mkdtemp(prefix="zip_extract_")
     try:
@@ -126,30 +212,9 @@ def processZipFile(zipFilePath, user_id=None):
             zf.extractall(temp_dir)
 
         roots = _find_project_roots(temp_dir)
-        results = []
-
-        for name, path in roots:
-            project_info = identifyProjectType(path)
-            project_type = project_info['type']
-
-            if project_type == 'code':
-                project_id = scan_coding_project(path, user_id=user_id)
-            elif project_type == 'media':
-                project_id = scan_media_project(path, user_id=user_id)
-            elif project_type == 'text':
-                project_id = scan_text_document(path, user_id=user_id)
-            else:
-                project_id = scan_text_document(path, user_id=user_id)
-
-            results.append({
-                "name": name,
-                "type": project_type,
-                "file_count": _count_files_recursive(path),
-                "path": path,
-                "details": project_info['details'],
-                "database_id": project_id,
-            })
-
+        order = {path: i for i, (_, path) in enumerate(roots)}
+        results = list(iterProjectRoots(temp_dir, user_id=user_id, max_workers=max_workers, roots=roots))
+        results.sort(key=lambda r: order.get(r["path"], len(order)))
         return results
     finally:
         shutil.rmtree(temp_dir, ignore_errors=True)
@@ -167,29 +232,16 @@ def identifyProjectType(folder_path):
             'code_count': int,
             'media_count': int,
             'text_count': int,
+            'file_count': int (non-ignored files visited),
+            'complete': bool (False if sampling stopped early),
+            'confidence': float (confidence in the type, 1.0 if complete),
             'details': str (description)
         }
     """
-    type_counts = {'code': 0, 'media': 0, 'text': 0}
-    skip_dirs = {'node_modules', '__pycache__', '.git', '.venv', 'venv', 'env', 
-                 'dist', 'build', '.next', '.cache', 'vendor', '__MACOSX'}
-
-    # Scan folder and count file types
-    for root, dirs, files in os.walk(folder_path):
-        # Remove skip directories from dirs list
-        dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith('.')]
-
-        for filename in files:
-            if filename.startswith('.'):
-                continue
-
-            ext = os.path.splitext(filename)[1].lower()
-            file_type = EXT_SUPERTYPES.get(ext)
-
-            print(f"Processing file: {filename}, Extension: {ext}, Type: {file_type}")
-
-            if file_type in type_counts:
-                type_counts[file_type] += 1
+    # Extension + head-sample classification; large trees stop early
+    sample = sample_project_types(folder_path)
+    type_counts = {kind: sample[kind] for kind in ('code', 'media', 'text')}
+    file_count = sample['file_count']
 
     total_files = sum(type_counts.values())
 
@@ -199,6 +251,9 @@ def identifyProjectType(folder_path):
             'code_count': 0,
             'media_count': 0,
             'text_count': 0,
+            'file_count': file_count,
+            'complete': sample['complete'],
+            'confidence': sample['confidence'],
             'details': 'No recognizable files found'
         }
 
@@ -231,6 +286,9 @@ def identifyProjectType(folder_path):
         'code_count': type_counts['code'],
         'media_count': type_counts['media'],
         'text_count': type_counts['text'],
+        'file_count': file_count,
+        'complete': sample['complete'],
+        'confidence': sample['confidence'],
         'details': details
     }
 
@@ -0,0 +1,114 @@
+"""
+Compiled multi-keyword matcher for the skill dictionaries.
+
+A SkillMatcher is built once per {skill: [keywords]} dictionary and counts
+every keyword in a text with one tokenization pass. The lowercased text is
+split once into alternating word (\\w+) and separator (\\W+) parts:
+  - single-word keywords ("django", "s3", "grammar") are looked up in a
+    Counter of the words, so they cost nothing per keyword
+  - phrases and punctuated keywords ("call to action", "ci/cd", "three.js")
+    are compared part by part, only at words that start some phrase
+  - the rare keyword that starts or ends with punctuation keeps a
+    precompiled \\bkeyword\\b pattern
+
+Counts are identical to running re.findall(r'\\b<keyword>\\b') per keyword
+on the lowercased text, which is what the skill extractors used to do.
+
+Long documents can be counted a chunk (page, paragraph, line) at a time
+with count_chunks(); chunks must break at whitespace, as pages and lines do.
+
+Usage:
+    from src.Analysis.skillMatcher import SkillMatcher
+
+    matcher = SkillMatcher(SKILL_KEYWORDS)
+    matcher.count_skills(text)            # {skill: total keyword matches}
+    counts = matcher.count_chunks(pages)  # Counter {keyword: matches}
+    matcher.skill_counts(counts)
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+_WORD = re.compile(r"\w+")
+_PARTS = re.compile(r"(\W+)")
+
+
+class SkillMatcher:
+    """Counts every keyword of a skill dictionary in one pass over a text."""
+
+    def __init__(self, skill_keywords: Dict[str, Iterable[str]]):
+        # Keywords are matched lowercased; a skill listing a keyword twice
+        # counts it twice, as the per-keyword loops did
+        self.skills: Dict[str, List[str]] = {
+            skill: [kw.lower() for kw in keywords] for skill, keywords in skill_keywords.items()
+        }
+        unique = {kw for keywords in self.skills.values() for kw in keywords}
+
+        self.single_words = frozenset(kw for kw in unique if _WORD.fullmatch(kw))
+
+        # first word -> [(phrase, its word/separator parts)]
+        self._phrase_starts: Dict[str, List[Tuple[str, List[str]]]] = {}
+        # (keyword, pattern) for keywords that don't begin and end on a word
+        self._patterns: List[Tuple[str, re.Pattern]] = []
+        for kw in sorted(unique - self.single_words):
+            parts = _PARTS.split(kw)
+            if parts[0] and parts[-1]:
+                self._phrase_starts.setdefault(parts[0], []).append((kw, parts))
+            else:
+                self._patterns.append((kw, re.compile(r"\b" + re.escape(kw) + r"\b")))
+
+    def _count_into(self, counts: Counter, text: str, single_words_only: bool) -> None:
+        text = text.lower()
+        parts = _PARTS.split(text)
+        words = parts[::2]
+        tokens = Counter(words)
+        for word in self.single_words & tokens.keys():
+            counts[word] += tokens[word]
+        if single_words_only:
+            return
+
+        starts = self._phrase_starts.keys() & tokens.keys()
+        if starts:
+            # A word part is a whole \w+ run and a separator a whole \W+ run,
+            # so equal parts is exactly a \bphrase\b match
+            next_free = {}
+            for i in [i for i, w in enumerate(words) if w in starts]:
+                at = 2 * i
+                for kw, kw_parts in self._phrase_starts[words[i]]:
+                    end = at + len(kw_parts)
+                    if parts[at:end] == kw_parts and at >= next_free.get(kw, 0):
+                        counts[kw] += 1
+                        next_free[kw] = end  # findall matches don't overlap
+        for kw, pattern in self._patterns:
+            found = len(pattern.findall(text))
+            if found:
+                counts[kw] += found
+
+    def keyword_counts(self, text: Optional[str], single_words_only: bool = False) -> Counter:
+        """
+        {keyword: matches} for every keyword that occurs in text.
+        single_words_only skips the phrase patterns.
+        """
+        return self.count_chunks([text], single_words_only)
+
+    def count_chunks(self, chunks: Iterable[Optional[str]], single_words_only: bool = False) -> Counter:
+        """keyword_counts() summed over consecutive chunks of one document."""
+        counts = Counter()
+        for chunk in chunks:
+            if chunk:
+                self._count_into(counts, chunk, single_words_only)
+        return counts
+
+    def skill_counts(self, keyword_counts: Counter) -> Dict[str, int]:
+        """{skill: summed keyword matches} for the skills with any match."""
+        result = {}
+        for skill, keywords in self.skills.items():
+            total = sum(keyword_counts.get(kw, 0) for kw in keywords)
+            if total:
+                result[skill] = total
+        return result
+
+    def count_skills(self, text: Optional[str]) -> Dict[str, int]:
+        """{skill: summed keyword matches} for one text."""
+        return self.skill_counts(self.keyword_counts(text))
@@ -1,6 +1,6 @@
-from collections import defaultdict
 from pathlib import Path
-import re
+
+from src.Analysis.skillMatcher import SkillMatcher
 
 # Skill categories and keywords 
 SKILL_KEYWORDS = {
@@ -101,31 +101,26 @@ def extract_skills_from_folder(folder_path, file_extensions=None):
     if not folder.is_dir():
         raise NotADirectoryError(f"{folder_path} is not a valid folder")
 
-    all_text = ""
-    for file in folder.rglob("*"):  # recursively include subfolders
-        if file.is_file() and (file_extensions is None or file.suffix in file_extensions):
-            try:
-                all_text += file.read_text(encoding="utf-8") + "\n"
-            except UnicodeDecodeError:
-                pass  # skip non-text files
+    def file_texts():
+        for file in folder.rglob("*"):  # recursively include subfolders
+            if file.is_file() and (file_extensions is None or file.suffix in file_extensions):
+                try:
+                    yield file.read_text(encoding="utf-8")
+                except UnicodeDecodeError:
+                    pass  # skip non-text files
+
+    # Count file by file instead of concatenating every file into one string
+    return _normalize_scores(_MATCHER.skill_counts(_MATCHER.count_chunks(file_texts())))
 
-    return extract_skills_with_scores(all_text)
+# Compiled once; whole-word matching avoids partial matches (ex. nosql vs sql)
+_MATCHER = SkillMatcher(SKILL_KEYWORDS)
 
 # weighted skill scoring
 def extract_skills_with_scores(text):
-    text = text.lower()
-    scores = defaultdict(float)
-
-    # Tokenize to avoid partial matches (ex. nosql vs sql)
-    for skill, keywords in SKILL_KEYWORDS.items():
-        for kw in keywords:
-            kw_lower = kw.lower()
-            # Use regex to match whole words (multi-word keywords are handled too)
-            pattern = r'\b' + re.escape(kw_lower) + r'\b'
-            matches = re.findall(pattern, text)
-            if matches:
-                scores[skill] += len(matches)
+    return _normalize_scores(_MATCHER.count_skills(text))
+
 
+def _normalize_scores(scores):
     # normalizing score
     total = sum(scores.values())
     if total == 0:
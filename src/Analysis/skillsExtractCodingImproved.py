@@ -2,6 +2,8 @@ from collections import defaultdict, Counter
 from pathlib import Path
 import re
 
+from src.Helpers.ignoreRules import IgnoreMatcher
+
 # --- Top-level skill keywords ---
 SKILL_KEYWORDS = {
     # --- Languages (extension-boosted; keywords are import/library names specific to that language) ---
@@ -470,23 +472,26 @@ _SKILL_LOOKUPS = _build_skill_lookups(SKILL_KEYWORDS)
 _SUBSKILL_LOOKUPS = _build_subskill_lookups(SUBSKILL_KEYWORDS)
 
 # --- Skill analyzer function ---
-def analyze_coding_skills_refined(folder_path, file_extensions=None):
+def analyze_coding_skills_refined(folder_path, file_extensions=None, ignore=None):
     folder = Path(folder_path)
     if not folder.is_dir():
         raise NotADirectoryError(f"{folder_path} is not a valid folder")
 
+    # Prune node_modules, .git, .gitignored paths etc. instead of rglob-ing into them
+    if ignore is None:
+        ignore = IgnoreMatcher(str(folder))
+
     skill_scores = defaultdict(float)
     skill_subskills = defaultdict(lambda: defaultdict(lambda: defaultdict(float)))
     project_detected_skills = set()
     raw_skill_hits = defaultdict(int)
 
-    for file in folder.rglob("*"):
-        if not file.is_file():
-            continue
+    for entry in ignore.walk(str(folder)):
+        file = Path(entry.path)
         if file_extensions and file.suffix not in file_extensions:
             continue
         try:
-            if file.stat().st_size > _MAX_FILE_BYTES:
+            if entry.stat().st_size > _MAX_FILE_BYTES:
                 continue
         except OSError:
             continue
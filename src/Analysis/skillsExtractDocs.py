@@ -1,8 +1,12 @@
+import logging
 import os
 import re
 from collections import defaultdict
-from PyPDF2 import PdfReader
-from docx import Document
+from functools import lru_cache
+
+from src.Analysis.skillMatcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
 
 
 
@@ -62,42 +66,72 @@ def extract_text(file_path):
             return f.read()
     elif ext == ".docx":
         try:
+            from docx import Document
             doc = Document(file_path)
             return "\n".join([p.text for p in doc.paragraphs])
         except Exception as e:
-            print(f"Error reading DOCX {file_path}: {e}")
+            logger.warning("Error reading DOCX %s: %s", file_path, e)
             return ""
     elif ext == ".pdf":
         try:
-            reader = PdfReader(file_path)
-            text = ""
-            for page in reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            return text
+            return "".join(page + "\n" for page in pdf_pages(file_path) if page)
         except Exception as e:
-            print(f"Error reading PDF {file_path}: {e}")
+            logger.warning("Error reading PDF %s: %s", file_path, e)
             return ""
     else:
         return ""
 
 
-# --- Precompiled patterns (built once at import time) ---
-_COMPILED_SKILL_PATTERNS = {
-    skill: [
-        (kw.lower(), re.compile(r'\b' + re.escape(kw.lower()) + r'\b'))
-        for kw in keywords
-    ]
-    for skill, keywords in SKILL_KEYWORDS.items()
-}
+@lru_cache(maxsize=8)
+def _read_pdf_pages(file_path, mtime_ns, size):
+    from PyPDF2 import PdfReader
+    return tuple(page.extract_text() for page in PdfReader(file_path).pages)
+
+
+def pdf_pages(file_path):
+    """
+    Text of each PDF page. PyPDF2 extraction dominates document analysis and
+    the text scanner asks for the same file several times (keywords, content,
+    skills), so the last few documents are cached per file version.
+    """
+    st = os.stat(file_path)
+    return _read_pdf_pages(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
 
-# For the word-tokenization path in analyze_folder_for_skills:
-# keep only single-word keywords (multi-word phrases aren't found by the word
-# tokenizer anyway) as frozensets for O(1) membership tests.
+
+def iter_text_chunks(file_path):
+    """
+    Yield a document's text a line (TXT), paragraph (DOCX) or page (PDF) at a
+    time, so skill counting never joins a long document into one string.
+    """
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == ".txt":
+        with open(file_path, "r", encoding="utf-8") as f:
+            yield from f
+    elif ext == ".docx":
+        try:
+            from docx import Document
+            paragraphs = Document(file_path).paragraphs
+        except Exception as e:
+            logger.warning("Error reading DOCX %s: %s", file_path, e)
+            return
+        for p in paragraphs:
+            yield p.text
+    elif ext == ".pdf":
+        try:
+            pages = pdf_pages(file_path)
+        except Exception as e:
+            logger.warning("Error reading PDF %s: %s", file_path, e)
+            return
+        yield from pages
+
+
+# One compiled matcher for the skill dictionary, built at import time
+_MATCHER = SkillMatcher(SKILL_KEYWORDS)
+
+# For analyze_folder_for_skills: only single-word keywords count there
 _SKILL_SINGLE_WORD_SETS = {
-    skill: frozenset(kw.lower() for kw in keywords if ' ' not in kw.lower())
-    for skill, keywords in SKILL_KEYWORDS.items()
+    skill: frozenset(kw for kw in keywords if kw in _MATCHER.single_words)
+    for skill, keywords in _MATCHER.skills.items()
 }
 
 
@@ -105,19 +139,7 @@ def count_keyword_matches(text: str, keywords: list[str]) -> int:
     """
     Counts both single-word and multi-word keyword occurrences in text.
     """
-    text = text.lower()
-    count = 0
-
-    for kw in keywords:
-        kw = kw.lower()
-        if " " in kw:
-            # Match full phrase
-            count += len(re.findall(rf"\b{re.escape(kw)}\b", text))
-        else:
-            # Match single word
-            count += len(re.findall(rf"\b{kw}\b", text))
-
-    return count
+    return SkillMatcher({"keywords": keywords}).count_skills(text).get("keywords", 0)
 
 def normalize_text(text: str) -> str:
     return re.sub(r"\s+", " ", text.lower()).strip()
@@ -135,18 +157,7 @@ def analyze_document_for_skills(file_path):
     Returns:
         List of tuples: [(skill, count), ...] sorted by count descending
     """
-    text = extract_text(file_path)
-    if not text:
-        return []
-
-    text_lower = text.lower()
-    skill_counts = defaultdict(int)
-
-    # Use precompiled patterns — no re-compilation per call
-    for skill, patterns in _COMPILED_SKILL_PATTERNS.items():
-        count = sum(len(pat.findall(text_lower)) for _, pat in patterns)
-        if count > 0:
-            skill_counts[skill] = count
+    skill_counts = _MATCHER.skill_counts(_MATCHER.count_chunks(iter_text_chunks(file_path)))
 
     return sorted(
         [(s, c) for s, c in skill_counts.items() if c > 0],
@@ -175,13 +186,10 @@ def analyze_folder_for_skills(folder_path):
         if not file_path.endswith((".txt", ".pdf", ".docx")):
             continue
 
-        text = extract_text(file_path)
-        if not text:
+        # Tokenize once, a page/paragraph/line at a time
+        word_counter = _MATCHER.count_chunks(iter_text_chunks(file_path), single_words_only=True)
+        if not word_counter:
             continue
-
-        text_lower = text.lower()
-        # Tokenize once; use Counter for O(1) per-word frequency lookups
-        word_counter = Counter(re.findall(r"\b[a-z]+\b", text_lower))
         words_set = set(word_counter)
 
         for skill, kw_set in _SKILL_SINGLE_WORD_SETS.items():
@@ -8,19 +8,19 @@ Implements:
  - weighted overall score computation
  - greedy diversity-aware selection (approximate max-coverage for top-k)
  - human-readable summary generation
+
+Scoring and selection run on NumPy arrays (see src/Helpers/rankingMatrix.py).
 """
 
 from typing import List, Dict, Any, Optional
-from copy import deepcopy
+
+import numpy as np
+
+from src.Helpers.rankingMatrix import diverse_top_k, min_max, skill_incidence
 
 
 def _min_max_normalize(values: List[float]) -> List[float]:
-    if not values:
-        return []
-    lo, hi = min(values), max(values)
-    if hi == lo:
-        return [1.0] * len(values)
-    return [(v - lo) / (hi - lo) for v in values]
+    return min_max(values).tolist()
 
 
 def summarize_projects(
@@ -35,7 +35,8 @@ def summarize_projects(
     if weights is None:
         weights = {"time": 0.4, "success": 0.3, "contribution": 0.3}
 
-    items = deepcopy(projects)
+    # Shallow copies: only top-level keys are added or replaced below
+    items = [dict(p) for p in projects]
     for p in items:
         p.setdefault("project_name", "<unnamed>")
         p.setdefault("time_spent", 0.0)
@@ -54,38 +55,38 @@ def summarize_projects(
         }
 
     # --- Normalize numeric metrics ---
-    t_norm = _min_max_normalize([p["time_spent"] for p in items])
-    s_norm = _min_max_normalize([p["success_score"] for p in items])
-    c_norm = _min_max_normalize([p["contribution_score"] for p in items])
-
-    for i, p in enumerate(items):
-        p["_time_norm"], p["_success_norm"], p["_contrib_norm"] = t_norm[i], s_norm[i], c_norm[i]
-        score = (
-            weights["time"] * t_norm[i]
-            + weights["success"] * s_norm[i]
-            + weights["contribution"] * c_norm[i]
-        )
-        p["_overall_score"] = max(0.0, min(1.0, score))
-
-    all_skills = set(s for p in items for s in p["skills"])
-    total_skill_count = len(all_skills) or 1
-
-    remaining = sorted(items, key=lambda x: (x["_overall_score"], x["project_name"]), reverse=True)
-    selected, covered = [], set()
-
-    for _ in range(min(top_k, len(items))):
-        best_idx, best_val = None, -float("inf")
-        for i, cand in enumerate(remaining):
-            new_skills = set(cand["skills"]) - covered
-            diversity = len(new_skills) / total_skill_count
-            val = cand["_overall_score"] + diversity_alpha * diversity
-            if val > best_val:
-                best_val, best_idx = val, i
-        if best_idx is None:
-            break
-        chosen = remaining.pop(best_idx)
-        selected.append(chosen)
-        covered.update(chosen["skills"])
+    t_norm = min_max([p["time_spent"] for p in items])
+    s_norm = min_max([p["success_score"] for p in items])
+    c_norm = min_max([p["contribution_score"] for p in items])
+    scores = np.clip(
+        weights["time"] * t_norm
+        + weights["success"] * s_norm
+        + weights["contribution"] * c_norm,
+        0.0, 1.0,
+    )
+
+    for p, t, s, c, score in zip(items, t_norm.tolist(), s_norm.tolist(),
+                                 c_norm.tolist(), scores.tolist()):
+        p["_time_norm"], p["_success_norm"], p["_contrib_norm"] = t, s, c
+        p["_overall_score"] = score
+
+    vocab, incidence = skill_incidence([p["skills"] for p in items])
+    total_skill_count = len(vocab) or 1
+
+    # Candidate order for ties: by score, then name, both descending
+    order = np.array(sorted(range(len(items)),
+                            key=lambda i: (items[i]["_overall_score"], items[i]["project_name"]),
+                            reverse=True))
+    picked = diverse_top_k(
+        scores,
+        incidence,
+        top_k,
+        bonus=lambda new_skills: diversity_alpha * (new_skills / total_skill_count),
+        max_bonus=abs(diversity_alpha),
+        order=order,
+    )
+    selected = [items[i] for i in picked]
+    covered = set().union(*(p["skills"] for p in selected))
 
     unique_skills = sorted(covered)
     avg_score = round(sum(p["_overall_score"] for p in selected) / max(1, len(selected)), 4)
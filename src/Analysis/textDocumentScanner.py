@@ -3,6 +3,7 @@ Text Document Scanner
 Scans text documents, analyzes them using existing functions, and stores in database
 """
 
+import logging
 import os
 import sys
 from datetime import datetime, timezone
@@ -10,8 +11,6 @@ from pathlib import Path
 from typing import Dict, Any, List, Optional
 from collections import defaultdict
 import re as _re
-import nltk
-from nltk.tokenize import word_tokenize
 
 
 def _pdf_date(file_path: Path) -> Optional[datetime]:
@@ -40,8 +39,6 @@ def _pdf_date(file_path: Path) -> Optional[datetime]:
     return None
 
 
-# nltk.download('punkt', quiet=True)
-
 # Setup path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
 from src.Settings.config import EXT_SUPERTYPES
@@ -53,6 +50,9 @@ from src.Helpers.fileDataCheck import sniff_supertype
 from src.Helpers.classifier import supertype_from_extension
 from src.Analysis.file_hasher import compute_file_hash
 from src.UserPrompts.config_integration import config_manager
+from src.Helpers.ignoreRules import IgnoreMatcher, normalize_extensions
+
+logger = logging.getLogger(__name__)
 
 class TextDocumentScanner:
     """Scans and analyzes text-based documents"""
@@ -94,10 +94,8 @@ class TextDocumentScanner:
         self.all_skills = {}
         self.all_keywords = []
         
-        # Directories to skip during scanning
+        # Document-specific folders to skip on top of the built-in ones
         self.skip_dirs = {
-            '.git',  # Version control
-            '__MACOSX',  # Mac metadata
             '.DS_Store',  # Mac folder settings
             'Thumbs.db',  # Windows thumbnails
             '.backup', 'backup', 'backups',  # Backup folders
@@ -105,26 +103,28 @@ class TextDocumentScanner:
             '.trash', 'trash',  # Trash folders
             'temp', 'tmp', '.tmp',  # Temporary folders
         }
-        self.excluded_file_types = self._load_excluded_file_types()
+        self.excluded_file_types, self.excluded_folders = self._load_user_exclusions()
+
+        # Built-in skips + user exclusions + the folder's .gitignore
+        self.ignore = IgnoreMatcher(
+            str(self.document_path.parent if self.single_file else self.document_path),
+            excluded_folders=self.excluded_folders,
+            excluded_file_types=self.excluded_file_types,
+            extra_skip_dirs=self.skip_dirs,
+        )
 
-    def _load_excluded_file_types(self) -> set[str]:
-        """Load normalized excluded file extensions from user config."""
+    def _load_user_exclusions(self) -> tuple[set[str], list[str]]:
+        """Load normalized excluded file extensions and excluded folders from user config."""
         try:
             config = config_manager.get_or_create_config()
             raw_extensions = getattr(config, 'excluded_file_types', []) or []
+            folders = getattr(config, 'excluded_folders', []) or []
         except Exception:
-            return set()
-
-        normalized_extensions = set()
-        for extension in raw_extensions:
-            normalized_extension = str(extension).strip().lower()
-            if not normalized_extension:
-                continue
-            if not normalized_extension.startswith('.'):
-                normalized_extension = f'.{normalized_extension}'
-            normalized_extensions.add(normalized_extension)
+            return set(), []
 
-        return normalized_extensions
+        if not isinstance(folders, list):
+            folders = []
+        return normalize_extensions(raw_extensions), folders
     
     def scan_and_store(self, user_id: Optional[int] = None) -> int:
         """
@@ -136,10 +136,8 @@ class TextDocumentScanner:
         """
         from datetime import datetime, timezone
         
-        print(f"\n{'='*60}")
-        print(f"Scanning Text Document: {self.document_name}")
-        print(f"Path: {self.document_path}")
-        print(f"{'='*60}\n")
+        logger.info("Scanning Text Document: %s", self.document_name)
+        logger.info("Path: %s", self.document_path)
         
         # Check if already in database
         existing = db_manager.get_project_by_path(str(self.document_path))
@@ -161,12 +159,12 @@ class TextDocumentScanner:
                 existing = None
         
         # Step 1: Find text files
-        print("Step 1: Finding text files...")
+        logger.info("Step 1: Finding text files...")
         self._find_text_files()
-        print(f"  ✓ Found {len(self.text_files)} text files")
+        logger.info("  ✓ Found %s text files", len(self.text_files))
 
         if len(self.text_files) == 0:
-            print("\n⚠️  No text files found.")
+            logger.warning("⚠️  No text files found.")
             return None
         
         if is_incremental:
@@ -202,9 +200,9 @@ class TextDocumentScanner:
             }
             db_manager.update_project(project_id, updates)
             
-            print(f"\n✓ Incremental update complete!")
-            print(f"  Added {new_files_count} new files")
-            print(f"  Total files: {updates['file_count']}")
+            logger.info("✓ Incremental update complete!")
+            logger.info("  Added %s new files", new_files_count)
+            logger.info("  Total files: %s", updates['file_count'])
             
         else:
             # Pre-calculate metadata and metrics for accurate scoring
@@ -232,9 +230,9 @@ class TextDocumentScanner:
             project = db_manager.create_project(project_data)
             project_id = project.id
             
-            print(f"\n✓ Project stored with ID: {project_id}")
+            logger.info("✓ Project stored with ID: %s", project_id)
             
-            print("\nStep 2: Storing file information...")
+            logger.info("Step 2: Storing file information...")
             for file_path in self.text_files:
                 file_hash = compute_file_hash(str(file_path))
                 file_data = {
@@ -249,12 +247,12 @@ class TextDocumentScanner:
                 }
                 db_manager.add_file_to_project(file_data)
             
-            print(f"  ✓ Stored {len(self.text_files)} files")
+            logger.info("  ✓ Stored %s files", len(self.text_files))
             
             # Extract keywords if enabled
             # Extract keywords if enabled
             if config_manager.get_or_create_config().enable_keyword_extraction:
-                print("\nStep 3: Extracting keywords...")
+                logger.info("Step 3: Extracting keywords...")
                 self._extract_keywords()
                 if self.all_keywords:
                     for keyword, score in self.all_keywords[:30]:  
@@ -264,7 +262,7 @@ class TextDocumentScanner:
                             'score': float(score)
                         }
                         db_manager.add_keyword(keyword_data)
-                    print(f"  ✓ Extracted {len(self.all_keywords)} keywords")
+                    logger.info("  ✓ Extracted %s keywords", len(self.all_keywords))
 
             # Calculate and store importance score after metadata/keywords are saved
             from src.Analysis.importanceScores import calculate_importance_score
@@ -283,7 +281,7 @@ class TextDocumentScanner:
 
             # 0) Respect user-configured excluded file extensions
             if file_ext in self.excluded_file_types:
-                print(f"Skipping user-excluded file type: {path_str}")
+                logger.debug("Skipping user-excluded file type: %s", path_str)
                 return
 
             # 1) First: global format check (ALLOWED_FORMATS)
@@ -291,14 +289,14 @@ class TextDocumentScanner:
                 check_file_format(path_str)
             except InvalidFileFormatError as e:
                 # This is where unsupported formats will show
-                print(f"Skipping unsupported file: {path_str} — {e}")
+                logger.debug("Skipping unsupported file: %s — %s", path_str, e)
                 return
 
             # 2) Then: is this a text extension we care about?
             ext_supertype = supertype_from_extension(path_str)
             if ext_supertype != "text":
                 # Not configured as a text file
-                print(f"Skipping file with unsupported text extension: {path_str}")
+                logger.debug("Skipping file with unsupported text extension: %s", path_str)
                 return
 
             # 3) Finally: sniff content to confirm it's actually text
@@ -308,7 +306,7 @@ class TextDocumentScanner:
                 if sniffed_supertype != "text":
                     # Allow common text extensions even if sniffing is inconclusive
                     if file_ext not in {'.txt', '.md', '.xml', '.pdf', '.doc', '.docx'}:
-                        print(f"Skipping file due to content mismatch: {path_str} (sniffed as {sniffed_supertype})")
+                        logger.debug("Skipping file due to content mismatch: %s (sniffed as %s)", path_str, sniffed_supertype)
                         return
             except Exception:
                 # Allow based on extension if sniffing fails
@@ -322,18 +320,9 @@ class TextDocumentScanner:
             _maybe_add_text_file(self.document_path)
             return
 
-        # --- Directory mode ---
-        for root, dirs, files in os.walk(self.document_path):
-            # Remove skip directories from dirs list
-            dirs[:] = [d for d in dirs if d not in self.skip_dirs and not d.startswith('.')]
-
-            for filename in files:
-                # Skip hidden files
-                if filename.startswith('.'):
-                    continue
-
-                file_path = Path(root) / filename
-                _maybe_add_text_file(file_path)
+        # --- Directory mode: ignored folders are pruned without being opened ---
+        for entry in self.ignore.walk():
+            _maybe_add_text_file(Path(entry.path))
 
     
     def _detect_document_types(self):
@@ -363,7 +352,7 @@ class TextDocumentScanner:
         # Print breakdown
         if type_counts:
             for doc_type, count in sorted(type_counts.items(), key=lambda x: x[1], reverse=True):
-                print(f"    - {doc_type}: {count} file(s)")
+                logger.debug("    - %s: %s file(s)", doc_type, count)
     
     def _extract_keywords(self):
         """Extract keywords from text files using existing keyword extractor"""
@@ -383,7 +372,7 @@ class TextDocumentScanner:
                     keyword_scores[keyword.lower()] += score
                     
             except Exception as e:
-                print(f"  ⚠️  Error extracting keywords from {file_path.name}: {e}")
+                logger.warning("  ⚠️  Error extracting keywords from %s: %s", file_path.name, e)
                 continue
         
         # Store sorted list in self.all_keywords as (keyword, score) tuples
@@ -409,7 +398,7 @@ class TextDocumentScanner:
         except ImportError:
             pass
         except Exception as e:
-            print(f"  ⚠️  Error analyzing skills: {e}")
+            logger.warning("  ⚠️  Error analyzing skills: %s", e)
             pass
 
 
@@ -424,7 +413,7 @@ class TextDocumentScanner:
                 return file_path.read_text(encoding='utf-8', errors='ignore')
             return content
         except Exception as e:
-            print(f"    ⚠️  Error reading {file_path.name}: {str(e)}")
+            logger.warning("    ⚠️  Error reading %s: %s", file_path.name, e)
             return None
         
 
@@ -461,7 +450,7 @@ class TextDocumentScanner:
 
             except Exception as e:
                 # Don’t hide errors completely—print once so tests aren’t silent
-                print(f"  ⚠️  Skipping {file_path.name} due to error: {e}")
+                logger.warning("  ⚠️  Skipping %s due to error: %s", file_path.name, e)
                 continue
 
         # Determine date range
@@ -508,7 +497,7 @@ class TextDocumentScanner:
         
         # Store keywords (top 30)
         if self.all_keywords:
-            print(f"  → Storing {min(len(self.all_keywords), 30)} keywords...")
+            logger.info("  → Storing %s keywords...", min(len(self.all_keywords), 30))
             for keyword, score in self.all_keywords[:30]:
                 db_manager.add_keyword({
                     'project_id': project.id,
@@ -535,12 +524,13 @@ def scan_text_document(document_path: str, single_file: Optional[bool] = None, u
         scanner = TextDocumentScanner(document_path)
         return scanner.scan_and_store(user_id=user_id)
     except Exception as e:
-        print(f"\n✗ Error scanning project: {e}")
+        logger.error("✗ Error scanning project: %s", e)
         return None
 
 
 if __name__ == "__main__":
     """Command-line interface"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     if len(sys.argv) < 2:
         print("Usage: python textDocumentScanner.py <document_path>")
         sys.exit(1)
@@ -1,5 +1,4 @@
 import os
-from PIL import Image, ExifTags
 
 def analyze_visual_project(path):
     """
@@ -142,6 +141,7 @@ def analyze_visual_project(path):
         # Check EXIF metadata for program info (for images)
         if ext in ['.jpg', '.jpeg', '.png', '.tiff', '.tif']:
             try:
+                from PIL import Image, ExifTags
                 with Image.open(path) as img:
                     exif_data = img.getexif()
                     if exif_data:
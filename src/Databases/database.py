@@ -1,9 +1,20 @@
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index, func, UniqueConstraint
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Boolean, Text, ForeignKey, Index, func, UniqueConstraint, select, and_, or_, bindparam
+from sqlalchemy import event
 from sqlalchemy.orm import declarative_base, relationship, sessionmaker, joinedload
+from collections import OrderedDict
 from datetime import datetime, timezone
+import base64
 import json
+import logging
 import os
-from typing import List, Optional, Dict, Any
+import threading
+import time
+from typing import List, Optional, Dict, Any, Tuple
+
+from src.Databases.request_scope import current_scope
+from src.Services import metrics
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================
@@ -82,6 +93,8 @@ class Project(Base):
     files = relationship('File', back_populates='project', cascade='all, delete-orphan', lazy='select')
     contributors = relationship('Contributor', back_populates='project', cascade='all, delete-orphan', lazy='select')
     keywords = relationship('Keyword', back_populates='project', cascade='all, delete-orphan', lazy='select')
+    ai_context = relationship('ProjectAIContext', back_populates='project', cascade='all, delete-orphan',
+                              uselist=False, lazy='select')
     
     # Timestamps - FIXED: Use timezone-aware datetime
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
@@ -260,6 +273,12 @@ class File(Base):
     # Relationships
     project = relationship('Project', back_populates='files')
     duplicate_of = relationship('File', remote_side=[id], backref='duplicates')
+
+    # Covering indexes for "which paths/hashes belong to more than one project"
+    __table_args__ = (
+        Index('idx_file_path_project', 'file_path', 'project_id'),
+        Index('idx_file_hash_project', 'file_hash', 'project_id'),
+    )
     
     @property
     def editors(self) -> List[str]:
@@ -350,6 +369,27 @@ class Keyword(Base):
             'category': self.category,
         }
 
+class ProjectAIContext(Base):
+    """Token-budgeted project digest reused by AI prompts (see src/AI/project_context.py)"""
+    __tablename__ = 'project_ai_contexts'
+
+    project_id = Column(Integer, ForeignKey('projects.id', ondelete='CASCADE'), primary_key=True)
+    version = Column(String(64), nullable=False)   # content version the digest was built from
+    _digest = Column('digest', Text, nullable=False)
+    token_count = Column(Integer, default=0)
+    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
+
+    project = relationship('Project', back_populates='ai_context')
+
+    @property
+    def digest(self) -> Dict[str, Any]:
+        return Project._safe_json_loads(self._digest, {})
+
+    @digest.setter
+    def digest(self, value: Dict[str, Any]):
+        self._digest = json.dumps(value)
+
+
 class Resume(Base):
     __tablename__ = 'resumes'
     id = Column(Integer, primary_key=True)
@@ -605,6 +645,142 @@ class ContactInfo(Base):
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
         }
 
+# ============================================
+# PROJECT PROJECTIONS
+# ============================================
+
+# Columns a project card/list row needs. Leaves out ai_analysis,
+# resume_bullets, success_evidence and file_path, which only the detail
+# view uses and which dominate row size.
+PROJECT_CARD_COLUMNS = (
+    Project.id, Project.name, Project.description, Project.project_type,
+    Project.collaboration_type, Project.importance_score, Project.user_rank,
+    Project.is_featured, Project.is_hidden, Project.date_created,
+    Project.date_modified, Project.date_scanned, Project.lines_of_code,
+    Project.word_count, Project.file_count, Project.total_size_bytes,
+    Project._languages, Project._frameworks, Project._skills, Project._tags,
+    Project.thumbnail_path, Project.custom_description, Project.user_role,
+    Project.ai_description, Project.created_at, Project.updated_at,
+)
+
+_JSON_CARD_COLUMNS = {'_languages': 'languages', '_frameworks': 'frameworks', '_skills': 'skills', '_tags': 'tags'}
+
+
+def project_card_to_dict(row) -> Dict[str, Any]:
+    """Convert a PROJECT_CARD_COLUMNS row to the same keys Project.to_dict() uses."""
+    result = {}
+    for key, value in row._mapping.items():
+        if key in _JSON_CARD_COLUMNS:
+            result[_JSON_CARD_COLUMNS[key]] = Project._safe_json_loads(value, [])
+        elif isinstance(value, datetime):
+            result[key] = value.isoformat()
+        else:
+            result[key] = value
+    return result
+
+
+def encode_project_cursor(date_modified: Optional[datetime], project_id: int) -> str:
+    """Opaque keyset cursor for (date_modified DESC, id DESC) pagination."""
+    payload = json.dumps([date_modified.isoformat() if date_modified else None, project_id])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_project_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """Inverse of encode_project_cursor. Raises ValueError on a malformed cursor."""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        date_str, project_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(date_str) if date_str else None), int(project_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+# ============================================
+# USER PROJECTIONS
+# ============================================
+
+# Scalar profile fields the auth'd endpoints read on every request (/auth/me,
+# export filenames, portfolio visibility). Leaves out the password hash and
+# the portfolio/resume/contact JSON blobs.
+USER_SUMMARY_COLUMNS = (
+    User.id, User.first_name, User.last_name, User.email, User.avatar,
+    User.github_username, User.portfolio_public, User.created_at, User.updated_at,
+)
+
+# Cached summaries are dropped on commit when this process changes the user;
+# the TTL bounds how stale one can get when another process writes
+USER_SUMMARY_CACHE_SIZE = 256
+USER_SUMMARY_TTL_SECONDS = 60.0
+
+
+_CHANGED_PROJECTS_KEY = 'changed_project_ids'
+_BULK_CHANGE_KEY = 'bulk_project_change'
+
+
+def _collect_project_changes(session, flush_context):
+    changed = session.info.setdefault(_CHANGED_PROJECTS_KEY, set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, Project):
+            changed.add(obj.id)
+        elif isinstance(obj, (File, Keyword)):
+            changed.add(obj.project_id)
+
+
+def _collect_bulk_project_changes(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in (Project, File, Keyword):
+        orm_execute_state.session.info[_BULK_CHANGE_KEY] = True
+
+
+def _discard_project_changes(session):
+    session.info.pop(_CHANGED_PROJECTS_KEY, None)
+    session.info.pop(_BULK_CHANGE_KEY, None)
+
+
+_CHANGED_USERS_KEY = 'changed_user_ids'
+_BULK_USER_CHANGE_KEY = 'bulk_user_change'
+
+
+def _collect_user_changes(session, flush_context):
+    changed = session.info.setdefault(_CHANGED_USERS_KEY, set())
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if isinstance(obj, User):
+            changed.add(obj.id)
+
+
+def _collect_bulk_user_changes(orm_execute_state):
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ is User:
+        orm_execute_state.session.info[_BULK_USER_CHANGE_KEY] = True
+
+
+def _discard_user_changes(session):
+    session.info.pop(_CHANGED_USERS_KEY, None)
+    session.info.pop(_BULK_USER_CHANGE_KEY, None)
+
+
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    conn.info['query_start_time'] = time.perf_counter()
+    scope = current_scope()
+    if scope is not None:
+        scope.count_query()
+
+
+def _time_query(conn, cursor, statement, parameters, context, executemany):
+    start = conn.info.pop('query_start_time', None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    metrics.record_query(statement, elapsed)
+    scope = current_scope()
+    if scope is not None:
+        scope.add_query_time(elapsed)
+
+
 # ============================================
 # DATABASE MANAGER
 # ============================================
@@ -634,8 +810,7 @@ class DatabaseManager:
     def __init__(self, db_path: str = 'data/projects.db'):
         """Initialize database manager - FIXED: Proper engine disposal"""
         os.makedirs(os.path.dirname(db_path) if os.path.dirname(db_path) else 'data', exist_ok=True)
-        print("DB FILE:", os.path.abspath(db_path))
-        print("TABLES:", Base.metadata.tables.keys())
+        logger.debug("DB file: %s", os.path.abspath(db_path))
         
         # Create engine with proper settings for Windows
         self.engine = create_engine(
@@ -653,12 +828,74 @@ class DatabaseManager:
             except (ImportError, ModuleNotFoundError):
                 pass
         
-        Base.metadata.create_all(self.engine)
-        
-        # Run schema upgrade to add missing columns
-        self._upgrade_schema()
+        # Versioned migrations: a single SELECT when the schema is current
+        from src.Databases.db_migration import ensure_schema
+        ensure_schema(self.engine)
 
         self.Session = sessionmaker(bind=self.engine)
+
+        # Per-request query counter (no-op outside a request scope) and /metrics query timings
+        event.listen(self.engine, "before_cursor_execute", _count_query)
+        event.listen(self.engine, "after_cursor_execute", _time_query)
+        # Any committed write may touch a cached project's files/contributors/keywords
+        event.listen(self.Session, "after_commit", self._invalidate_scope_projects)
+
+        # Derived views (analytics snapshot, search index) subscribe to project changes
+        self._project_listeners = []
+        event.listen(self.Session, "after_flush", _collect_project_changes)
+        event.listen(self.Session, "do_orm_execute", _collect_bulk_project_changes)
+        event.listen(self.Session, "after_commit", self._notify_project_listeners)
+        event.listen(self.Session, "after_rollback", _discard_project_changes)
+
+        # get_user_summary() cache: user_id -> (row, expires_at)
+        self._user_summaries = OrderedDict()
+        self._user_summary_lock = threading.Lock()
+        self._user_summary_generation = 0
+        event.listen(self.Session, "after_flush", _collect_user_changes)
+        event.listen(self.Session, "do_orm_execute", _collect_bulk_user_changes)
+        event.listen(self.Session, "after_commit", self._invalidate_user_summaries)
+        event.listen(self.Session, "after_rollback", _discard_user_changes)
+
+    def _invalidate_scope_projects(self, session):
+        scope = current_scope()
+        if scope is not None:
+            scope.clear_projects(self)
+
+    def add_project_change_listener(self, callback) -> None:
+        """
+        Call callback(project_ids) after every commit that touched projects
+        or their files/keywords. project_ids is None when the commit ran a
+        bulk UPDATE/DELETE whose rows aren't known (treat as "everything").
+        """
+        self._project_listeners.append(callback)
+
+    def _notify_project_listeners(self, session):
+        changed = session.info.pop(_CHANGED_PROJECTS_KEY, None)
+        bulk = session.info.pop(_BULK_CHANGE_KEY, False)
+        if bulk:
+            self._publish_project_changes(None)
+        elif changed:
+            self._publish_project_changes({pid for pid in changed if pid is not None})
+
+    def _invalidate_user_summaries(self, session):
+        changed = session.info.pop(_CHANGED_USERS_KEY, None)
+        bulk = session.info.pop(_BULK_USER_CHANGE_KEY, False)
+        if not (bulk or changed):
+            return
+        with self._user_summary_lock:
+            self._user_summary_generation += 1
+            if bulk:
+                self._user_summaries.clear()
+            else:
+                for user_id in changed:
+                    self._user_summaries.pop(user_id, None)
+
+    def _publish_project_changes(self, project_ids) -> None:
+        for callback in list(self._project_listeners):
+            try:
+                callback(project_ids)
+            except Exception as e:
+                logger.warning("Project change listener failed: %s", e)
     
     def close(self):
         """FIXED: Properly close all connections"""
@@ -670,125 +907,31 @@ class DatabaseManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.close()
     
-    def _upgrade_schema(self):
-        """Add missing columns to existing tables"""
-        from sqlalchemy import text, inspect
-        inspector = inspect(self.engine)
-        
-        if 'projects' not in inspector.get_table_names():
-            return
-        
-        existing_columns = [col['name'] for col in inspector.get_columns('projects')]
-        
-        with self.engine.connect() as conn:
-            if 'word_count' not in existing_columns:
-                try:
-                    conn.execute(text("ALTER TABLE projects ADD COLUMN word_count INTEGER DEFAULT 0;"))
-                    conn.commit()
-                    print("✅ Added word_count column")
-                except Exception as e:
-                    print(f"⚠️  Could not add word_count: {e}")
-
-            if 'ai_description' not in existing_columns:
-                try:
-                    conn.execute(text("ALTER TABLE projects ADD COLUMN ai_description TEXT;"))
-                    conn.commit()
-                    print("✅ Added ai_description column")
-                except Exception as e:
-                    print(f"⚠️  Could not add ai_description: {e}")
-
-            if 'ai_analysis' not in existing_columns:
-                try:
-                    conn.execute(text("ALTER TABLE projects ADD COLUMN ai_analysis TEXT;"))
-                    conn.commit()
-                    print("✅ Added ai_analysis column")
-                except Exception as e:
-                    print(f"⚠️  Could not add ai_analysis: {e}")
-
-            if 'user_id' not in existing_columns:
-                try:
-                    conn.execute(text("ALTER TABLE projects ADD COLUMN user_id INTEGER;"))
-                    conn.execute(text("CREATE INDEX IF NOT EXISTS idx_user_projects ON projects(user_id, date_modified);"))
-                    conn.commit()
-                    print("✅ Added user_id column to projects")
-                except Exception as e:
-                    print(f"⚠️  Could not add user_id: {e}")
-
-            if 'custom_description' not in existing_columns:
-                try:
-                    conn.execute(text("ALTER TABLE projects ADD COLUMN custom_description TEXT;"))
-                    conn.commit()
-                    print("✅ Added custom_description column")
-                except Exception as e:
-                    print(f"⚠️  Could not add custom_description: {e}")
-
-            if 'user_role' not in existing_columns:
-                try:
-                    conn.execute(text("ALTER TABLE projects ADD COLUMN user_role VARCHAR(100);"))
-                    conn.commit()
-                    print("✅ Added user_role column")
-                except Exception as e:
-                    print(f"⚠️  Could not add user_role: {e}")
-
-            if 'user_contribution_percent' not in existing_columns:
-                try:
-                    conn.execute(text("ALTER TABLE projects ADD COLUMN user_contribution_percent FLOAT;"))
-                    conn.commit()
-                    print("✅ Added user_contribution_percent column")
-                except Exception as e:
-                    print(f"⚠️  Could not add user_contribution_percent: {e}")
-
-            if 'is_hidden' not in existing_columns:
-                try:
-                    conn.execute(text("ALTER TABLE projects ADD COLUMN is_hidden BOOLEAN DEFAULT 0;"))
-                    conn.commit()
-                    print("✅ Added is_hidden column")
-                except Exception as e:
-                    print(f"⚠️  Could not add is_hidden: {e}")
-
-            if 'user_rank' not in existing_columns:
-                try:
-                    conn.execute(text("ALTER TABLE projects ADD COLUMN user_rank INTEGER;"))
-                    conn.commit()
-                    print("✅ Added user_rank column")
-                except Exception as e:
-                    print(f"⚠️  Could not add user_rank: {e}")
-
-        if 'content_hash' not in existing_columns:
-            try:
-                conn.execute(text("ALTER TABLE projects ADD COLUMN content_hash VARCHAR(64);"))
-                conn.execute(text("CREATE INDEX IF NOT EXISTS idx_project_content_hash ON projects(content_hash);"))
-                conn.commit()
-                print("✅ Added content_hash column")
-            except Exception as e:
-                print(f"⚠️  Could not add content_hash: {e}")
-
-        if 'files' in inspector.get_table_names():
-            existing_file_columns = [col['name'] for col in inspector.get_columns('files')]
-            with self.engine.connect() as conn:
-                if 'file_hash' not in existing_file_columns:
-                    try:
-                        conn.execute(text("ALTER TABLE files ADD COLUMN file_hash VARCHAR(64);"))
-                        conn.execute(text("CREATE INDEX IF NOT EXISTS idx_file_hash ON files(file_hash);"))
-                        conn.commit()
-                        print("✅ Added file_hash column")
-                    except Exception as e:
-                        print(f"⚠️  Could not add file_hash: {e}")
-
-        if 'work_history' in inspector.get_table_names():
-            existing_work_columns = [col['name'] for col in inspector.get_columns('work_history')]
-            with self.engine.connect() as conn:
-                if 'experience_type' not in existing_work_columns:
-                    try:
-                        conn.execute(text("ALTER TABLE work_history ADD COLUMN experience_type VARCHAR(50) DEFAULT 'work';"))
-                        conn.execute(text("UPDATE work_history SET experience_type = 'work' WHERE experience_type IS NULL;"))
-                        conn.commit()
-                        print("✅ Added experience_type column to work_history")
-                    except Exception as e:
-                        print(f"⚠️  Could not add experience_type: {e}")
-    
     def get_session(self):
+        # Buffered writes go out before any real query so reads stay consistent
+        scope = current_scope()
+        if scope is not None and scope.has_pending(self):
+            self.flush_pending_updates()
         return self.Session()
+
+    def flush_pending_updates(self) -> int:
+        """Write update_project() calls buffered by the request scope in one transaction."""
+        scope = current_scope()
+        pending = scope.take_pending(self) if scope is not None else {}
+        if not pending:
+            return 0
+        session = self.Session()
+        try:
+            projects = session.query(Project).filter(Project.id.in_(list(pending))).all()
+            now = datetime.now(timezone.utc)
+            for project in projects:
+                for key, value in pending[project.id].items():
+                    setattr(project, key, value)
+                project.updated_at = now
+            session.commit()
+            return len(projects)
+        finally:
+            session.close()
     
     # ============ PROJECT OPERATIONS ============
     
@@ -804,13 +947,21 @@ class DatabaseManager:
             session.close()
     
     def get_project(self, project_id: int) -> Optional[Project]:
+        scope = current_scope()
+        if scope is not None:
+            cached = scope.get_project(self, project_id)
+            if cached is not None:
+                return cached
         session = self.get_session()
         try:
-            return session.query(Project).options(
+            project = session.query(Project).options(
                 joinedload(Project.files),
                 joinedload(Project.contributors),
                 joinedload(Project.keywords)
             ).filter(Project.id == project_id).first()
+            if scope is not None:
+                scope.put_project(self, project)
+            return project
         finally:
             session.close()
     
@@ -851,6 +1002,17 @@ class DatabaseManager:
             session.close()
     
     def update_project(self, project_id: int, updates: Dict[str, Any]) -> Optional[Project]:
+        scope = current_scope()
+        if scope is not None:
+            # Apply to the request's copy now, write with the next flush
+            project = self.get_project(project_id)
+            if project:
+                for key, value in updates.items():
+                    setattr(project, key, value)
+                project.updated_at = datetime.now(timezone.utc)
+                scope.defer_update(self, project_id, updates)
+            return project
+
         session = self.get_session()
         try:
             project = session.query(Project).filter(Project.id == project_id).first()
@@ -863,8 +1025,41 @@ class DatabaseManager:
             return project
         finally:
             session.close()
-    
+
+    def bulk_update_importance_scores(self, scores: Dict[int, float]) -> int:
+        """
+        Write many importance scores with one executemany UPDATE.
+
+        Runs on the engine rather than through a Session, so request-scoped
+        copies of the projects are dropped afterwards.
+        """
+        if not scores:
+            return 0
+        scope = current_scope()
+        if scope is not None and scope.has_pending(self):
+            self.flush_pending_updates()
+
+        table = Project.__table__
+        stmt = (
+            table.update()
+            .where(table.c.id == bindparam('project_id'))
+            .values(importance_score=bindparam('score'))
+        )
+        with self.engine.begin() as conn:
+            conn.execute(stmt, [
+                {'project_id': project_id, 'score': score}
+                for project_id, score in scores.items()
+            ])
+
+        if scope is not None:
+            scope.clear_projects(self)
+        self._publish_project_changes(set(scores))
+        return len(scores)
+
     def delete_project(self, project_id: int) -> bool:
+        scope = current_scope()
+        if scope is not None:
+            scope.forget_project(self, project_id)
         session = self.get_session()
         try:
             project = session.query(Project).filter(Project.id == project_id).first()
@@ -900,6 +1095,9 @@ class DatabaseManager:
         session = self.get_session()
         try:
             count = session.query(Project).filter(Project.user_id == None).count()
+            guest_ids = session.query(Project.id).filter(Project.user_id == None)
+            session.query(ProjectAIContext).filter(ProjectAIContext.project_id.in_(guest_ids)).delete(
+                synchronize_session=False)
             session.query(Project).filter(Project.user_id == None).delete()
             session.commit()
             return count
@@ -928,6 +1126,104 @@ class DatabaseManager:
         finally:
             session.close()
     
+    def get_project_cards(self, project_ids: List[int]) -> Dict[int, Any]:
+        """PROJECT_CARD_COLUMNS rows for the given ids, keyed by id (one query)."""
+        if not project_ids:
+            return {}
+        session = self.get_session()
+        try:
+            rows = session.query(*PROJECT_CARD_COLUMNS).filter(Project.id.in_(list(project_ids))).all()
+            return {row.id: row for row in rows}
+        finally:
+            session.close()
+
+    def get_project_with_counts(self, project_id: int) -> Tuple[Optional[Project], Dict[str, int]]:
+        """
+        Load one project plus its file/contributor/keyword counts.
+        Counts come from correlated COUNT subqueries instead of loading
+        every related row just to call len() on it.
+        """
+        file_count = select(func.count(File.id)).where(File.project_id == Project.id).scalar_subquery()
+        contributor_count = select(func.count(Contributor.id)).where(Contributor.project_id == Project.id).scalar_subquery()
+        keyword_count = select(func.count(Keyword.id)).where(Keyword.project_id == Project.id).scalar_subquery()
+
+        session = self.get_session()
+        try:
+            row = session.query(Project, file_count, contributor_count, keyword_count).filter(
+                Project.id == project_id
+            ).first()
+            if row is None:
+                return None, {}
+            project, files, contributors, keywords = row
+            return project, {
+                'file_count_actual': files or 0,
+                'contributor_count': contributors or 0,
+                'keyword_count': keywords or 0,
+            }
+        finally:
+            session.close()
+
+    def get_project_page(
+        self,
+        user_id: Optional[int],
+        include_hidden: bool = False,
+        view: str = 'full',
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Tuple[list, Optional[str]]:
+        """
+        One page of a user's projects (guest projects when user_id is None),
+        newest first.
+
+        Args:
+            view: 'card' returns PROJECT_CARD_COLUMNS rows (only those columns
+                are selected); 'full' returns Project objects.
+            limit: Page size, or None for everything
+            cursor: Value returned as next_cursor by the previous page
+
+        Returns:
+            (items, next_cursor) where next_cursor is None on the last page.
+        """
+        session = self.get_session()
+        try:
+            if view == 'card':
+                query = session.query(*PROJECT_CARD_COLUMNS)
+            else:
+                query = session.query(Project)
+
+            if user_id is None:
+                query = query.filter(Project.user_id == None)
+            else:
+                query = query.filter(Project.user_id == user_id)
+            if not include_hidden:
+                query = query.filter(Project.is_hidden == False)
+
+            if cursor:
+                after_date, after_id = decode_project_cursor(cursor)
+                # SQLite sorts NULL dates last in DESC order
+                if after_date is None:
+                    query = query.filter(Project.date_modified == None, Project.id < after_id)
+                else:
+                    query = query.filter(or_(
+                        Project.date_modified < after_date,
+                        and_(Project.date_modified == after_date, Project.id < after_id),
+                        Project.date_modified == None,
+                    ))
+
+            query = query.order_by(Project.date_modified.desc(), Project.id.desc())
+            if limit is None:
+                return query.all(), None
+
+            # Fetch one extra row to know whether another page exists
+            rows = query.limit(limit + 1).all()
+            if len(rows) <= limit:
+                return rows, None
+            rows = rows[:limit]
+            last = rows[-1]
+            return rows, encode_project_cursor(last.date_modified, last.id)
+        finally:
+            session.close()
+
     # ============ FILE OPERATIONS ============
     
     def add_file_to_project(self, file_data: Dict[str, Any]) -> File:
@@ -1007,6 +1303,27 @@ class DatabaseManager:
         finally:
             session.close()
     
+    # ============ AI CONTEXT OPERATIONS ============
+
+    def get_project_ai_context(self, project_id: int) -> Optional[ProjectAIContext]:
+        session = self.get_session()
+        try:
+            return session.get(ProjectAIContext, project_id)
+        finally:
+            session.close()
+
+    def save_project_ai_context(self, project_id: int, version: str, digest: Dict[str, Any],
+                                token_count: int) -> None:
+        session = self.get_session()
+        try:
+            session.merge(ProjectAIContext(
+                project_id=project_id, version=version, digest=digest, token_count=token_count,
+                created_at=datetime.now(timezone.utc),
+            ))
+            session.commit()
+        finally:
+            session.close()
+
     # ============ RESUME BULLETS OPERATIONS ============
     
     def save_resume_bullets(self, project_id: int, bullets: List[str], header: str, ats_score: Optional[float] = None) -> bool:
@@ -1294,6 +1611,46 @@ class DatabaseManager:
         finally:
             session.close()
 
+    def get_user_summary(self, user_id: int):
+        """
+        USER_SUMMARY_COLUMNS row for a user (attribute access: .first_name,
+        .portfolio_public, ...), or None if the user doesn't exist.
+
+        Served from a small LRU; commits that change the user invalidate it.
+        Use get_user() when the education/work history or JSON blobs are needed.
+        """
+        now = time.monotonic()
+        with self._user_summary_lock:
+            entry = self._user_summaries.get(user_id)
+            if entry is not None and entry[1] > now:
+                self._user_summaries.move_to_end(user_id)
+                return entry[0]
+            generation = self._user_summary_generation
+
+        session = self.get_session()
+        try:
+            row = session.execute(
+                select(*USER_SUMMARY_COLUMNS).where(User.id == user_id)
+            ).first()
+        finally:
+            session.close()
+
+        if row is not None:
+            with self._user_summary_lock:
+                # Skip the store if a commit invalidated users while we read
+                if generation == self._user_summary_generation:
+                    self._user_summaries[user_id] = (row, now + USER_SUMMARY_TTL_SECONDS)
+                    self._user_summaries.move_to_end(user_id)
+                    while len(self._user_summaries) > USER_SUMMARY_CACHE_SIZE:
+                        self._user_summaries.popitem(last=False)
+        return row
+
+    def clear_user_summaries(self) -> None:
+        """Drop every cached get_user_summary() row."""
+        with self._user_summary_lock:
+            self._user_summary_generation += 1
+            self._user_summaries.clear()
+
     def get_user_by_email(self, email: str) -> Optional[User]:
         session = self.get_session()
         try:
@@ -1477,6 +1834,7 @@ class DatabaseManager:
             session.query(Keyword).delete()
             session.query(Contributor).delete()
             session.query(File).delete()
+            session.query(ProjectAIContext).delete()
             session.query(Project).delete()
             session.query(Education).delete()
             session.query(WorkHistory).delete()
@@ -1,132 +1,255 @@
-from sqlalchemy import text
-from Databases.database import DatabaseManager
+"""
+Versioned schema migrations for the SQLite database.
 
+The database records the schema version it is at in a one-row
+`schema_version` table. DatabaseManager calls ensure_schema() when it is
+constructed; on an up-to-date database that is a single SELECT, with no
+create_all() and no column reflection.
 
-def migrate_add_file_hash():
-    """Add file_hash column to files table if it doesn't exist"""
+Migrations run in order, once, inside one BEGIN IMMEDIATE transaction, so a
+failed upgrade leaves the database at its previous version and two
+processes starting together don't both migrate. A brand new database is
+created straight from the models and stamped with the latest version.
+
+Adding a column to an existing table:
+  1. add it to the model in database.py
+  2. append a Migration to MIGRATIONS that adds it with _add_columns()
+
+New tables need no migration: the stored metadata fingerprint (a hash of
+the model table names) changes, and the next startup runs create_all() once.
+
+Run all pending migrations by hand:
+    python -m src.Databases.db_migration
+"""
+
+import hashlib
+import logging
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+SCHEMA_VERSION_TABLE = "schema_version"
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    apply: Callable  # apply(conn) inside the migration transaction
+
+
+def _columns(conn, table: str) -> set:
+    return {row[1] for row in conn.execute(text(f"PRAGMA table_info({table})"))}
+
+
+def _add_columns(conn, table: str, columns: Sequence[Tuple[str, str]],
+                 indexes: Sequence[str] = ()) -> List[str]:
+    """
+    ADD COLUMN each (name, type/default DDL) the table lacks, then run the
+    CREATE INDEX IF NOT EXISTS statements. Returns the columns added; a
+    missing table is left alone (create_all builds it whole).
+    """
+    existing = _columns(conn, table)
+    if not existing:
+        return []
+    added = []
+    for name, ddl in columns:
+        if name not in existing:
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {name} {ddl}"))
+            added.append(name)
+    for statement in indexes:
+        conn.execute(text(statement))
+    return added
+
+
+def _create_tables(conn):
+    from src.Databases.database import Base
+    Base.metadata.create_all(conn)
+
+
+def _projects_columns(conn):
+    _add_columns(conn, "projects", [
+        ("word_count", "INTEGER DEFAULT 0"),
+        ("ai_description", "TEXT"),
+        ("ai_analysis", "TEXT"),
+        ("user_id", "INTEGER"),
+        ("custom_description", "TEXT"),
+        ("user_role", "VARCHAR(100)"),
+        ("user_contribution_percent", "FLOAT"),
+        ("importance_score", "FLOAT DEFAULT 0"),
+        ("is_hidden", "BOOLEAN DEFAULT 0"),
+        ("user_rank", "INTEGER"),
+        ("content_hash", "VARCHAR(64)"),
+    ], indexes=[
+        "CREATE INDEX IF NOT EXISTS idx_user_projects ON projects(user_id, date_modified)",
+        "CREATE INDEX IF NOT EXISTS idx_project_content_hash ON projects(content_hash)",
+    ])
+
+
+def _files_columns(conn):
+    _add_columns(conn, "files", [
+        ("file_hash", "VARCHAR(64)"),
+    ], indexes=[
+        "CREATE INDEX IF NOT EXISTS idx_file_hash ON files(file_hash)",
+        # Composite indexes for set-based shared-file detection
+        "CREATE INDEX IF NOT EXISTS idx_file_path_project ON files(file_path, project_id)",
+        "CREATE INDEX IF NOT EXISTS idx_file_hash_project ON files(file_hash, project_id)",
+    ])
+
+
+def _work_history_columns(conn):
+    if "experience_type" in _add_columns(conn, "work_history", [
+        ("experience_type", "VARCHAR(50) DEFAULT 'work'"),
+    ]):
+        conn.execute(text("UPDATE work_history SET experience_type = 'work' WHERE experience_type IS NULL"))
+
+
+def _users_columns(conn):
+    _add_columns(conn, "users", [
+        ("avatar", "TEXT"),
+        ("github_username", "TEXT"),
+        ("portfolio_public", "BOOLEAN NOT NULL DEFAULT 0"),
+    ])
+
+
+# Ordered; never edit or renumber an entry once it has shipped, append instead.
+# 2-5 replace the column checks DatabaseManager used to run on every start.
+MIGRATIONS: List[Migration] = [
+    Migration(1, "create tables", _create_tables),
+    Migration(2, "projects: analysis, ownership and ranking columns", _projects_columns),
+    Migration(3, "files: file_hash and shared-file indexes", _files_columns),
+    Migration(4, "work_history: experience_type", _work_history_columns),
+    Migration(5, "users: avatar, github_username, portfolio_public", _users_columns),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def metadata_fingerprint() -> str:
+    """Hash of the model table names; changes when a model table is added."""
+    from src.Databases.database import Base
+    return hashlib.sha1(",".join(sorted(Base.metadata.tables)).encode()).hexdigest()[:16]
+
+
+def read_schema_version(conn) -> Optional[Tuple[int, str]]:
+    """(version, fingerprint) stored in the database, or None if unversioned."""
+    try:
+        row = conn.execute(text(f"SELECT version, fingerprint FROM {SCHEMA_VERSION_TABLE}")).first()
+    except OperationalError:
+        return None
+    return (row[0], row[1]) if row else None
+
+
+def _has_app_tables(conn) -> bool:
+    return conn.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'projects'"
+    )).first() is not None
+
+
+def ensure_schema(engine) -> int:
+    """
+    Bring the database at `engine` up to LATEST_VERSION.
+
+    Returns the version the database was at before (LATEST_VERSION when
+    nothing had to be done, 0 for an unversioned database).
+    """
+    fingerprint = metadata_fingerprint()
+    with engine.connect() as conn:
+        stored = read_schema_version(conn)
+    if stored == (LATEST_VERSION, fingerprint):
+        return LATEST_VERSION
+
+    with engine.begin() as conn:
+        # Take the write lock first, then re-check: another process may have
+        # migrated while this one waited
+        conn.execute(text("BEGIN IMMEDIATE"))
+        stored = read_schema_version(conn)
+        if stored is None:
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {SCHEMA_VERSION_TABLE} "
+                "(version INTEGER NOT NULL, fingerprint VARCHAR(16) NOT NULL)"
+            ))
+            # Nothing to upgrade on a new database: the models are current
+            current = 0 if _has_app_tables(conn) else None
+        else:
+            current = stored[0]
+
+        if current is None:
+            _create_tables(conn)
+            current = LATEST_VERSION
+        else:
+            for migration in MIGRATIONS:
+                if migration.version > current:
+                    migration.apply(conn)
+                    logger.info("Applied migration %d: %s", migration.version, migration.description)
+            if stored is not None and stored[1] != fingerprint:
+                _create_tables(conn)  # a model table was added since the last run
+
+        conn.execute(text(f"DELETE FROM {SCHEMA_VERSION_TABLE}"))
+        conn.execute(
+            text(f"INSERT INTO {SCHEMA_VERSION_TABLE} (version, fingerprint) VALUES (:v, :f)"),
+            {"v": LATEST_VERSION, "f": fingerprint},
+        )
+    return stored[0] if stored else 0
+
+
+# ============ STANDALONE COLUMN MIGRATIONS ============
+# Kept for scripts that call them directly; ensure_schema() covers all of them.
+# DatabaseManager is imported inside the functions: database.py imports this
+# module while it constructs the global db_manager.
+
+def _migrate_columns(table: str, columns: Sequence[Tuple[str, str]], indexes: Sequence[str] = ()):
+    from src.Databases.database import DatabaseManager
     db = DatabaseManager()
-    session = db.get_session()
-    
     try:
-        # Check if column exists
-        result = session.execute(text("PRAGMA table_info(files)"))
-        columns = [row[1] for row in result]
-        
-        if 'file_hash' not in columns:
-            print("Adding file_hash column to files table...")
-            session.execute(text("ALTER TABLE files ADD COLUMN file_hash VARCHAR(64)"))
-            session.execute(text("CREATE INDEX IF NOT EXISTS ix_files_file_hash ON files(file_hash)"))
-            session.commit()
-            print("✓ Migration complete")
+        with db.engine.begin() as conn:
+            added = _add_columns(conn, table, columns, indexes)
+    except Exception:
+        logger.error("Migrating %s columns failed", table, exc_info=True)
+        raise
+    for name, _ in columns:
+        if name in added:
+            logger.info("Added %s column to %s table", name, table)
         else:
-            print("✓ file_hash column already exists")
-    except Exception as e:
-        print(f"Migration error: {e}")
-        session.rollback()
-    finally:
-        session.close()
+            logger.info("%s column already exists on %s table", name, table)
+
+
+def migrate_add_file_hash():
+    """Add file_hash column to files table if it doesn't exist"""
+    _migrate_columns("files", [("file_hash", "VARCHAR(64)")],
+                     ["CREATE INDEX IF NOT EXISTS ix_files_file_hash ON files(file_hash)"])
 
 
 def migrate_add_user_contribution_percent():
     """Add user_contribution_percent column to projects table if it doesn't exist"""
-    db = DatabaseManager()
-    session = db.get_session()
-    
-    try:
-        # Check if column exists
-        result = session.execute(text("PRAGMA table_info(projects)"))
-        columns = [row[1] for row in result]
-        
-        if 'user_contribution_percent' not in columns:
-            print("Adding user_contribution_percent column to projects table...")
-            session.execute(text("ALTER TABLE projects ADD COLUMN user_contribution_percent FLOAT"))
-            session.commit()
-            print("✓ Migration complete")
-        else:
-            print("✓ user_contribution_percent column already exists")
-    except Exception as e:
-        print(f"Migration error: {e}")
-        session.rollback()
-    finally:
-        session.close()
+    _migrate_columns("projects", [("user_contribution_percent", "FLOAT")])
 
 
 def migrate_add_importance_score():
     """Add importance_score column to projects table if it doesn't exist"""
-    db = DatabaseManager()
-    session = db.get_session()
-
-    try:
-        # Check if column exists
-        result = session.execute(text("PRAGMA table_info(projects)"))
-        columns = [row[1] for row in result]
-
-        if 'importance_score' not in columns:
-            print("Adding importance_score column to projects table...")
-            session.execute(text("ALTER TABLE projects ADD COLUMN importance_score FLOAT DEFAULT 0"))
-            session.commit()
-            print("✓ Migration complete")
-        else:
-            print("✓ importance_score column already exists")
-    except Exception as e:
-        print(f"Migration error: {e}")
-        session.rollback()
-    finally:
-        session.close()
+    _migrate_columns("projects", [("importance_score", "FLOAT DEFAULT 0")])
 
 
 def migrate_add_user_avatar():
     """Add avatar column to users table if it doesn't exist"""
-    db = DatabaseManager()
-    session = db.get_session()
-    try:
-        result = session.execute(text("PRAGMA table_info(users)"))
-        columns = [row[1] for row in result]
-        if 'avatar' not in columns:
-            print("Adding avatar column to users table...")
-            session.execute(text("ALTER TABLE users ADD COLUMN avatar TEXT"))
-            session.commit()
-            print("✓ Migration complete")
-        else:
-            print("✓ avatar column already exists")
-    except Exception as e:
-        print(f"Migration error: {e}")
-        session.rollback()
-    finally:
-        session.close()
+    _migrate_columns("users", [("avatar", "TEXT")])
 
 
 def migrate_add_portfolio_public():
     """Add portfolio_public column to users table if it doesn't exist"""
-    db = DatabaseManager()
-    session = db.get_session()
-    try:
-        result = session.execute(text("PRAGMA table_info(users)"))
-        columns = [row[1] for row in result]
-        if 'portfolio_public' not in columns:
-            print("Adding portfolio_public column to users table...")
-            session.execute(text("ALTER TABLE users ADD COLUMN portfolio_public BOOLEAN NOT NULL DEFAULT 0"))
-            session.commit()
-            print("✓ Migration complete")
-        else:
-            print("✓ portfolio_public column already exists")
-    except Exception as e:
-        print(f"Migration error: {e}")
-        session.rollback()
-    finally:
-        session.close()
+    _migrate_columns("users", [("portfolio_public", "BOOLEAN NOT NULL DEFAULT 0")])
 
 
 def run_all_migrations():
-    """Run all migrations in order"""
-    print("Running database migrations...")
-    migrate_add_file_hash()
-    migrate_add_user_contribution_percent()
-    migrate_add_importance_score()
-    migrate_add_user_avatar()
-    migrate_add_portfolio_public()
-    print("\nAll migrations complete!")
+    """Run all pending migrations in order"""
+    from src.Databases.database import DatabaseManager
+    logger.info("Running database migrations...")
+    DatabaseManager()  # construction applies anything pending
+    logger.info("All migrations complete (schema version %d)", LATEST_VERSION)
 
 
 if __name__ == "__main__":
-    run_all_migrations()
\ No newline at end of file
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    run_all_migrations()
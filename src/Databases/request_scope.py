@@ -0,0 +1,198 @@
+"""
+Request-scoped identity map and write-behind buffer for DatabaseManager.
+
+While a RequestScope is active (one per API request, set up by
+RequestScopeMiddleware), DatabaseManager:
+  - returns the same Project object for repeated get_project(id) calls
+    instead of re-querying it
+  - buffers update_project() calls and writes them in one transaction,
+    either before the next real query (so reads stay consistent) or when
+    the endpoint returns (flush_request_writes)
+  - counts every SQL statement it executes and the time spent in them
+
+Outside a request (CLI, scanners run from tests, worker threads) there is
+no active scope and DatabaseManager behaves exactly as before.
+
+Usage:
+    from src.Databases.request_scope import request_scope
+
+    with request_scope() as scope:
+        db_manager.get_project(1)
+        db_manager.get_project(1)   # served from scope, no query
+    print(scope.query_count)
+"""
+
+import logging
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+_current_scope: ContextVar[Optional["RequestScope"]] = ContextVar("request_scope", default=None)
+
+QUERY_COUNT_HEADER = b"x-db-query-count"
+
+
+class RequestScope:
+    """Identity map, pending writes and query counter for one request."""
+
+    def __init__(self):
+        self.query_count = 0
+        self.query_seconds = 0.0
+        self.cache_hits = 0
+        # (id(manager), project_id) -> Project
+        self._projects: Dict[Tuple[int, int], Any] = {}
+        # manager -> {project_id: {column: value}}
+        self._pending: Dict[Any, Dict[int, Dict[str, Any]]] = {}
+        # Scanners stream results from threadpool workers that share this scope
+        self._lock = threading.RLock()
+
+    # ── identity map ────────────────────────────────────────────────────────
+
+    def get_project(self, manager, project_id: int):
+        with self._lock:
+            project = self._projects.get((id(manager), project_id))
+            if project is not None:
+                self.cache_hits += 1
+            return project
+
+    def put_project(self, manager, project) -> None:
+        if project is None:
+            return
+        with self._lock:
+            self._projects[(id(manager), project.id)] = project
+
+    def forget_project(self, manager, project_id: int) -> None:
+        with self._lock:
+            self._projects.pop((id(manager), project_id), None)
+            pending = self._pending.get(manager)
+            if pending:
+                pending.pop(project_id, None)
+
+    def clear_projects(self, manager) -> None:
+        """Drop every cached project of one manager (after a committed write)."""
+        with self._lock:
+            key = id(manager)
+            for cache_key in [k for k in self._projects if k[0] == key]:
+                del self._projects[cache_key]
+
+    # ── write-behind ────────────────────────────────────────────────────────
+
+    def defer_update(self, manager, project_id: int, updates: Dict[str, Any]) -> None:
+        with self._lock:
+            self._pending.setdefault(manager, {}).setdefault(project_id, {}).update(updates)
+
+    def has_pending(self, manager=None) -> bool:
+        with self._lock:
+            if manager is None:
+                return any(self._pending.values())
+            return bool(self._pending.get(manager))
+
+    def take_pending(self, manager) -> Dict[int, Dict[str, Any]]:
+        with self._lock:
+            return self._pending.pop(manager, None) or {}
+
+    def flush(self, raise_errors: bool = False) -> None:
+        """
+        Write every buffered update (one transaction per DatabaseManager).
+        Failures are logged, or raised with raise_errors=True.
+        """
+        with self._lock:
+            managers = [m for m, pending in self._pending.items() if pending]
+        for manager in managers:
+            try:
+                manager.flush_pending_updates()
+            except Exception as e:
+                if raise_errors:
+                    raise
+                logger.error("Failed to flush buffered project updates: %s", e)
+
+    def count_query(self) -> None:
+        self.query_count += 1
+
+    def add_query_time(self, seconds: float) -> None:
+        self.query_seconds += seconds
+
+
+def current_scope() -> Optional[RequestScope]:
+    """The scope of the request being handled, or None."""
+    return _current_scope.get()
+
+
+@contextmanager
+def request_scope() -> Iterator[RequestScope]:
+    """Activate a fresh scope for the duration of the block, flushing on exit."""
+    scope = RequestScope()
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        try:
+            scope.flush()
+        finally:
+            _current_scope.reset(token)
+
+
+def flush_request_writes() -> Iterator[None]:
+    """
+    App-wide FastAPI dependency, used with scope="function": once the
+    endpoint returns (or raises), writes its buffered updates from the
+    threadpool, before the response is built. A failed write becomes a 500
+    instead of a success response for a change that was never saved.
+    """
+    try:
+        yield
+    finally:
+        scope = current_scope()
+        if scope is not None and scope.has_pending():
+            try:
+                scope.flush(raise_errors=True)
+            except Exception as e:
+                from fastapi import HTTPException
+                logger.error("Failed to save buffered project updates: %s", e)
+                raise HTTPException(status_code=500, detail="Failed to save changes") from e
+
+
+def get_request_scope() -> Optional[RequestScope]:
+    """
+    FastAPI dependency returning the current request's scope, e.g. to read
+    scope.query_count while profiling an endpoint.
+    """
+    return current_scope()
+
+
+class RequestScopeMiddleware:
+    """
+    ASGI middleware that opens a RequestScope per HTTP request.
+
+    Endpoints flush their buffered writes through flush_request_writes;
+    anything still pending when the response starts (e.g. written while a
+    streaming body is produced) is flushed from the threadpool then, so a
+    client that issues its next request as soon as it sees the response
+    always reads the updated rows. The response carries the number of SQL
+    statements the request ran in an X-DB-Query-Count header.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with request_scope() as req_scope:
+            async def send_wrapper(message):
+                if message["type"] == "http.response.start":
+                    if req_scope.has_pending():
+                        await run_in_threadpool(req_scope.flush)
+                    headers = list(message.get("headers", []))
+                    headers.append((QUERY_COUNT_HEADER, str(req_scope.query_count).encode()))
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
@@ -6,7 +6,10 @@ Manages user preferences, consent settings, privacy options, and application set
 from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, Float
 from sqlalchemy.ext.declarative import declarative_base
 from datetime import datetime, timezone
+import functools
 import json
+import threading
+import weakref
 from typing import Dict, Any, Optional, List
 from src.Databases.database import Base
 
@@ -258,15 +261,79 @@ class UserConfig(Base):
         return f"<UserConfig(id={self.id}, version={self.config_version}, updated={self.updated_at})>"
 
 
+class _ConfigSnapshot:
+    """In-memory copy of the config row for one database, plus a version counter"""
+
+    __slots__ = ('version', 'config')
+
+    def __init__(self):
+        self.version = 0
+        self.config: Optional[UserConfig] = None
+
+
+# Shared by every ConfigManager on the same DatabaseManager, so a write through
+# one manager (e.g. the consent router) is seen by all the others.
+_snapshots: "weakref.WeakKeyDictionary[Any, _ConfigSnapshot]" = weakref.WeakKeyDictionary()
+_snapshot_lock = threading.Lock()
+
+
+def _copy_config(config: UserConfig) -> UserConfig:
+    """Return a detached copy so callers can't mutate the cached snapshot"""
+    copy = UserConfig()
+    for column in UserConfig.__table__.columns:
+        setattr(copy, column.key, getattr(config, column.key))
+    return copy
+
+
+def _invalidates_snapshot(method):
+    """Bump the snapshot version after a method that writes the config row"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate_cache()
+    return wrapper
+
+
 class ConfigManager:
     """
     Manager for user configuration operations
     Handles CRUD operations and configuration validation
+
+    Reads are served from an in-memory snapshot of the config row; every
+    write below invalidates it and the next read goes back to the database.
     """
     
     def __init__(self, database_manager):
         """Initialize configuration manager with database manager"""
         self.db_manager = database_manager
+        with _snapshot_lock:
+            if database_manager not in _snapshots:
+                _snapshots[database_manager] = _ConfigSnapshot()
+            self._snapshot = _snapshots[database_manager]
+
+    @property
+    def cache_version(self) -> int:
+        """Incremented every time the stored configuration changes"""
+        return self._snapshot.version
+
+    def invalidate_cache(self):
+        """Drop the cached snapshot (call after writing user_configs directly)"""
+        with _snapshot_lock:
+            self._snapshot.version += 1
+            self._snapshot.config = None
+
+    def _cached_config(self) -> Optional[UserConfig]:
+        with _snapshot_lock:
+            config = self._snapshot.config
+        return _copy_config(config) if config is not None else None
+
+    def _store_snapshot(self, config: UserConfig, version: int):
+        # Skip if a write landed while we were reading, the row we read is stale
+        with _snapshot_lock:
+            if self._snapshot.version == version:
+                self._snapshot.config = _copy_config(config)
 
     @staticmethod
     def _normalize_extension(extension: str) -> str:
@@ -287,10 +354,16 @@ class ConfigManager:
         """
         Get existing configuration or create default one
         There should only be one config per user/installation
+        Served from the in-memory snapshot when one is cached
         
         Returns:
             UserConfig: The user's configuration (detached from session)
         """
+        cached = self._cached_config()
+        if cached is not None:
+            return cached
+
+        version = self.cache_version
         session = self.db_manager.get_session()
         try:
             config = session.query(UserConfig).first()
@@ -302,7 +375,7 @@ class ConfigManager:
                 session.commit()
                 session.refresh(config)
             else:
-                # Update last accessed timestamp
+                # Update last accessed timestamp (only on a snapshot miss)
                 config.last_accessed = datetime.now()
                 session.commit()
                 session.refresh(config)
@@ -310,6 +383,7 @@ class ConfigManager:
             # Detach from session by accessing all properties
             # This ensures the object can be used after session closes
             session.expunge(config)
+            self._store_snapshot(config, version)
             
             return config
         finally:
@@ -322,15 +396,22 @@ class ConfigManager:
         Returns:
             Optional[UserConfig]: The configuration or None (detached from session)
         """
+        cached = self._cached_config()
+        if cached is not None:
+            return cached
+
+        version = self.cache_version
         session = self.db_manager.get_session()
         try:
             config = session.query(UserConfig).first()
             if config:
                 session.expunge(config)
+                self._store_snapshot(config, version)
             return config
         finally:
             session.close()
     
+    @_invalidates_snapshot
     def update_config(self, updates: Dict[str, Any]) -> UserConfig:
         """
         Update configuration with provided values
@@ -413,6 +494,7 @@ class ConfigManager:
             'ai_enabled': False
         })
     
+    @_invalidates_snapshot
     def add_excluded_folder(self, folder_path: str) -> UserConfig:
         """
         Add folder to exclusion list
@@ -444,6 +526,7 @@ class ConfigManager:
         finally:
             session.close()
     
+    @_invalidates_snapshot
     def remove_excluded_folder(self, folder_path: str) -> UserConfig:
         """
         Remove folder from exclusion list
@@ -475,6 +558,7 @@ class ConfigManager:
         finally:
             session.close()
     
+    @_invalidates_snapshot
     def add_excluded_file_type(self, extension: str) -> UserConfig:
         """
         Add file extension to exclusion list
@@ -514,6 +598,7 @@ class ConfigManager:
         finally:
             session.close()
     
+    @_invalidates_snapshot
     def remove_excluded_file_type(self, extension: str) -> UserConfig:
         """
         Remove file extension from exclusion list
@@ -553,6 +638,7 @@ class ConfigManager:
         finally:
             session.close()
     
+    @_invalidates_snapshot
     def toggle_feature(self, feature_name: str) -> UserConfig:
         """
         Toggle a boolean feature on/off
@@ -583,6 +669,7 @@ class ConfigManager:
         finally:
             session.close()
     
+    @_invalidates_snapshot
     def add_favorite_project(self, project_id: int) -> UserConfig:
         """
         Add project to favorites
@@ -614,6 +701,7 @@ class ConfigManager:
         finally:
             session.close()
     
+    @_invalidates_snapshot
     def remove_favorite_project(self, project_id: int) -> UserConfig:
         """
         Remove project from favorites
@@ -645,6 +733,7 @@ class ConfigManager:
         finally:
             session.close()
     
+    @_invalidates_snapshot
     def reset_to_defaults(self) -> UserConfig:
         """
         Reset configuration to default values
@@ -716,14 +805,10 @@ class ConfigManager:
         Returns:
             bool: True if excluded
         """
-        session = self.db_manager.get_session()
-        try:
-            config = session.query(UserConfig).first()
-            if not config:
-                return False
-            return folder_path in config.excluded_folders
-        finally:
-            session.close()
+        config = self.get_config()
+        if not config:
+            return False
+        return folder_path in config.excluded_folders
     
     def is_file_type_excluded(self, extension: str) -> bool:
         """
@@ -735,16 +820,12 @@ class ConfigManager:
         Returns:
             bool: True if excluded
         """
-        session = self.db_manager.get_session()
-        try:
-            config = session.query(UserConfig).first()
-            if not config:
-                return False
-            
-            extension = self._normalize_extension(extension)
-            return extension in self._normalized_extension_list(config.excluded_file_types)
-        finally:
-            session.close()
+        config = self.get_config()
+        if not config:
+            return False
+        
+        extension = self._normalize_extension(extension)
+        return extension in self._normalized_extension_list(config.excluded_file_types)
     
     def should_process_file(self, file_path: str, file_size: int) -> bool:
         """
@@ -757,27 +838,22 @@ class ConfigManager:
         Returns:
             bool: True if file should be processed
         """
-        session = self.db_manager.get_session()
-        try:
-            config = session.query(UserConfig).first()
-            if not config:
-                return True  # Process by default if no config
-            
-            # Check file size limits
-            if file_size < config.min_file_size_scan or file_size > config.max_file_size_scan:
-                return False
-            
-            # Check if extension is excluded
-            extension = self._normalize_extension(file_path.split('.')[-1]) if '.' in file_path else ''
-            if extension and extension in self._normalized_extension_list(config.excluded_file_types):
+        config = self.get_config()
+        if not config:
+            return True  # Process by default if no config
+        
+        # Check file size limits
+        if file_size < config.min_file_size_scan or file_size > config.max_file_size_scan:
+            return False
+        
+        # Check if extension is excluded
+        extension = self._normalize_extension(file_path.split('.')[-1]) if '.' in file_path else ''
+        if extension and extension in self._normalized_extension_list(config.excluded_file_types):
+            return False
+        
+        # Check if parent folder is excluded
+        for excluded_folder in config.excluded_folders:
+            if excluded_folder in file_path:
                 return False
-            
-            # Check if parent folder is excluded
-            for excluded_folder in config.excluded_folders:
-                if excluded_folder in file_path:
-                    return False
-            
-            return True
-        finally:
-            session.close()
-
+        
+        return True
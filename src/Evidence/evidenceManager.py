@@ -164,31 +164,26 @@ class EvidenceManager:
         ai_description = getattr(project, "ai_description", "") or ""
         name = project.name or "Untitled"
 
-        # Try to read content from file for richer extraction
+        # Shared, token-budgeted digest: the document text is extracted
+        # (DOCX/PDF included) once per content version
+        from src.AI.project_context import SECTION_BUDGETS, get_project_context
+        from src.AI.tokens import truncate_to_tokens
+
         content_sample = ""
         try:
             if project.file_path:
-                from pathlib import Path
-                p = Path(project.file_path)
-                if p.is_file():
-                    content_sample = p.read_text(encoding="utf-8", errors="ignore")[:3000]
-                elif p.is_dir():
-                    for f in sorted(p.rglob("*"))[:5]:
-                        if f.is_file() and f.suffix.lower() in (".txt", ".md", ".docx", ".pdf", ".rtf"):
-                            try:
-                                content_sample += f.read_text(encoding="utf-8", errors="ignore")[:600]
-                            except Exception:
-                                pass
+                content_sample = (get_project_context(project, self.db) or {}).get("content", "")
         except Exception:
             pass
 
-        context = content_sample or ai_description or description or name
+        context = truncate_to_tokens(content_sample or ai_description or description or name,
+                                     SECTION_BUDGETS["content"])
 
         prompt = f"""Analyze this text/writing project and extract concrete evidence of quality and effort.
 
 Project: {name}
 Word count: {word_count if word_count else "unknown"}
-Content sample: {context[:2000]}
+Content sample: {context}
 
 Return ONLY valid JSON with these fields (omit any field you cannot determine):
 {{
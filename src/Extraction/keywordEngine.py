@@ -0,0 +1,195 @@
+"""
+Shared RAKE keyword engine for the code and text keyword extractors.
+
+Importing this module touches neither the network nor the NLTK data
+directories. The first extraction resolves, once per process:
+  - the Punkt sentence tokenizer (falls back to a punctuation splitter when
+    the punkt/punkt_tab data is not installed)
+  - the English stopword list (falls back to a built-in copy when the
+    stopwords corpus is not installed)
+
+so extraction works fully offline. Each engine keeps its stopword set and
+one configured Rake instance per thread, instead of building a new Rake
+(and re-reading the stopwords corpus) for every file.
+
+NLTK data can be fetched ahead of time with download_nltk_data().
+
+Usage:
+    from src.Extraction.keywordEngine import KeywordEngine
+
+    engine = KeywordEngine(stopwords={"def", "class"})
+    engine.extract("Parses the config file. Retries failed uploads.")
+    engine.extract_many([text_a, text_b])     # [[(score, phrase), ...], ...]
+"""
+
+import logging
+import re
+import threading
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# NLTK resources the engine can use when they are installed locally
+NLTK_RESOURCES = {
+    "punkt": "tokenizers/punkt",
+    "punkt_tab": "tokenizers/punkt_tab/english/",
+    "stopwords": "corpora/stopwords",
+}
+
+# NLTK's English stopword list, used when the corpus is not installed
+FALLBACK_ENGLISH_STOPWORDS = frozenset("""
+i me my myself we our ours ourselves you you're you've you'll you'd your
+yours yourself yourselves he him his himself she she's her hers herself it
+it's its itself they them their theirs themselves what which who whom this
+that that'll these those am is are was were be been being have has had having
+do does did doing a an the and but if or because as until while of at by for
+with about against between into through during before after above below to
+from up down in out on off over under again further then once here there when
+where why how all any both each few more most other some such no nor not only
+own same so than too very s t can will just don don't should should've now d
+ll m o re ve y ain aren aren't couldn couldn't didn didn't doesn doesn't hadn
+hadn't hasn hasn't haven haven't isn isn't ma mightn mightn't mustn mustn't
+needn needn't shan shan't shouldn shouldn't wasn wasn't weren weren't won
+won't wouldn wouldn't
+""".split())
+
+# Sentence breaks for the offline fallback: terminal punctuation, blank lines
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n\s*\n")
+# Same pattern as nltk.tokenize.wordpunct_tokenize
+_WORDPUNCT = re.compile(r"\w+|[^\w\s]+")
+
+_init_lock = threading.Lock()
+_sentence_tokenizer: Optional[Callable[[str], List[str]]] = None
+_english_stopwords: Optional[FrozenSet[str]] = None
+
+
+def _has_nltk_resource(name: str) -> bool:
+    try:
+        import nltk
+        nltk.data.find(NLTK_RESOURCES[name])
+        return True
+    except (ImportError, LookupError):
+        return False
+
+
+def _split_sentences(text: str) -> List[str]:
+    return [s for s in _SENTENCE_BREAK.split(text) if s and s.strip()]
+
+
+def wordpunct_tokenize(text: str) -> List[str]:
+    return _WORDPUNCT.findall(text)
+
+
+def sentence_tokenizer() -> Callable[[str], List[str]]:
+    """The sentence splitter, resolved on first call."""
+    global _sentence_tokenizer
+    if _sentence_tokenizer is None:
+        with _init_lock:
+            if _sentence_tokenizer is None:
+                tokenizer = _split_sentences
+                if _has_nltk_resource("punkt_tab"):
+                    try:
+                        from nltk.tokenize import PunktTokenizer
+                        tokenizer = PunktTokenizer("english").tokenize
+                    except Exception as e:
+                        logger.warning("Punkt tokenizer unavailable, using fallback splitter: %s", e)
+                _sentence_tokenizer = tokenizer
+    return _sentence_tokenizer
+
+
+def english_stopwords() -> FrozenSet[str]:
+    """NLTK's English stopwords (or the built-in copy), loaded on first call."""
+    global _english_stopwords
+    if _english_stopwords is None:
+        with _init_lock:
+            if _english_stopwords is None:
+                words = FALLBACK_ENGLISH_STOPWORDS
+                if _has_nltk_resource("stopwords"):
+                    try:
+                        from nltk.corpus import stopwords
+                        words = frozenset(stopwords.words("english"))
+                    except Exception as e:
+                        logger.warning("NLTK stopwords unavailable, using built-in list: %s", e)
+                _english_stopwords = words
+    return _english_stopwords
+
+
+def download_nltk_data(quiet: bool = True) -> Dict[str, bool]:
+    """
+    Download whichever NLTK resources are missing (a setup step, never run
+    implicitly). Returns resource -> available afterwards.
+    """
+    global _sentence_tokenizer, _english_stopwords
+    status = {}
+    try:
+        import nltk
+    except ImportError:
+        return {name: False for name in NLTK_RESOURCES}
+
+    for name in NLTK_RESOURCES:
+        if not _has_nltk_resource(name):
+            try:
+                nltk.download(name, quiet=quiet)
+            except Exception as e:
+                logger.warning("NLTK download of %r failed: %s", name, e)
+        status[name] = _has_nltk_resource(name)
+
+    # Re-resolve on next use in case a fallback was picked earlier
+    with _init_lock:
+        _sentence_tokenizer = None
+        _english_stopwords = None
+    return status
+
+
+class KeywordEngine:
+    """RAKE with a fixed stopword set and one Rake instance per thread."""
+
+    def __init__(self, stopwords: Optional[Iterable[str]] = None):
+        """
+        Args:
+            stopwords: Words RAKE treats as phrase breaks. None means the
+                English stopword list, loaded on first extraction.
+        """
+        self._stopwords = frozenset(stopwords) if stopwords else None
+        # Rake keeps the last result on the instance, so threads get their own
+        self._local = threading.local()
+
+    @property
+    def stopwords(self) -> FrozenSet[str]:
+        if self._stopwords is None:
+            self._stopwords = english_stopwords()
+        return self._stopwords
+
+    def _rake(self):
+        rake = getattr(self._local, "rake", None)
+        if rake is None:
+            from rake_nltk import Rake
+            rake = Rake(
+                stopwords=self.stopwords,
+                sentence_tokenizer=sentence_tokenizer(),
+                word_tokenizer=wordpunct_tokenize,
+            )
+            self._local.rake = rake
+        return rake
+
+    def extract(self, text: Optional[str]) -> List[Tuple[float, str]]:
+        """(score, phrase) pairs for one text, best first."""
+        if not text or not text.strip():
+            return []
+        rake = self._rake()
+        rake.extract_keywords_from_text(text)
+        return list(rake.get_ranked_phrases_with_scores())
+
+    def extract_many(self, texts: Iterable[Optional[str]]) -> List[List[Tuple[float, str]]]:
+        """
+        extract() for each text, in order. Identical texts in the batch
+        (duplicated files, shared boilerplate) are only processed once.
+        """
+        seen: Dict[str, List[Tuple[float, str]]] = {}
+        results = []
+        for text in texts:
+            key = text or ""
+            if key not in seen:
+                seen[key] = self.extract(key)
+            results.append(list(seen[key]))
+        return results
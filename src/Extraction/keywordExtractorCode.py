@@ -1,11 +1,10 @@
-from rake_nltk import Rake
-import nltk
 from pathlib import Path
-from typing import Union
+import os
 import re
+from typing import Iterable, Iterator, Optional, Sequence, Union
 
-nltk.download('punkt')
-nltk.download('punkt_tab')
+from src.Analysis.codeIdentifier import LANGUAGE_BY_EXTENSION
+from src.Extraction.keywordEngine import KeywordEngine
 
 CODE_STOPWORDS = {
     # --- Python / General keywords ---
@@ -57,6 +56,9 @@ CODE_STOPWORDS = {
     'n', 'i', 'j', 'k', 'x', 'y', 'z', '_', '__', 'a', 'b', 'c'
 }
 
+# One engine (stopword set + RAKE instances) shared by every call
+_engine = KeywordEngine(stopwords=CODE_STOPWORDS)
+
 def read_code_file(filepath: str) -> str:
     """Read the contents of a code file and return it as a string, preserving newlines."""
     try:
@@ -72,43 +74,156 @@ def read_code_file(filepath: str) -> str:
 
 
 
-def extract_comments(code: str) -> str:
-    """
-    Extracts comments from code 
-    Keeps each comment distinct to prevent RAKE from merging them.
-    """
-    if not isinstance(code, str):
-        raise TypeError(f"Expected a string of code, got {type(code).__name__}")
+# ---------------------------
+# Comment scanning
+# ---------------------------
+# Each comment syntax family is scanned forward once, merging the match
+# streams of its comment forms by position: comments come out in source
+# order with no sort. A "#" or "//" inside a string literal (URLs, format strings) is
+# rejected by parsing only the part of its own line that precedes it; when
+# the candidate is inside a string, scanning resumes after that string.
+# Every character is looked at a bounded number of times, and block
+# comments/docstrings left open run to the end of the file, so the scan
+# stays linear even on malformed input. Strings spanning lines (template
+# literals, raw strings) are not tracked.
+
+# Bodies are unrolled loops ([^x]*(?:x[^x]*)*) rather than lazy .*?, so
+# each character costs one charset test
+_LINE_SLASH = r'//(?P<slash>[^\n]*)'
+_LINE_HASH = r'#(?P<hash>[^\n]*)'
+_LINE_DASH = r'--(?P<dash>[^\n]*)'
+_BLOCK_C = r'/\*(?P<block>[^*]*(?:\*(?!/)[^*]*)*)(?:\*/|\Z)'
+_BLOCK_HTML = r'<!--(?P<html>[^-]*(?:-(?!->)[^-]*)*)(?:-->|\Z)'
+_BLOCK_RUBY = r'^=begin\b(?P<ruby>.*?)(?:^=end\b|\Z)'
+_DOC_DQ = r'"""(?P<doc_dq>[^"]*(?:"(?!"")[^"]*)*)(?:"""|\Z)'
+_DOC_SQ = r"'''(?P<doc_sq>[^']*(?:'(?!'')[^']*)*)(?:'''|\Z)"
+
+# Single-line string literals
+_STR_DQ = r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"'
+_STR_SQ = r"'[^'\\\n]*(?:\\.[^'\\\n]*)*'"
+_STR_BACKTICK = r'`[^`\\\n]*(?:\\.[^`\\\n]*)*`'
+_STR_SQL = r"'[^'\n]*(?:''[^'\n]*)*'"
+
+# family -> (comment forms, string literal forms)
+_COMMENT_SYNTAX = {
+    'c': ((_BLOCK_C, _LINE_SLASH), (_STR_DQ, _STR_SQ, _STR_BACKTICK)),
+    'python': ((_DOC_DQ, _DOC_SQ, _LINE_HASH), (_STR_DQ, _STR_SQ)),
+    'hash': ((_BLOCK_RUBY, _LINE_HASH), (_STR_DQ, _STR_SQ)),
+    'php': ((_BLOCK_C, _LINE_SLASH, _LINE_HASH), (_STR_DQ, _STR_SQ)),
+    'css': ((_BLOCK_C,), (_STR_DQ, _STR_SQ)),
+    'html': ((_BLOCK_HTML,), ()),
+    'sql': ((_BLOCK_C, _LINE_DASH), (_STR_SQL, _STR_DQ)),
+    # Unknown language / raw text: every common comment form and no string
+    # parsing (prose apostrophes aren't quotes); "//" after ":" is a URL
+    'generic': ((_DOC_DQ, _DOC_SQ, _BLOCK_C, r'(?<!:)' + _LINE_SLASH, _LINE_HASH), ()),
+}
 
-    try:
-        matches_with_pos = []
+# LANGUAGE_BY_EXTENSION names -> syntax family
+_SYNTAX_BY_LANGUAGE = {
+    'Python': 'python',
+    'JavaScript': 'c', 'TypeScript': 'c', 'Java': 'c', 'C++': 'c', 'C': 'c',
+    'C#': 'c', 'Go': 'c', 'Rust': 'c', 'Swift': 'c', 'Kotlin': 'c',
+    'Scala': 'c', 'Objective-C': 'c',
+    'Ruby': 'hash', 'R': 'hash',
+    'PHP': 'php',
+    'CSS': 'css',
+    'HTML': 'html',
+    'SQL': 'sql',
+}
 
-        for m in re.finditer(r'//(.*?)$', code, re.MULTILINE):
-            matches_with_pos.append((m.start(), m.group(1).strip()))
 
-        for m in re.finditer(r'/\*(.*?)\*/', code, re.DOTALL):
-            matches_with_pos.append((m.start(), m.group(1).strip()))
+class _CommentScanner:
+    """Compiled patterns for one syntax family."""
+
+    def __init__(self, comments, strings):
+        # One pattern per comment form: each starts with a literal, which
+        # the regex engine finds much faster than a set of first characters
+        self.comment_res = [re.compile(c, re.DOTALL | re.MULTILINE) for c in comments]
+        self.string_re = re.compile('|'.join(strings)) if strings else None
+        quotes = ''.join(sorted({pattern[0] for pattern in strings}))
+        self.quote_re = re.compile('[' + re.escape(quotes) + ']') if strings else None
+
+    def _string_end(self, code: str, lo: int, pos: int) -> Optional[int]:
+        """End of the string literal containing pos, if one starts in [lo, pos)."""
+        i = lo
+        while True:
+            quote = self.quote_re.search(code, i, pos)
+            if quote is None:
+                return None
+            literal = self.string_re.match(code, quote.start())
+            if literal is None:
+                # Stray quote (apostrophe, Rust lifetime, unterminated string)
+                i = quote.end()
+            elif literal.end() > pos:
+                return literal.end()
+            else:
+                i = literal.end()
+
+    def scan(self, code: str) -> Iterator[str]:
+        # Merge the per-form match streams by position. A form's next match
+        # is only searched again once the scan has moved past it.
+        patterns = self.comment_res
+        upcoming = [rx.search(code) for rx in patterns]
+        pos = 0
+        while True:
+            m = None
+            for i, candidate in enumerate(upcoming):
+                if candidate is not None and candidate.start() < pos:
+                    candidate = upcoming[i] = patterns[i].search(code, pos)
+                if candidate is not None and (m is None or candidate.start() < m.start()):
+                    m = candidate
+            if m is None:
+                return
+
+            start = m.start()
+            if self.string_re is not None:
+                line_start = code.rfind('\n', pos, start) + 1
+                string_end = self._string_end(code, max(line_start, pos), start)
+                if string_end is not None:
+                    pos = string_end
+                    continue
+            pos = max(m.end(), start + 1)
+            text = m.group(m.lastgroup).strip()
+            if text:
+                yield text
+
+
+_COMMENT_SCANNERS = {
+    family: _CommentScanner(comments, strings)
+    for family, (comments, strings) in _COMMENT_SYNTAX.items()
+}
 
-        for m in re.finditer(r'#(.*?)$', code, re.MULTILINE):
-            matches_with_pos.append((m.start(), m.group(1).strip()))
 
-        for m in re.finditer(r'"""(.*?)"""', code, re.DOTALL):
-            matches_with_pos.append((m.start(), m.group(1).strip()))
+def language_for_path(filepath: Union[str, Path]) -> Optional[str]:
+    """Language name from LANGUAGE_BY_EXTENSION, or None if unknown."""
+    return LANGUAGE_BY_EXTENSION.get(os.path.splitext(str(filepath))[1].lower())
 
-        for m in re.finditer(r"'''(.*?)'''", code, re.DOTALL):
-            matches_with_pos.append((m.start(), m.group(1).strip()))
 
-        matches_with_pos.sort(key=lambda x: x[0])
-        comments = [text for _, text in matches_with_pos if text]
-        return ". ".join(comments)
+def iter_comments(code: str, language: Optional[str] = None) -> Iterator[str]:
+    """
+    Yields the text of each comment/docstring in source order, in one pass.
+
+    Args:
+        code: Source code.
+        language: A LANGUAGE_BY_EXTENSION name; None (or an unknown name)
+            uses the generic scanner.
+    """
+    if not isinstance(code, str):
+        raise TypeError(f"Expected a string of code, got {type(code).__name__}")
+
+    scanner = _COMMENT_SCANNERS[_SYNTAX_BY_LANGUAGE.get(language, 'generic')]
+    yield from scanner.scan(code)
 
-    except re.error as e:
-        raise RuntimeError(f"Regex error during comment extraction: {e}")
 
+def extract_comments(code: str, language: Optional[str] = None) -> str:
+    """
+    Extracts comments from code 
+    Keeps each comment distinct to prevent RAKE from merging them.
+    """
+    return ". ".join(iter_comments(code, language))
 
 
 
-import os
 
 def extract_code_keywords_with_scores(filepath_or_text: Union[str, Path]) -> list[tuple[float, str]]:
     """
@@ -120,17 +235,31 @@ def extract_code_keywords_with_scores(filepath_or_text: Union[str, Path]) -> lis
     Returns:
         list[tuple[float, str]]: A list of (score, keyword) pairs, sorted by importance.
     """
+    return _engine.extract(_comments_of(filepath_or_text))
+
+
+def extract_code_keywords_many(paths_or_texts: Iterable[Union[str, Path]],
+                               languages: Optional[Sequence[Optional[str]]] = None) -> list[list[tuple[float, str]]]:
+    """
+    Batch version of extract_code_keywords_with_scores: one result list per
+    input, in order, sharing a single RAKE engine.
+
+    Args:
+        paths_or_texts: File paths and/or raw code texts.
+        languages: Optional LANGUAGE_BY_EXTENSION names, one per input, for
+            raw texts whose language is known (paths are detected by extension).
+    """
+    items = list(paths_or_texts)
+    languages = list(languages) if languages is not None else [None] * len(items)
+    return _engine.extract_many(_comments_of(item, lang) for item, lang in zip(items, languages))
+
+
+def _comments_of(filepath_or_text: Union[str, Path], language: Optional[str] = None) -> str:
     # Detect whether the input is a path to an existing file
     if isinstance(filepath_or_text, (str, Path)) and os.path.exists(filepath_or_text):
         text = read_code_file(str(filepath_or_text))
+        language = language or language_for_path(filepath_or_text)
     else:
         # Assume it's raw text (already read from file or pasted in)
         text = str(filepath_or_text)
-
-    r = Rake(stopwords=CODE_STOPWORDS)
-    text = extract_comments(text)
-    r.extract_keywords_from_text(text)
-    return r.get_ranked_phrases_with_scores()
-
-
-
+    return extract_comments(text, language)
@@ -1,5 +1,4 @@
-from rake_nltk import Rake
-import nltk
+from src.Extraction.keywordEngine import KeywordEngine
 # from pathlib import Path
 # from typing import Union
 
@@ -91,13 +90,8 @@ def boost_repeated_technical_terms(text, keywords):
 
 
 
-# Ensure necessary NLTK data is available
-try:
-    nltk.download('stopwords', quiet=True)
-    nltk.download('punkt', quiet=True)
-    nltk.download('punkt_tab', quiet=True)
-except Exception as e:
-    print(f"NLTK download failed — {e}")
+# Default English stopwords; NLTK data is resolved on first use, not at import
+_engine = KeywordEngine()
 
 def extract_keywords_with_scores(text: str):
     """
@@ -112,11 +106,22 @@ def extract_keywords_with_scores(text: str):
     """
     if not text.strip():
         return []
-    
-    r = Rake()  # Uses default English stopwords
-    r.extract_keywords_from_text(text)
-    keywords = r.get_ranked_phrases_with_scores()
+    return _postprocess(text, _engine.extract(text))
+
+
+def extract_keywords_many(texts):
+    """
+    Batch version of extract_keywords_with_scores: one result list per
+    input text, in order, sharing a single RAKE engine.
+    """
+    texts = list(texts)
+    return [
+        _postprocess(text, keywords) if text and text.strip() else []
+        for text, keywords in zip(texts, _engine.extract_many(texts))
+    ]
+
 
+def _postprocess(text, keywords):
     # Post-processing steps (YOUR contribution)
     keywords = filter_by_phrase_length(keywords)
     keywords = filter_generic_phrases(keywords)
@@ -124,5 +129,3 @@ def extract_keywords_with_scores(text: str):
     keywords = boost_repeated_technical_terms(text, keywords)
 
     return sorted(keywords, reverse=True)
-
-
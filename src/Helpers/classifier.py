@@ -1,10 +1,163 @@
+import math
 import os
+import re
 import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.Settings.config import EXT_SUPERTYPES
+from src.Helpers.ignoreRules import IgnoreMatcher
+
+# Bytes read from a file whose extension we don't recognise
+HEAD_SAMPLE_BYTES = 4096
+
+# Files classified before the early-stopping test is first applied, and how
+# often it is re-checked after that
+MIN_SAMPLE_FILES = 200
+CHECK_EVERY = 50
+
+# z for a two-sided 99% interval
+Z_99 = 2.576
+
+# Leading bytes of common binary formats
+MAGIC_NUMBERS = (
+    (b'\x89PNG\r\n\x1a\n', 'media'),
+    (b'\xff\xd8\xff', 'media'),          # JPEG
+    (b'GIF87a', 'media'),
+    (b'GIF89a', 'media'),
+    (b'RIFF', 'media'),                  # WAV / AVI / WebP
+    (b'ID3', 'media'),                   # MP3
+    (b'OggS', 'media'),
+    (b'fLaC', 'media'),
+    (b'\x1a\x45\xdf\xa3', 'media'),      # Matroska / WebM
+    (b'II*\x00', 'media'),               # TIFF (little endian)
+    (b'MM\x00*', 'media'),               # TIFF (big endian)
+    (b'8BPS', 'media'),                  # Photoshop
+    (b'%PDF', 'text'),
+)
+
+# One alternation instead of a regex per pattern per line
+CODE_LINE_RE = re.compile(
+    r"^\s*(?:"
+    r"def\s+\w+\(|class\s+\w+|#include|function\s|import\s|"
+    r"(?:var|let|const)\s+\w+|public\s|<html|<!doctype|<\?xml|fn\s+\w+\("
+    r")",
+    re.I | re.M,
+)
 
 
 def supertype_from_extension(file_path: str) -> str | None:
     _, ext = os.path.splitext(file_path)
     return EXT_SUPERTYPES.get(ext.lower())
+
+
+def sniff_head(file_path: str, sample_bytes: int = HEAD_SAMPLE_BYTES) -> str | None:
+    """
+    Classify a file from its first few KB only (magic bytes, then a
+    printable/code check on the decoded sample).
+
+    Returns:
+        'code', 'text', 'media', or None for unrecognised binary data.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            head = f.read(sample_bytes)
+    except OSError:
+        return None
+    if not head:
+        return None
+
+    for magic, supertype in MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return supertype
+    if head[4:8] == b'ftyp':  # MP4 / MOV / HEIC
+        return 'media'
+    if b'\x00' in head:
+        return None
+
+    text = head.decode('utf-8', errors='ignore')
+    if not text.strip():
+        return None
+    printable = sum(c.isprintable() or c in '\n\r\t' for c in text)
+    if printable / len(text) <= 0.85:
+        return None
+    return 'code' if CODE_LINE_RE.search(text) else 'text'
+
+
+def classify_file(file_path: str) -> str | None:
+    """Extension first; only unknown extensions pay for a head sample."""
+    supertype = supertype_from_extension(file_path)
+    if supertype is not None:
+        return supertype
+    return sniff_head(file_path)
+
+
+def _margin_confidence(hits: int, n: int, threshold: float) -> float:
+    """
+    Normal-approximation confidence that the true proportion is on the same
+    side of `threshold` as the observed one.
+    """
+    p = hits / n
+    # Laplace-smoothed variance so p = 0 or 1 doesn't look infinitely certain
+    ps = (hits + 1) / (n + 2)
+    se = math.sqrt(ps * (1 - ps) / n)
+    z = abs(p - threshold) / se
+    return 0.5 * (1 + math.erf(z / math.sqrt(2)))
+
+
+def _settled_confidence(counts: dict) -> float:
+    """
+    Lowest confidence across the code/media cut-offs used to pick a project
+    type (70% primary, 20% mixed).
+    """
+    n = counts['code'] + counts['media'] + counts['text']
+    if n == 0:
+        return 0.0
+    return min(
+        _margin_confidence(counts[kind], n, threshold)
+        for kind in ('code', 'media')
+        for threshold in (0.7, 0.2)
+    )
+
+
+def sample_project_types(
+    folder_path: str,
+    min_files: int = MIN_SAMPLE_FILES,
+    confidence: float = 0.99,
+    ignore: IgnoreMatcher | None = None,
+) -> dict:
+    """
+    Count code/media/text files under a folder, stopping early once the
+    type distribution is settled.
+
+    Files are visited round-robin across directories so an early stop sees
+    the whole tree, not just the first folder. After `min_files` classified
+    files, the walk stops as soon as every code/media cut-off is cleared
+    with at least `confidence`.
+
+    Returns:
+        dict: {
+            'code': int, 'media': int, 'text': int,
+            'file_count': int (non-ignored files visited),
+            'complete': bool (False if the walk stopped early),
+            'confidence': float (1.0 when complete)
+        }
+    """
+    counts = {'code': 0, 'media': 0, 'text': 0}
+    matcher = ignore or IgnoreMatcher(folder_path)
+    file_count = 0
+    classified = 0
+
+    for entry in matcher.walk_interleaved(folder_path):
+        file_count += 1
+        supertype = classify_file(entry.path)
+        if supertype not in counts:
+            continue
+        counts[supertype] += 1
+        classified += 1
+
+        if classified >= min_files and classified % CHECK_EVERY == 0:
+            settled = _settled_confidence(counts)
+            if settled >= confidence:
+                return {**counts, 'file_count': file_count, 'complete': False, 'confidence': settled}
+
+    return {**counts, 'file_count': file_count, 'complete': True, 'confidence': 1.0}
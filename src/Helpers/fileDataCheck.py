@@ -1,8 +1,7 @@
 import os
 import re
-from docx import Document
-from PyPDF2 import PdfReader
 from src.Settings.config import EXT_SUPERTYPES
+from src.Helpers.classifier import CODE_LINE_RE, HEAD_SAMPLE_BYTES, classify_file, sample_project_types
 
 
 def extract_text(file_path: str) -> str:
@@ -17,6 +16,7 @@ def extract_text(file_path: str) -> str:
 
     elif ext == ".docx":
         try:
+            from docx import Document
             doc = Document(file_path)
             return "\n".join(p.text for p in doc.paragraphs)
         except:
@@ -24,6 +24,7 @@ def extract_text(file_path: str) -> str:
 
     elif ext == ".pdf":
         try:
+            from PyPDF2 import PdfReader
             reader = PdfReader(file_path)
             text = ""
             for page in reader.pages:
@@ -46,58 +47,31 @@ def is_text_content(text: str, min_length: int = 20) -> bool:
     if not text or len(text.strip()) < min_length:
         return False
 
-    printable = sum(c.isprintable() or c in "\n\r\t" for c in text)
-    ratio = printable / len(text)
+    # The printable ratio of the first few KB is representative enough
+    sample = text[:HEAD_SAMPLE_BYTES]
+    printable = sum(c.isprintable() or c in "\n\r\t" for c in sample)
+    ratio = printable / len(sample)
     return ratio > 0.85
 
 
 def looks_like_code(text: str) -> bool:
-    lines = text.splitlines()
-
-    patterns = [
-        r"^\s*def\s+\w+\(",
-        r"^\s*class\s+\w+",
-        r"^\s*#include",
-        r"^\s*function\s",
-        r"^\s*import\s",
-        r"^\s*(var|let|const)\s+\w+",
-        r"^\s*public\s",
-        r"^\s*<html",
-        r"^\s*<!doctype",
-        r"^\s*<\?xml",
-        r"^\s*fn\s+\w+\(",
-    ]
-    regexes = [re.compile(p, re.I) for p in patterns]
-
-    for line in lines:
-        if any(r.search(line) for r in regexes):
-            return True
-
-    return False
+    return CODE_LINE_RE.search(text) is not None
 
 
 def sniff_supertype(path: str) -> str:
     """
-    Determine project type by counting file extensions (code, media, text) in a file or directory.
-    Uses EXT_SUPERTYPES mapping from config.
+    Determine project type by counting file types (code, media, text) in a file or directory.
+    Known extensions come from EXT_SUPERTYPES; anything else is classified from
+    a small head sample. Large folders stop early once the mix is settled.
     """
     type_counts = {'code': 0, 'media': 0, 'text': 0}
-    skip_dirs = {'node_modules', '__pycache__', '.git', '.venv', 'venv', 'env',
-                 'dist', 'build', '.next', '.cache', 'vendor', '__MACOSX'}
 
     if os.path.isdir(path):
-        for root, dirs, files in os.walk(path):
-            dirs[:] = [d for d in dirs if d not in skip_dirs and not d.startswith('.')]
-            for filename in files:
-                if filename.startswith('.'):
-                    continue
-                ext = os.path.splitext(filename)[1].lower()
-                file_type = EXT_SUPERTYPES.get(ext)
-                if file_type in type_counts:
-                    type_counts[file_type] += 1
+        sample = sample_project_types(path)
+        for kind in type_counts:
+            type_counts[kind] = sample[kind]
     else:
-        ext = os.path.splitext(path)[1].lower()
-        file_type = EXT_SUPERTYPES.get(ext)
+        file_type = classify_file(path)
         if file_type in type_counts:
             type_counts[file_type] += 1
 
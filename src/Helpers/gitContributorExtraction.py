@@ -10,6 +10,7 @@ import subprocess
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 from collections import defaultdict
+import logging
 import re
 
 # Ensure project root is on path
@@ -20,6 +21,8 @@ sys.path.insert(0, PROJECT_ROOT)
 
 from src.Databases.database import db_manager, Project
 
+logger = logging.getLogger(__name__)
+
 
 def run_git_command(repo_path: str, command: List[str]) -> Optional[str]:
     """
@@ -44,10 +47,10 @@ def run_git_command(repo_path: str, command: List[str]) -> Optional[str]:
         )
         return result.stdout
     except subprocess.CalledProcessError as e:
-        print(f"Git command error: {e.stderr}")
+        logger.debug("Git command error: %s", e.stderr)
         return None
     except Exception as e:
-        print(f"Error running git command: {e}")
+        logger.debug("Error running git command: %s", e)
         return None
 
 
@@ -57,7 +60,7 @@ def is_git_repository(path: str) -> bool:
     uploads_root = os.path.abspath(os.path.join(PROJECT_ROOT, 'evidence', 'uploads'))
     abs_path = os.path.abspath(path)
     if not abs_path.startswith(uploads_root):
-        print(f"[SECURITY] Refusing to run git commands outside uploads directory: {abs_path}")
+        logger.debug("[SECURITY] Refusing to run git commands outside uploads directory: %s", abs_path)
         return False
     # Check for .git directory at top level
     git_dir = os.path.join(abs_path, '.git')
@@ -75,8 +78,8 @@ def is_git_repository(path: str) -> bool:
                 if result is not None:
                     return True
     except Exception as e:
-        print(f"[SECURITY] Error checking subfolders for .git: {e}")
-    print(f"[SECURITY] No .git directory found in: {abs_path} or any first-level subfolder")
+        logger.debug("[SECURITY] Error checking subfolders for .git: %s", e)
+    logger.debug("[SECURITY] No .git directory found in: %s or any first-level subfolder", abs_path)
     return False
 
 
@@ -109,18 +112,17 @@ def extract_git_contributors(project_path: str, since_date: Optional[str] = None
                     repo_path = subfolder
                     break
         except Exception as e:
-            print(f"[SECURITY] Error checking subfolders for .git: {e}")
+            logger.debug("[SECURITY] Error checking subfolders for .git: %s", e)
     if not repo_path or not is_git_repository(repo_path):
-        print(f"Not a Git repository or not allowed: {project_path}")
+        logger.debug("Not a Git repository or not allowed: %s", project_path)
         return []
     project_path = repo_path
     # ...existing code...
     
-    print(f"\nAnalyzing Git repository: {project_path}")
+    logger.info("Analyzing Git repository: %s", project_path)
     if since_date or until_date:
-        date_range = f" (from {since_date or 'start'} to {until_date or 'now'})"
-        print(f"Date range: {date_range}")
-    print("Extracting contributor data using git commands...")
+        logger.info("Date range: from %s to %s", since_date or 'start', until_date or 'now')
+    logger.debug("Extracting contributor data using git commands...")
     
     # Track contributors by username (GitHub username when available, otherwise name)
     contributors = defaultdict(lambda: {
@@ -210,7 +212,7 @@ def extract_git_contributors(project_path: str, since_date: Optional[str] = None
     contributor_list = [c for c in contributor_list if c['name'] and c['email']]
     
     if contributor_list:
-        print(f"  Found {len(contributor_list)} unique contributors")
+        logger.info("  Found %d unique contributors", len(contributor_list))
         
         # Calculate contribution percentages based on total lines changed
         total_lines = sum(c['lines_added'] + c['lines_deleted'] for c in contributor_list)
@@ -229,7 +231,7 @@ def extract_git_contributors(project_path: str, since_date: Optional[str] = None
                 for contrib in contributor_list:
                     contrib['contribution_percent'] = 0.0
     else:
-        print("  No contributors found")
+        logger.info("  No contributors found")
     
     return contributor_list
 
@@ -246,19 +248,17 @@ def populate_contributors_for_project(project: Project, since_date: Optional[str
     Returns:
         Number of contributors added
     """
-    print(f"\n{'='*60}")
-    print(f"Populating Contributors for: {project.name}")
-    print(f"{'='*60}")
+    logger.info("Populating contributors for: %s", project.name)
     
     # Extract contributors from Git
     contributors = extract_git_contributors(project.file_path, since_date, until_date)
     
     if not contributors:
-        print("\n⚠️  No Git contributors found")
+        logger.info("No Git contributors found")
         return 0
     
     # Add contributors to database
-    print(f"\nStoring {len(contributors)} contributors in database...")
+    logger.info("Storing %d contributors in database...", len(contributors))
     
     added_count = 0
     for contrib in contributors:
@@ -273,17 +273,15 @@ def populate_contributors_for_project(project: Project, since_date: Optional[str
                 'contribution_percent': contrib['contribution_percent']
             })
             
-            print(f"  ✓ {contrib['name']} ({contrib['email']})")
-            print(f"    • Commits: {contrib['commit_count']}")
-            print(f"    • Lines added: {contrib['lines_added']}")
-            print(f"    • Lines deleted: {contrib['lines_deleted']}")
-            print(f"    • Contribution: {contrib['contribution_percent']}%")
+            logger.debug("  ✓ %s (%s): %d commits, +%d/-%d lines, %s%%",
+                         contrib['name'], contrib['email'], contrib['commit_count'],
+                         contrib['lines_added'], contrib['lines_deleted'], contrib['contribution_percent'])
             added_count += 1
             
         except Exception as e:
-            print(f"  ✗ Failed to add {contrib['name']}: {e}")
+            logger.warning("Failed to add contributor %s: %s", contrib['name'], e)
     
-    print(f"\n✓ Successfully populated {added_count} contributors")
+    logger.info("✓ Populated %d contributors", added_count)
     return added_count
 
 
@@ -0,0 +1,332 @@
+"""
+Shared ignore-rule engine for project traversal.
+
+Merges three sources of exclusions into one compiled matcher:
+  - built-in skips (dependency, build and VCS folders)
+  - the user's excluded_folders / excluded_file_types from UserConfig
+  - the project's own .gitignore files (root and nested)
+
+IgnoreMatcher.walk() prunes whole ignored subtrees while traversing with
+os.scandir, so scanners never descend into node_modules, .git, etc.
+
+Usage:
+    from src.Helpers.ignoreRules import IgnoreMatcher
+
+    matcher = IgnoreMatcher(project_root, excluded_file_types={'.log'})
+    for entry in matcher.walk():
+        print(entry.path)
+"""
+
+import os
+import re
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Set
+
+# Folders that are never part of a user's own work
+BUILTIN_SKIP_DIRS = frozenset({
+    'node_modules', '__pycache__', '.git', '.venv', 'venv',
+    'env', 'dist', 'build', '.next', '.cache', 'vendor',
+    '.pytest_cache', 'coverage', '.mypy_cache', '__MACOSX',
+})
+
+
+def normalize_extensions(extensions: Optional[Iterable[str]]) -> Set[str]:
+    """Normalize a list of extensions to lowercase '.ext' form."""
+    normalized = set()
+    if not isinstance(extensions, (list, tuple, set, frozenset)):
+        return normalized
+    for extension in extensions:
+        ext = str(extension).strip().lower()
+        if not ext:
+            continue
+        if not ext.startswith('.'):
+            ext = f'.{ext}'
+        normalized.add(ext)
+    return normalized
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob (without anchoring) to a regex body."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern[i:i + 3] == '**/':
+                out.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern[i:i + 2] == '**':
+                out.append('.*')
+                i += 2
+                continue
+            out.append('[^/]*')
+        elif c == '?':
+            out.append('[^/]')
+        elif c == '[':
+            end = pattern.find(']', i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = pattern[i + 1:end]
+                if body.startswith('!'):
+                    body = '^' + body[1:]
+                out.append(f'[{body}]')
+                i = end
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            out.append(re.escape(pattern[i]))
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return ''.join(out)
+
+
+class _Rule:
+    """One compiled gitignore line, scoped to the folder its file lives in."""
+
+    __slots__ = ('regex', 'negate', 'dir_only', 'base')
+
+    def __init__(self, regex, negate: bool, dir_only: bool, base: str):
+        self.regex = regex
+        self.negate = negate
+        self.dir_only = dir_only
+        self.base = base
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        if self.base:
+            prefix = self.base + '/'
+            if not rel_path.startswith(prefix):
+                return False
+            rel_path = rel_path[len(prefix):]
+        m = self.regex.match(rel_path)
+        if m is None:
+            return False
+        # 'build/' ignores the folder and everything in it, but not a file named build
+        if self.dir_only and not is_dir and m.group(1) is None:
+            return False
+        return True
+
+
+def parse_gitignore(lines: Iterable[str], base: str = '') -> List[_Rule]:
+    """
+    Compile gitignore lines into rules.
+
+    Args:
+        lines: Lines of a .gitignore file
+        base: Folder (relative to the scan root, '/' separated) the file lives in
+    """
+    rules = []
+    for raw in lines:
+        line = raw.rstrip('\n').rstrip('\r')
+        if not line.strip() or line.startswith('#'):
+            continue
+        # Trailing spaces are ignored unless escaped
+        if not line.endswith('\\ '):
+            line = line.rstrip(' ')
+
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+        elif line.startswith('\\!') or line.startswith('\\#'):
+            line = line[1:]
+
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+
+        # A slash anywhere but the end anchors the pattern to `base`
+        anchored = '/' in line
+        line = line.lstrip('/')
+        body = _glob_to_regex(line)
+        if not anchored:
+            body = '(?:.*/)?' + body
+        regex = re.compile(f'^{body}(/.*)?$')
+        rules.append(_Rule(regex, negate, dir_only, base))
+    return rules
+
+
+class IgnoreMatcher:
+    """Compiled ignore rules for one scan root."""
+
+    def __init__(
+        self,
+        root: str,
+        excluded_folders: Optional[Iterable[str]] = None,
+        excluded_file_types: Optional[Iterable[str]] = None,
+        extra_skip_dirs: Optional[Iterable[str]] = None,
+        skip_hidden: bool = True,
+        use_gitignore: bool = True,
+    ):
+        """
+        Args:
+            root: Directory the scan starts from
+            excluded_folders: User-excluded folders. Absolute paths exclude that
+                exact subtree; anything else is treated as a gitignore pattern.
+            excluded_file_types: Extensions to skip (e.g. ['.log', 'tmp'])
+            extra_skip_dirs: Scanner-specific folder names to skip
+            skip_hidden: Skip dot-files and dot-folders
+            use_gitignore: Honour .gitignore files found while walking
+        """
+        self.root = os.path.abspath(root)
+        self.skip_dirs = set(BUILTIN_SKIP_DIRS) | set(extra_skip_dirs or ())
+        self.excluded_file_types = normalize_extensions(excluded_file_types)
+        self.skip_hidden = skip_hidden
+        self.use_gitignore = use_gitignore
+
+        self.excluded_paths = set()
+        self.rules: List[_Rule] = []
+        folders = excluded_folders if isinstance(excluded_folders, (list, tuple, set, frozenset)) else []
+        for folder in folders:
+            folder = str(folder).strip()
+            if not folder:
+                continue
+            if os.path.isabs(folder):
+                self.excluded_paths.add(os.path.normcase(os.path.abspath(folder)))
+            else:
+                self.rules.extend(parse_gitignore([folder.replace('\\', '/')]))
+
+        # Root .gitignore is loaded up front; nested ones are picked up by walk()
+        self._loaded_gitignores = set()
+        if use_gitignore and os.path.isdir(self.root):
+            self._load_gitignore(self.root, '')
+
+    @classmethod
+    def from_config(cls, root: str, config, **kwargs) -> 'IgnoreMatcher':
+        """Build a matcher from a UserConfig (or any object with the same fields)."""
+        return cls(
+            root,
+            excluded_folders=getattr(config, 'excluded_folders', None) or [],
+            excluded_file_types=getattr(config, 'excluded_file_types', None) or [],
+            **kwargs,
+        )
+
+    def _load_gitignore(self, directory: str, rel_dir: str) -> None:
+        if directory in self._loaded_gitignores:
+            return
+        self._loaded_gitignores.add(directory)
+        path = os.path.join(directory, '.gitignore')
+        try:
+            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+                self.rules.extend(parse_gitignore(f, base=rel_dir))
+        except OSError:
+            pass
+
+    def _match_rules(self, rel_path: str, is_dir: bool) -> bool:
+        ignored = False
+        for rule in self.rules:
+            if rule.matches(rel_path, is_dir):
+                ignored = not rule.negate
+        return ignored
+
+    def is_ignored(self, path: str, is_dir: Optional[bool] = None) -> bool:
+        """Check a single path (absolute or relative to root)."""
+        abs_path = path if os.path.isabs(path) else os.path.join(self.root, path)
+        if is_dir is None:
+            is_dir = os.path.isdir(abs_path)
+        rel_path = os.path.relpath(abs_path, self.root).replace(os.sep, '/')
+        name = os.path.basename(abs_path)
+        if rel_path == '.':
+            return False
+        if is_dir:
+            return self._dir_ignored(abs_path, rel_path, name)
+        return self._file_ignored(rel_path, name)
+
+    def _dir_ignored(self, abs_path: str, rel_path: str, name: str) -> bool:
+        if name in self.skip_dirs:
+            return True
+        if self.skip_hidden and name.startswith('.'):
+            return True
+        if self.excluded_paths:
+            norm = os.path.normcase(abs_path)
+            for excluded in self.excluded_paths:
+                if norm == excluded or norm.startswith(excluded + os.sep):
+                    return True
+        return self._match_rules(rel_path, True)
+
+    def _file_ignored(self, rel_path: str, name: str) -> bool:
+        if self.skip_hidden and name.startswith('.'):
+            return True
+        if self.excluded_file_types and os.path.splitext(name)[1].lower() in self.excluded_file_types:
+            return True
+        return self._match_rules(rel_path, False)
+
+    def walk(self, start: Optional[str] = None) -> Iterator[os.DirEntry]:
+        """
+        Yield a DirEntry for every non-ignored file under `start` (default: root).
+        Ignored directories are pruned and never opened.
+        """
+        start = os.path.abspath(start) if start else self.root
+        stack = [start]
+        while stack:
+            directory = stack.pop()
+            rel_dir = os.path.relpath(directory, self.root).replace(os.sep, '/')
+            if rel_dir == '.':
+                rel_dir = ''
+            if self.use_gitignore and rel_dir:
+                self._load_gitignore(directory, rel_dir)
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    if not self._dir_ignored(entry.path, rel_path, entry.name):
+                        subdirs.append(entry.path)
+                elif entry.is_file():
+                    if not self._file_ignored(rel_path, entry.name):
+                        yield entry
+            # Reverse so directories are visited in listing order
+            stack.extend(reversed(subdirs))
+
+    def walk_interleaved(self, start: Optional[str] = None) -> Iterator[os.DirEntry]:
+        """
+        Like walk(), but takes one entry from each open directory in turn.
+        The first N files yielded are spread across the whole tree instead
+        of coming from the first folder, which makes them usable as a sample.
+        """
+        start = os.path.abspath(start) if start else self.root
+        queue = deque()
+
+        def _open(directory: str):
+            rel_dir = os.path.relpath(directory, self.root).replace(os.sep, '/')
+            if rel_dir == '.':
+                rel_dir = ''
+            if self.use_gitignore and rel_dir:
+                self._load_gitignore(directory, rel_dir)
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                return
+            if entries:
+                queue.append((rel_dir, iter(entries)))
+
+        _open(start)
+        while queue:
+            rel_dir, entries = queue.popleft()
+            entry = next(entries, None)
+            if entry is None:
+                continue
+            queue.append((rel_dir, entries))
+
+            rel_path = f'{rel_dir}/{entry.name}' if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+            except OSError:
+                continue
+            if is_dir:
+                if not self._dir_ignored(entry.path, rel_path, entry.name):
+                    _open(entry.path)
+            elif entry.is_file():
+                if not self._file_ignored(rel_path, entry.name):
+                    yield entry
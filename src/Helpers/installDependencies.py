@@ -62,5 +62,17 @@ def install_requirements():
         sys.exit(1)
 
 
+def install_nltk_data():
+    """Fetch missing NLTK data used by keyword extraction (works without it)."""
+    try:
+        from src.Extraction.keywordEngine import download_nltk_data
+    except ImportError:
+        return
+    missing = [name for name, ok in download_nltk_data().items() if not ok]
+    if missing:
+        print(f"⚠️ NLTK data unavailable ({', '.join(missing)}); using built-in keyword fallbacks.")
+
+
 if __name__ == "__main__":
     install_requirements()
+    install_nltk_data()
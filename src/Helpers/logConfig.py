@@ -0,0 +1,110 @@
+"""
+Logging setup shared by the CLI and the API.
+
+Library code logs through per-module loggers under the "src" namespace and
+never configures handlers itself:
+
+    import logging
+    logger = logging.getLogger(__name__)
+
+    logger.info("Scanning %s", path)        # %-args are only formatted if emitted
+    logger.debug("  processed %s", name)    # per-file progress: DEBUG only
+
+Entry points call configure_logging() once. Records go through a
+QueueHandler to a background QueueListener thread, so a request or scanner
+thread never blocks on stdout/stderr I/O.
+
+Environment:
+    LOG_LEVEL   DEBUG, INFO (default), WARNING, ...
+    LOG_FORMAT  text (default) or json (one object per line)
+
+Without configure_logging() (tests, imports from scripts) Python's
+last-resort handler shows WARNING and above on stderr and drops the rest.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from typing import Optional, TextIO
+
+ROOT_LOGGER = "src"
+
+# Interactive CLI: messages read like the old print() progress output
+CLI_FORMAT = "%(message)s"
+# API / server: timestamped and attributable
+SERVER_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+# LogRecord attributes that aren't user-supplied `extra=` fields
+_RECORD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record: time, level, logger, message, extras, exception."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+def configure_logging(level: Optional[str] = None, json_output: Optional[bool] = None,
+                      fmt: str = CLI_FORMAT, stream: Optional[TextIO] = None) -> logging.Logger:
+    """
+    Route the "src" loggers through a background queue to `stream`
+    (stdout by default). Safe to call again; the previous setup is replaced.
+
+    level and json_output default to LOG_LEVEL and LOG_FORMAT=json.
+    Returns the configured "src" logger.
+    """
+    global _listener, _queue_handler
+
+    level = (level or os.getenv("LOG_LEVEL", "INFO")).upper()
+    if json_output is None:
+        json_output = os.getenv("LOG_FORMAT", "text").lower() == "json"
+
+    handler = logging.StreamHandler(stream or sys.stdout)
+    handler.setFormatter(JsonFormatter() if json_output else logging.Formatter(fmt))
+
+    root = logging.getLogger(ROOT_LOGGER)
+    shutdown_logging()
+
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+
+    root.addHandler(_queue_handler)
+    root.setLevel(level)
+    root.propagate = False
+    return root
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and detach the handler installed by configure_logging()."""
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger(ROOT_LOGGER).removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()  # drains the queue first
+        _listener = None
+
+
+atexit.register(shutdown_logging)
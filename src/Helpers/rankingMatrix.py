@@ -0,0 +1,123 @@
+"""
+Array helpers shared by the project ranker and summarizer.
+
+Projects are turned into a few matrices once (metric columns, a float32
+embedding matrix, a boolean project x skill incidence matrix). Scoring is
+then whole-array arithmetic, and diversity-aware top-k selection only
+re-scores the candidates that can still win, with the per-pick "new skills"
+count computed as one matrix reduction.
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def min_max(values) -> np.ndarray:
+    """Min-max scale to [0, 1]; a constant column becomes all ones."""
+    arr = np.asarray(values, dtype=np.float64)
+    if arr.size == 0:
+        return arr
+    lo, hi = arr.min(), arr.max()
+    if lo == hi:
+        return np.ones_like(arr)
+    return (arr - lo) / (hi - lo)
+
+
+def embedding_matrix(embeddings: Sequence[Optional[Sequence[float]]],
+                     dim: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Stack embeddings into a zero-padded float32 matrix.
+
+    Returns:
+        (matrix [n, max(dim, longest)], has_embedding bool [n])
+    """
+    has = np.array([bool(e) for e in embeddings], dtype=bool)
+    width = max([dim] + [len(e) for e in embeddings if e])
+    matrix = np.zeros((len(embeddings), width), dtype=np.float32)
+    for i, e in enumerate(embeddings):
+        if e:
+            matrix[i, :len(e)] = e
+    return matrix, has
+
+
+def cosine_to(matrix: np.ndarray, target: Sequence[float]) -> np.ndarray:
+    """
+    Cosine similarity of every row with target (0 for zero vectors). Rows
+    and target are compared over their common prefix, norms use the full
+    vectors.
+    """
+    vec = np.zeros(matrix.shape[1], dtype=np.float32)
+    vec[:min(len(target), matrix.shape[1])] = target[:matrix.shape[1]]
+    target_norm = float(np.linalg.norm(np.asarray(target, dtype=np.float32)))
+    row_norms = np.linalg.norm(matrix, axis=1)
+    denom = row_norms * target_norm
+    dots = matrix @ vec
+    out = np.zeros(matrix.shape[0], dtype=np.float64)
+    nonzero = denom > 0
+    out[nonzero] = dots[nonzero] / denom[nonzero]
+    return out
+
+
+def skill_incidence(skill_lists: Sequence[Sequence[str]]) -> Tuple[List[str], np.ndarray]:
+    """
+    Returns:
+        (vocabulary, bool matrix [n_projects, n_skills])
+    """
+    index: Dict[str, int] = {}
+    for skills in skill_lists:
+        for skill in skills:
+            index.setdefault(skill, len(index))
+    incidence = np.zeros((len(skill_lists), len(index)), dtype=bool)
+    for row, skills in enumerate(skill_lists):
+        cols = [index[s] for s in skills]
+        if cols:
+            incidence[row, cols] = True
+    return list(index), incidence
+
+
+def diverse_top_k(
+    scores: np.ndarray,
+    incidence: np.ndarray,
+    k: int,
+    bonus: Callable[[np.ndarray], np.ndarray],
+    max_bonus: float,
+    order: Optional[np.ndarray] = None,
+) -> List[int]:
+    """
+    Greedy MMR-style selection: each pick maximises score + bonus(number of
+    skills not yet covered). Ties go to the earlier index in `order`
+    (default: by score, descending, stable).
+
+    max_bonus is the spread between the largest and smallest bonus. Every
+    pick scores at least (k-th best score - max_bonus), so only that pool is
+    ever re-scored; the k-th best score is found with argpartition in O(n).
+
+    Returns:
+        Selected indices in pick order.
+    """
+    n = scores.shape[0]
+    k = min(k, n)
+    if k <= 0:
+        return []
+    if order is None:
+        order = np.argsort(-scores, kind='stable')
+
+    kth_best = scores[np.argpartition(scores, n - k)[n - k]]
+    in_pool = scores >= kth_best - max_bonus - 1e-9
+    pool = order[in_pool[order]]
+
+    pool_scores = scores[pool]
+    pool_skills = incidence[pool]
+    alive = np.ones(pool.shape[0], dtype=bool)
+    covered = np.zeros(incidence.shape[1], dtype=bool)
+    picked = []
+
+    for _ in range(k):
+        new_counts = (pool_skills & ~covered).sum(axis=1)
+        vals = np.where(alive, pool_scores + bonus(new_counts), -np.inf)
+        best = int(np.argmax(vals))
+        alive[best] = False
+        covered |= pool_skills[best]
+        picked.append(int(pool[best]))
+    return picked
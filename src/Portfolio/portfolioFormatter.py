@@ -20,6 +20,7 @@ from datetime import datetime
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from src.Databases.database import db_manager, Project
+from src.Services.media_service import derivative_urls
 
 
 class PortfolioFormatter:
@@ -171,6 +172,7 @@ class PortfolioFormatter:
             "frameworks": self._as_list(project.frameworks),
             "total_size_bytes": project.total_size_bytes,
             "thumbnail_path": getattr(project, "thumbnail_path", None) or "",
+            "thumbnail_urls": derivative_urls(getattr(project, "thumbnail_path", None)),
             "user_role": getattr(project, "user_role", None) or "",
             "success_evidence": getattr(project, "success_evidence", None) or "",
         }
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends
 from typing import Optional
-from src.Services.auth_service import get_current_user_id
-from src.Services.analytics_service import get_skill_cooccurrence, get_full_skill_analytics
+from src.Services.auth_service import get_current_user_id, require_auth
+from src.Services.analytics_service import get_skill_cooccurrence, get_full_skill_analytics, check_analytics_snapshot
 
 router = APIRouter(prefix="/analytics", tags=["analytics"])
 
@@ -22,4 +22,14 @@ def skills_analytics(user_id: Optional[int] = Depends(get_current_user_id)):
     Returns raw skill data with projects and co-occurrence,
     plus insights like top skills and diversity
     """
-    return get_full_skill_analytics(user_id=user_id)
\ No newline at end of file
+    return get_full_skill_analytics(user_id=user_id)
+
+
+@router.post("/snapshot/verify")
+def verify_analytics_snapshot(rebuild: bool = True, user_id: int = Depends(require_auth)):
+    """
+    Rebuilds the caller's skill analytics from scratch and compares them
+    with the incrementally maintained snapshot; replaces it on mismatch
+    unless rebuild=false
+    """
+    return check_analytics_snapshot(user_id, rebuild=rebuild)
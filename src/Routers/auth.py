@@ -5,10 +5,13 @@ API endpoints for user signup, login, and profile access.
 """
 
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, EmailStr
 from typing import Optional, Any
 from src.Databases.database import db_manager
-from src.Services.auth_service import hash_password, verify_password, create_access_token, require_auth
+from src.Services.auth_service import (
+    hash_password_async, verify_password_async, create_access_token, require_auth
+)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -50,8 +53,12 @@ class AuthResponse(BaseModel):
 
 
 # Endpoints
+# signup, login and reset-password are async so bcrypt waits on the password
+# hash pool rather than holding a request thread; their DB calls still run
+# on the threadpool.
+
 @router.post("/signup", response_model=AuthResponse)
-def signup(body: SignupRequest):
+async def signup(body: SignupRequest):
     """
     Create a new user account.
     
@@ -65,7 +72,7 @@ def signup(body: SignupRequest):
         )
     
     # Check if email already exists
-    existing = db_manager.get_user_by_email(body.email)
+    existing = await run_in_threadpool(db_manager.get_user_by_email, body.email)
     if existing:
         raise HTTPException(
             status_code=400,
@@ -73,12 +80,13 @@ def signup(body: SignupRequest):
         )
     
     # Create user
+    password_hash = await hash_password_async(body.password)
     try:
-        user = db_manager.create_user({
+        user = await run_in_threadpool(db_manager.create_user, {
             'first_name': body.first_name,
             'last_name': body.last_name,
             'email': body.email,
-            'password_hash': hash_password(body.password)
+            'password_hash': password_hash
         })
     except Exception as e:
         raise HTTPException(
@@ -101,14 +109,14 @@ def signup(body: SignupRequest):
 
 
 @router.post("/login", response_model=AuthResponse)
-def login(body: LoginRequest):
+async def login(body: LoginRequest):
     """
     Login with email and password.
     
     Returns user info and authentication token.
     """
     # Find user
-    user = db_manager.get_user_by_email(body.email)
+    user = await run_in_threadpool(db_manager.get_user_by_email, body.email)
     if not user:
         raise HTTPException(
             status_code=401,
@@ -116,11 +124,15 @@ def login(body: LoginRequest):
         )
     
     # Verify password
-    if not verify_password(body.password, user.password_hash):
+    valid, new_hash = await verify_password_async(body.password, user.password_hash)
+    if not valid:
         raise HTTPException(
             status_code=401,
             detail="Invalid email or password"
         )
+    if new_hash:
+        # Stored hash used other bcrypt rounds than BCRYPT_ROUNDS
+        await run_in_threadpool(db_manager.update_user, user.id, {"password_hash": new_hash})
     
     # Generate token
     token = create_access_token(user.id)
@@ -143,7 +155,7 @@ def get_current_user(user_id: int = Depends(require_auth)):
     
     Requires valid authentication token.
     """
-    user = db_manager.get_user(user_id)
+    user = db_manager.get_user_summary(user_id)
     if not user:
         raise HTTPException(
             status_code=404,
@@ -174,17 +186,18 @@ class ResetPasswordRequest(BaseModel):
 
 
 @router.post("/reset-password")
-def reset_password(body: ResetPasswordRequest):
+async def reset_password(body: ResetPasswordRequest):
     """
     Reset a user's password by email.
     Verifies the email exists, then updates the password hash.
     """
     if len(body.new_password) < 6:
         raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
-    user = db_manager.get_user_by_email(body.email)
+    user = await run_in_threadpool(db_manager.get_user_by_email, body.email)
     if not user:
         raise HTTPException(status_code=404, detail="No account found with that email")
-    db_manager.update_user(user.id, {"password_hash": hash_password(body.new_password)})
+    password_hash = await hash_password_async(body.new_password)
+    await run_in_threadpool(db_manager.update_user, user.id, {"password_hash": password_hash})
     return {"message": "Password updated successfully"}
 
 
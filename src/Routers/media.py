@@ -0,0 +1,42 @@
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse
+
+from src.Services.media_service import (
+    DERIVATIVE_FORMATS,
+    DERIVATIVE_SIZES,
+    derivative_available,
+    get_derivative,
+    is_valid_hash,
+)
+
+router = APIRouter(prefix="/media", tags=["Media"])
+
+# Derivatives are content-addressed, so a URL never changes meaning
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@router.get("/{content_hash}/{size}")
+def get_media_derivative(content_hash: str, size: str, request: Request, fmt: str = None):
+    """Serve a resized thumbnail/preview, generating it on demand if needed."""
+    if not is_valid_hash(content_hash):
+        raise HTTPException(status_code=400, detail="Invalid media hash")
+    if size not in DERIVATIVE_SIZES:
+        raise HTTPException(status_code=404, detail=f"Unknown size '{size}'. Supported: {', '.join(DERIVATIVE_SIZES)}")
+
+    # Explicit ?fmt= wins, otherwise negotiate WebP from the Accept header
+    if fmt is None:
+        fmt = "webp" if "image/webp" in request.headers.get("accept", "") else "jpeg"
+    if fmt not in DERIVATIVE_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format '{fmt}'")
+
+    etag = f'"{content_hash}-{size}-{fmt}"'
+    headers = {"Cache-Control": CACHE_CONTROL, "ETag": etag, "Vary": "Accept"}
+    # The ETag alone doesn't prove the media still exists
+    if request.headers.get("if-none-match") == etag and derivative_available(content_hash, size, fmt):
+        return Response(status_code=304, headers=headers)
+
+    path = get_derivative(content_hash, size, fmt)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Media not found")
+
+    return FileResponse(path, media_type=DERIVATIVE_FORMATS[fmt][2], headers=headers)
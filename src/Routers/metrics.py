@@ -0,0 +1,21 @@
+"""
+Metrics Routes
+==============
+Prometheus-style scrape endpoint for the in-process request, database,
+scanner, AI and password hashing metrics.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from src.Services import metrics
+
+router = APIRouter(tags=["Metrics"])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def get_metrics():
+    """Current metrics in the Prometheus text exposition format."""
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -152,7 +152,7 @@ def save_contact(body: dict = Body(...), user_id: int = Depends(require_auth)):
 @router.get("/visibility")
 def get_portfolio_visibility(user_id: int = Depends(require_auth)):
     """Return whether the authenticated user's portfolio is public."""
-    user = db_manager.get_user(user_id)
+    user = db_manager.get_user_summary(user_id)
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return {"portfolio_public": bool(getattr(user, "portfolio_public", False))}
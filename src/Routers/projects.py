@@ -1,17 +1,23 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Body, Query
+from fastapi import APIRouter, UploadFile, File, HTTPException, Depends, Body, Query, Response, BackgroundTasks
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from pathlib import Path
 from typing import Optional, List
 from pydantic import BaseModel
+import logging
 import uuid
 import zipfile
 import json
 
-from src.Databases.database import db_manager
+from src.Databases.database import db_manager, project_card_to_dict
+from src.Analysis.multiProjectZip import iterProjectRoots
 from src.Services.projects_service import process_uploaded_path, upload_project_thumbnail
+from src.Services.media_service import schedule_derivatives, derivative_urls
 from src.Services.auth_service import get_current_user_id, require_auth
 from src.UserPrompts.config_integration import has_ai_consent, has_basic_consent
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
+logger = logging.getLogger(__name__)
 
 UPLOAD_DIR = Path("evidence/uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -80,6 +86,8 @@ class AnalyzeRequest(BaseModel):
 class RankRequest(BaseModel):
     target_skills: Optional[List[str]] = None
     top_k: Optional[int] = 3
+    # Free-text focus ("data pipelines") matched semantically, like target_skills
+    query: Optional[str] = None
 
 class BatchAnalyzeRequest(BaseModel):
     analysis_types: Optional[List[str]] = ["overview"]
@@ -102,12 +110,73 @@ def _display_name(project) -> str:
 
 # ── Upload ─────────────────────────────────────────────────────────────────────
 
+def _upload_project_root(name: str, path: str, user_id: Optional[int]) -> dict:
+    """
+    Scan one root of a multi-root ZIP through the same path as a single
+    upload (duplicate detection, content hash, classification). A root
+    that already exists reports the type and file count it was stored with.
+
+    Runs on an iterProjectRoots worker thread, which has no request scope,
+    so these writes commit immediately and raise on failure instead of
+    being buffered until after the streamed response has started.
+    """
+    result = process_uploaded_path(path, user_id=user_id)
+    pid = result.get("project_id")
+    if result.get("status") == "created":
+        db_manager.update_project(pid, {"custom_description": name})
+    return {
+        "name": name,
+        "type": result.get("project_type") or "unknown",
+        "file_count": result.get("file_count") or 0,
+        "path": path,
+        "details": result.get("reason", ""),
+        "database_id": pid,
+        "status": result.get("status", "skipped"),
+    }
+
+
+def _stream_project_roots(extract_dir: Path, user_id: Optional[int]):
+    """Yield one NDJSON line per project root as soon as its scan finishes."""
+    for root in iterProjectRoots(str(extract_dir), user_id=user_id, scan_root=_upload_project_root):
+        line = {
+            "status": "error" if root.get("error") else root["status"],
+            "project_id": root["database_id"],
+            "project_name": root["name"],
+            "project_type": root["type"],
+            "file_count": root["file_count"],
+            "details": root.get("error") or root["details"],
+        }
+        yield json.dumps(line) + "\n"
+
+
+def _search_index():
+    """The shared project search index (imports NumPy on first use)."""
+    from src.Services.search_index import search_index_for
+    return search_index_for(db_manager)
+
+
+def _refresh_search_index():
+    """Index newly uploaded projects and persist the index (after the response)."""
+    try:
+        _search_index().refresh(save=True)
+    except Exception as e:
+        logger.warning("Failed to update search index: %s", e)
+
+
 @router.post("/upload")
 async def upload_project(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
+    multi_root: bool = Query(False, description="Treat each top-level folder of a ZIP as its own project and stream results"),
     user_id: Optional[int] = Depends(get_current_user_id)
 ):
-    """Upload and scan a project file or ZIP archive."""
+    """
+    Upload and scan a project file or ZIP archive.
+
+    With multi_root=true a ZIP is split into project roots that are scanned
+    concurrently; the response is NDJSON with one line per root, sent as
+    each root finishes.
+    """
     if not has_basic_consent():
         raise HTTPException(
             status_code=403,
@@ -126,6 +195,12 @@ async def upload_project(
         extract_dir.mkdir()
         with zipfile.ZipFile(upload_path, 'r') as zip_ref:
             zip_ref.extractall(extract_dir)
+        if multi_root:
+            return StreamingResponse(
+                _stream_project_roots(extract_dir, user_id),
+                media_type="application/x-ndjson",
+                background=BackgroundTask(_refresh_search_index),
+            )
         process_path = extract_dir
     else:
         process_path = upload_path
@@ -139,6 +214,7 @@ async def upload_project(
         if proj and not proj.custom_description:
             db_manager.update_project(pid, {"custom_description": original_stem})
 
+    background_tasks.add_task(_refresh_search_index)
     return result
 
 
@@ -147,6 +223,7 @@ async def upload_project(
 @router.post("/{project_id}/upload")
 async def incremental_upload(
     project_id: int,
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     user_id: Optional[int] = Depends(get_current_user_id)
 ):
@@ -184,8 +261,9 @@ async def incremental_upload(
                 populate_contributors_for_project(project)
         except Exception as e:
             # Log but do not fail the upload if contributor extraction fails
-            print(f"[WARN] Failed to populate Git contributors: {e}")
+            logger.warning("Failed to populate Git contributors: %s", e)
 
+        background_tasks.add_task(_refresh_search_index)
         return result
     except HTTPException:
         raise
@@ -195,17 +273,80 @@ async def incremental_upload(
 
 # ── List / Get ─────────────────────────────────────────────────────────────────
 
+PROJECT_VIEWS = ("full", "card")
+MAX_PAGE_SIZE = 200
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[set]:
+    """Parse ?fields=a,b,c into a set (id is always included)."""
+    if not fields:
+        return None
+    wanted = {f.strip() for f in fields.split(",") if f.strip()}
+    return wanted | {"id"} if wanted else None
+
+
+def _project_payload(project, d: dict, wanted: Optional[set]) -> dict:
+    """Add computed keys and trim to the requested fields."""
+    if wanted is None or "display_name" in wanted:
+        d["display_name"] = _display_name(project)
+    if wanted is None or "thumbnail_urls" in wanted:
+        d["thumbnail_urls"] = derivative_urls(project.thumbnail_path)
+    if wanted is not None:
+        d = {k: v for k, v in d.items() if k in wanted}
+    return d
+
+
 @router.get("")
-def list_projects(user_id: Optional[int] = Depends(get_current_user_id)):
-    """Get all projects for the current user (or guest projects)."""
-    if user_id:
-        projects = db_manager.get_projects_for_user(user_id)
-    else:
-        projects = db_manager.get_guest_projects()
+def list_projects(
+    response: Response,
+    view: str = Query("full", description="'card' selects only the columns a project card shows"),
+    fields: Optional[str] = Query(None, description="Comma-separated keys to return"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    user_id: Optional[int] = Depends(get_current_user_id),
+):
+    """
+    Get projects for the current user (or guest projects), newest first.
+
+    Without limit the whole list is returned. With limit, the cursor for the
+    next page is sent in the X-Next-Cursor header (absent on the last page).
+    """
+    if view not in PROJECT_VIEWS:
+        raise HTTPException(status_code=400, detail=f"Unknown view '{view}'. Supported: {', '.join(PROJECT_VIEWS)}")
+    try:
+        rows, next_cursor = db_manager.get_project_page(user_id, view=view, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    wanted = _parse_fields(fields)
     result = []
-    for p in projects:
-        d = p.to_dict()
-        d["display_name"] = _display_name(p)
+    for p in rows:
+        d = project_card_to_dict(p) if view == "card" else p.to_dict()
+        result.append(_project_payload(p, d, wanted))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return result
+
+
+@router.get("/search")
+def search_projects(
+    q: str = Query(..., min_length=1, description="Words, skills or a description to look for"),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    user_id: Optional[int] = Depends(get_current_user_id),
+):
+    """
+    Relevance-ranked search over project names, descriptions, keywords and
+    skills (local hashed TF-IDF index; no AI service involved).
+    """
+    hits = _search_index().search(q, user_id=user_id, limit=limit)
+    cards = db_manager.get_project_cards([pid for pid, _ in hits])
+    result = []
+    for pid, score in hits:
+        row = cards.get(pid)
+        if row is None:
+            continue
+        d = _project_payload(row, project_card_to_dict(row), None)
+        d["search_score"] = round(score, 4)
         result.append(d)
     return result
 
@@ -245,9 +386,10 @@ def shared_files_report(user_id: Optional[int] = Depends(get_current_user_id)):
             projects = db_manager.get_projects_for_user(user_id, include_hidden=True)
         else:
             projects = db_manager.get_guest_projects(include_hidden=True)
+        shared_map = manager.get_shared_files_map(p.id for p in projects)
         report = []
         for p in projects:
-            shared = manager.get_shared_files(p.id)
+            shared = shared_map.get(p.id)
             if shared:
                 report.append({
                     "project_id": p.id,
@@ -318,10 +460,11 @@ def estimate_upload_time(size_bytes: int = Depends(parse_size_bytes)):
 @router.get("/{project_id}")
 def get_project(
     project_id: int,
+    fields: Optional[str] = Query(None, description="Comma-separated keys to return"),
     user_id: Optional[int] = Depends(get_current_user_id)
 ):
     """Get a single project by ID."""
-    project = db_manager.get_project(project_id)
+    project, counts = db_manager.get_project_with_counts(project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     if project.user_id != user_id:
@@ -353,9 +496,9 @@ def get_project(
                 project._skills = json.dumps(extracted)
         except Exception:
             pass
-    d = project.to_dict(include_counts=True)
-    d["display_name"] = _display_name(project)
-    return d
+    d = project.to_dict()
+    d.update(counts)
+    return _project_payload(project, d, _parse_fields(fields))
 
 
 # ── Delete ─────────────────────────────────────────────────────────────────────
@@ -448,6 +591,13 @@ async def upload_thumbnail(
         raise HTTPException(status_code=400, detail=str(e))
     if result is None:
         raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
+    # Render thumb/preview derivatives in the background worker pool
+    try:
+        digest = schedule_derivatives(str(thumbnail_disk_path))
+        if digest:
+            result["thumbnail_urls"] = derivative_urls(filename)
+    except Exception as e:
+        logger.warning("Could not schedule thumbnail derivatives: %s", e)
     # Invalidate the cached portfolio so the next GET /portfolio regenerates with the new thumbnail
     db_manager.update_user(user_id, {"portfolio": None})
     return result
@@ -543,7 +693,7 @@ Return exactly this JSON:
                     else:
                         raw = response.text
                 except Exception as ex:
-                    print(f"  ⚠️ Native file analysis failed: {ex}")
+                    logger.warning("Native file analysis failed: %s", ex)
 
             # Fallback for plain text files
             if raw is None:
@@ -561,15 +711,15 @@ Return exactly this JSON:
             if raw:
                 try:
                     text = raw.strip()
-                    print(f"  Raw AI response (first 300): {text[:300]}")
+                    logger.debug("Raw AI response (first 300): %s", text[:300])
                     if text.startswith("```"):
                         text = text.split("```")[1]
                         if text.startswith("json"):
                             text = text[4:]
                     results = _json.loads(text.strip())
-                    print(f"  Parsed keys: {list(results.keys())}")
+                    logger.debug("Parsed keys: %s", list(results.keys()))
                 except Exception as parse_err:
-                    print(f"  JSON parse failed: {parse_err} | raw: {raw[:200] if raw else None}")
+                    logger.warning("AI response JSON parse failed: %s | raw: %s", parse_err, raw[:200])
                     results = {}
 
             updates = {}
@@ -709,21 +859,14 @@ def batch_analyze(
 @router.post("/compute-importance")
 def compute_importance(user_id: Optional[int] = Depends(get_current_user_id)):
     """Compute and save importance scores for all projects."""
-    if user_id:
-        projects = db_manager.get_projects_for_user(user_id, include_hidden=True)
-    else:
-        projects = db_manager.get_guest_projects(include_hidden=True)
-
-    if not projects:
-        return {"updated": 0, "scores": []}
-
     try:
-        from src.Analysis.importanceScores import calculate_importance_score
-        scores = []
-        for p in projects:
-            score = calculate_importance_score(p)
-            db_manager.update_project(p.id, {"importance_score": score})
-            scores.append({"project_id": p.id, "name": _display_name(p), "importance_score": round(score, 4)})
+        from src.Analysis.importanceScores import compute_importance_scores
+        # One query, one vectorized pass, one batched UPDATE
+        results = compute_importance_scores(user_id=user_id, guest=not user_id)
+        scores = [
+            {"project_id": row.id, "name": _display_name(row), "importance_score": round(score, 4)}
+            for row, score in results
+        ]
         scores.sort(key=lambda x: x["importance_score"], reverse=True)
         return {"updated": len(scores), "scores": scores}
     except Exception as e:
@@ -761,6 +904,15 @@ def rank_projects(
             "importance_score": float(p.importance_score or 0),
         })
 
+    # Semantic match against the search index's hashed TF-IDF embeddings
+    target_embedding = None
+    if body.target_skills or body.query:
+        index = _search_index()
+        target_embedding = index.embed_query(body.query or "", skills=body.target_skills)
+        if target_embedding is not None:
+            for d in project_dicts:
+                d["embedding"] = index.embedding_for(d["project_id"])
+
     try:
         from src.AI.ai_project_ranker import AIProjectRanker
         ranker = AIProjectRanker()
@@ -768,7 +920,11 @@ def rank_projects(
             project_dicts,
             target_skills=body.target_skills,
             top_k=body.top_k or 3,
+            target_embedding=target_embedding,
         )
+        # Embeddings are internal; keep responses small
+        for proj in result.get("all_scored", []):
+            proj.pop("embedding", None)
         # Clean up internal scoring keys before returning
         for proj in result.get("selected", []):
             proj.pop("_rank_score_raw", None)
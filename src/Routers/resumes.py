@@ -59,11 +59,8 @@ from src.Services.resume_service import (
     delete_user_resume,
     duplicate_user_resume,
 )
-from src.Services.resume_export_service import (
-    generate_resume_pdf,
-    generate_resume_docx,
-    get_resume_page_count,
-)
+# resume_export_service (ReportLab, python-docx) is imported inside the
+# export endpoints so the router does not load them at startup.
 
 router = APIRouter(prefix="/resume", tags=["Resume"])
 
@@ -287,6 +284,7 @@ def page_count_endpoint(
     Build the resume PDF in memory from the supplied payload and return
     the page count. Nothing is saved to the database.
     """
+    from src.Services.resume_export_service import get_resume_page_count
     try:
         pages = get_resume_page_count(body)
         return {"pages": pages}
@@ -300,10 +298,11 @@ def download_pdf_endpoint(
     user_id: int = Depends(require_auth)
 ):
     """Export the stored resume as a downloadable PDF."""
-    user = db_manager.get_user(user_id)
+    user = db_manager.get_user_summary(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    from src.Services.resume_export_service import generate_resume_pdf
     try:
         pdf_bytes = generate_resume_pdf(user_id, resume_id)
     except ValueError as e:
@@ -325,10 +324,11 @@ def download_docx_endpoint(
     user_id: int = Depends(require_auth)
 ):
     """Export the stored resume as a downloadable DOCX."""
-    user = db_manager.get_user(user_id)
+    user = db_manager.get_user_summary(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
+    from src.Services.resume_export_service import generate_resume_docx
     try:
         docx_bytes = generate_resume_docx(user_id, resume_id)
     except ValueError as e:
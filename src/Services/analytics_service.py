@@ -1,67 +1,51 @@
-from collections import defaultdict
-from itertools import combinations
 from typing import Optional
 from src.Databases.database import db_manager
+from src.Services.analytics_snapshot import snapshot_for
 
-from math import log
 
-def get_skill_cooccurrence(user_id: Optional[int] = None):
-    """
-    Returns a list of skill pairs with:
-    - count of projects they appear together in
-    - project list
-    """
-    projects = db_manager.get_all_projects(user_id=user_id)
-    pair_map = defaultdict(set)  # (skill_a, skill_b) -> set(project names)
-
-    for project in projects:
-        skills = project.skills or []
-
-        # Only consider unique skills per project
-        unique_skills = sorted(set(skills))
-
-        # Create all pairs
-        for skill_a, skill_b in combinations(unique_skills, 2):
-            pair_map[(skill_a, skill_b)].add(project.name)
-
-    # Format output
+def _build_cooccurrence(aggregate):
     result = []
-    for (skill_a, skill_b), project_names in pair_map.items():
+    for skill_a, skill_b in aggregate.ordered_pairs():
+        project_ids = sorted(aggregate.pair_projects[(skill_a, skill_b)])
         result.append({
             "skill_1": skill_a,
             "skill_2": skill_b,
-            "count": len(project_names),
-            "projects": [{"project_name": name} for name in project_names]
+            "count": len(project_ids),
+            "projects": [
+                {"project_name": aggregate.projects[pid].name} for pid in project_ids
+            ]
         })
-
-    # Sort by count descending
-    result.sort(key=lambda x: x["count"], reverse=True)
     return result
 
 
-# for skill analytics /produces deeper insight. This function gathers raw skills first
-def get_raw_skills_with_projects(user_id: Optional[int] = None):
-    skills_map = defaultdict(list)
-    projects = db_manager.get_all_projects(user_id=user_id)
+def get_skill_cooccurrence(user_id: Optional[int] = None):
+    """
+    Returns a list of skill pairs with:
+    - count of projects they appear together in
+    - project list
+    """
+    return snapshot_for(db_manager).render(user_id, "cooccurrence", _build_cooccurrence)
 
-    for project in projects:
-        for skill in project.skills or []:
-            skills_map[skill].append({
-                "project_id": project.id,
-                "project_name": project.name
-            })
 
+def _build_raw_skills(aggregate):
     raw_skills = []
-    for skill, project_list in skills_map.items():
+    for skill in aggregate.ordered_skills():
+        project_list = [
+            {"project_id": pid, "project_name": aggregate.projects[pid].name}
+            for pid in sorted(aggregate.skill_projects[skill])
+        ]
         raw_skills.append({
             "skill": skill,
             "count": len(project_list),
             "projects": project_list
         })
-
-    raw_skills.sort(key=lambda x: x["count"], reverse=True)
     return raw_skills
 
+
+# for skill analytics /produces deeper insight. This function gathers raw skills first
+def get_raw_skills_with_projects(user_id: Optional[int] = None):
+    return snapshot_for(db_manager).render(user_id, "raw_skills", _build_raw_skills)
+
 # this function generates the insights
 
 def get_skill_insights(user_id: Optional[int] = None):
@@ -73,7 +57,7 @@ def get_skill_insights(user_id: Optional[int] = None):
 
     # skill diversity: # of distinct skills / # of projects
     total_skills = len(raw_skills)
-    total_projects = len(db_manager.get_all_projects(user_id=user_id))
+    total_projects = len(snapshot_for(db_manager).aggregate(user_id).projects)
     skill_diversity = round(total_skills / total_projects, 3) if total_projects else 0
 
     return {
@@ -93,4 +77,10 @@ def get_full_skill_analytics(user_id: Optional[int] = None):
             "co_occurrence": get_skill_cooccurrence(user_id=user_id)
         },
         "insights": insights
-    }
\ No newline at end of file
+    }
+
+
+def check_analytics_snapshot(user_id: int, rebuild: bool = True):
+    """Compare one user's maintained snapshot bucket with a from-scratch rebuild."""
+    result = snapshot_for(db_manager).check_consistency(rebuild=rebuild, user_ids=[user_id])
+    return {key: result[key] for key in ("consistent", "rebuilt", "buckets_checked", "version")}
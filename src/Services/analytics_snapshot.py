@@ -0,0 +1,280 @@
+"""
+Materialized skill analytics, kept up to date by delta.
+
+Instead of rebuilding skill counts and co-occurrence pairs from every project
+on each dashboard load, the snapshot keeps, per user_id that has been read
+(None meaning every project, as in get_all_projects):
+  - the projects in scope
+  - skill -> project ids
+  - (skill_a, skill_b) -> project ids
+
+Committed writes to projects/files mark the touched project ids dirty (bulk
+deletes/updates mark the whole snapshot stale), via
+DatabaseManager.add_project_change_listener. The next read re-loads only
+the dirty projects and moves them between buckets; rendered responses are
+memoized per bucket until that bucket changes, so repeated reads only copy
+the memoized result.
+
+check_consistency() rebuilds from scratch and compares, for writes that
+bypass this DatabaseManager (other processes, raw SQL).
+
+Usage:
+    from src.Services.analytics_snapshot import snapshot_for
+
+    aggregate = snapshot_for(db_manager).aggregate(user_id)
+"""
+
+import threading
+from itertools import combinations
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+from src.Databases.request_scope import current_scope
+
+
+def _copy_rendered(value):
+    """Return a detached copy so callers can't mutate the memoized response"""
+    if isinstance(value, dict):
+        return {key: _copy_rendered(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_copy_rendered(item) for item in value]
+    return value
+
+
+class _ProjectEntry:
+    """The fields of one project that skill analytics read."""
+
+    __slots__ = ("id", "name", "custom_description", "project_type", "file_count",
+                 "user_id", "skills", "duration")
+
+    def __init__(self, project):
+        self.id = project.id
+        self.name = project.name
+        self.custom_description = getattr(project, "custom_description", None)
+        self.project_type = getattr(project, "project_type", None)
+        self.file_count = getattr(project, "file_count", None)
+        self.user_id = getattr(project, "user_id", None)
+        # Unique, in the order the project lists them
+        self.skills = tuple(dict.fromkeys(project.skills or []))
+        # (first_date, last_date, duration_days), loaded on first timeline read
+        self.duration = None
+
+    def key(self) -> tuple:
+        return (self.name, self.custom_description, self.project_type,
+                self.file_count, self.user_id, self.skills)
+
+
+class SkillAggregate:
+    """Skill and pair membership for one user's projects."""
+
+    def __init__(self):
+        self.projects: Dict[int, _ProjectEntry] = {}
+        self.skill_projects: Dict[str, Set[int]] = {}
+        self.pair_projects: Dict[Tuple[str, str], Set[int]] = {}
+        self._rendered: Dict[str, Any] = {}
+
+    def add(self, entry: _ProjectEntry) -> None:
+        self.projects[entry.id] = entry
+        for skill in entry.skills:
+            self.skill_projects.setdefault(skill, set()).add(entry.id)
+        for pair in combinations(sorted(entry.skills), 2):
+            self.pair_projects.setdefault(pair, set()).add(entry.id)
+        self._rendered.clear()
+
+    def remove(self, entry: _ProjectEntry) -> None:
+        self.projects.pop(entry.id, None)
+        for skill in entry.skills:
+            self._discard(self.skill_projects, skill, entry.id)
+        for pair in combinations(sorted(entry.skills), 2):
+            self._discard(self.pair_projects, pair, entry.id)
+        self._rendered.clear()
+
+    @staticmethod
+    def _discard(index: dict, key, project_id: int) -> None:
+        ids = index.get(key)
+        if ids is None:
+            return
+        ids.discard(project_id)
+        if not ids:
+            del index[key]
+
+    def ordered_skills(self):
+        """
+        Skills by project count (descending); ties keep first-seen order
+        across projects sorted by id, like a scan of get_all_projects().
+        """
+        first_seen = {}
+        for project_id in sorted(self.projects):
+            for position, skill in enumerate(self.projects[project_id].skills):
+                first_seen.setdefault(skill, (project_id, position))
+        return sorted(
+            self.skill_projects,
+            key=lambda s: (-len(self.skill_projects[s]), first_seen[s]),
+        )
+
+    def ordered_pairs(self):
+        """Pairs by project count (descending), then first project id."""
+        return sorted(
+            self.pair_projects,
+            key=lambda p: (-len(self.pair_projects[p]), min(self.pair_projects[p]), p),
+        )
+
+    def signature(self) -> tuple:
+        return (
+            {pid: entry.key() for pid, entry in self.projects.items()},
+            self.skill_projects,
+            self.pair_projects,
+        )
+
+
+class AnalyticsSnapshot:
+    """Per-user skill aggregates for one DatabaseManager."""
+
+    def __init__(self, manager):
+        self.manager = manager
+        self.version = 0
+        self._lock = threading.RLock()
+        self._buckets: Dict[Optional[int], SkillAggregate] = {}
+        self._dirty: Set[int] = set()
+
+        # Managers that can't report their writes are rebuilt on every read
+        self.tracked = callable(getattr(type(manager), "add_project_change_listener", None))
+        if self.tracked:
+            manager.add_project_change_listener(self._on_projects_changed)
+
+    def _on_projects_changed(self, project_ids) -> None:
+        if project_ids is None:
+            self.invalidate()
+            return
+        with self._lock:
+            self._dirty.update(project_ids)
+
+    def invalidate(self) -> None:
+        """Drop every bucket; each is rebuilt on its next read."""
+        with self._lock:
+            self._buckets.clear()
+            self._dirty.clear()
+            self.version += 1
+
+    # ── maintenance ─────────────────────────────────────────────────────────
+
+    def _build(self, user_id: Optional[int]) -> SkillAggregate:
+        aggregate = SkillAggregate()
+        for project in self.manager.get_all_projects(user_id=user_id):
+            aggregate.add(_ProjectEntry(project))
+        return aggregate
+
+    def _refresh(self, project_id: int) -> None:
+        project = self.manager.get_project(project_id)
+        visible = project is not None and not project.is_hidden
+
+        for user_id, aggregate in self._buckets.items():
+            old = aggregate.projects.get(project_id)
+            new = None
+            if visible and (user_id is None or project.user_id == user_id):
+                new = _ProjectEntry(project)
+
+            if old is not None and new is not None and old.key() == new.key():
+                # Only dates/files changed: skills and pairs are untouched
+                old.duration = None
+                aggregate._rendered.clear()
+                continue
+            if old is not None:
+                aggregate.remove(old)
+            if new is not None:
+                aggregate.add(new)
+
+    def _sync(self) -> None:
+        scope = current_scope()
+        if scope is not None and scope.has_pending(self.manager):
+            self.manager.flush_pending_updates()
+        if not self.tracked:
+            self._buckets.clear()
+            return
+        if self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            for project_id in sorted(dirty):
+                self._refresh(project_id)
+            self.version += 1
+
+    def check_consistency(self, rebuild: bool = True,
+                          user_ids: Optional[Iterable[Optional[int]]] = None) -> Dict[str, Any]:
+        """
+        Rebuild buckets (every loaded one, or just user_ids, loading any
+        that aren't yet) from scratch and compare with the maintained ones.
+        With rebuild=True a mismatching bucket is replaced. The rebuilds run
+        outside the lock so reads are not held up; a bucket that changed
+        meanwhile is rebuilt again under it.
+        """
+        with self._lock:
+            self._sync()
+            if user_ids is None:
+                targets = list(self._buckets)
+            else:
+                targets = list(dict.fromkeys(user_ids))
+                for user_id in targets:
+                    self.aggregate(user_id)
+            version = self.version
+        fresh = {user_id: self._build(user_id) for user_id in targets}
+
+        with self._lock:
+            self._sync()
+            stale = []
+            for user_id in targets:
+                aggregate = self._buckets.get(user_id)
+                if aggregate is None:
+                    continue
+                if self.version != version:
+                    fresh[user_id] = self._build(user_id)
+                if fresh[user_id].signature() != aggregate.signature():
+                    stale.append(user_id)
+                    if rebuild:
+                        self._buckets[user_id] = fresh[user_id]
+            if stale and rebuild:
+                self.version += 1
+            return {
+                "consistent": not stale,
+                "rebuilt": bool(stale) and rebuild,
+                "buckets_checked": len(targets),
+                "stale_user_ids": stale,
+                "version": self.version,
+            }
+
+    # ── reads ───────────────────────────────────────────────────────────────
+
+    def aggregate(self, user_id: Optional[int] = None) -> SkillAggregate:
+        with self._lock:
+            self._sync()
+            aggregate = self._buckets.get(user_id)
+            if aggregate is None:
+                aggregate = self._buckets[user_id] = self._build(user_id)
+            return aggregate
+
+    def render(self, user_id: Optional[int], name: str, builder: Callable[[SkillAggregate], Any]):
+        """
+        builder(aggregate), memoized until this user's aggregate changes.
+        Each call gets its own copy of the memoized dicts and lists.
+        """
+        with self._lock:
+            aggregate = self.aggregate(user_id)
+            if name not in aggregate._rendered:
+                aggregate._rendered[name] = builder(aggregate)
+            return _copy_rendered(aggregate._rendered[name])
+
+    def project_duration(self, entry: _ProjectEntry):
+        """(first_date, last_date, duration_days), cached on the entry."""
+        if entry.duration is None:
+            entry.duration = self.manager.get_project_duration(entry.id)
+        return entry.duration
+
+
+_snapshots: Dict[int, AnalyticsSnapshot] = {}
+_snapshots_lock = threading.Lock()
+
+
+def snapshot_for(manager) -> AnalyticsSnapshot:
+    """The snapshot maintained for a DatabaseManager (created on first use)."""
+    with _snapshots_lock:
+        snapshot = _snapshots.get(id(manager))
+        if snapshot is None or snapshot.manager is not manager:
+            snapshot = _snapshots[id(manager)] = AnalyticsSnapshot(manager)
+        return snapshot
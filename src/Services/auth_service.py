@@ -4,25 +4,48 @@ Authentication Utilities
 JWT token generation/validation and password hashing for API authentication.
 """
 
+import asyncio
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 
+from src.Services import metrics
+
 # Configuration
 SECRET_KEY = "dam-secret-key-2025-change-in-production"  # TODO: Move to environment variable
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30 * 24 * 60  # 30 days
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing. Each +1 round doubles the bcrypt cost; run
+# benchmarks/bench_password_hash.py to pick a value for the deployment.
+# Existing hashes are upgraded to the configured rounds on the next login.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+# The API routes hash on their own small pool (see PasswordHashPool) instead
+# of the request threadpool every other endpoint shares
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", "64"))
 
 # HTTP Bearer token extraction (auto_error=False allows guest access)
 security = HTTPBearer(auto_error=False)
 
+# Verified tokens: token -> (user_id, exp as a unix timestamp). A signed
+# token's claims can't change, so each one is decoded once and then served
+# from here until it expires. Invalid tokens are never cached.
+TOKEN_CACHE_SIZE = 1024
+_token_cache: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
 
 def hash_password(password: str) -> str:
     """
@@ -51,6 +74,109 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class PasswordHashPool:
+    """
+    Bounded executor for bcrypt work.
+
+    At most `workers` hashes run at once and at most `max_queue` wait behind
+    them; past that, run() raises 503 so a login burst is shed instead of
+    piling up. bcrypt releases the GIL, so the workers hash in parallel.
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_queue: int = PASSWORD_HASH_MAX_QUEUE):
+        self.workers = max(1, workers)
+        self.max_queue = max(0, max_queue)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._pending = 0   # submitted and not finished (running + queued)
+        self._running = 0
+        self._peak_queued = 0
+        self._completed = 0
+        self._rejected = 0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers,
+                                                    thread_name_prefix="password-hash")
+            return self._executor
+
+    def _run(self, fn: Callable, args: tuple) -> Any:
+        with self._lock:
+            self._running += 1
+        try:
+            return fn(*args)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    def _done(self, future) -> None:
+        # Also called for futures cancelled before they started
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self._completed += 1
+
+    async def run(self, fn: Callable, *args) -> Any:
+        """Run fn(*args) on the pool and await its result."""
+        with self._lock:
+            if self._pending - self.workers >= self.max_queue:
+                self._rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many sign-in requests, please retry shortly",
+                    headers={"Retry-After": "1"},
+                )
+            self._pending += 1
+            self._peak_queued = max(self._peak_queued, self._pending - self.workers)
+        future = self._get_executor().submit(self._run, fn, args)
+        future.add_done_callback(self._done)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> Dict[str, int]:
+        """Current load and lifetime counters, for monitoring."""
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queued": self._pending - self._running,
+                "peak_queued": self._peak_queued,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "bcrypt_rounds": BCRYPT_ROUNDS,
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+
+password_hash_pool = PasswordHashPool()
+
+metrics.REGISTRY.gauge_callback(
+    "password_hash_pool", "Password hash pool load (running, queued) and lifetime counts, by stat.",
+    password_hash_pool.stats,
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password() on the password hash pool."""
+    return await password_hash_pool.run(pwd_context.hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    verify_password() on the password hash pool.
+
+    Returns (valid, new_hash); new_hash is set when the stored hash uses
+    different bcrypt rounds than BCRYPT_ROUNDS and should be saved.
+    """
+    return await password_hash_pool.run(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
 def create_access_token(user_id: int) -> str:
     """
     Create a JWT access token for a user.
@@ -69,6 +195,56 @@ def create_access_token(user_id: int) -> str:
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
+def clear_token_cache() -> None:
+    """Forget every verified token (e.g. after rotating SECRET_KEY)."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
+def _cache_token(token: str, user_id: int, exp: float, now: float) -> None:
+    with _token_cache_lock:
+        _token_cache[token] = (user_id, exp)
+        _token_cache.move_to_end(token)
+        if len(_token_cache) > TOKEN_CACHE_SIZE:
+            # Expired entries go first, then the least recently used
+            for key in [k for k, (_, k_exp) in _token_cache.items() if k_exp <= now]:
+                del _token_cache[key]
+            while len(_token_cache) > TOKEN_CACHE_SIZE:
+                _token_cache.popitem(last=False)
+
+
+def decode_user_id(token: str) -> Optional[int]:
+    """
+    User ID a token was issued for, or None if it is invalid or expired.
+
+    Checks the cache of verified tokens before running jwt.decode.
+    """
+    now = time.time()
+    with _token_cache_lock:
+        entry = _token_cache.get(token)
+        if entry is not None:
+            if entry[1] > now:
+                _token_cache.move_to_end(token)
+                return entry[0]
+            del _token_cache[token]
+            return None
+
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+
+    user_id_str: str = payload.get("sub")
+    if user_id_str is None:
+        return None
+    user_id = int(user_id_str)
+
+    exp = payload.get("exp")
+    if exp is not None:
+        _cache_token(token, user_id, float(exp), now)
+    return user_id
+
+
 def get_current_user_id(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security)
 ) -> Optional[int]:
@@ -93,20 +269,8 @@ def get_current_user_id(
     if not credentials:
         return None  # No Authorization header = guest mode
     
-    token = credentials.credentials
-    
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id_str: str = payload.get("sub")
-        
-        if user_id_str is None:
-            return None
-        
-        return int(user_id_str)
-        
-    except JWTError:
-        # Invalid or expired token = treat as guest
-        return None
+    # Invalid or expired token = treat as guest
+    return decode_user_id(credentials.credentials)
 
 
 def require_auth(user_id: Optional[int] = Depends(get_current_user_id)) -> int:
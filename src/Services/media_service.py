@@ -0,0 +1,304 @@
+# src/Services/media_service.py
+"""
+Image derivative pipeline.
+
+Uploaded thumbnails are stored as full-size originals in evidence/uploads.
+This module turns them into fixed-size WebP/JPEG derivatives that are
+stored content-addressed (one folder per SHA-256 of the original) under
+evidence/derivatives and served by the /media router.
+
+Layout:
+    evidence/derivatives/<hash>/source        -> absolute path of the original
+    evidence/derivatives/<hash>/<size>.<fmt>  -> rendered derivative
+
+Derivatives are rendered in a small process pool at upload time and
+regenerated on demand if they were evicted by the LRU size cap.
+"""
+
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from src.Analysis.file_hasher import compute_file_hash
+
+logger = logging.getLogger(__name__)
+
+DERIVATIVE_DIR = Path("evidence/derivatives")
+
+# Bounding boxes for each named size (aspect ratio is preserved)
+DERIVATIVE_SIZES: Dict[str, Tuple[int, int]] = {
+    "thumb": (320, 320),
+    "preview": (1280, 1280),
+}
+
+# Output format name -> (file extension, Pillow format, media type)
+DERIVATIVE_FORMATS: Dict[str, Tuple[str, str, str]] = {
+    "webp": ("webp", "WEBP", "image/webp"),
+    "jpeg": ("jpg", "JPEG", "image/jpeg"),
+}
+
+# Extensions Pillow can decode (SVG is vector and is served as-is)
+RASTER_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+
+MAX_CACHE_BYTES = 256 * 1024 * 1024  # 256 MB of derivatives before LRU eviction
+MAX_WORKERS = 2
+
+_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    """Create the bounded worker pool on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=MAX_WORKERS)
+        return _pool
+
+
+def shutdown_pool(wait: bool = True) -> None:
+    """Stop the worker pool (used on app shutdown and in tests)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=wait)
+            _pool = None
+
+
+def is_valid_hash(content_hash: str) -> bool:
+    return bool(content_hash) and bool(_HASH_RE.match(content_hash))
+
+
+def derivative_path(content_hash: str, size: str, fmt: str = "webp") -> Path:
+    ext = DERIVATIVE_FORMATS[fmt][0]
+    return DERIVATIVE_DIR / content_hash / f"{size}.{ext}"
+
+
+@lru_cache(maxsize=1024)
+def _cached_hash(path: str, mtime_ns: int, file_size: int) -> str:
+    # mtime/size are part of the key so a replaced file is re-hashed
+    return compute_file_hash(path)
+
+
+def content_hash(source_path: str) -> str:
+    """SHA-256 of a source image, memoised on (path, mtime, size)."""
+    stat = os.stat(source_path)
+    return _cached_hash(os.path.abspath(source_path), stat.st_mtime_ns, stat.st_size)
+
+
+def render_derivative(source_path: str, dest_path: str, box: Tuple[int, int], pil_format: str) -> str:
+    """
+    Render one derivative. Runs inside a worker process, so it only takes
+    plain arguments and imports Pillow lazily.
+
+    draft() lets the JPEG decoder scale by 1/2, 1/4 or 1/8 while decoding,
+    and thumbnail(reducing_gap=...) uses Image.reduce() before the final
+    resample, so large originals are never fully decoded at full size.
+    """
+    from PIL import Image, ImageOps
+
+    with Image.open(source_path) as img:
+        img.draft("RGB", box)
+        img = ImageOps.exif_transpose(img)
+        img.thumbnail(box, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+        if pil_format == "JPEG" and img.mode != "RGB":
+            img = img.convert("RGB")
+        elif img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGBA")
+
+        dest = Path(dest_path)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(dest.name + ".tmp")
+        img.save(tmp, format=pil_format, quality=82, optimize=True)
+        os.replace(tmp, dest)
+
+    return dest_path
+
+
+def register_source(source_path: str) -> Optional[str]:
+    """
+    Record an original image in the derivative store.
+
+    Returns:
+        The content hash, or None if the file is not a raster image.
+    """
+    if Path(source_path).suffix.lower() not in RASTER_EXTENSIONS:
+        return None
+
+    digest = content_hash(source_path)
+    if not digest:
+        return None
+
+    folder = DERIVATIVE_DIR / digest
+    folder.mkdir(parents=True, exist_ok=True)
+    (folder / "source").write_text(os.path.abspath(source_path), encoding="utf-8")
+    return digest
+
+
+def schedule_derivatives(source_path: str) -> Optional[str]:
+    """
+    Register an uploaded image and queue every size/format in the worker
+    pool. Returns immediately with the content hash.
+    """
+    digest = register_source(source_path)
+    if not digest:
+        return None
+
+    pool = _get_pool()
+    futures = []
+    for size, box in DERIVATIVE_SIZES.items():
+        for fmt, (_, pil_format, _) in DERIVATIVE_FORMATS.items():
+            dest = derivative_path(digest, size, fmt)
+            if dest.exists():
+                continue
+            futures.append(pool.submit(render_derivative, os.path.abspath(source_path), str(dest), box, pil_format))
+
+    # Callbacks are attached once the batch is complete so the last one to
+    # finish (not just the first) runs the size cap
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def _done(future) -> None:
+        _log_failure(future)
+        with lock:
+            remaining[0] -= 1
+            last = remaining[0] == 0
+        if last:
+            try:
+                enforce_cache_limit()
+            except Exception as e:
+                logger.warning("Derivative cache eviction failed: %s", e)
+
+    for future in futures:
+        future.add_done_callback(_done)
+    return digest
+
+
+def _log_failure(future) -> None:
+    exc = future.exception()
+    if exc is not None:
+        logger.warning("Thumbnail derivative failed: %s", exc)
+
+
+def get_derivative(content_hash: str, size: str, fmt: str = "webp") -> Optional[Path]:
+    """
+    Return the path of a derivative, generating it on demand if it is
+    missing. Returns None if the hash/size is unknown or the original is gone.
+    """
+    if not is_valid_hash(content_hash) or size not in DERIVATIVE_SIZES or fmt not in DERIVATIVE_FORMATS:
+        return None
+
+    dest = derivative_path(content_hash, size, fmt)
+    if dest.exists():
+        # Touch so the LRU sweep keeps recently served files
+        try:
+            os.utime(dest)
+        except OSError:
+            pass
+        return dest
+
+    pointer = DERIVATIVE_DIR / content_hash / "source"
+    if not pointer.exists():
+        return None
+    source = pointer.read_text(encoding="utf-8").strip()
+    if not os.path.isfile(source):
+        return None
+
+    try:
+        render_derivative(source, str(dest), DERIVATIVE_SIZES[size], DERIVATIVE_FORMATS[fmt][1])
+    except Exception as e:
+        logger.warning("On-demand derivative failed for %s/%s: %s", content_hash, size, e)
+        return None
+
+    enforce_cache_limit()
+    return dest
+
+
+def derivative_available(content_hash: str, size: str, fmt: str = "webp") -> bool:
+    """
+    Cheap check that get_derivative() would find or could render this
+    derivative: the file exists, or the recorded original is still on disk.
+    """
+    if not is_valid_hash(content_hash) or size not in DERIVATIVE_SIZES or fmt not in DERIVATIVE_FORMATS:
+        return False
+    if derivative_path(content_hash, size, fmt).exists():
+        return True
+    pointer = DERIVATIVE_DIR / content_hash / "source"
+    try:
+        return os.path.isfile(pointer.read_text(encoding="utf-8").strip())
+    except OSError:
+        return False
+
+
+def enforce_cache_limit(max_bytes: Optional[int] = None) -> int:
+    """
+    Delete least-recently-used derivatives until the store fits in max_bytes
+    (MAX_CACHE_BYTES by default). Runs after on-demand renders and after
+    each upload-time batch. Source pointers are kept so evicted sizes can be
+    regenerated.
+
+    Returns:
+        Number of derivative files removed.
+    """
+    if max_bytes is None:
+        max_bytes = MAX_CACHE_BYTES
+    if not DERIVATIVE_DIR.exists():
+        return 0
+
+    entries = []
+    total = 0
+    for folder in DERIVATIVE_DIR.iterdir():
+        if not folder.is_dir():
+            continue
+        for f in folder.iterdir():
+            if f.name == "source" or f.name.endswith(".tmp"):
+                continue
+            try:
+                stat = f.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, f))
+            total += stat.st_size
+
+    removed = 0
+    entries.sort(key=lambda e: e[0])
+    for _, file_size, f in entries:
+        if total <= max_bytes:
+            break
+        try:
+            f.unlink()
+            total -= file_size
+            removed += 1
+        except OSError:
+            continue
+    return removed
+
+
+def derivative_urls(thumbnail_path: Optional[str], upload_dir: Path = Path("evidence/uploads")) -> Optional[Dict[str, str]]:
+    """
+    Build /media URLs for a project's stored thumbnail filename.
+    Returns None when there is no raster thumbnail on disk.
+    """
+    if not thumbnail_path:
+        return None
+    source = upload_dir / Path(thumbnail_path).name
+    if source.suffix.lower() not in RASTER_EXTENSIONS or not source.is_file():
+        return None
+    try:
+        digest = content_hash(str(source))
+    except OSError:
+        return None
+    if not digest:
+        return None
+    if not (DERIVATIVE_DIR / digest / "source").exists():
+        # Thumbnail uploaded before the derivative store existed
+        register_source(str(source))
+    return {size: f"/media/{digest}/{size}" for size in DERIVATIVE_SIZES}
@@ -0,0 +1,310 @@
+"""
+In-process metrics with a Prometheus text exposition.
+
+Counters and histograms live in this process only (no push gateway, no
+client library); GET /metrics renders them in the Prometheus text format so
+any scraper, or a plain curl, can read them. Values reset on restart.
+
+Recorded here:
+  - http_*              per-route request counts and latency, and the SQL
+                        statements / DB time each request spent
+                        (MetricsMiddleware)
+  - db_query_*          every SQL statement by operation (database.py
+                        cursor events)
+  - scanner_phase_*     time spent in each scan_and_store phase (phase())
+  - ai_request_*        Gemini call latency by outcome, and response cache
+                        hits (ai_service)
+  - password_hash_*     the password hash pool's load (auth_service)
+
+Usage:
+    from src.Services import metrics
+
+    with metrics.phase("coding", "find_files"):
+        ...
+    metrics.AI_REQUESTS.inc(outcome="cached")
+    print(metrics.render())
+"""
+
+import bisect
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds: sub-millisecond DB statements up to multi-minute scans
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+# Statements per request
+COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250, 1000)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _format_labels(key: LabelKey, extra: Sequence[Tuple[str, str]] = ()) -> str:
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    escaped = (v.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') for _, v in pairs)
+    return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic count per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(_label_key(labels), 0)
+
+    def total(self) -> float:
+        """Sum over every label set."""
+        with self._lock:
+            return sum(self._values.values())
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram:
+    """Bucketed observations (cumulative buckets, sum and count) per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets))
+        # label key -> [per-bucket counts..., +Inf count, sum]
+        self._values: Dict[LabelKey, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            row = self._values.get(key)
+            if row is None:
+                row = self._values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            row[index] += 1
+            row[-1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """Observe the duration of the with-block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            row = self._values.get(_label_key(labels))
+            return int(sum(row[:-1])) if row else 0
+
+    def sum(self, **labels) -> float:
+        with self._lock:
+            row = self._values.get(_label_key(labels))
+            return row[-1] if row else 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            items = sorted((key, list(row)) for key, row in self._values.items())
+        lines = []
+        for key, row in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), row[:-1]):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(key, [('le', _format_value(bound))])} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {_format_value(row[-1])}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Named metrics plus gauge callbacks read at render time."""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        # name -> (help, label name, callback returning {label value: value})
+        self._gauges: Dict[str, Tuple[str, str, Callable[[], Dict[str, float]]]] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help_text: str) -> Counter:
+        return self._register(Counter(name, help_text))
+
+    def histogram(self, name: str, help_text: str, buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help_text, buckets))
+
+    def gauge_callback(self, name: str, help_text: str, callback: Callable[[], Dict[str, float]],
+                       label: str = "stat") -> None:
+        """Report callback()'s {label value: value} as a gauge on every render."""
+        with self._lock:
+            self._gauges[name] = (help_text, label, callback)
+
+    def reset(self) -> None:
+        """Zero every counter and histogram (tests, benchmarks)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.reset()
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = sorted(self._metrics.items())
+            gauges = sorted(self._gauges.items())
+        lines = []
+        for name, metric in metrics:
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.samples())
+        for name, (help_text, label, callback) in gauges:
+            try:
+                values = callback()
+            except Exception as e:
+                logger.warning("Metrics gauge %s failed: %s", name, e)
+                continue
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            lines.extend(f"{name}{_format_labels(((label, str(key)),))} {_format_value(value)}"
+                         for key, value in sorted(values.items()))
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.counter(
+    "http_requests_total", "HTTP requests by method, route template and status code.")
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds", "Time to the end of the response body, by method and route template.")
+HTTP_REQUEST_DB_QUERIES = REGISTRY.histogram(
+    "http_request_db_queries", "SQL statements executed per request, by route template.", COUNT_BUCKETS)
+HTTP_REQUEST_DB_SECONDS = REGISTRY.histogram(
+    "http_request_db_seconds", "Time spent in SQL statements per request, by route template.")
+
+DB_QUERIES = REGISTRY.counter(
+    "db_queries_total", "SQL statements executed, by operation.")
+DB_QUERY_SECONDS = REGISTRY.histogram(
+    "db_query_duration_seconds", "SQL statement execution time, by operation.")
+
+SCANNER_PHASE_SECONDS = REGISTRY.histogram(
+    "scanner_phase_duration_seconds", "Time spent in each project scanner phase.")
+
+AI_REQUESTS = REGISTRY.counter(
+    "ai_requests_total", "AI text generation calls by outcome (success, failed, blocked, cached).")
+AI_REQUEST_SECONDS = REGISTRY.histogram(
+    "ai_request_duration_seconds", "Latency of AI generation calls that reached the model, by outcome.")
+
+
+def render() -> str:
+    """The whole registry in the Prometheus text exposition format."""
+    return REGISTRY.render()
+
+
+@contextmanager
+def phase(scanner: str, name: str) -> Iterator[None]:
+    """Record the duration of one scanner phase."""
+    with SCANNER_PHASE_SECONDS.time(scanner=scanner, phase=name):
+        yield
+
+
+def statement_operation(statement: str) -> str:
+    """First SQL keyword, lowercased (select, insert, update, ...)."""
+    head = statement.lstrip().split(None, 1)
+    return head[0].lower() if head else "unknown"
+
+
+def record_query(statement: str, seconds: float) -> None:
+    operation = statement_operation(statement)
+    DB_QUERIES.inc(operation=operation)
+    DB_QUERY_SECONDS.observe(seconds, operation=operation)
+
+
+def _route_template(scope) -> str:
+    route = scope.get("route")
+    path = getattr(route, "path", None)
+    # Unmatched paths share one label so scanners of random URLs can't grow the registry
+    return path if path else "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording per-route latency, status and DB usage.
+
+    Add it before RequestScopeMiddleware (so it runs inside the request
+    scope) to get the per-request SQL statement counts and DB time.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        from src.Databases.request_scope import current_scope
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            route = _route_template(scope)
+            method = scope.get("method", "")
+            HTTP_REQUESTS.inc(method=method, route=route, status=status_code)
+            HTTP_REQUEST_SECONDS.observe(elapsed, method=method, route=route)
+            req_scope = current_scope()
+            if req_scope is not None:
+                HTTP_REQUEST_DB_QUERIES.observe(req_scope.query_count, route=route)
+                HTTP_REQUEST_DB_SECONDS.observe(req_scope.query_seconds, route=route)
@@ -61,6 +61,8 @@ def process_uploaded_path(path: str, user_id: Optional[int] = None):
             "status": "exists",
             "project_id": existing.id,
             "project_name": existing.name,
+            "project_type": existing.project_type,
+            "file_count": existing.file_count,
         }
 
     # 2. Content hash match (catches same zip uploaded under a new UUID filename)
@@ -76,6 +78,8 @@ def process_uploaded_path(path: str, user_id: Optional[int] = None):
                 "status": "exists",
                 "project_id": existing_by_hash.id,
                 "project_name": existing_by_hash.name,
+                "project_type": existing_by_hash.project_type,
+                "file_count": existing_by_hash.file_count,
             }
     except Exception:
         content_hash = None  # non-fatal -- proceed with upload
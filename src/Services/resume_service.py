@@ -72,7 +72,7 @@ def _check_resume_ownership(resume_id: int, user_id: int) -> dict:
 # ── resume management operations ──────────────────────────────────────────────
 
 def list_user_resumes(user_id: int) -> dict:
-    user = db_manager.get_user(user_id)
+    user = db_manager.get_user_summary(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     resumes = db_manager.list_resumes(user_id)
@@ -80,7 +80,7 @@ def list_user_resumes(user_id: int) -> dict:
 
 
 def create_user_resume(user_id: int, name: str) -> dict:
-    user = db_manager.get_user(user_id)
+    user = db_manager.get_user_summary(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     r = db_manager.create_resume(user_id, name or "New Resume")
@@ -460,7 +460,7 @@ def generate_full_resume(user_id: int, num_bullets: int = 3, resume_id: int = No
 
     Returns the resume JSON.
     """
-    user = db_manager.get_user(user_id)
+    user = db_manager.get_user_summary(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -541,7 +541,7 @@ def get_full_resume(user_id: int, resume_id: int = None) -> dict:
     Return the stored resume JSON from the Resume row.
     Raises 404 if no resume has been generated yet.
     """
-    user = db_manager.get_user(user_id)
+    user = db_manager.get_user_summary(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
@@ -579,7 +579,7 @@ def save_full_resume(user_id: int, resume_data: dict, resume_id: int = None) ->
     Save the enriched resume (with frontend-added education, work history,
     skills, etc.) back to the Resume row in the database.
     """
-    user = db_manager.get_user(user_id)
+    user = db_manager.get_user_summary(user_id)
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
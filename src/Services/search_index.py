@@ -0,0 +1,463 @@
+"""
+Offline project search: a hashed BM25 (TF-IDF family) index over project
+names, descriptions, keywords and skills.
+
+Terms are hashed into N_FEATURES buckets, so there is no vocabulary to store
+or grow, and the index needs no model downloads or network access. Each
+bucket keeps a posting list; a query only touches the postings of its own
+terms, so search cost grows with how common the query words are rather than
+with the number of projects.
+
+The index:
+  - is persisted to data/search_index.npz and reloaded on start-up, where
+    only projects whose indexed text changed are re-tokenized
+  - follows DatabaseManager commits (add_project_change_listener) and
+    re-indexes just the touched projects before the next query
+  - also produces small dense "hashed TF-IDF" embeddings, so
+    AIProjectRanker can rank by semantic similarity to target skills
+
+Usage:
+    from src.Services.search_index import search_index_for
+
+    index = search_index_for(db_manager)
+    hits = index.search("react dashboard", user_id=3)   # [(project_id, score), ...]
+"""
+
+import logging
+import math
+import os
+import re
+import threading
+import zlib
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func, select
+
+from src.Databases.database import Project, Keyword
+
+logger = logging.getLogger(__name__)
+
+INDEX_PATH = 'data/search_index.npz'
+INDEX_FORMAT = 1
+
+N_FEATURES = 1 << 20
+EMBEDDING_DIM = 256
+
+# BM25 parameters (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Skill-like fields are also indexed as whole phrases under this prefix, so
+# "machine learning" matches the skill itself more strongly than two words
+PHRASE_PREFIX = 'skill:'
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in into is it its of on or
+that the their this to was were will with using used use project projects
+""".split())
+
+# Sentinel user id for guest (unowned) projects in the user array
+_GUEST = -1
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lower-cased word tokens (keeps c++, c#, node.js), minus stopwords."""
+    if not text:
+        return []
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS and len(t) > 1]
+
+
+def _phrases(values: Iterable[str]) -> List[str]:
+    return [PHRASE_PREFIX + ' '.join(v.lower().split()) for v in values if v and v.strip()]
+
+
+def hash_terms(terms: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Terms -> (sorted unique buckets int64, term counts float32)."""
+    if not terms:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+    hashed = np.fromiter((zlib.crc32(t.encode('utf-8')) for t in terms),
+                         dtype=np.int64, count=len(terms)) & (N_FEATURES - 1)
+    buckets, counts = np.unique(hashed, return_counts=True)
+    return buckets, counts.astype(np.float32)
+
+
+def query_terms(text: str, skills: Optional[Sequence[str]] = None) -> List[str]:
+    """Terms for a free-text query and/or a list of target skills."""
+    terms = tokenize(text)
+    if text and text.strip():
+        terms += _phrases([text])
+    for skill in skills or []:
+        terms += tokenize(skill) + _phrases([skill])
+    return terms
+
+
+def _document_terms(row) -> List[str]:
+    skill_like = []
+    for raw in (row._skills, row._languages, row._frameworks, row._tags):
+        values = Project._safe_json_loads(raw, [])
+        if isinstance(values, list):
+            skill_like.extend(str(v) for v in values if v)
+    keywords = row.keywords.split('\x1f') if row.keywords else []
+
+    terms = []
+    for text in (row.name, row.custom_description, row.description, row.ai_description):
+        terms += tokenize(text)
+    for text in keywords + skill_like:
+        terms += tokenize(text)
+    terms += _phrases(keywords + skill_like)
+    return terms
+
+
+def _fingerprint(row) -> int:
+    parts = [row.name, row.custom_description, row.description, row.ai_description,
+             row.keywords, row._skills, row._languages, row._frameworks, row._tags]
+    return zlib.crc32('\x1e'.join(p or '' for p in parts).encode('utf-8'))
+
+
+class ProjectSearchIndex:
+    """BM25 over hashed terms, with row arrays sized for fast NumPy scoring."""
+
+    def __init__(self, manager, path: Optional[str] = INDEX_PATH):
+        self.manager = manager
+        self.path = path
+        self._lock = threading.RLock()
+        self._reset()
+        self._loaded = False
+        self._dirty: set = set()
+        self._full_sync = True
+
+        if callable(getattr(type(manager), 'add_project_change_listener', None)):
+            manager.add_project_change_listener(self._on_projects_changed)
+
+    def _reset(self) -> None:
+        self._pid_row: Dict[int, int] = {}
+        self._row_pid = np.zeros(0, dtype=np.int64)
+        self._row_user = np.zeros(0, dtype=np.int64)
+        self._row_len = np.zeros(0, dtype=np.float32)
+        self._row_alive = np.zeros(0, dtype=bool)
+        self._row_fp: List[int] = []
+        self._row_terms: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._n_rows = 0
+        self._postings: Dict[int, Tuple[List[int], List[float]]] = {}
+        self._posting_arrays: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+        self._df: Dict[int, int] = {}
+        self._total_len = 0.0
+        self._n_alive = 0
+
+    # ── change tracking ─────────────────────────────────────────────────────
+
+    def _on_projects_changed(self, project_ids) -> None:
+        with self._lock:
+            if project_ids is None:
+                self._full_sync = True
+            else:
+                self._dirty.update(project_ids)
+
+    # ── row storage ─────────────────────────────────────────────────────────
+
+    def _grow(self, needed: int) -> None:
+        capacity = self._row_pid.shape[0]
+        if needed <= capacity:
+            return
+        new_capacity = max(needed, capacity * 2, 64)
+        for name in ('_row_pid', '_row_user', '_row_len', '_row_alive'):
+            old = getattr(self, name)
+            grown = np.zeros(new_capacity, dtype=old.dtype)
+            grown[:capacity] = old
+            setattr(self, name, grown)
+
+    def _add(self, project_id: int, user_id: Optional[int], fingerprint: int,
+             buckets: np.ndarray, counts: np.ndarray) -> None:
+        row = self._n_rows
+        self._grow(row + 1)
+        self._n_rows += 1
+        self._row_pid[row] = project_id
+        self._row_user[row] = _GUEST if user_id is None else user_id
+        self._row_len[row] = float(counts.sum())
+        self._row_alive[row] = True
+        self._row_fp.append(fingerprint)
+        self._row_terms.append((buckets, counts))
+        self._pid_row[project_id] = row
+        self._total_len += float(counts.sum())
+        self._n_alive += 1
+
+        for bucket, count in zip(buckets.tolist(), counts.tolist()):
+            rows, tfs = self._postings.setdefault(bucket, ([], []))
+            rows.append(row)
+            tfs.append(count)
+            self._df[bucket] = self._df.get(bucket, 0) + 1
+            self._posting_arrays.pop(bucket, None)
+
+    def _remove(self, project_id: int) -> None:
+        row = self._pid_row.pop(project_id, None)
+        if row is None:
+            return
+        self._row_alive[row] = False
+        buckets, counts = self._row_terms[row]
+        self._row_terms[row] = (buckets[:0], counts[:0])
+        self._total_len -= float(counts.sum())
+        self._n_alive -= 1
+        for bucket in buckets.tolist():
+            self._df[bucket] -= 1
+        # Dead rows stay in the postings (masked at query time) until compaction
+        if self._n_rows > 1024 and self._n_alive < self._n_rows // 2:
+            self._compact()
+
+    def _compact(self) -> None:
+        live = np.flatnonzero(self._row_alive[:self._n_rows])
+        terms = [self._row_terms[r] for r in live]
+        fingerprints = [self._row_fp[r] for r in live]
+        pids, users = self._row_pid[live], self._row_user[live]
+        self._reset()
+        self._bulk_add(pids, users, fingerprints, terms)
+
+    def _bulk_add(self, pids: np.ndarray, users: np.ndarray, fingerprints: Sequence[int],
+                  terms: Sequence[Tuple[np.ndarray, np.ndarray]]) -> None:
+        """Load many rows into an empty index, building postings with one sort."""
+        n = len(terms)
+        self._grow(n)
+        self._n_rows = n
+        self._row_pid[:n] = pids
+        self._row_user[:n] = users
+        self._row_alive[:n] = True
+        self._row_fp = list(fingerprints)
+        self._row_terms = list(terms)
+        self._pid_row = {int(pid): row for row, pid in enumerate(pids.tolist())}
+        self._n_alive = n
+        if not n:
+            return
+
+        lengths = np.array([b.shape[0] for b, _ in terms], dtype=np.int64)
+        all_buckets = np.concatenate([b for b, _ in terms])
+        all_counts = np.concatenate([c for _, c in terms]).astype(np.float32)
+        all_rows = np.repeat(np.arange(n, dtype=np.int64), lengths)
+        self._row_len[:n] = np.bincount(all_rows, weights=all_counts, minlength=n)
+        self._total_len = float(all_counts.sum())
+
+        order = np.argsort(all_buckets, kind='stable')
+        sorted_buckets = all_buckets[order]
+        bounds = np.flatnonzero(np.diff(sorted_buckets)) + 1
+        starts = np.r_[0, bounds]
+        ends = np.r_[bounds, sorted_buckets.size]
+        sorted_rows, sorted_counts = all_rows[order], all_counts[order]
+        for bucket, lo, hi in zip(sorted_buckets[starts].tolist(), starts.tolist(), ends.tolist()):
+            rows, tfs = sorted_rows[lo:hi], sorted_counts[lo:hi]
+            self._postings[bucket] = (rows.tolist(), tfs.tolist())
+            self._posting_arrays[bucket] = (rows, tfs)
+            self._df[bucket] = hi - lo
+
+    def _postings_for(self, bucket: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        arrays = self._posting_arrays.get(bucket)
+        if arrays is None:
+            lists = self._postings.get(bucket)
+            if lists is None:
+                return None
+            arrays = (np.asarray(lists[0], dtype=np.int64), np.asarray(lists[1], dtype=np.float32))
+            self._posting_arrays[bucket] = arrays
+        return arrays
+
+    # ── loading from the database ───────────────────────────────────────────
+
+    def _select_rows(self, project_ids: Optional[Iterable[int]] = None):
+        keywords = (
+            select(Keyword.project_id, func.group_concat(Keyword.keyword, '\x1f').label('keywords'))
+            .group_by(Keyword.project_id).subquery()
+        )
+        stmt = (
+            select(
+                Project.id, Project.user_id, Project.name, Project.custom_description,
+                Project.description, Project.ai_description,
+                Project._skills, Project._languages, Project._frameworks, Project._tags,
+                keywords.c.keywords,
+            )
+            .outerjoin(keywords, keywords.c.project_id == Project.id)
+            .where(Project.is_hidden == False)
+        )
+        if project_ids is not None:
+            stmt = stmt.where(Project.id.in_(list(project_ids)))
+        session = self.manager.get_session()
+        try:
+            return session.execute(stmt).all()
+        finally:
+            session.close()
+
+    def _index_rows(self, rows) -> int:
+        changed = 0
+        for row in rows:
+            fingerprint = _fingerprint(row)
+            current = self._pid_row.get(row.id)
+            if current is not None:
+                owner = int(self._row_user[current])
+                same_owner = owner == (_GUEST if row.user_id is None else row.user_id)
+                if same_owner and self._row_fp[current] == fingerprint:
+                    continue
+                self._remove(row.id)
+            buckets, counts = hash_terms(_document_terms(row))
+            self._add(row.id, row.user_id, fingerprint, buckets, counts)
+            changed += 1
+        return changed
+
+    def _sync(self) -> bool:
+        """Bring the index up to date with the database. True if anything changed."""
+        if not self._loaded:
+            self._load()
+        if self._full_sync:
+            self._full_sync = False
+            self._dirty.clear()
+            rows = self._select_rows()
+            present = {row.id for row in rows}
+            stale = [pid for pid in self._pid_row if pid not in present]
+            for pid in stale:
+                self._remove(pid)
+            return bool(self._index_rows(rows) or stale)
+        if self._dirty:
+            dirty, self._dirty = self._dirty, set()
+            rows = self._select_rows(dirty)
+            for pid in dirty - {row.id for row in rows}:
+                self._remove(pid)
+            self._index_rows(rows)
+            return True
+        return False
+
+    def refresh(self, save: bool = True) -> None:
+        """Apply pending changes now (and persist them), e.g. after an upload."""
+        with self._lock:
+            if self._sync() and save:
+                self.save()
+
+    # ── persistence ─────────────────────────────────────────────────────────
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        with self._lock:
+            live = [r for r in range(self._n_rows) if self._row_alive[r]]
+            lengths = [self._row_terms[r][0].shape[0] for r in live]
+            indptr = np.zeros(len(live) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            buckets = np.concatenate([self._row_terms[r][0] for r in live]) if live else np.zeros(0, np.int64)
+            counts = np.concatenate([self._row_terms[r][1] for r in live]) if live else np.zeros(0, np.float32)
+
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            tmp = f"{self.path}.tmp.npz"
+            np.savez(
+                tmp,
+                format=np.int64(INDEX_FORMAT),
+                n_features=np.int64(N_FEATURES),
+                pids=self._row_pid[live],
+                users=self._row_user[live],
+                fingerprints=np.asarray([self._row_fp[r] for r in live], dtype=np.int64),
+                indptr=indptr,
+                buckets=buckets,
+                counts=counts,
+            )
+            os.replace(tmp, self.path)
+
+    def _load(self) -> None:
+        self._loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with np.load(self.path) as data:
+                if int(data['format']) != INDEX_FORMAT or int(data['n_features']) != N_FEATURES:
+                    return
+                indptr, buckets, counts = data['indptr'], data['buckets'], data['counts']
+                terms = [(buckets[lo:hi], counts[lo:hi])
+                         for lo, hi in zip(indptr[:-1].tolist(), indptr[1:].tolist())]
+                self._bulk_add(data['pids'], data['users'], data['fingerprints'].tolist(), terms)
+        except Exception as e:
+            logger.warning("Could not load search index %s: %s", self.path, e)
+            self._reset()
+
+    # ── queries ─────────────────────────────────────────────────────────────
+
+    def _scope_mask(self, user_id: Optional[int]) -> np.ndarray:
+        n = self._n_rows
+        owner = _GUEST if user_id is None else user_id
+        return self._row_alive[:n] & (self._row_user[:n] == owner)
+
+    def _idf(self, bucket: int) -> float:
+        df = self._df.get(bucket, 0)
+        return math.log(1 + (self._n_alive - df + 0.5) / (df + 0.5))
+
+    def search(self, query: str = '', user_id: Optional[int] = None, limit: int = 20,
+               skills: Optional[Sequence[str]] = None) -> List[Tuple[int, float]]:
+        """
+        Best-matching projects of one user (user_id=None: guest projects).
+
+        Returns:
+            [(project_id, score), ...], best first, score > 0 only
+        """
+        buckets, q_counts = hash_terms(query_terms(query, skills))
+        with self._lock:
+            self._sync()
+            if not buckets.size or not self._n_alive:
+                return []
+            n = self._n_rows
+            avg_len = self._total_len / self._n_alive if self._n_alive else 1.0
+            scores = np.zeros(n, dtype=np.float32)
+            for bucket, q_count in zip(buckets.tolist(), q_counts.tolist()):
+                postings = self._postings_for(bucket)
+                if postings is None:
+                    continue
+                rows, tfs = postings
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._row_len[rows] / avg_len)
+                scores[rows] += (self._idf(bucket) * q_count) * tfs * (BM25_K1 + 1) / (tfs + norm)
+
+            scores[~self._scope_mask(user_id)] = 0
+            hits = np.flatnonzero(scores > 0)
+            if hits.size > limit:
+                hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+            hits = hits[np.argsort(-scores[hits], kind='stable')]
+            return [(int(self._row_pid[r]), float(scores[r])) for r in hits]
+
+    def _embed(self, buckets: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        vec = np.zeros(EMBEDDING_DIM, dtype=np.float32)
+        if buckets.size:
+            idf = np.fromiter((self._idf(b) for b in buckets.tolist()), dtype=np.float32,
+                              count=buckets.size)
+            signs = 1 - 2 * ((buckets // EMBEDDING_DIM) & 1)
+            np.add.at(vec, buckets % EMBEDDING_DIM, signs * counts * idf)
+            norm = np.linalg.norm(vec)
+            if norm > 0:
+                vec /= norm
+        return vec
+
+    def embedding_for(self, project_id: int) -> Optional[List[float]]:
+        """Unit-length hashed TF-IDF vector of an indexed project, or None."""
+        with self._lock:
+            self._sync()
+            row = self._pid_row.get(project_id)
+            if row is None:
+                return None
+            return self._embed(*self._row_terms[row]).tolist()
+
+    def embed_query(self, query: str = '', skills: Optional[Sequence[str]] = None) -> Optional[List[float]]:
+        """Same embedding space as embedding_for, for free text and/or skills."""
+        buckets, counts = hash_terms(query_terms(query, skills))
+        if not buckets.size:
+            return None
+        with self._lock:
+            self._sync()
+            return self._embed(buckets, counts).tolist()
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._sync()
+            return self._n_alive
+
+
+_indexes: Dict[int, ProjectSearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def search_index_for(manager, path: Optional[str] = INDEX_PATH) -> ProjectSearchIndex:
+    """The search index kept for a DatabaseManager (created on first use)."""
+    with _indexes_lock:
+        index = _indexes.get(id(manager))
+        if index is None or index.manager is not manager:
+            index = _indexes[id(manager)] = ProjectSearchIndex(manager, path=path)
+        return index
@@ -1,52 +1,47 @@
-from collections import defaultdict
 from typing import Optional
 from src.Databases.database import db_manager
+from src.Services.analytics_snapshot import snapshot_for
 
 
 def _display_name(project) -> str:
     return project.custom_description or project.name or f"Project {project.id}"
 
 
-def get_skills(user_id: Optional[int] = None):
-    projects = db_manager.get_all_projects(user_id=user_id)
+def _build_skills(aggregate):
+    skills = []
+    for skill in aggregate.ordered_skills():
+        projects = [aggregate.projects[pid] for pid in sorted(aggregate.skill_projects[skill])]
+        skills.append({
+            "name": skill,
+            "count": len(projects),
+            "projects": [
+                {
+                    "project_id": project.id,
+                    "project_name": _display_name(project),
+                    "project_type": project.project_type,
+                }
+                for project in projects
+            ],
+        })
+    return {"skills": skills}
 
-    skill_map = defaultdict(lambda: {"count": 0, "projects": []})
 
-    for project in projects:
-        if not project.skills:
-            continue
-        for skill in project.skills:
-            skill_map[skill]["count"] += 1
-            skill_map[skill]["projects"].append({
-                "project_id": project.id,
-                "project_name": _display_name(project),
-                "project_type": project.project_type,
-            })
-
-    return {
-        "skills": [
-            {"name": skill, "count": data["count"], "projects": data["projects"]}
-            for skill, data in sorted(
-                skill_map.items(), key=lambda x: x[1]["count"], reverse=True
-            )
-        ]
-    }
+def get_skills(user_id: Optional[int] = None):
+    return snapshot_for(db_manager).render(user_id, "skills", _build_skills)
 
 
 def get_skill_detail(skill_name: str, user_id: Optional[int] = None):
-    projects = db_manager.get_all_projects(user_id=user_id)
+    aggregate = snapshot_for(db_manager).aggregate(user_id)
 
     matching_projects = []
-    for project in projects:
-        if not project.skills:
-            continue
-        if skill_name in project.skills:
-            matching_projects.append({
-                "project_id": project.id,
-                "project_name": _display_name(project),
-                "project_type": project.project_type,
-                "file_count": project.file_count,
-            })
+    for project_id in sorted(aggregate.skill_projects.get(skill_name, ())):
+        project = aggregate.projects[project_id]
+        matching_projects.append({
+            "project_id": project.id,
+            "project_name": _display_name(project),
+            "project_type": project.project_type,
+            "file_count": project.file_count,
+        })
 
     return {
         "skill": skill_name,
@@ -55,30 +50,16 @@ def get_skill_detail(skill_name: str, user_id: Optional[int] = None):
     }
 
 
-def get_skills_timeline(user_id: Optional[int] = None):
-    """
-    Returns skills with date ranges derived from project activity,
-    showing when each skill was first and last used across all projects.
-    """
-    projects = db_manager.get_all_projects(user_id=user_id)
-
-    skill_map = defaultdict(lambda: {
-        "first_seen": None,
-        "last_seen": None,
-        "project_count": 0,
-        "projects": [],
-    })
-
-    for project in projects:
-        if not project.skills:
-            continue
-
-        first_date, last_date, duration_days = db_manager.get_project_duration(project.id)
-
-        for skill in project.skills:
-            entry = skill_map[skill]
-            entry["project_count"] += 1
-            entry["projects"].append({
+def _build_timeline(aggregate):
+    snapshot = snapshot_for(db_manager)
+    timeline = []
+    for skill in aggregate.ordered_skills():
+        first_seen = last_seen = None
+        projects = []
+        for project_id in sorted(aggregate.skill_projects[skill]):
+            project = aggregate.projects[project_id]
+            first_date, last_date, duration_days = snapshot.project_duration(project)
+            projects.append({
                 "project_id": project.id,
                 "project_name": _display_name(project),
                 "project_type": project.project_type,
@@ -87,22 +68,26 @@ def get_skills_timeline(user_id: Optional[int] = None):
                 "duration_days": duration_days,
             })
 
-            if first_date:
-                if entry["first_seen"] is None or first_date < entry["first_seen"]:
-                    entry["first_seen"] = first_date
-            if last_date:
-                if entry["last_seen"] is None or last_date > entry["last_seen"]:
-                    entry["last_seen"] = last_date
+            if first_date and (first_seen is None or first_date < first_seen):
+                first_seen = first_date
+            if last_date and (last_seen is None or last_date > last_seen):
+                last_seen = last_date
 
-    timeline = []
-    for skill, data in skill_map.items():
         timeline.append({
             "name": skill,
-            "first_seen": data["first_seen"].isoformat() if data["first_seen"] else None,
-            "last_seen": data["last_seen"].isoformat() if data["last_seen"] else None,
-            "project_count": data["project_count"],
-            "projects": data["projects"],
+            "first_seen": first_seen.isoformat() if first_seen else None,
+            "last_seen": last_seen.isoformat() if last_seen else None,
+            "project_count": len(projects),
+            "projects": projects,
         })
 
     timeline.sort(key=lambda x: (x["first_seen"] or ""))
-    return {"skills": timeline}
\ No newline at end of file
+    return {"skills": timeline}
+
+
+def get_skills_timeline(user_id: Optional[int] = None):
+    """
+    Returns skills with date ranges derived from project activity,
+    showing when each skill was first and last used across all projects.
+    """
+    return snapshot_for(db_manager).render(user_id, "timeline", _build_timeline)
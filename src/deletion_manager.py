@@ -9,35 +9,60 @@ from src.Databases.database import db_manager
 class DeletionManager:
     """Core deletion logic: remove insights, remove project, protect shared files."""
 
-    def get_shared_files(self, project_id: int):
+    def get_shared_files_map(self, project_ids, key: str = "file_path"):
         """
-        Return a list of file paths used by more than one project.
-        Uses file_path comparison across projects.
+        Return {project_id: [shared values]} for every project in project_ids,
+        where a value is shared if more than one project has a file with it.
+
+        One grouped query (GROUP BY key HAVING COUNT(DISTINCT project_id) > 1),
+        served by the (file_path, project_id) / (file_hash, project_id) indexes.
+
+        Args:
+            project_ids: Projects to report on
+            key: 'file_path' or 'file_hash'
         """
+        project_ids = list(project_ids)
+        if not project_ids:
+            return {}
+        if key not in ("file_path", "file_hash"):
+            raise ValueError(f"Unsupported shared-file key: {key}")
+
         session = db_manager.get_session()
         try:
             from src.Databases.database import File
-            from sqlalchemy import func
-            
-            # Get all files for this project
-            project_files = session.query(File).filter(
-                File.project_id == project_id
-            ).all()
-            
-            shared = []
-            for file in project_files:
-                # Count how many projects use this file path
-                count = session.query(File).filter(
-                    File.file_path == file.file_path
-                ).count()
-                
-                if count > 1:
-                    shared.append(file.file_path)
-            
+            from sqlalchemy import func, select
+
+            column = getattr(File, key)
+            # Only group values that appear in the requested projects
+            candidates = select(column).where(
+                File.project_id.in_(project_ids), column.isnot(None)
+            )
+            shared_values = session.query(column).filter(
+                column.in_(candidates)
+            ).group_by(column).having(
+                func.count(func.distinct(File.project_id)) > 1
+            ).subquery()
+
+            rows = session.query(File.project_id, column).join(
+                shared_values, column == shared_values.c[key]
+            ).filter(
+                File.project_id.in_(project_ids)
+            ).distinct().order_by(File.project_id, column).all()
+
+            shared = {}
+            for project_id, value in rows:
+                shared.setdefault(project_id, []).append(value)
             return shared
         finally:
             session.close()
 
+    def get_shared_files(self, project_id: int):
+        """
+        Return a list of file paths used by more than one project.
+        Uses file_path comparison across projects.
+        """
+        return self.get_shared_files_map([project_id]).get(project_id, [])
+
     def _delete_cache_for_project(self, project_id: int):
         """
         Delete cached analysis results for a project.
@@ -11,19 +11,13 @@ import re
 import math
 from datetime import datetime, timezone
 
-# Filter out Git error messages globally
-_original_print = print
-def print(*args, **kwargs):
-    message = ' '.join(str(arg) for arg in args)
-    if 'Git' not in message and 'git' not in message:
-        _original_print(*args, **kwargs)
-import builtins
-builtins.print = print
-
-
-
 # Add parent directory to path so we can import from src
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Scanner/DB progress goes through logging (LOG_LEVEL, LOG_FORMAT); Git
+# command errors are logged at DEBUG, so they stay out of the menus
+from src.Helpers.logConfig import configure_logging
+configure_logging()
 from src.Databases.user_config import ConfigManager
 
 from src.Helpers.installDependencies import install_requirements
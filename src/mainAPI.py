@@ -1,13 +1,38 @@
-from fastapi import FastAPI 
+from contextlib import asynccontextmanager
+
+from fastapi import Depends, FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from pathlib import Path
+
+# Timestamped, leveled logs for the "src" loggers (LOG_LEVEL, LOG_FORMAT=json)
+from src.Helpers.logConfig import configure_logging, SERVER_FORMAT
+configure_logging(fmt=SERVER_FORMAT)
+
 from src.Routers import projects, resumes, portfolio, skills, analytics, consent, auth, configuration, evidence, education, work_history, contributors
 from src.Routers import interview_router
 from src.Routers import user_profile
 from src.Routers import public_portfolios
+from src.Routers import media
+from src.Routers import metrics as metrics_router
+from src.Databases.request_scope import RequestScopeMiddleware, flush_request_writes
+from src.Services.metrics import MetricsMiddleware
+from src.Services.media_service import shutdown_pool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Stop the thumbnail derivative worker processes
+    shutdown_pool()
 
-app = FastAPI(title="Digital Artifact Mining API")
+
+# Buffered project writes are committed when each endpoint returns
+app = FastAPI(
+    title="Digital Artifact Mining API",
+    lifespan=lifespan,
+    dependencies=[Depends(flush_request_writes, scope="function")],
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,8 +40,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-DB-Query-Count"],
 )
 
+# Per-route latency and DB usage for /metrics; added first so it runs
+# inside the request scope and can read the scope's query counters
+app.add_middleware(MetricsMiddleware)
+
+# Per-request identity map, buffered project writes and query counter
+app.add_middleware(RequestScopeMiddleware)
+
 # Serve uploaded thumbnails as static files
 UPLOAD_DIR = Path("evidence/uploads")
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
@@ -36,4 +69,6 @@ app.include_router(evidence.router)
 app.include_router(interview_router.router)
 app.include_router(user_profile.router)
 app.include_router(contributors.router)
-app.include_router(public_portfolios.router)
\ No newline at end of file
+app.include_router(public_portfolios.router)
+app.include_router(media.router)
+app.include_router(metrics_router.router)
\ No newline at end of file
@@ -10,9 +10,11 @@ Tests for:
 - Database integration
 """
 
+import io
 import sys
 import os
 import unittest
+from contextlib import redirect_stdout
 from unittest.mock import Mock, patch, MagicMock
 from pathlib import Path
 
@@ -126,6 +128,26 @@ class TestAIProjectAnalyzer(unittest.TestCase):
         self.assertEqual(skills[2]['evidence'], 'Moderate')
         self.assertIn('evidence', skills[0])
 
+    @patch('src.AI.ai_project_analyzer.get_ai_service')
+    @patch('src.AI.ai_project_analyzer.db_manager')
+    def test_complete_analysis_logs_instead_of_printing(self, mock_db, mock_get_ai_service):
+        """Progress goes to the module logger, nothing to stdout"""
+        from src.AI.ai_project_analyzer import AIProjectAnalyzer
+
+        mock_db.get_project.return_value = self.mock_project
+        mock_ai = Mock()
+        mock_ai.generate_text.return_value = "API Design (Strong): REST endpoints"
+        mock_get_ai_service.return_value = mock_ai
+
+        analyzer = AIProjectAnalyzer()
+        with redirect_stdout(io.StringIO()) as out, \
+                self.assertLogs('src.AI.ai_project_analyzer', level='DEBUG') as logs:
+            results = analyzer.analyze_project_complete(1)
+
+        self.assertNotIn('error', results)
+        self.assertEqual(out.getvalue(), "")
+        self.assertTrue(any("Running complete AI analysis" in line for line in logs.output))
+
 class TestAIEnhancedSummarizer(unittest.TestCase):
     """Test the enhanced summarizer integration"""
     
@@ -208,4 +208,45 @@ def test_analytics_skills_no_cross_user_leakage():
     response = client.get("/analytics/skills", headers=headers_a)
     data = response.json()
     skill_names = [s["skill"] for s in data["raw"]["skills"]]
-    assert "UniqueSkillB" not in skill_names
\ No newline at end of file
+    assert "UniqueSkillB" not in skill_names
+
+# ── POST /analytics/snapshot/verify ────────────────────────────────────────────
+
+def test_snapshot_verify_requires_auth():
+    response = client.post("/analytics/snapshot/verify")
+    assert response.status_code == 401
+
+
+def test_snapshot_verify_checks_only_own_bucket():
+    user, headers = _create_user()
+    other, _ = _create_user("analytics_other@example.com")
+    _create_project(user.id, "Mine", ["Python"])
+    _create_project(other.id, "Theirs", ["Go"])
+    client.get("/analytics/skills", headers=headers)
+
+    response = client.post("/analytics/snapshot/verify", headers=headers)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["consistent"] is True
+    assert data["buckets_checked"] == 1
+    assert "stale_user_ids" not in data
+
+
+def test_snapshot_verify_checks_bucket_before_first_read():
+    user, headers = _create_user("analytics_cold@example.com")
+    _create_project(user.id, "Cold", ["Rust"])
+
+    data = client.post("/analytics/snapshot/verify", headers=headers).json()
+    assert data["consistent"] is True
+    assert data["buckets_checked"] == 1
+
+
+def test_skill_analytics_response_is_not_shared():
+    user, headers = _create_user("analytics_copy@example.com")
+    _create_project(user.id, "Copy", ["Elixir"])
+
+    from src.Services.analytics_service import get_raw_skills_with_projects
+    get_raw_skills_with_projects(user_id=user.id)[0]["projects"].clear()
+
+    skills = client.get("/analytics/skills", headers=headers).json()["raw"]["skills"]
+    assert [p["project_name"] for p in skills[0]["projects"]] == ["Copy"]
@@ -1,4 +1,5 @@
 import io
+import json
 import os
 import sys
 import zipfile
@@ -101,6 +102,81 @@ def test_list_projects():
     assert isinstance(response.json(), list)
 
 
+# Test: cursor pagination walks every project exactly once
+
+def test_list_projects_cursor_pagination():
+    from datetime import datetime, timedelta
+    user, headers = _create_user_and_headers("paging@example.com")
+    base = datetime(2024, 1, 1)
+    for i in range(5):
+        db_manager.create_project({
+            "name": f"Paged {i}",
+            "file_path": f"/tmp/paged-{i}",
+            "project_type": "code",
+            "user_id": user.id,
+            # Two projects share a timestamp to exercise the id tie-break
+            "date_modified": base + timedelta(days=min(i, 3)),
+        })
+
+    seen, cursor = [], None
+    for _ in range(5):
+        url = "/projects?view=card&limit=2" + (f"&cursor={cursor}" if cursor else "")
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        seen.extend(p["name"] for p in response.json())
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+
+    assert sorted(seen) == [f"Paged {i}" for i in range(5)]
+    assert len(seen) == 5
+    assert seen[0] in ("Paged 3", "Paged 4")
+
+
+def test_list_projects_card_view_and_fields():
+    user, headers = _create_user_and_headers("cards@example.com")
+    db_manager.create_project({
+        "name": "Card Project",
+        "file_path": "/tmp/card-project",
+        "project_type": "code",
+        "user_id": user.id,
+        "languages": ["Python"],
+        "ai_analysis": json.dumps({"summary": "x" * 1000}),
+    })
+
+    card = client.get("/projects?view=card", headers=headers).json()[0]
+    assert card["languages"] == ["Python"]
+    assert card["display_name"] == "Card Project"
+    assert "ai_analysis" not in card
+
+    trimmed = client.get("/projects?fields=name,project_type", headers=headers).json()[0]
+    assert set(trimmed) == {"id", "name", "project_type"}
+
+
+def test_list_projects_rejects_bad_cursor_and_view():
+    assert client.get("/projects?limit=2&cursor=not-a-cursor").status_code == 400
+    assert client.get("/projects?view=everything").status_code == 400
+
+
+def test_get_project_counts_related_rows():
+    user, headers = _create_user_and_headers("counts@example.com")
+    project = db_manager.create_project({
+        "name": "Counted",
+        "file_path": "/tmp/counted-project",
+        "project_type": "code",
+        "user_id": user.id,
+    })
+    for name in ("alice", "bob"):
+        db_manager.add_contributor_to_project({"project_id": project.id, "name": name})
+    db_manager.add_keyword({"project_id": project.id, "keyword": "api", "score": 0.5})
+
+    data = client.get(f"/projects/{project.id}", headers=headers).json()
+
+    assert data["contributor_count"] == 2
+    assert data["keyword_count"] == 1
+    assert data["file_count_actual"] == 0
+
+
 # Test: get non-existent project
 
 def test_get_project_not_found():
@@ -153,6 +229,59 @@ def test_upload_multi_zip_endpoint(monkeypatch, tmp_path):
     pass
 
 
+# Test: multi-root ZIP upload streams one NDJSON line per project
+
+def test_upload_multi_root_streams_each_project(tmp_path):
+    zip_path = tmp_path / "multi.zip"
+    with zipfile.ZipFile(zip_path, "w") as zipf:
+        zipf.writestr("api/main.py", "def handler():\n    return 'ok'\n")
+        zipf.writestr("api/utils.py", "def helper():\n    pass\n")
+        zipf.writestr("cli/run.py", "print('hello')\n")
+
+    with open(zip_path, "rb") as f:
+        response = client.post(
+            "/projects/upload?multi_root=true",
+            files={"file": ("multi.zip", f, "application/zip")}
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+
+    lines = [json.loads(line) for line in response.text.splitlines() if line]
+    assert sorted(line["project_name"] for line in lines) == ["api", "cli"]
+    for line in lines:
+        assert line["status"] in ("created", "skipped")
+        assert line["project_type"] == "code"
+    assert {line["project_name"]: line["file_count"] for line in lines} == {"api": 2, "cli": 1}
+
+
+def test_upload_multi_root_twice_reports_existing_projects(tmp_path):
+    zip_path = tmp_path / "multi_again.zip"
+    with zipfile.ZipFile(zip_path, "w") as zipf:
+        zipf.writestr("web/app.py", "def index():\n    return 'home'\n")
+        zipf.writestr("jobs/worker.py", "def work():\n    return 1\n")
+
+    def upload():
+        with open(zip_path, "rb") as f:
+            response = client.post(
+                "/projects/upload?multi_root=true",
+                files={"file": ("multi_again.zip", f, "application/zip")}
+            )
+        assert response.status_code == 200
+        return {line["project_name"]: line for line in map(json.loads, response.text.splitlines()) if line}
+
+    first = upload()
+    second = upload()
+
+    assert {name: line["status"] for name, line in second.items()} == {"web": "exists", "jobs": "exists"}
+    for name, line in first.items():
+        assert line["status"] == "created"
+        assert second[name]["project_id"] == line["project_id"]
+        assert second[name]["project_type"] == line["project_type"] == "code"
+        assert second[name]["file_count"] == line["file_count"] == 1
+        assert db_manager.get_project(line["project_id"]).custom_description == name
+
+
 @pytest.mark.skip(reason="POST /projects/{id}/upload/files endpoint does not exist; use /projects/{id}/upload with a ZIP")
 def test_add_files_to_existing_project(tmp_path):
     pass
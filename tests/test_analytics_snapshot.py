@@ -0,0 +1,137 @@
+"""
+Tests for the incrementally maintained skill analytics snapshot.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Databases.database import DatabaseManager
+from src.Services.analytics_snapshot import AnalyticsSnapshot
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(db_path=str(tmp_path / "analytics.db"))
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def snapshot(db):
+    return AnalyticsSnapshot(db)
+
+
+def _project(db, name, skills, **extra):
+    return db.create_project({"name": name, "file_path": f"/tmp/{name}", "skills": skills, **extra})
+
+
+def _counts(aggregate):
+    return {skill: len(ids) for skill, ids in aggregate.skill_projects.items()}
+
+
+def test_initial_build_counts_skills_and_pairs(db, snapshot):
+    _project(db, "a", ["Python", "FastAPI", "SQL"])
+    _project(db, "b", ["Python", "FastAPI"])
+
+    aggregate = snapshot.aggregate()
+
+    assert _counts(aggregate) == {"Python": 2, "FastAPI": 2, "SQL": 1}
+    assert len(aggregate.pair_projects[("FastAPI", "Python")]) == 2
+    assert aggregate.ordered_skills()[-1] == "SQL"
+
+
+def test_changes_are_applied_by_delta(db, snapshot, monkeypatch):
+    a = _project(db, "a", ["Python", "FastAPI"])
+    snapshot.aggregate()
+
+    # Later reads must not rescan every project
+    monkeypatch.setattr(db, "get_all_projects", lambda **kw: pytest.fail("full rebuild"))
+
+    b = _project(db, "b", ["Python", "React"])
+    db.update_project(a.id, {"skills": ["Python"]})
+    aggregate = snapshot.aggregate()
+    assert _counts(aggregate) == {"Python": 2, "React": 1}
+    assert list(aggregate.pair_projects) == [("Python", "React")]
+
+    db.update_project(b.id, {"is_hidden": True})
+    assert _counts(snapshot.aggregate()) == {"Python": 1}
+
+    db.delete_project(a.id)
+    assert snapshot.aggregate().skill_projects == {}
+
+
+def test_rendered_results_are_reused_until_a_change(db, snapshot):
+    project = _project(db, "a", ["Python", "Go"])
+    builds = []
+
+    def build(agg):
+        builds.append(1)
+        return sorted(agg.skill_projects)
+
+    first = snapshot.render(None, "names", build)
+    assert snapshot.render(None, "names", build) == first
+    assert len(builds) == 1
+
+    db.update_project(project.id, {"skills": ["Rust"]})
+    assert snapshot.render(None, "names", build) == ["Rust"]
+    assert len(builds) == 2
+
+
+def test_rendered_results_are_copies(db, snapshot):
+    project = _project(db, "a", ["Python"])
+    build = lambda agg: [{"skill": s, "projects": sorted(ids)} for s, ids in agg.skill_projects.items()]
+
+    first = snapshot.render(None, "skills", build)
+    first[0]["projects"].append(999)
+    first.append({"skill": "Injected"})
+
+    assert snapshot.render(None, "skills", build) == [{"skill": "Python", "projects": [project.id]}]
+
+
+def test_user_buckets_only_see_their_projects(db, snapshot):
+    user = db.create_user({"first_name": "A", "last_name": "B", "email": "snap@example.com", "password_hash": "x"})
+    _project(db, "mine", ["Django"], user_id=user.id)
+    _project(db, "guest", ["Vue"])
+
+    assert _counts(snapshot.aggregate(user.id)) == {"Django": 1}
+    _project(db, "mine2", ["Django", "Celery"], user_id=user.id)
+    assert _counts(snapshot.aggregate(user.id)) == {"Django": 2, "Celery": 1}
+    assert _counts(snapshot.aggregate()) == {"Django": 2, "Celery": 1, "Vue": 1}
+
+
+def test_bulk_delete_invalidates(db, snapshot):
+    _project(db, "a", ["Python"])
+    assert snapshot.aggregate().skill_projects
+
+    db.clear_all_data()
+    assert snapshot.aggregate().skill_projects == {}
+
+
+def test_consistency_check_repairs_out_of_band_writes(db, snapshot, tmp_path):
+    project = _project(db, "a", ["Python"])
+    snapshot.aggregate()
+    assert snapshot.check_consistency()["consistent"] is True
+
+    # A second manager on the same file is invisible to this snapshot
+    other = DatabaseManager(db_path=str(tmp_path / "analytics.db"))
+    other.update_project(project.id, {"skills": ["Haskell"]})
+    other.close()
+    assert _counts(snapshot.aggregate()) == {"Python": 1}
+
+    result = snapshot.check_consistency()
+    assert result["consistent"] is False and result["rebuilt"] is True
+    assert _counts(snapshot.aggregate()) == {"Haskell": 1}
+
+
+def test_consistency_check_loads_requested_buckets(db, snapshot):
+    _project(db, "a", ["Python"])
+
+    result = snapshot.check_consistency(user_ids=[None])
+
+    assert result["consistent"] is True
+    assert result["buckets_checked"] == 1
+    assert _counts(snapshot.aggregate()) == {"Python": 1}
@@ -0,0 +1,133 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from jose import jwt
+
+from src.Databases.database import DatabaseManager, User
+from src.Services import auth_service
+
+
+def make_token(user_id, expires_in=timedelta(minutes=5)):
+    payload = {"sub": str(user_id), "exp": datetime.utcnow() + expires_in}
+    return jwt.encode(payload, auth_service.SECRET_KEY, algorithm=auth_service.ALGORITHM)
+
+
+class TestTokenCache(unittest.TestCase):
+
+    def setUp(self):
+        auth_service.clear_token_cache()
+
+    def tearDown(self):
+        auth_service.clear_token_cache()
+
+    def test_valid_token_is_decoded_once(self):
+        token = auth_service.create_access_token(42)
+        with patch.object(auth_service.jwt, "decode", wraps=jwt.decode) as decode:
+            self.assertEqual(auth_service.decode_user_id(token), 42)
+            self.assertEqual(auth_service.decode_user_id(token), 42)
+        self.assertEqual(decode.call_count, 1)
+
+    def test_invalid_tokens_are_not_cached(self):
+        self.assertIsNone(auth_service.decode_user_id("not-a-token"))
+        forged = jwt.encode({"sub": "1", "exp": datetime.utcnow() + timedelta(minutes=5)},
+                            "wrong-key", algorithm=auth_service.ALGORITHM)
+        self.assertIsNone(auth_service.decode_user_id(forged))
+        self.assertIsNone(auth_service.decode_user_id(make_token(1, timedelta(seconds=-5))))
+        self.assertEqual(len(auth_service._token_cache), 0)
+
+    def test_cached_token_expires(self):
+        token = make_token(7, timedelta(seconds=30))
+        self.assertEqual(auth_service.decode_user_id(token), 7)
+        later = auth_service.time.time() + 60
+        with patch.object(auth_service.time, "time", return_value=later):
+            self.assertIsNone(auth_service.decode_user_id(token))
+        self.assertNotIn(token, auth_service._token_cache)
+
+    def test_eviction_drops_expired_then_least_recent(self):
+        with patch.object(auth_service, "TOKEN_CACHE_SIZE", 3):
+            short = make_token(1, timedelta(seconds=30))
+            first, second = make_token(2), make_token(3)
+            for token in (short, first, second):
+                auth_service.decode_user_id(token)
+            later = auth_service.time.time() + 60
+            with patch.object(auth_service.time, "time", return_value=later):
+                auth_service.decode_user_id(make_token(4))
+            self.assertNotIn(short, auth_service._token_cache)
+            self.assertIn(first, auth_service._token_cache)
+
+            auth_service.decode_user_id(first)  # first is now the most recent
+            auth_service.decode_user_id(make_token(5))
+            self.assertNotIn(second, auth_service._token_cache)
+            self.assertIn(first, auth_service._token_cache)
+            self.assertEqual(len(auth_service._token_cache), 3)
+
+
+class TestUserSummaryCache(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.test_dir, 'test.db'))
+        self.user = self.db.create_user({
+            'first_name': 'Jane', 'last_name': 'Doe',
+            'email': 'summary@example.com', 'password_hash': 'hash',
+        })
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _count_queries(self):
+        queries = []
+        from sqlalchemy import event
+        listener = lambda *args: queries.append(args[2])
+        event.listen(self.db.engine, "before_cursor_execute", listener)
+        self.addCleanup(event.remove, self.db.engine, "before_cursor_execute", listener)
+        return queries
+
+    def test_summary_is_cached(self):
+        queries = self._count_queries()
+        summary = self.db.get_user_summary(self.user.id)
+        self.assertEqual((summary.first_name, summary.email), ('Jane', 'summary@example.com'))
+        self.assertFalse(summary.portfolio_public)
+        self.assertIs(self.db.get_user_summary(self.user.id), summary)
+        self.assertEqual(len(queries), 1)
+
+    def test_missing_user_is_not_cached(self):
+        self.assertIsNone(self.db.get_user_summary(99999))
+        self.assertNotIn(99999, self.db._user_summaries)
+
+    def test_update_user_invalidates(self):
+        self.db.get_user_summary(self.user.id)
+        self.db.update_user(self.user.id, {'first_name': 'Janet', 'portfolio_public': True})
+        summary = self.db.get_user_summary(self.user.id)
+        self.assertEqual(summary.first_name, 'Janet')
+        self.assertTrue(summary.portfolio_public)
+
+    def test_session_write_and_delete_invalidate(self):
+        self.db.get_user_summary(self.user.id)
+        session = self.db.get_session()
+        try:
+            session.get(User, self.user.id).avatar = 'data:image/png;base64,AAAA'
+            session.commit()
+        finally:
+            session.close()
+        self.assertEqual(self.db.get_user_summary(self.user.id).avatar, 'data:image/png;base64,AAAA')
+
+        self.db.delete_user(self.user.id)
+        self.assertIsNone(self.db.get_user_summary(self.user.id))
+
+    def test_bulk_delete_clears_cache(self):
+        self.db.get_user_summary(self.user.id)
+        self.db.clear_all_data()
+        self.assertIsNone(self.db.get_user_summary(self.user.id))
+
+
+if __name__ == "__main__":
+    unittest.main()
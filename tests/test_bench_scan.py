@@ -0,0 +1,72 @@
+import hashlib
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import scan_corpus
+from benchmarks.bench_scan import find_regressions
+
+
+def _digest(root):
+    digest = hashlib.sha256()
+    for path in sorted(Path(root).rglob('*')):
+        if path.is_file():
+            digest.update(str(path.relative_to(root)).encode())
+            digest.update(path.read_bytes())
+            digest.update(str(path.stat().st_mtime).encode())
+    return digest.hexdigest()
+
+
+class TestScanCorpus(unittest.TestCase):
+
+    def test_generators_are_deterministic(self):
+        digests = []
+        for _ in range(2):
+            with tempfile.TemporaryDirectory() as root:
+                code = scan_corpus.generate_code_repo(os.path.join(root, 'code'), files=12, seed=3)
+                scan_corpus.generate_media_set(os.path.join(root, 'media'), images=3, size=(64, 48), seed=3)
+                digests.append(_digest(root))
+        self.assertEqual(digests[0], digests[1])
+        self.assertEqual(code['files'], 12 + 3)  # sources plus manifests
+
+    def test_images_carry_exif(self):
+        from PIL import Image
+        with tempfile.TemporaryDirectory() as root:
+            scan_corpus.generate_media_set(root, images=2, size=(64, 48))
+            jpeg = next(Path(root).rglob('*.jpg'))
+            with Image.open(jpeg) as image:
+                exif = image.getexif()
+            self.assertIn(exif[0x010F], [make for make, _ in scan_corpus.CAMERAS])
+            self.assertTrue(exif[0x0132].startswith('2024:'))
+
+
+class TestRegressionGate(unittest.TestCase):
+
+    def _run(self, files_per_sec, queries=100, regressions=()):
+        return {'machine': 'm', 'scale': 'small', 'seed': 0, 'regressions': list(regressions),
+                'results': {'code': {'files_per_sec': files_per_sec, 'peak_rss_mb': 100.0, 'db_queries': queries}}}
+
+    def test_slower_run_beyond_threshold_is_reported(self):
+        history = [self._run(100), self._run(110), self._run(90)]
+        current = {'code': {'files_per_sec': 70, 'peak_rss_mb': 100.0, 'db_queries': 100}}
+        regressions = find_regressions(current, history, 'm', 'small', 0, baseline_runs=5, threshold=0.2)
+        self.assertEqual(regressions, [('code', 'files_per_sec', 100, 70)])
+
+    def test_within_threshold_and_other_machines_pass(self):
+        history = [self._run(100), self._run(1000, regressions=['code.files_per_sec'])]
+        history.append(dict(self._run(500), machine='other'))
+        current = {'code': {'files_per_sec': 85, 'peak_rss_mb': 110.0, 'db_queries': 100}}
+        self.assertEqual(find_regressions(current, history, 'm', 'small', 0, 5, 0.2), [])
+
+    def test_more_queries_is_a_regression(self):
+        current = {'code': {'files_per_sec': 100, 'peak_rss_mb': 100.0, 'db_queries': 200}}
+        regressions = find_regressions(current, [self._run(100)], 'm', 'small', 0, 5, 0.2)
+        self.assertEqual([(case, metric) for case, metric, _, _ in regressions], [('code', 'db_queries')])
+
+
+if __name__ == '__main__':
+    unittest.main()
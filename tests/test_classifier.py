@@ -0,0 +1,77 @@
+"""
+Tests for the sampling file-type classifier.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Helpers import classifier
+from src.Helpers.classifier import classify_file, sample_project_types, sniff_head
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(data, bytes):
+        path.write_bytes(data)
+    else:
+        path.write_text(data)
+    return str(path)
+
+
+def test_known_extension_is_not_opened(tmp_path, monkeypatch):
+    path = _write(tmp_path / "main.py", "print('hi')")
+    monkeypatch.setattr(classifier, "sniff_head", lambda *a, **k: (_ for _ in ()).throw(AssertionError("read")))
+    assert classify_file(path) == "code"
+
+
+def test_sniff_head_magic_bytes_and_text(tmp_path):
+    assert sniff_head(_write(tmp_path / "image", b"\x89PNG\r\n\x1a\n" + b"\x00" * 32)) == "media"
+    assert sniff_head(_write(tmp_path / "clip", b"\x00\x00\x00\x18ftypmp42")) == "media"
+    assert sniff_head(_write(tmp_path / "Component.jsx", "import React from 'react'\n")) == "code"
+    assert sniff_head(_write(tmp_path / "LICENSE", "Permission is hereby granted, free of charge\n")) == "text"
+    assert sniff_head(_write(tmp_path / "blob", b"\x01\x02\x00\x03")) is None
+
+
+def test_sniff_head_reads_only_the_sample(tmp_path):
+    # Code marker past the sample window is never seen
+    path = _write(tmp_path / "notes", "word " * 2000 + "\ndef late():\n")
+    assert sniff_head(path, sample_bytes=1024) == "text"
+
+
+def test_small_tree_is_counted_completely(tmp_path):
+    _write(tmp_path / "src" / "a.py", "x = 1")
+    _write(tmp_path / "src" / "b.py", "y = 2")
+    _write(tmp_path / "assets" / "logo.png", b"\x89PNG\r\n\x1a\n")
+    _write(tmp_path / "node_modules" / "dep.js", "var x = 1")
+
+    result = sample_project_types(str(tmp_path))
+
+    assert result["complete"] is True
+    assert result["confidence"] == 1.0
+    assert (result["code"], result["media"], result["text"]) == (2, 1, 0)
+    assert result["file_count"] == 3
+
+
+def test_large_uniform_tree_stops_early(tmp_path):
+    for i in range(600):
+        _write(tmp_path / f"pkg{i % 10}" / f"mod{i}.py", "x = 1")
+
+    result = sample_project_types(str(tmp_path), min_files=100)
+
+    assert result["complete"] is False
+    assert result["confidence"] >= 0.99
+    assert result["file_count"] < 600
+    assert result["media"] == 0
+
+
+def test_interleaved_sample_spans_folders(tmp_path):
+    # A lopsided tree: the early sample must still see both folders
+    for i in range(300):
+        _write(tmp_path / "a_code" / f"m{i}.py", "x = 1")
+        _write(tmp_path / "b_media" / f"p{i}.png", b"\x89PNG")
+
+    result = sample_project_types(str(tmp_path), min_files=100)
+
+    assert result["code"] > 0 and result["media"] > 0
@@ -1,6 +1,10 @@
+import os
+import shutil
+import tempfile
 import unittest
 from unittest.mock import patch
 from src.Analysis import codeEfficiency as ce
+from src.Analysis import folderEfficiency as fe
 
 class TestCodeEfficiency(unittest.TestCase):
 
@@ -53,5 +57,73 @@ class TestCodeEfficiency(unittest.TestCase):
         self.assertIsNotNone(result["efficiency_score"])
         self.assertGreater(result["efficiency_score"], 80)
 
+class TestAnalysisContext(unittest.TestCase):
+
+    RECURSIVE = (
+        "def fact(n):\n"
+        "    if n <= 1:\n"
+        "        return 1\n"
+        "    def helper():\n"
+        "        return fact(n - 1)\n"
+        "    return n * fact(n - 1) + helper()\n"
+        "for i in range(3):\n"
+        "    while i:\n"
+        "        i -= 1\n"
+    )
+
+    def test_file_identified_and_parsed_once(self):
+        with patch("src.Analysis.codeEfficiency.identify_language_and_framework",
+                   return_value=("Python", [])) as mock_ident, \
+             patch("src.Analysis.codeEfficiency.ast.parse", wraps=ce.ast.parse) as mock_parse:
+            ce.grade_efficiency(self.RECURSIVE, "rec.py")
+        self.assertEqual(mock_ident.call_count, 1)
+        self.assertEqual(mock_parse.call_count, 1)
+
+    def test_single_traversal_metrics(self):
+        metrics = ce.CodeAnalysisContext(self.RECURSIVE, "rec.py").python_metrics
+        self.assertEqual(metrics, {"max_loop_depth": 2, "total_loops": 2, "recursive_calls": 2})
+
+    def test_parse_failure_reported_by_both_scorers(self):
+        context = ce.CodeAnalysisContext("def broken(:\n", "broken.py", language="Python")
+        time_result = ce.timeScore_interpreted(context.code, context.file_path, context)
+        space_result = ce.spaceScore_interpreted(context.code, context.file_path, context)
+        self.assertEqual(time_result["time_score"], 70)
+        self.assertEqual(space_result["space_score"], 70)
+        self.assertTrue(time_result["notes"][0].startswith("AST parse failed"))
+
+    def test_language_passed_to_identifier_with_content(self):
+        result = ce.identify_language_and_framework("never_written.py", content="from flask import Flask")
+        self.assertEqual(result, ("Python", ["Flask"]))
+
+
+class TestGradeFolder(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        for i in range(fe.PARALLEL_MIN_FILES + 4):
+            depth = i % 3 + 1
+            body = "def f(x):\n" + "".join("    " * (d + 1) + "for a in x:\n" for d in range(depth))
+            body += "    " * (depth + 1) + "pass\n"
+            with open(os.path.join(self.folder, f"mod_{i}.py"), "w", encoding="utf-8") as f:
+                f.write(body)
+        with open(os.path.join(self.folder, "bad.py"), "wb") as f:
+            f.write(b"\xff\xfe not utf-8")
+
+    def tearDown(self):
+        shutil.rmtree(self.folder, ignore_errors=True)
+
+    def test_parallel_matches_serial(self):
+        serial = fe.grade_folder(self.folder, workers=1)
+        parallel = fe.grade_folder(self.folder, workers=2)
+        self.assertEqual(serial, parallel)
+        self.assertEqual(serial["num_files"], fe.PARALLEL_MIN_FILES + 5)
+        self.assertEqual(serial["max_loop_depth"], 3)
+
+    def test_unreadable_file_becomes_note(self):
+        result = fe.grade_file(os.path.join(self.folder, "bad.py"))
+        self.assertIsNone(result["time_score"])
+        self.assertTrue(result["notes"][0].startswith("Failed to read or parse file"))
+
+
 if __name__ == "__main__":
     unittest.main()
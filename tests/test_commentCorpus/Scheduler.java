@@ -0,0 +1,12 @@
+/**
+ * Job scheduler with cron expressions.
+ */
+public class Scheduler {
+    private static final String DOCS = "http://docs.example.com/cron#syntax";
+    private static final char HASH = '#';
+
+    // exponential backoff between attempts
+    public void schedule(String cron) {
+        String banner = "/* not a comment */";
+    }
+}
@@ -0,0 +1,10 @@
+// Shopping cart checkout flow
+const PAYMENT_URL = "https://payments.example.com/charge"; // payment gateway
+const note = 'Use // for comments and /* for blocks';
+
+/* Validate coupon codes
+   before applying discounts */
+function applyCoupon(cart, code) {
+  const msg = `Coupon ${code} // applied`;
+  return cart.total * 0.9; // flat ten percent discount
+}
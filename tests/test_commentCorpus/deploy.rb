@@ -0,0 +1,5 @@
+=begin
+Deployment tasks for staging servers
+=end
+SERVER = "deploy#primary" # primary release host
+puts 'Deploying # now'
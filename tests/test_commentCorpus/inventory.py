@@ -0,0 +1,12 @@
+"""Inventory service for warehouse stock levels."""
+import requests
+
+API_URL = "https://inventory.example.com/api#stock"  # remote stock endpoint
+HEADER = '# sku, quantity, location'
+
+
+def restock(item, amount):
+    '''Reorder supplier shipments when stock runs low.'''
+    # retry transient network failures
+    query = "SELECT * FROM items -- not a comment"
+    return requests.post(API_URL, json={"item": item, "amount": amount})
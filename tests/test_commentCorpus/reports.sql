@@ -0,0 +1,5 @@
+-- monthly revenue report
+SELECT region, SUM(total) AS revenue
+FROM orders
+WHERE note <> '-- manual entry' /* exclude refunds */
+GROUP BY region;
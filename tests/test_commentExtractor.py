@@ -0,0 +1,137 @@
+import sys
+import os
+import re
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Extraction.keywordEngine import KeywordEngine
+from src.Extraction.keywordExtractorCode import (
+    CODE_STOPWORDS,
+    extract_code_keywords_with_scores,
+    extract_comments,
+    iter_comments,
+    language_for_path,
+)
+
+CORPUS_DIR = os.path.join(os.path.dirname(__file__), 'test_commentCorpus')
+
+
+def legacy_extract_comments(code):
+    """The previous five-pass extractor, kept as the regression baseline."""
+    matches = []
+    for pattern, flags in ((r'//(.*?)$', re.MULTILINE), (r'/\*(.*?)\*/', re.DOTALL),
+                           (r'#(.*?)$', re.MULTILINE), (r'"""(.*?)"""', re.DOTALL),
+                           (r"'''(.*?)'''", re.DOTALL)):
+        for m in re.finditer(pattern, code, flags):
+            matches.append((m.start(), m.group(1).strip()))
+    matches.sort(key=lambda x: x[0])
+    return ". ".join(text for _, text in matches if text)
+
+
+def read_corpus(name):
+    with open(os.path.join(CORPUS_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+# Corpus file -> (comments the scanner must find, phrases that only come from
+# strings/URLs and must not reach RAKE)
+CORPUS = {
+    'inventory.py': (
+        ['Inventory service for warehouse stock levels.', 'remote stock endpoint',
+         'Reorder supplier shipments when stock runs low.', 'retry transient network failures'],
+        ['sku', 'quantity, location', 'stock"'],
+    ),
+    'checkout.js': (
+        ['Shopping cart checkout flow', 'payment gateway',
+         'Validate coupon codes\n   before applying discounts', 'flat ten percent discount'],
+        ['payments.example.com', 'blocks', 'applied'],
+    ),
+    'Scheduler.java': (
+        ['*\n * Job scheduler with cron expressions.', 'exponential backoff between attempts'],
+        ['docs.example.com', 'syntax', 'not a comment'],
+    ),
+    'reports.sql': (
+        ['monthly revenue report', 'exclude refunds'],
+        ['manual entry'],
+    ),
+    'deploy.rb': (
+        ['Deployment tasks for staging servers', 'primary release host'],
+        ['primary"', 'now'],
+    ),
+    'theme.css': (
+        ['dark theme palette'],
+        ['cdn.example.com', 'eeeeee', 'decorative'],
+    ),
+    'landing.html': (
+        ['hero banner section'],
+        ['pricing', 'plans', 'support'],
+    ),
+}
+
+
+class TestCommentScanner(unittest.TestCase):
+
+    def test_corpus_comments_in_source_order(self):
+        for name, (expected, _) in CORPUS.items():
+            with self.subTest(file=name):
+                code = read_corpus(name)
+                self.assertEqual(list(iter_comments(code, language_for_path(name))), expected)
+
+    def test_corpus_drops_string_and_url_noise(self):
+        for name, (expected, noise) in CORPUS.items():
+            with self.subTest(file=name):
+                comments = extract_comments(read_corpus(name), language_for_path(name))
+                legacy = legacy_extract_comments(read_corpus(name))
+                for text in noise:
+                    self.assertNotIn(text, comments)
+                # Every real comment the old extractor found is still found
+                for text in expected:
+                    if text in legacy:
+                        self.assertIn(text, comments)
+
+    def test_corpus_keywords_equal_or_better(self):
+        engine = KeywordEngine(stopwords=CODE_STOPWORDS)
+        for name in CORPUS:
+            with self.subTest(file=name):
+                path = os.path.join(CORPUS_DIR, name)
+                new_phrases = {kw for _, kw in extract_code_keywords_with_scores(path)}
+                legacy_phrases = {kw for _, kw in engine.extract(legacy_extract_comments(read_corpus(name)))}
+                expected_words = {w.lower().strip('.*') for c in CORPUS[name][0] for w in c.split()}
+                # No keyword comes from outside the file's real comments
+                for phrase in new_phrases:
+                    for word in re.findall(r'\w+', phrase):
+                        self.assertIn(word, expected_words, f"{phrase!r} is noise")
+                # Comment words the legacy output had are still covered
+                legacy_words = {w for p in legacy_phrases for w in re.findall(r'\w+', p)}
+                new_words = {w for p in new_phrases for w in re.findall(r'\w+', p)}
+                self.assertLessEqual(legacy_words & expected_words, new_words)
+
+    def test_plain_comments_match_legacy(self):
+        code = (
+            "# load the training data\n"
+            "def f():\n"
+            "    '''Compute rolling averages'''\n"
+            "// cache eviction policy\n"
+            "/* batch size tuning */\n"
+        )
+        self.assertEqual(extract_comments(code), legacy_extract_comments(code))
+
+    def test_generic_scanner_skips_urls(self):
+        code = 'see = "https://example.com/docs"  # documentation link'
+        self.assertEqual(list(iter_comments(code)), ['documentation link'])
+
+    def test_unterminated_block_runs_to_end(self):
+        self.assertEqual(list(iter_comments("int x; /* never closed", "C")), ['never closed'])
+
+    def test_language_for_path(self):
+        self.assertEqual(language_for_path('src/App.JSX'), 'JavaScript')
+        self.assertIsNone(language_for_path('notes.unknown'))
+
+    def test_rejects_non_string(self):
+        with self.assertRaises(TypeError):
+            extract_comments(b"# bytes")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ import tempfile
 import shutil
 from sqlalchemy import create_engine, inspect, text
 import sys
+from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
@@ -50,15 +51,10 @@ class TestDatabaseMigration(unittest.TestCase):
         # Now run migration
         from src.Databases.db_migration import migrate_add_file_hash
         
-        # Override db_manager to use test database
-        import src.Databases.db_migration as migration_module
-        original_db = migration_module.DatabaseManager
-        migration_module.DatabaseManager = lambda: db
-        
-        try:
+        # Override DatabaseManager to use test database
+        import src.Databases.database as database_module
+        with patch.object(database_module, 'DatabaseManager', lambda: db):
             migrate_add_file_hash()
-        finally:
-            migration_module.DatabaseManager = original_db
         
         # Verify column was added
         inspector = inspect(engine)
@@ -75,17 +71,16 @@ class TestDatabaseMigration(unittest.TestCase):
         
         db = DatabaseManager(db_path=self.test_db_path)
         
-        # Override db_manager
-        import src.Databases.db_migration as migration_module
-        original_db = migration_module.DatabaseManager
-        migration_module.DatabaseManager = lambda: db
+        # Override DatabaseManager
+        import src.Databases.database as database_module
         
         try:
-            # Run migration first time
-            migrate_add_file_hash()
-            
-            # Run migration second time (should not error)
-            migrate_add_file_hash()
+            with patch.object(database_module, 'DatabaseManager', lambda: db):
+                # Run migration first time
+                migrate_add_file_hash()
+                
+                # Run migration second time (should not error)
+                migrate_add_file_hash()
             
             # Verify column exists
             inspector = inspect(db.engine)
@@ -93,9 +88,20 @@ class TestDatabaseMigration(unittest.TestCase):
             self.assertIn('file_hash', columns)
             
         finally:
-            migration_module.DatabaseManager = original_db
             db.close()
     
+    def test_migration_failure_is_logged_and_raised(self):
+        """A failed standalone migration is logged, not swallowed"""
+        import src.Databases.database as database_module
+        import src.Databases.db_migration as migration_module
+        
+        db = MagicMock()
+        db.engine.begin.side_effect = RuntimeError("database is locked")
+        with patch.object(database_module, 'DatabaseManager', lambda: db):
+            with self.assertLogs(migration_module.logger, level='ERROR'):
+                with self.assertRaises(RuntimeError):
+                    migration_module.migrate_add_file_hash()
+    
     def test_file_hash_column_properties(self):
         """Test that file_hash column has correct properties"""
         from src.Databases.database import DatabaseManager
@@ -117,5 +123,113 @@ class TestDatabaseMigration(unittest.TestCase):
         db.close()
 
 
+class TestSchemaVersioning(unittest.TestCase):
+    """Versioned migrations run once; later starts only read the version"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.test_db_path = os.path.join(self.test_dir, 'test_versioning.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _version(self, db):
+        from src.Databases.db_migration import read_schema_version
+        with db.engine.connect() as conn:
+            return read_schema_version(conn)
+
+    def test_new_database_is_stamped_latest(self):
+        from src.Databases.database import DatabaseManager
+        from src.Databases.db_migration import LATEST_VERSION, metadata_fingerprint
+
+        db = DatabaseManager(db_path=self.test_db_path)
+        self.assertEqual(self._version(db), (LATEST_VERSION, metadata_fingerprint()))
+        self.assertIn('portfolio_public', [c['name'] for c in inspect(db.engine).get_columns('users')])
+        db.close()
+
+    def test_current_database_reads_version_only(self):
+        from sqlalchemy import event
+        from src.Databases.database import DatabaseManager
+        from src.Databases.db_migration import ensure_schema, LATEST_VERSION
+
+        db = DatabaseManager(db_path=self.test_db_path)
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            self.assertEqual(ensure_schema(db.engine), LATEST_VERSION)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith('SELECT version'))
+        db.close()
+
+    def test_unversioned_database_is_upgraded(self):
+        from src.Databases.database import DatabaseManager
+        from src.Databases.db_migration import LATEST_VERSION
+
+        db = DatabaseManager(db_path=self.test_db_path)
+        with db.engine.begin() as conn:
+            # An old database: no version table, users without newer columns
+            conn.execute(text("DROP TABLE schema_version"))
+            conn.execute(text("ALTER TABLE users DROP COLUMN avatar"))
+            conn.execute(text("ALTER TABLE work_history DROP COLUMN experience_type"))
+        db.close()
+
+        db = DatabaseManager(db_path=self.test_db_path)
+        self.assertEqual(self._version(db)[0], LATEST_VERSION)
+        self.assertIn('avatar', [c['name'] for c in inspect(db.engine).get_columns('users')])
+        self.assertIn('experience_type', [c['name'] for c in inspect(db.engine).get_columns('work_history')])
+        db.close()
+
+    def test_failed_migration_rolls_back(self):
+        from src.Databases.database import DatabaseManager
+        import src.Databases.db_migration as migration_module
+        from src.Databases.db_migration import Migration, ensure_schema, LATEST_VERSION
+
+        db = DatabaseManager(db_path=self.test_db_path)
+
+        def add_then_fail(conn):
+            conn.execute(text("ALTER TABLE users ADD COLUMN nickname TEXT"))
+            raise RuntimeError("boom")
+
+        original = migration_module.MIGRATIONS
+        migration_module.MIGRATIONS = original + [Migration(LATEST_VERSION + 1, "broken", add_then_fail)]
+        migration_module.LATEST_VERSION = LATEST_VERSION + 1
+        try:
+            with self.assertRaises(RuntimeError):
+                ensure_schema(db.engine)
+        finally:
+            migration_module.MIGRATIONS = original
+            migration_module.LATEST_VERSION = LATEST_VERSION
+
+        self.assertEqual(self._version(db)[0], LATEST_VERSION)
+        self.assertNotIn('nickname', [c['name'] for c in inspect(db.engine).get_columns('users')])
+        db.close()
+
+    def test_new_model_table_created_once(self):
+        from src.Databases.database import DatabaseManager
+        import src.Databases.db_migration as migration_module
+
+        db = DatabaseManager(db_path=self.test_db_path)
+        with db.engine.begin() as conn:
+            conn.execute(text("DROP TABLE contact_info"))
+
+        # Same fingerprint: nothing is reflected or created
+        migration_module.ensure_schema(db.engine)
+        self.assertNotIn('contact_info', inspect(db.engine).get_table_names())
+
+        # Changed model tables: create_all runs and the new fingerprint is stored
+        original = migration_module.metadata_fingerprint
+        migration_module.metadata_fingerprint = lambda: 'changed'
+        try:
+            migration_module.ensure_schema(db.engine)
+            self.assertEqual(self._version(db)[1], 'changed')
+        finally:
+            migration_module.metadata_fingerprint = original
+        self.assertIn('contact_info', inspect(db.engine).get_table_names())
+        db.close()
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -19,31 +19,37 @@ class TestDeletionManager(unittest.TestCase):
         self.manager = DeletionManager()
 
     # Test: Get shared files
-    @patch("src.deletion_manager.db_manager")
-    def test_get_shared_files(self, mock_db):
-        """Test identifying shared files"""
-        # Setup mock session
-        mock_session = MagicMock()
-        mock_db.get_session.return_value = mock_session
-        
-        # Create mock files
-        mock_file1 = Mock(file_path="/path/to/shared.py")
-        mock_file2 = Mock(file_path="/path/to/unique.py")
-        
-        # Mock query chain
-        mock_query = MagicMock()
-        mock_session.query.return_value = mock_query
-        mock_query.filter.return_value.all.return_value = [mock_file1, mock_file2]
-        
-        # Mock counts: file1 is shared (count=2), file2 is not (count=1)
-        mock_query.filter.return_value.count.side_effect = [2, 1]
-        
-        # Test
-        shared = self.manager.get_shared_files(1)
-        
-        # Verify
-        self.assertEqual(len(shared), 1)
-        self.assertIn("/path/to/shared.py", shared)
+    def test_get_shared_files(self):
+        """Test identifying shared files with one grouped query"""
+        from src.Databases.database import db_manager
+        db_manager.clear_all_data()
+        try:
+            p1 = db_manager.create_project({"name": "one", "file_path": "/tmp/shared-one"})
+            p2 = db_manager.create_project({"name": "two", "file_path": "/tmp/shared-two"})
+            p3 = db_manager.create_project({"name": "three", "file_path": "/tmp/shared-three"})
+            for project, path in [
+                (p1, "/path/to/shared.py"), (p1, "/path/to/unique.py"),
+                (p2, "/path/to/shared.py"), (p3, "/path/to/other.py"),
+                # Same path twice in one project is not "shared"
+                (p3, "/path/to/twice.py"), (p3, "/path/to/twice.py"),
+            ]:
+                db_manager.add_file_to_project({
+                    "project_id": project.id,
+                    "file_path": path,
+                    "file_name": os.path.basename(path),
+                })
+
+            shared = self.manager.get_shared_files(p1.id)
+            self.assertEqual(shared, ["/path/to/shared.py"])
+
+            shared_map = self.manager.get_shared_files_map([p1.id, p2.id, p3.id])
+            self.assertEqual(shared_map, {
+                p1.id: ["/path/to/shared.py"],
+                p2.id: ["/path/to/shared.py"],
+            })
+            self.assertEqual(self.manager.get_shared_files_map([]), {})
+        finally:
+            db_manager.clear_all_data()
 
     # Test: Delete AI insights
     @patch("src.deletion_manager.db_manager")
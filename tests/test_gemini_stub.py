@@ -0,0 +1,48 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from benchmarks import gemini_stub
+from src.AI import ai_service
+
+_MODULES = ("google", "google.generativeai", "google.generativeai.types")
+
+
+class TestGeminiStub(unittest.TestCase):
+    """The load-test stub must look like the SDK to AIService."""
+
+    def setUp(self):
+        self.saved_modules = {name: sys.modules.get(name) for name in _MODULES}
+        self.saved = (ai_service.genai, ai_service._ai_service, os.environ.get("GEMINI_API_KEY"))
+        gemini_stub.install(latency=0.0)
+
+    def tearDown(self):
+        for name, module in self.saved_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        ai_service.genai, ai_service._ai_service, key = self.saved
+        if key is None:
+            os.environ.pop("GEMINI_API_KEY", None)
+
+    def _service(self):
+        service = ai_service.AIService(enable_cache=False)
+        service._save_stats = lambda: None
+        return service
+
+    def test_ai_service_generates_through_stub(self):
+        text = self._service().generate_text("Write three resume bullets", use_cache=False)
+        self.assertIn("REST API", text)
+        self.assertEqual(gemini_stub.GenerativeModel.calls, 1)
+
+    def test_json_prompts_get_json(self):
+        import json
+        text = self._service().generate_text("Return ONLY valid JSON", use_cache=False)
+        self.assertIn("ai_description", json.loads(text))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+Tests for the shared ignore-rule engine (built-in skips, user exclusions, .gitignore).
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Helpers.ignoreRules import IgnoreMatcher, normalize_extensions, parse_gitignore
+
+
+def _touch(root, rel, content="x"):
+    path = root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def _walked(matcher):
+    return sorted(
+        os.path.relpath(entry.path, matcher.root).replace(os.sep, '/')
+        for entry in matcher.walk()
+    )
+
+
+def test_builtin_dirs_and_hidden_files_are_pruned(tmp_path):
+    _touch(tmp_path, "main.py")
+    _touch(tmp_path, "node_modules/lib/index.js")
+    _touch(tmp_path, ".git/config")
+    _touch(tmp_path, "src/__pycache__/main.cpython-312.pyc")
+    _touch(tmp_path, ".env")
+
+    assert _walked(IgnoreMatcher(str(tmp_path))) == ["main.py"]
+
+
+def test_gitignore_patterns_and_negation(tmp_path):
+    _touch(tmp_path, ".gitignore", "*.log\n!keep.log\nout/\n/docs\n")
+    _touch(tmp_path, "app.py")
+    _touch(tmp_path, "debug.log")
+    _touch(tmp_path, "keep.log")
+    _touch(tmp_path, "out/bundle.js")
+    _touch(tmp_path, "docs/index.md")
+    _touch(tmp_path, "src/docs/notes.md")
+    _touch(tmp_path, "src/out")  # a file named like a dir-only pattern
+
+    assert _walked(IgnoreMatcher(str(tmp_path))) == [
+        "app.py", "keep.log", "src/docs/notes.md", "src/out",
+    ]
+
+
+def test_nested_gitignore_is_scoped_to_its_folder(tmp_path):
+    _touch(tmp_path, "api/.gitignore", "*.tmp\n")
+    _touch(tmp_path, "api/cache.tmp")
+    _touch(tmp_path, "api/server.py")
+    _touch(tmp_path, "web/cache.tmp")
+
+    assert _walked(IgnoreMatcher(str(tmp_path))) == ["api/server.py", "web/cache.tmp"]
+
+
+def test_gitignore_can_be_disabled(tmp_path):
+    _touch(tmp_path, ".gitignore", "*.log\n")
+    _touch(tmp_path, "debug.log")
+
+    assert _walked(IgnoreMatcher(str(tmp_path), use_gitignore=False)) == ["debug.log"]
+
+
+def test_user_excluded_folders_and_file_types(tmp_path):
+    _touch(tmp_path, "keep/a.py")
+    _touch(tmp_path, "private/secret.py")
+    _touch(tmp_path, "drafts/b.py")
+    _touch(tmp_path, "keep/notes.TXT")
+
+    matcher = IgnoreMatcher(
+        str(tmp_path),
+        excluded_folders=[str(tmp_path / "private"), "drafts/"],
+        excluded_file_types=["txt"],
+    )
+
+    assert _walked(matcher) == ["keep/a.py"]
+    assert matcher.is_ignored(str(tmp_path / "private" / "secret.py"), is_dir=False) is False
+    assert matcher.is_ignored(str(tmp_path / "private"), is_dir=True) is True
+
+
+def test_extra_skip_dirs(tmp_path):
+    _touch(tmp_path, "backup/old.md")
+    _touch(tmp_path, "report.md")
+
+    assert _walked(IgnoreMatcher(str(tmp_path), extra_skip_dirs={"backup"})) == ["report.md"]
+
+
+def test_from_config_tolerates_non_list_values(tmp_path):
+    _touch(tmp_path, "a.py")
+
+    matcher = IgnoreMatcher.from_config(str(tmp_path), Mock())
+    assert _walked(matcher) == ["a.py"]
+
+    config = SimpleNamespace(excluded_folders=None, excluded_file_types=[".py"])
+    assert _walked(IgnoreMatcher.from_config(str(tmp_path), config)) == []
+
+
+def test_normalize_extensions():
+    assert normalize_extensions(["TXT", ".Md", " ", "py"]) == {".txt", ".md", ".py"}
+    assert normalize_extensions(None) == set()
+
+
+def test_parse_gitignore_skips_comments_and_blanks():
+    rules = parse_gitignore(["# comment", "", "   ", "*.pyc"])
+    assert len(rules) == 1
+    assert rules[0].matches("pkg/mod.pyc", False)
@@ -0,0 +1,91 @@
+import sys
+import os
+import threading
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Extraction import keywordEngine
+from src.Extraction.keywordEngine import KeywordEngine, english_stopwords, sentence_tokenizer
+from src.Extraction.keywordExtractorCode import (
+    extract_code_keywords_with_scores,
+    extract_code_keywords_many,
+)
+from src.Extraction.keywordExtractorText import extract_keywords_with_scores, extract_keywords_many
+
+
+class TestKeywordEngine(unittest.TestCase):
+
+    def test_extract_returns_ranked_pairs(self):
+        engine = KeywordEngine(stopwords={"the", "and", "of"})
+        results = engine.extract("Parsing of the configuration loader. The retry queue and the upload worker.")
+
+        self.assertTrue(results)
+        scores = [score for score, _ in results]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertIn("configuration loader", [phrase for _, phrase in results])
+
+    def test_blank_text_returns_empty(self):
+        engine = KeywordEngine()
+        self.assertEqual(engine.extract(""), [])
+        self.assertEqual(engine.extract("   \n"), [])
+        self.assertEqual(engine.extract(None), [])
+
+    def test_extract_many_matches_single_calls(self):
+        engine = KeywordEngine()
+        texts = [
+            "Machine learning pipeline for image classification.",
+            "",
+            "Machine learning pipeline for image classification.",
+            "REST API with token authentication.",
+        ]
+        batch = engine.extract_many(texts)
+
+        self.assertEqual(len(batch), len(texts))
+        for text, result in zip(texts, batch):
+            self.assertEqual(result, engine.extract(text))
+        # Duplicates get their own list, so callers can mutate results safely
+        self.assertIsNot(batch[0], batch[2])
+
+    def test_rake_instance_reused_per_thread(self):
+        engine = KeywordEngine()
+        engine.extract("First document text.")
+        rake = engine._rake()
+        engine.extract("Second document text.")
+        self.assertIs(engine._rake(), rake)
+
+        other = []
+        worker = threading.Thread(target=lambda: other.append(engine._rake()))
+        worker.start()
+        worker.join()
+        self.assertIsNot(other[0], rake)
+
+    def test_tokenizers_resolved_once(self):
+        self.assertIs(sentence_tokenizer(), sentence_tokenizer())
+        self.assertIs(english_stopwords(), english_stopwords())
+        self.assertIn("the", english_stopwords())
+
+    def test_offline_fallback_splits_sentences(self):
+        sentences = keywordEngine._split_sentences("First point here. Second point!\n\nThird block")
+        self.assertEqual(sentences, ["First point here.", "Second point!", "Third block"])
+
+
+class TestKeywordBatchApis(unittest.TestCase):
+
+    def test_code_batch_matches_single(self):
+        snippets = ["# parse config values\n# retry failed uploads", "", "// render chart widgets"]
+        self.assertEqual(
+            extract_code_keywords_many(snippets),
+            [extract_code_keywords_with_scores(s) for s in snippets],
+        )
+
+    def test_text_batch_matches_single(self):
+        texts = ["This project uses Python and Pandas for data analysis.", "", "Python Python Python scripts."]
+        self.assertEqual(
+            extract_keywords_many(texts),
+            [extract_keywords_with_scores(t) for t in texts],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
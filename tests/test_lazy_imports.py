@@ -0,0 +1,36 @@
+"""
+Startup guard: importing the API must not load the heavy analyzer and
+exporter dependencies; they load on first use.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+HEAVY_PACKAGES = ('google.generativeai', 'numpy', 'pandas', 'reportlab', 'docx', 'PyPDF2', 'PIL')
+
+
+def _loaded_after_import(statement):
+    probe = f"import sys\n{statement}\nprint('LOADED:' + ','.join(p for p in {HEAVY_PACKAGES!r} if p in sys.modules))"
+    proc = subprocess.run([sys.executable, '-c', probe], cwd=ROOT, capture_output=True, text=True,
+                          env={**os.environ, 'PYTHONPATH': ROOT}, timeout=120)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    line = next(l for l in proc.stdout.splitlines() if l.startswith('LOADED:'))
+    return [p for p in line[len('LOADED:'):].split(',') if p]
+
+
+def test_api_import_skips_heavy_packages():
+    assert _loaded_after_import("import src.mainAPI") == []
+
+
+@pytest.mark.parametrize("statement, package", [
+    ("from src.Services.resume_export_service import generate_resume_pdf", "reportlab"),
+    ("from src.Routers.projects import _search_index; _search_index()", "numpy"),
+    ("from src.AI.ai_service import _load_genai; _load_genai()", "google.generativeai"),
+])
+def test_heavy_packages_load_on_first_use(statement, package):
+    assert package in _loaded_after_import(statement)
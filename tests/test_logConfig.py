@@ -0,0 +1,81 @@
+import io
+import json
+import logging
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Helpers import logConfig
+from src.Helpers.logConfig import JsonFormatter, configure_logging, shutdown_logging
+
+
+class TestConfigureLogging(unittest.TestCase):
+
+    def setUp(self):
+        self.stream = io.StringIO()
+        self.logger = logging.getLogger("src.tests.logconfig")
+
+    def tearDown(self):
+        shutdown_logging()
+        root = logging.getLogger(logConfig.ROOT_LOGGER)
+        root.setLevel(logging.NOTSET)
+        root.propagate = True
+
+    def test_records_reach_stream_through_queue(self):
+        configure_logging(level="INFO", json_output=False, stream=self.stream)
+        self.logger.info("Scanning %s", "project-a")
+        shutdown_logging()
+        self.assertEqual(self.stream.getvalue(), "Scanning project-a\n")
+
+    def test_level_filters_debug(self):
+        configure_logging(level="INFO", json_output=False, stream=self.stream)
+        self.logger.debug("per-file detail")
+        self.logger.warning("Failed to read %s", "a.pdf")
+        shutdown_logging()
+        self.assertNotIn("per-file detail", self.stream.getvalue())
+        self.assertIn("Failed to read a.pdf", self.stream.getvalue())
+
+    def test_env_selects_json(self):
+        os.environ["LOG_FORMAT"] = "json"
+        try:
+            configure_logging(level="DEBUG", stream=self.stream)
+        finally:
+            del os.environ["LOG_FORMAT"]
+        self.logger.debug("Processed %d files", 3, extra={"project_id": 7})
+        shutdown_logging()
+        entry = json.loads(self.stream.getvalue())
+        self.assertEqual(entry["level"], "DEBUG")
+        self.assertEqual(entry["logger"], "src.tests.logconfig")
+        self.assertEqual(entry["message"], "Processed 3 files")
+        self.assertEqual(entry["project_id"], 7)
+
+    def test_reconfigure_replaces_handler(self):
+        configure_logging(level="INFO", stream=io.StringIO())
+        configure_logging(level="INFO", stream=self.stream)
+        self.assertEqual(len(logging.getLogger(logConfig.ROOT_LOGGER).handlers), 1)
+
+
+class TestJsonFormatter(unittest.TestCase):
+
+    def test_exception_is_included(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.getLogger("src.x").makeRecord(
+                "src.x", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+        entry = json.loads(JsonFormatter().format(record))
+        self.assertIn("ValueError: boom", entry["exception"])
+
+
+class TestNoPrintOverride(unittest.TestCase):
+
+    def test_main_does_not_replace_print(self):
+        with open(os.path.join(os.path.dirname(__file__), '..', 'src', 'main.py'), encoding='utf-8') as f:
+            source = f.read()
+        self.assertNotIn("builtins.print =", source)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,153 @@
+"""
+Tests for the thumbnail/preview derivative pipeline and the /media endpoint.
+"""
+
+import os
+import sys
+
+import pytest
+from PIL import Image
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Services import media_service
+from src.mainAPI import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Point the derivative store at a temp folder."""
+    derivatives = tmp_path / "derivatives"
+    monkeypatch.setattr(media_service, "DERIVATIVE_DIR", derivatives)
+    return derivatives
+
+
+@pytest.fixture
+def big_image(tmp_path):
+    path = tmp_path / "original.jpg"
+    Image.new("RGB", (2400, 1600), (200, 40, 40)).save(path, "JPEG")
+    return path
+
+
+def test_render_derivative_fits_bounding_box(store, big_image, tmp_path):
+    dest = tmp_path / "out.webp"
+    media_service.render_derivative(str(big_image), str(dest), (320, 320), "WEBP")
+
+    with Image.open(dest) as img:
+        assert img.format == "WEBP"
+        assert max(img.size) == 320
+        # aspect ratio preserved (3:2)
+        assert img.size == (320, 213)
+
+
+def test_register_source_is_content_addressed(store, big_image, tmp_path):
+    copy = tmp_path / "copy.jpg"
+    copy.write_bytes(big_image.read_bytes())
+
+    h1 = media_service.register_source(str(big_image))
+    h2 = media_service.register_source(str(copy))
+
+    assert h1 == h2
+    assert media_service.is_valid_hash(h1)
+    assert (store / h1 / "source").exists()
+
+
+def test_register_source_ignores_vector_images(store, tmp_path):
+    svg = tmp_path / "logo.svg"
+    svg.write_text("<svg xmlns='http://www.w3.org/2000/svg'/>")
+    assert media_service.register_source(str(svg)) is None
+
+
+def test_get_derivative_generates_on_demand(store, big_image):
+    digest = media_service.register_source(str(big_image))
+
+    path = media_service.get_derivative(digest, "preview", "jpeg")
+
+    assert path is not None and path.exists()
+    with Image.open(path) as img:
+        assert img.format == "JPEG"
+        assert max(img.size) == 1280
+
+
+def test_get_derivative_rejects_unknown_inputs(store):
+    assert media_service.get_derivative("not-a-hash", "thumb") is None
+    assert media_service.get_derivative("a" * 64, "thumb") is None
+    assert media_service.get_derivative("a" * 64, "huge") is None
+
+
+def test_enforce_cache_limit_evicts_oldest_first(store, big_image):
+    digest = media_service.register_source(str(big_image))
+    old = media_service.get_derivative(digest, "preview", "jpeg")
+    new = media_service.get_derivative(digest, "thumb", "jpeg")
+    os.utime(old, (1, 1))
+
+    removed = media_service.enforce_cache_limit(max_bytes=new.stat().st_size)
+
+    assert removed == 1
+    assert not old.exists()
+    assert new.exists()
+    # Source pointer survives so the evicted size can be rebuilt
+    assert media_service.get_derivative(digest, "preview", "jpeg").exists()
+
+
+def _store_bytes(store):
+    return sum(f.stat().st_size for f in store.rglob("*") if f.is_file() and f.name != "source")
+
+
+def test_upload_time_derivatives_respect_cache_limit(store, big_image, tmp_path, monkeypatch):
+    media_service.schedule_derivatives(str(big_image))
+    media_service.shutdown_pool()
+    first_batch = _store_bytes(store)
+    assert first_batch > 0
+
+    monkeypatch.setattr(media_service, "MAX_CACHE_BYTES", first_batch)
+    other = tmp_path / "other.jpg"
+    Image.new("RGB", (2400, 1600), (40, 40, 200)).save(other, "JPEG")
+    digest = media_service.schedule_derivatives(str(other))
+    media_service.shutdown_pool()
+
+    assert _store_bytes(store) <= first_batch
+    assert (store / digest / "source").exists()
+
+
+def test_media_endpoint_serves_with_cache_headers(store, big_image):
+    digest = media_service.register_source(str(big_image))
+
+    response = client.get(f"/media/{digest}/thumb", headers={"Accept": "image/webp"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert "immutable" in response.headers["cache-control"]
+
+    etag = response.headers["etag"]
+    cached = client.get(f"/media/{digest}/thumb", headers={"Accept": "image/webp", "If-None-Match": etag})
+    assert cached.status_code == 304
+
+
+def test_media_endpoint_etag_of_missing_media_is_not_found(store):
+    digest = "c" * 64
+    etag = f'"{digest}-thumb-webp"'
+    response = client.get(f"/media/{digest}/thumb", headers={"Accept": "image/webp", "If-None-Match": etag})
+    assert response.status_code == 404
+
+
+def test_app_shutdown_stops_derivative_pool(store, big_image):
+    with TestClient(app):
+        media_service.schedule_derivatives(str(big_image))
+        assert media_service._pool is not None
+    assert media_service._pool is None
+
+
+def test_media_endpoint_falls_back_to_jpeg(store, big_image):
+    digest = media_service.register_source(str(big_image))
+    response = client.get(f"/media/{digest}/thumb", headers={"Accept": "image/png"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+
+
+def test_media_endpoint_unknown_hash(store):
+    assert client.get(f"/media/{'b' * 64}/thumb").status_code == 404
+    assert client.get("/media/nothex/thumb").status_code == 400
@@ -0,0 +1,118 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from fastapi.testclient import TestClient
+
+from src.Services import metrics
+from src.Services.metrics import Registry
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_counter_and_histogram_exposition(self):
+        registry = Registry()
+        requests = registry.counter("demo_requests_total", "Demo requests.")
+        latency = registry.histogram("demo_seconds", "Demo latency.", buckets=(0.1, 1.0))
+        requests.inc(route="/a")
+        requests.inc(2, route="/a")
+        latency.observe(0.05, route="/a")
+        latency.observe(0.5, route="/a")
+        latency.observe(5, route="/a")
+
+        text = registry.render()
+        self.assertIn("# TYPE demo_requests_total counter", text)
+        self.assertIn('demo_requests_total{route="/a"} 3', text)
+        self.assertIn('demo_seconds_bucket{route="/a",le="0.1"} 1', text)
+        self.assertIn('demo_seconds_bucket{route="/a",le="1"} 2', text)
+        self.assertIn('demo_seconds_bucket{route="/a",le="+Inf"} 3', text)
+        self.assertIn('demo_seconds_sum{route="/a"} 5.55', text)
+        self.assertIn('demo_seconds_count{route="/a"} 3', text)
+
+    def test_label_values_are_escaped(self):
+        registry = Registry()
+        registry.counter("demo_total", "Demo.").inc(path='a"b\\c\nd')
+        self.assertIn('demo_total{path="a\\"b\\\\c\\nd"} 1', registry.render())
+
+    def test_gauge_callback(self):
+        registry = Registry()
+        registry.gauge_callback("demo_pool", "Demo pool.", lambda: {"running": 2, "queued": 0})
+        text = registry.render()
+        self.assertIn("# TYPE demo_pool gauge", text)
+        self.assertIn('demo_pool{stat="running"} 2', text)
+
+    def test_phase_records_duration(self):
+        before = metrics.SCANNER_PHASE_SECONDS.count(scanner="test", phase="work")
+        with metrics.phase("test", "work"):
+            pass
+        self.assertEqual(metrics.SCANNER_PHASE_SECONDS.count(scanner="test", phase="work"), before + 1)
+
+
+class TestMetricsEndpoint(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        from src.mainAPI import app
+        cls.client = TestClient(app)
+
+    def test_requests_are_recorded_by_route_template(self):
+        before = metrics.HTTP_REQUESTS.value(method="GET", route="/auth/me", status=401)
+        self.client.get("/auth/me")
+        self.client.get("/no/such/path/123")
+        response = self.client.get("/metrics")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.headers["content-type"].startswith("text/plain"))
+        self.assertEqual(metrics.HTTP_REQUESTS.value(method="GET", route="/auth/me", status=401), before + 1)
+        self.assertIn('http_request_duration_seconds_count{method="GET",route="/auth/me"}', response.text)
+        self.assertIn('route="unmatched"', response.text)
+        self.assertNotIn("/no/such/path", response.text)
+        self.assertIn('password_hash_pool{stat="workers"}', response.text)
+
+    def test_db_queries_are_counted_per_request(self):
+        from src.Services.auth_service import create_access_token
+        before = metrics.HTTP_REQUEST_DB_QUERIES.count(route="/auth/me")
+        selects = metrics.DB_QUERIES.value(operation="select")
+        self.client.get("/auth/me", headers={"Authorization": f"Bearer {create_access_token(987654)}"})
+        self.assertEqual(metrics.HTTP_REQUEST_DB_QUERIES.count(route="/auth/me"), before + 1)
+        self.assertGreater(metrics.DB_QUERIES.value(operation="select"), selects)
+
+
+class TestAIMetrics(unittest.TestCase):
+
+    def _service(self, response):
+        from src.AI.ai_service import AIService, APIUsageStats
+        service = AIService.__new__(AIService)
+        service.cache = None
+        service.rate_limiter = MagicMock()
+        service.usage_stats = APIUsageStats()
+        service._save_stats = lambda: None
+        service.model = MagicMock()
+        service.model.generate_content.return_value = response
+        return service
+
+    def test_generate_text_records_latency_and_outcome(self):
+        part = MagicMock(text="hello")
+        candidate = MagicMock(finish_reason=1)
+        candidate.content.parts = [part]
+        service = self._service(MagicMock(candidates=[candidate]))
+        before = metrics.AI_REQUEST_SECONDS.count(outcome="success")
+        with patch("src.AI.ai_service.genai", MagicMock()):
+            self.assertEqual(service.generate_text("prompt", use_cache=False), "hello")
+        self.assertEqual(metrics.AI_REQUEST_SECONDS.count(outcome="success"), before + 1)
+
+    def test_cache_hits_are_counted(self):
+        service = self._service(None)
+        service.cache = MagicMock()
+        service.cache.get.return_value = "cached answer"
+        before = metrics.AI_REQUESTS.value(outcome="cached")
+        self.assertEqual(service.generate_text("prompt"), "cached answer")
+        self.assertEqual(metrics.AI_REQUESTS.value(outcome="cached"), before + 1)
+        service.model.generate_content.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,12 +4,18 @@ import sys
 import tempfile
 import zipfile
 import shutil
+import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from unittest.mock import patch
+
+from src.Analysis import multiProjectZip
 from src.Analysis.multiProjectZip import (
-    splitZipFile, identifyProjectType, _find_project_roots, _count_files_recursive
+    splitZipFile, identifyProjectType, _find_project_roots, _count_files_recursive,
+    iterProjectRoots, processZipFile
 )
+from src.Helpers.classifier import MIN_SAMPLE_FILES, sample_project_types
 
 
 class TestSplitZipFile(unittest.TestCase):
@@ -80,6 +86,13 @@ class TestCountFilesRecursive(unittest.TestCase):
     def test_empty_directory(self):
         self.assertEqual(_count_files_recursive(self.test_dir), 0)
 
+    def test_ignored_folders_not_counted(self):
+        for rel in ("main.py", ".git/HEAD", "node_modules/lib/index.js"):
+            path = os.path.join(self.test_dir, rel)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            open(path, 'w').close()
+        self.assertEqual(_count_files_recursive(self.test_dir), 1)
+
 
 class TestFindProjectRoots(unittest.TestCase):
 
@@ -174,6 +187,95 @@ class TestIdentifyProjectType(unittest.TestCase):
         result = identifyProjectType(self.test_dir)
         self.assertEqual(result['type'], 'unknown')  # text falls through to unknown per current logic
 
+    def test_file_count_skips_ignored_folders(self):
+        self._make_file("main.py")
+        self._make_file("notes.bin")
+        self._make_file("node_modules/lib/index.js")
+        result = identifyProjectType(self.test_dir)
+        self.assertEqual(result['file_count'], 2)
+
+    @patch.object(multiProjectZip, "scan_coding_project", return_value=1)
+    def test_scan_file_count_same_with_early_stop(self, _mock_scan):
+        for i in range(MIN_SAMPLE_FILES + 100):
+            self._make_file(f"src/mod_{i}.py")
+        for i in range(30):
+            self._make_file(f"node_modules/lib/file_{i}.js")
+            self._make_file(f".git/objects/obj_{i}")
+        total = MIN_SAMPLE_FILES + 100
+
+        sampled = multiProjectZip._scan_project_root("root", self.test_dir)
+        with patch.object(multiProjectZip, "sample_project_types",
+                          side_effect=lambda p: sample_project_types(p, min_files=10**6)):
+            full = multiProjectZip._scan_project_root("root", self.test_dir)
+
+        self.assertEqual(sampled["file_count"], total)
+        self.assertEqual(full["file_count"], total)
+
+
+class TestConcurrentRootScanning(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        for root in ("alpha", "beta", "gamma"):
+            os.makedirs(os.path.join(self.test_dir, root))
+            with open(os.path.join(self.test_dir, root, "main.py"), "w") as f:
+                f.write("print('hi')")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    @patch.object(multiProjectZip, "scan_coding_project")
+    def test_iter_project_roots_yields_every_root(self, mock_scan):
+        mock_scan.side_effect = lambda path, user_id=None: len(path)
+        results = list(iterProjectRoots(self.test_dir, user_id=7, max_workers=3))
+
+        self.assertEqual(sorted(r["name"] for r in results), ["alpha", "beta", "gamma"])
+        self.assertTrue(all(r["type"] == "code" and r["file_count"] == 1 for r in results))
+        self.assertEqual(mock_scan.call_count, 3)
+        for call in mock_scan.call_args_list:
+            self.assertEqual(call.kwargs["user_id"], 7)
+
+    @patch.object(multiProjectZip, "scan_coding_project")
+    def test_failed_root_does_not_stop_others(self, mock_scan):
+        def scan(path, user_id=None):
+            if path.endswith("beta"):
+                raise RuntimeError("boom")
+            return 1
+        mock_scan.side_effect = scan
+
+        with self.assertLogs(multiProjectZip.logger, level="WARNING") as logs:
+            results = {r["name"]: r for r in iterProjectRoots(self.test_dir)}
+
+        self.assertIn("'beta'", logs.output[0])
+        self.assertEqual(results["beta"]["error"], "boom")
+        self.assertIsNone(results["beta"]["database_id"])
+        self.assertEqual(results["alpha"]["database_id"], 1)
+
+    @patch.object(multiProjectZip, "scan_coding_project")
+    def test_process_zip_keeps_discovery_order(self, mock_scan):
+        # Earlier roots finish last, so completion order differs from discovery order
+        delays = {"first": 0.2, "second": 0.1, "third": 0.0}
+        def scan(path, user_id=None):
+            time.sleep(delays[os.path.basename(path)])
+            return 1
+        mock_scan.side_effect = scan
+
+        discovered = []
+        def spy(extract_dir):
+            roots = [(n, os.path.join(extract_dir, n)) for n in ("first", "second", "third")]
+            discovered.extend(n for n, _ in roots)
+            return roots
+
+        zip_path = os.path.join(self.test_dir, "multi.zip")
+        with zipfile.ZipFile(zip_path, "w") as zf:
+            for root in delays:
+                zf.writestr(f"{root}/main.py", "print('hi')")
+
+        with patch.object(multiProjectZip, "_find_project_roots", side_effect=spy):
+            results = processZipFile(zip_path, max_workers=3)
+
+        self.assertEqual([r["name"] for r in results], discovered)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,73 @@
+import asyncio
+import os
+import sys
+import threading
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Services import auth_service
+from src.Services.auth_service import PasswordHashPool
+
+
+def test_hash_and_verify_on_pool():
+    async def scenario():
+        hashed = await auth_service.hash_password_async("password123")
+        assert auth_service.verify_password("password123", hashed)
+        assert await auth_service.verify_password_async("password123", hashed) == (True, None)
+        assert (await auth_service.verify_password_async("wrong", hashed))[0] is False
+    asyncio.run(scenario())
+
+
+def test_rejects_past_queue_limit_and_counts():
+    pool = PasswordHashPool(workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(lambda: "done"))
+        await asyncio.sleep(0.05)
+        assert pool.stats()["running"] == 1
+        assert pool.stats()["queued"] == 1
+        with pytest.raises(HTTPException) as exc:
+            await pool.run(lambda: None)
+        assert exc.value.status_code == 503
+        release.set()
+        assert await queued == "done"
+        await running
+
+    asyncio.run(scenario())
+    stats = pool.stats()
+    assert (stats["running"], stats["queued"], stats["completed"], stats["rejected"]) == (0, 0, 2, 1)
+    assert stats["peak_queued"] == 1
+    pool.shutdown()
+
+
+def test_cancelled_request_frees_its_queue_slot():
+    pool = PasswordHashPool(workers=1, max_queue=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(lambda: None))
+        await asyncio.sleep(0.05)
+        queued.cancel()
+        await asyncio.sleep(0.05)
+        assert pool.stats()["queued"] == 0
+        release.set()
+        await running
+
+    asyncio.run(scenario())
+    pool.shutdown()
+
+
+def test_verify_upgrades_hash_with_other_rounds():
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=4).hash("password123")
+    valid, new_hash = asyncio.run(auth_service.verify_password_async("password123", old_hash))
+    assert valid
+    assert new_hash is not None and new_hash != old_hash
+    assert f"${auth_service.BCRYPT_ROUNDS:02d}$" in new_hash
+    assert auth_service.verify_password("password123", new_hash)
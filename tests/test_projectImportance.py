@@ -6,7 +6,8 @@ from datetime import datetime, timezone, timedelta
 # Add project root to path so both `src.X` and internal `from src.X` imports work
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.Analysis.importanceScores import calculate_importance_score
+from src.Analysis.importanceScores import calculate_importance_score, compute_importance_scores
+from src.Databases.database import db_manager
 
 class SimpleProject:
     """Lightweight project class for unit testing importance scoring"""
@@ -137,5 +138,59 @@ class TestCodingImportanceScoring(unittest.TestCase):
         self.assertGreater(score, 20)
 
 
+class TestBatchImportanceScoring(unittest.TestCase):
+    """The batch scorer must reproduce calculate_importance_score exactly."""
+
+    def setUp(self):
+        db_manager.clear_all_data()
+        # Mid-day offsets keep whole-day recency stable between the two passes
+        now = datetime.now(timezone.utc) - timedelta(hours=12)
+        specs = [
+            ("text", dict(word_count=800, total_size_bytes=150_000), ["a", "b"], 3),
+            ("text", dict(word_count=0, total_size_bytes=5 * 1024 * 1024), [], 40),
+            ("document", dict(word_count=20000, total_size_bytes=0, file_count=4), ["x"] * 10, 0),
+            ("code", dict(lines_of_code=1234, file_count=17), ["Python"], 0),
+            ("software", dict(lines_of_code=9000, file_count=40), [], 5),
+            ("visual_media", dict(file_count=0, total_size_bytes=250 * 1024 * 1024), ["Blender"], 12),
+            ("media", dict(file_count=45), [], 0),
+            (None, dict(), [], 0),
+        ]
+        self.projects = []
+        for i, (project_type, metrics, skills, keywords) in enumerate(specs):
+            project = db_manager.create_project({
+                "name": f"batch-{i}",
+                "file_path": f"/tmp/batch-{i}",
+                "project_type": project_type,
+                "date_modified": now - timedelta(days=97 * i) if i % 3 else None,
+                "skills": skills,
+                "languages": ["Python", "SQL"][: i % 3],
+                "tags": ["t"] * (i % 4),
+                **metrics,
+            })
+            for k in range(keywords):
+                db_manager.add_keyword({"project_id": project.id, "keyword": f"kw{k}", "score": 0.5})
+            for f in range(i % 3):
+                db_manager.add_file_to_project({
+                    "project_id": project.id,
+                    "file_path": f"/tmp/batch-{i}/f{f}.png",
+                    "file_name": f"f{f}.png",
+                    "file_type": ".png",
+                })
+            self.projects.append(project)
+
+    def tearDown(self):
+        db_manager.clear_all_data()
+
+    def test_batch_matches_per_project_scores(self):
+        expected = {p.id: calculate_importance_score(p) for p in self.projects}
+        results = compute_importance_scores(guest=True, save=False)
+        self.assertEqual({row.id: score for row, score in results}, expected)
+
+    def test_batch_saves_scores(self):
+        results = dict((row.id, score) for row, score in compute_importance_scores(guest=True))
+        for project in self.projects:
+            self.assertEqual(db_manager.get_project(project.id).importance_score, results[project.id])
+
+
 if __name__ == "__main__":
     unittest.main()
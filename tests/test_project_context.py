@@ -0,0 +1,109 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.AI import project_context
+from src.AI.project_context import dedupe_keywords, dedupe_lines, get_project_context
+from src.AI.tokens import estimate_tokens, truncate_to_tokens
+from src.Databases.database import DatabaseManager, ProjectAIContext
+
+
+class TestTokens(unittest.TestCase):
+
+    def test_code_costs_more_than_len_over_four(self):
+        code = 'if (x[i] != y[j]) { return {"a": 1}; }'
+        self.assertGreater(estimate_tokens(code), len(code) // 4)
+        self.assertEqual(estimate_tokens(""), 0)
+
+    def test_truncate_respects_budget(self):
+        text = "First sentence here. " * 200
+        cut = truncate_to_tokens(text, 50)
+        self.assertLessEqual(estimate_tokens(cut), 50)
+        self.assertTrue(cut.endswith("…"))
+        self.assertEqual(truncate_to_tokens("short", 50), "short")
+
+
+class TestDedupe(unittest.TestCase):
+
+    def test_keywords(self):
+        kept = dedupe_keywords(["Python", "data", "Flask", "Data Analysis", "API", "api"],
+                               exclude=["python", "Flask"])
+        self.assertEqual(kept, ["data analysis", "api"])
+
+    def test_lines_shared_across_documents(self):
+        seen = set()
+        first = dedupe_lines("Course Report\nIntro\n\n\nCourse Report\nBody", seen)
+        second = dedupe_lines("Course Report\nOther body", seen)
+        self.assertEqual(first, "Course Report\nIntro\n\nBody")
+        self.assertEqual(second, "Other body")
+
+
+class TestProjectContextCache(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.test_dir, 'test.db'))
+        self.docs = os.path.join(self.test_dir, 'essays')
+        os.makedirs(self.docs)
+        for name, body in (("a.txt", "Page header\nResilience in study habits."),
+                           ("b.md", "Page header\nSleep and memory consolidation.")):
+            with open(os.path.join(self.docs, name), 'w', encoding='utf-8') as f:
+                f.write(body)
+        self.project_id = self.db.create_project({
+            'name': 'Essays', 'file_path': self.docs, 'project_type': 'text',
+            'file_count': 2, 'word_count': 10,
+        }).id
+        self.db.add_keyword({'project_id': self.project_id, 'keyword': 'memory', 'score': 0.9})
+        project_context.clear_memory_cache()
+
+    def tearDown(self):
+        project_context.clear_memory_cache()
+        self.db.close()
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def _context(self):
+        return get_project_context(self.db.get_project(self.project_id), self.db)
+
+    def test_digest_is_built_and_stored(self):
+        digest = self._context()
+        self.assertEqual(digest['content'].count("Page header"), 1)
+        self.assertIn("Sleep and memory", digest['content'])
+        self.assertEqual(digest['keywords'], "memory")
+        stored = self.db.get_project_ai_context(self.project_id)
+        self.assertEqual(stored.digest['content'], digest['content'])
+        self.assertEqual(stored.token_count, digest['token_count'])
+
+    def test_same_version_is_not_rebuilt(self):
+        self._context()
+        project_context.clear_memory_cache()
+        with patch.object(project_context, 'build_project_context') as build:
+            self._context()
+        build.assert_not_called()
+
+    def test_new_keyword_rebuilds(self):
+        self._context()
+        self.db.add_keyword({'project_id': self.project_id, 'keyword': 'sleep', 'score': 0.5})
+        self.assertEqual(self._context()['keywords'], "memory, sleep")
+
+    def test_deleted_with_project(self):
+        self._context()
+        self.db.delete_project(self.project_id)
+        session = self.db.get_session()
+        try:
+            self.assertEqual(session.query(ProjectAIContext).count(), 0)
+        finally:
+            session.close()
+
+    def test_cleared_with_all_data(self):
+        self._context()
+        self.db.clear_all_data()
+        self.assertIsNone(self.db.get_project_ai_context(self.project_id))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Tests for the NumPy ranking helpers used by the ranker and summarizer.
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Helpers.rankingMatrix import (
+    cosine_to, diverse_top_k, embedding_matrix, min_max, skill_incidence,
+)
+
+
+def _greedy_reference(scores, skills, k, alpha):
+    """The original full-rescan greedy loop."""
+    remaining = sorted(range(len(scores)), key=lambda i: scores[i], reverse=True)
+    picked, covered = [], set()
+    for _ in range(min(k, len(scores))):
+        best_idx, best_val = None, -float("inf")
+        for pos, i in enumerate(remaining):
+            val = scores[i] + (alpha if set(skills[i]) - covered else 0)
+            if val > best_val:
+                best_idx, best_val = pos, val
+        chosen = remaining.pop(best_idx)
+        picked.append(chosen)
+        covered.update(skills[chosen])
+    return picked
+
+
+def test_min_max():
+    assert min_max([2, 4, 6]).tolist() == [0.0, 0.5, 1.0]
+    assert min_max([3, 3]).tolist() == [1.0, 1.0]
+    assert min_max([]).tolist() == []
+
+
+def test_cosine_matches_python_and_handles_missing_rows():
+    matrix, has = embedding_matrix([[1, 0], None, [0, 2, 0], []], dim=2)
+    sims = cosine_to(matrix, [1, 1])
+
+    assert has.tolist() == [True, False, True, False]
+    assert np.allclose(sims, [1 / np.sqrt(2), 0, 1 / np.sqrt(2), 0], atol=1e-6)
+
+
+def test_skill_incidence():
+    vocab, incidence = skill_incidence([["a", "b"], [], ["b", "c"]])
+    assert vocab == ["a", "b", "c"]
+    assert incidence.tolist() == [[True, True, False], [False, False, False], [False, True, True]]
+
+
+def test_diverse_top_k_matches_full_rescan():
+    rng = random.Random(7)
+    pool = [f"s{i}" for i in range(12)]
+    for _ in range(200):
+        n = rng.randint(1, 60)
+        # Coarse scores so ties are common
+        scores = [round(rng.random(), 1) for _ in range(n)]
+        skills = [rng.sample(pool, rng.randint(0, 3)) for _ in range(n)]
+        k, alpha = rng.randint(1, 10), rng.choice([0.05, 0.3, 1.0])
+
+        _, incidence = skill_incidence(skills)
+        picked = diverse_top_k(
+            np.array(scores), incidence, k,
+            bonus=lambda new: np.where(new > 0, alpha, 0.0), max_bonus=alpha,
+        )
+        assert picked == _greedy_reference(scores, skills, k, alpha)
+
+
+def test_diverse_top_k_edge_cases():
+    _, incidence = skill_incidence([["a"], ["a"]])
+    bonus = lambda new: np.zeros(new.shape)
+    assert diverse_top_k(np.array([0.1, 0.9]), incidence, 0, bonus, 0.0) == []
+    assert diverse_top_k(np.array([0.1, 0.9]), incidence, 5, bonus, 0.0) == [1, 0]
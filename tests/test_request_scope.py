@@ -0,0 +1,145 @@
+"""
+Tests for the request-scoped identity map and write-behind buffer.
+"""
+
+import os
+import sys
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Databases.database import DatabaseManager
+from src.Databases.request_scope import (
+    RequestScopeMiddleware, current_scope, flush_request_writes, request_scope,
+)
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(db_path=str(tmp_path / "scope.db"))
+    yield manager
+    manager.close()
+
+
+def test_no_scope_outside_requests(db):
+    assert current_scope() is None
+    project = db.create_project({"name": "plain", "file_path": "/tmp/plain"})
+    db.update_project(project.id, {"importance_score": 3.0})
+    assert db.get_project(project.id).importance_score == 3.0
+
+
+def test_repeated_get_is_served_from_scope(db):
+    project = db.create_project({"name": "cached", "file_path": "/tmp/cached"})
+
+    with request_scope() as scope:
+        first = db.get_project(project.id)
+        queries = scope.query_count
+        second = db.get_project(project.id)
+
+    assert first is second
+    assert queries >= 1
+    assert scope.query_count == queries
+    assert scope.cache_hits == 1
+
+
+def test_updates_are_coalesced_and_flushed_on_exit(db):
+    project = db.create_project({"name": "buffered", "file_path": "/tmp/buffered"})
+
+    with request_scope() as scope:
+        db.get_project(project.id)
+        before = scope.query_count
+        db.update_project(project.id, {"importance_score": 1.0})
+        updated = db.update_project(project.id, {"importance_score": 5.0, "user_role": "lead"})
+        assert updated.importance_score == 5.0
+        assert scope.query_count == before
+        assert scope.has_pending(db)
+
+    stored = db.get_project(project.id)
+    assert stored.importance_score == 5.0
+    assert stored.user_role == "lead"
+
+
+def test_pending_updates_flush_before_the_next_query(db):
+    project = db.create_project({"name": "listed", "file_path": "/tmp/listed"})
+
+    with request_scope() as scope:
+        db.update_project(project.id, {"user_role": "reviewer"})
+        listed = {p.id: p for p in db.get_all_projects()}
+        assert not scope.has_pending(db)
+
+    assert listed[project.id].user_role == "reviewer"
+
+
+def test_delete_drops_cached_and_pending_state(db):
+    project = db.create_project({"name": "gone", "file_path": "/tmp/gone"})
+
+    with request_scope() as scope:
+        db.update_project(project.id, {"user_role": "ghost"})
+        assert db.delete_project(project.id) is True
+        assert not scope.has_pending(db)
+        assert db.get_project(project.id) is None
+
+
+def test_committed_write_invalidates_cached_projects(db):
+    project = db.create_project({"name": "stale", "file_path": "/tmp/stale"})
+
+    with request_scope():
+        cached = db.get_project(project.id)
+        db.add_file_to_project({
+            "project_id": project.id,
+            "file_path": "/tmp/stale/a.py",
+            "file_name": "a.py",
+            "file_type": ".py",
+            "file_size": 10,
+        })
+        fresh = db.get_project(project.id)
+
+    assert fresh is not cached
+    assert len(fresh.files) == 1
+
+
+def test_api_responses_report_query_count():
+    from src.mainAPI import app
+
+    response = TestClient(app).get("/projects")
+
+    assert response.status_code == 200
+    assert int(response.headers["X-DB-Query-Count"]) >= 1
+
+
+def _scoped_app(db):
+    app = FastAPI(dependencies=[Depends(flush_request_writes, scope="function")])
+    app.add_middleware(RequestScopeMiddleware)
+
+    @app.put("/projects/{project_id}")
+    def rename(project_id: int):
+        db.update_project(project_id, {"user_role": "lead"})
+        assert current_scope().has_pending(db)
+        return {"ok": True}
+
+    return app
+
+
+def test_buffered_writes_are_committed_when_the_endpoint_returns(db):
+    project = db.create_project({"name": "endpoint", "file_path": "/tmp/endpoint"})
+
+    response = TestClient(_scoped_app(db)).put(f"/projects/{project.id}")
+
+    assert response.status_code == 200
+    assert db.get_project(project.id).user_role == "lead"
+
+
+def test_failed_flush_is_a_server_error(db, monkeypatch):
+    project = db.create_project({"name": "lost", "file_path": "/tmp/lost"})
+
+    def fail():
+        current_scope().take_pending(db)
+        raise RuntimeError("database is locked")
+    monkeypatch.setattr(db, "flush_pending_updates", fail)
+
+    response = TestClient(_scoped_app(db), raise_server_exceptions=False).put(f"/projects/{project.id}")
+
+    assert response.status_code == 500
@@ -0,0 +1,126 @@
+"""
+Tests for the local hashed TF-IDF project search index.
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Databases.database import DatabaseManager, db_manager
+from src.Services import search_index as search_module
+from src.Services.search_index import ProjectSearchIndex, tokenize
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = DatabaseManager(db_path=str(tmp_path / "search.db"))
+    yield manager
+    manager.close()
+
+
+def _project(db, name, **fields):
+    return db.create_project({"name": name, "file_path": f"/tmp/{name}", **fields})
+
+
+def _ids(hits):
+    return [pid for pid, _ in hits]
+
+
+def test_tokenize_keeps_tech_terms():
+    assert tokenize("Built with C++, C# and Node.js for the API") == ["built", "c++", "c#", "node.js", "api"]
+
+
+def test_relevance_ordering_and_skill_phrases(db, tmp_path):
+    ml = _project(db, "classifier", description="Image classification with convolutional networks",
+                  skills=["Machine Learning", "Python"])
+    web = _project(db, "storefront", description="React storefront with a Node.js API",
+                   skills=["React", "JavaScript"])
+    _project(db, "notes", description="Essay drafts", skills=["Writing"])
+    index = ProjectSearchIndex(db, path=str(tmp_path / "idx.npz"))
+
+    assert _ids(index.search("react api"))[0] == web.id
+    assert _ids(index.search("machine learning")) == [ml.id]
+    assert index.search("kubernetes") == []
+
+
+def test_results_are_scoped_to_the_owner_and_skip_hidden(db, tmp_path):
+    user = db.create_user({"first_name": "A", "last_name": "B", "email": "s@example.com", "password_hash": "x"})
+    mine = _project(db, "mine", description="django backend", user_id=user.id)
+    guest = _project(db, "guest", description="django backend")
+    _project(db, "hidden", description="django backend", is_hidden=True)
+    index = ProjectSearchIndex(db, path=None)
+
+    assert _ids(index.search("django", user_id=user.id)) == [mine.id]
+    assert _ids(index.search("django")) == [guest.id]
+
+
+def test_index_follows_commits(db):
+    project = _project(db, "app", description="flask service")
+    index = ProjectSearchIndex(db, path=None)
+    assert _ids(index.search("flask")) == [project.id]
+
+    db.update_project(project.id, {"description": "fastapi service"})
+    assert index.search("flask") == []
+    assert _ids(index.search("fastapi")) == [project.id]
+
+    db.add_keyword({"project_id": project.id, "keyword": "websockets", "score": 1.0})
+    assert _ids(index.search("websockets")) == [project.id]
+
+    db.delete_project(project.id)
+    assert index.search("fastapi") == []
+    assert len(index) == 0
+
+
+def test_persisted_index_only_reindexes_changed_projects(db, tmp_path, monkeypatch):
+    path = str(tmp_path / "idx.npz")
+    a = _project(db, "a", description="rust compiler")
+    b = _project(db, "b", description="go scheduler")
+    first = ProjectSearchIndex(db, path=path)
+    first.refresh(save=True)
+    assert os.path.exists(path)
+
+    db.update_project(b.id, {"description": "go garbage collector"})
+
+    tokenized = []
+    real_terms = search_module._document_terms
+    monkeypatch.setattr(search_module, "_document_terms", lambda row: tokenized.append(row.id) or real_terms(row))
+
+    second = ProjectSearchIndex(db, path=path)
+    assert _ids(second.search("rust")) == [a.id]
+    assert _ids(second.search("garbage")) == [b.id]
+    assert tokenized == [b.id]
+
+
+def test_embeddings_prefer_related_projects(db):
+    data = _project(db, "etl", description="data pipeline", skills=["Pandas", "SQL"])
+    art = _project(db, "poster", description="illustration", skills=["Photoshop"])
+    index = ProjectSearchIndex(db, path=None)
+
+    target = np.array(index.embed_query(skills=["SQL", "Pandas"]))
+    assert np.isclose(np.linalg.norm(target), 1.0)
+    assert target @ index.embedding_for(data.id) > target @ index.embedding_for(art.id)
+    assert index.embedding_for(999) is None
+
+
+def test_search_endpoint(monkeypatch):
+    from src.mainAPI import app
+
+    db_manager.clear_all_data()
+    try:
+        monkeypatch.setattr(search_module, "_indexes", {})
+        project = _project(db_manager, "dashboard", description="Analytics dashboard in Vue")
+
+        response = TestClient(app).get("/projects/search", params={"q": "vue dashboard"})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [p["id"] for p in body] == [project.id]
+        assert body[0]["search_score"] > 0
+        assert "display_name" in body[0]
+    finally:
+        db_manager.clear_all_data()
@@ -0,0 +1,112 @@
+import os
+import random
+import re
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.Analysis.skillMatcher import SkillMatcher
+from src.Analysis import skillsExtractCoding, skillsExtractDocs
+
+
+def legacy_count_skills(text, skill_keywords):
+    """The previous per-keyword findall loop, kept as the regression baseline."""
+    text = text.lower()
+    counts = {}
+    for skill, keywords in skill_keywords.items():
+        total = sum(len(re.findall(r'\b' + re.escape(kw.lower()) + r'\b', text)) for kw in keywords)
+        if total:
+            counts[skill] = total
+    return counts
+
+
+def random_text(skill_keywords, seed, words=60):
+    rng = random.Random(seed)
+    vocab = [kw for keywords in skill_keywords.values() for kw in keywords]
+    vocab += [w for kw in vocab for w in re.findall(r'\w+', kw)]
+    vocab += ['the', 'NoSQL', 'my_sql', 'sql2', 'Node.js', 'CI/CD', 'call  to action', 'café']
+    separators = [' ', '  ', '\n', ', ', '. ', '/', '-', '_']
+    text = ''.join(rng.choice(vocab) + rng.choice(separators) for _ in range(rng.randint(0, words)))
+    return text.title() if seed % 3 == 0 else text
+
+
+class TestSkillMatcher(unittest.TestCase):
+
+    def test_matches_legacy_counts(self):
+        for keywords in (skillsExtractCoding.SKILL_KEYWORDS, skillsExtractDocs.SKILL_KEYWORDS):
+            matcher = SkillMatcher(keywords)
+            for seed in range(300):
+                text = random_text(keywords, seed)
+                with self.subTest(seed=seed):
+                    self.assertEqual(matcher.count_skills(text), legacy_count_skills(text, keywords))
+
+    def test_phrases_and_punctuated_keywords(self):
+        matcher = SkillMatcher({"ops": ["ci/cd", "github actions"], "web": ["three.js", "node"]})
+        counts = matcher.keyword_counts("CI/CD via GitHub Actions; three.js and Node.js, not threeXjs or nodejs")
+        self.assertEqual(counts, {"ci/cd": 1, "github actions": 1, "three.js": 1, "node": 1})
+        # Whole words only
+        self.assertEqual(SkillMatcher({"db": ["sql"]}).count_skills("nosql my_sql sql2"), {})
+
+    def test_chunks_equal_whole_text(self):
+        keywords = skillsExtractDocs.SKILL_KEYWORDS
+        matcher = SkillMatcher(keywords)
+        for seed in range(50):
+            lines = random_text(keywords, seed, words=200).splitlines(keepends=True)
+            self.assertEqual(matcher.count_chunks(lines), matcher.keyword_counts(''.join(lines)))
+
+    def test_single_words_only_skips_phrases(self):
+        matcher = SkillMatcher({"writing": ["grammar", "call to action"]})
+        text = "Grammar matters. A call to action too."
+        self.assertEqual(matcher.keyword_counts(text, single_words_only=True), {"grammar": 1})
+        self.assertEqual(matcher.keyword_counts(text)["call to action"], 1)
+
+    def test_empty_input(self):
+        matcher = SkillMatcher(skillsExtractCoding.SKILL_KEYWORDS)
+        self.assertEqual(matcher.count_skills(""), {})
+        self.assertEqual(matcher.count_skills(None), {})
+        self.assertEqual(matcher.count_chunks([None, ""]), {})
+
+
+class TestDocumentSkillStreaming(unittest.TestCase):
+
+    def test_document_counts_match_whole_text(self):
+        keywords = skillsExtractDocs.SKILL_KEYWORDS
+        text = "\n".join(random_text(keywords, seed) for seed in range(40))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "long.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+            expected = sorted(legacy_count_skills(text, keywords).items(), key=lambda x: x[1], reverse=True)
+            self.assertEqual(skillsExtractDocs.analyze_document_for_skills(path), expected)
+
+    def test_pdf_is_read_page_by_page(self):
+        try:
+            from reportlab.pdfgen import canvas
+        except ImportError:
+            self.skipTest("reportlab not installed")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "report.pdf")
+            pdf = canvas.Canvas(path)
+            for page in ("Grammar and punctuation review.", "Proofreading the thesis with citation checks."):
+                pdf.drawString(72, 720, page)
+                pdf.showPage()
+            pdf.save()
+            self.assertEqual(len(list(skillsExtractDocs.iter_text_chunks(path))), 2)
+            skills = dict(skillsExtractDocs.analyze_document_for_skills(path))
+            self.assertEqual(skills["writing_mechanics"], 3)
+            self.assertEqual(skills["research_writing"], 2)
+
+    def test_code_folder_matches_single_text(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            texts = ["Django REST API with PostgreSQL", "Docker and CI/CD pipeline on AWS"]
+            for i, text in enumerate(texts):
+                with open(os.path.join(tmp, f"notes{i}.md"), "w", encoding="utf-8") as f:
+                    f.write(text)
+            self.assertEqual(skillsExtractCoding.extract_skills_from_folder(tmp),
+                             skillsExtractCoding.extract_skills_with_scores("\n".join(texts)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ import sys
 import tempfile
 import shutil
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -607,6 +608,61 @@ class TestConfigManagerEdgeCases(unittest.TestCase):
         self.assertEqual(config1.theme, config2.theme)
 
 
+class TestConfigSnapshotCache(unittest.TestCase):
+    """Test the in-memory config snapshot and its invalidation"""
+
+    def setUp(self):
+        self.test_db_path = tempfile.mktemp(suffix='.db')
+        self.db_manager = DatabaseManager(db_path=self.test_db_path)
+        self.config_manager = ConfigManager(database_manager=self.db_manager)
+
+    def tearDown(self):
+        self.db_manager.close()
+        if os.path.exists(self.test_db_path):
+            try:
+                os.remove(self.test_db_path)
+            except PermissionError:
+                pass
+
+    def test_cached_reads_skip_database(self):
+        """Test repeated reads are served without opening a session"""
+        self.config_manager.get_or_create_config()
+
+        with patch.object(self.db_manager, 'get_session', side_effect=AssertionError('DB hit')):
+            config = self.config_manager.get_or_create_config()
+            self.assertFalse(config.basic_consent_granted)
+            self.assertIsNotNone(self.config_manager.get_config())
+            self.assertTrue(self.config_manager.should_process_file('a.py', 1024))
+
+    def test_consent_changes_invalidate_snapshot(self):
+        """Test grant/revoke are visible on the next read"""
+        self.assertFalse(self.config_manager.get_or_create_config().ai_consent_granted)
+        version = self.config_manager.cache_version
+
+        self.config_manager.grant_ai_consent()
+        self.assertGreater(self.config_manager.cache_version, version)
+        self.assertTrue(self.config_manager.get_or_create_config().ai_consent_granted)
+
+        self.config_manager.revoke_ai_consent()
+        self.assertFalse(self.config_manager.get_or_create_config().ai_consent_granted)
+
+    def test_snapshot_shared_between_managers(self):
+        """Test a write through one manager invalidates the others"""
+        other = ConfigManager(database_manager=self.db_manager)
+        self.assertFalse(other.get_or_create_config().basic_consent_granted)
+
+        self.config_manager.grant_basic_consent()
+
+        self.assertTrue(other.get_or_create_config().basic_consent_granted)
+
+    def test_returned_config_is_a_copy(self):
+        """Test mutating a returned config does not leak into the cache"""
+        config = self.config_manager.get_or_create_config()
+        config.theme = 'mutated'
+
+        self.assertNotEqual(self.config_manager.get_or_create_config().theme, 'mutated')
+
+
 def run_tests():
     """Run all tests"""
     unittest.main(argv=[''], exit=False, verbosity=2)